@@ -0,0 +1 @@
+"Contains a generator for synthetic models of scalable size and a runner which measures the performance of the simulation."
@@ -0,0 +1,420 @@
+import datetime
+from dataclasses import dataclass
+
+from ethos_penalps.data_classes import Commodity, LoadType
+from ethos_penalps.order_generator import NOrderGenerator
+from ethos_penalps.organizational_agents.enterprise import Enterprise
+from ethos_penalps.organizational_agents.process_chain import ProcessChain
+from ethos_penalps.process_nodes.process_step import ProcessStep
+from ethos_penalps.process_nodes.sink import Sink
+from ethos_penalps.process_nodes.source import Source
+from ethos_penalps.stream import (
+    BatchStream,
+    BatchStreamStaticData,
+    ContinuousStream,
+    ContinuousStreamStaticData,
+)
+from ethos_penalps.time_data import TimeData
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+
+
+class BenchmarkStreamTypes:
+    """Contains the options for the types of the streams
+    in a benchmark model.
+    """
+
+    batch: str = "batch"
+    continuous: str = "continuous"
+    mixed: str = "mixed"
+    """The streams of a chain alternate between batch and
+    continuous streams starting with a batch stream at the source."""
+
+
+@dataclass
+class BenchmarkModelParameters:
+    """Contains the parameters of a synthetic benchmark model. The model
+    consists of a single NetworkLevel with identical parallel chains
+    between a main source and a main sink.
+    """
+
+    number_of_orders: int = 10
+    """Number of orders in the sink."""
+    number_of_process_steps_in_chain: int = 2
+    """Number of sequential ProcessSteps in each chain."""
+    number_of_parallel_chains: int = 1
+    """Number of chains which share the orders of the sink."""
+    stream_type: str = BenchmarkStreamTypes.continuous
+    """One of the BenchmarkStreamTypes."""
+    mass_per_order: float = 4
+    """Mass of each order in metric tons."""
+    time_span_between_orders: datetime.timedelta = datetime.timedelta(days=1)
+    """Time between the deadlines of two subsequent orders."""
+
+    def __post_init__(self):
+        """Checks the parameters of the model."""
+        if self.stream_type not in (
+            BenchmarkStreamTypes.batch,
+            BenchmarkStreamTypes.continuous,
+            BenchmarkStreamTypes.mixed,
+        ):
+            raise MisconfigurationError(
+                "Unknown benchmark stream type: " + str(self.stream_type)
+            )
+        for parameter_name in (
+            "number_of_orders",
+            "number_of_process_steps_in_chain",
+            "number_of_parallel_chains",
+        ):
+            if getattr(self, parameter_name) < 1:
+                raise MisconfigurationError(
+                    "The benchmark parameter "
+                    + parameter_name
+                    + " must be at least 1 but is: "
+                    + str(getattr(self, parameter_name))
+                )
+
+    def get_name(self) -> str:
+        """Returns a name which contains all parameters that
+        determine the size of the model.
+
+        Returns:
+            str: Name of the benchmark model.
+        """
+        return (
+            str(self.stream_type)
+            + "_orders_"
+            + str(self.number_of_orders)
+            + "_steps_"
+            + str(self.number_of_process_steps_in_chain)
+            + "_chains_"
+            + str(self.number_of_parallel_chains)
+        )
+
+
+class BenchmarkModelGenerator:
+    """Creates synthetic models whose size is determined by the
+    BenchmarkModelParameters. All ProcessSteps are built from the
+    state factories of the ProcessStateHandler. A step with a continuous
+    output stream processes its input and output in parallel, a step with a
+    batch output stream fills, processes and discharges a batch.
+    """
+
+    maximum_operation_rate: float = 1.0
+    """Rate of all continuous streams in metric tons per hour."""
+    maximum_batch_mass_value: float = 1.0
+    """Mass of a batch of all batch streams in metric tons."""
+    batch_stream_delay: datetime.timedelta = datetime.timedelta(minutes=5)
+    processing_time_of_batch: datetime.timedelta = datetime.timedelta(minutes=30)
+    specific_energy_demand: float = 10.0
+    """Specific electricity demand of each output stream in MJ per metric ton."""
+
+    def __init__(self, benchmark_model_parameters: BenchmarkModelParameters) -> None:
+        """
+
+        Args:
+            benchmark_model_parameters (BenchmarkModelParameters): Determine
+                the size of the generated model.
+        """
+        self.benchmark_model_parameters: BenchmarkModelParameters = (
+            benchmark_model_parameters
+        )
+        self.electricity_load: LoadType = LoadType(name="Electricity")
+        self.time_data: TimeData = self.create_time_data()
+
+    def create_time_data(self) -> TimeData:
+        """Creates the time data such that all orders are in the
+        simulated period.
+
+        Returns:
+            TimeData: Start and end date of the benchmark model.
+        """
+        global_end_date = datetime.datetime(year=2023, month=1, day=1)
+        global_start_date = global_end_date - (
+            self.benchmark_model_parameters.number_of_orders + 1
+        ) * (self.benchmark_model_parameters.time_span_between_orders)
+        return TimeData(
+            global_start_date=global_start_date, global_end_date=global_end_date
+        )
+
+    def get_stream_type(self, stream_number: int) -> str:
+        """Returns the type of a stream in the chain.
+
+        Args:
+            stream_number (int): Position of the stream in the chain
+                starting with 0 at the source.
+
+        Returns:
+            str: Either BenchmarkStreamTypes.batch or BenchmarkStreamTypes.continuous.
+        """
+        stream_type = self.benchmark_model_parameters.stream_type
+        if stream_type == BenchmarkStreamTypes.mixed:
+            if stream_number % 2 == 0:
+                return BenchmarkStreamTypes.batch
+            return BenchmarkStreamTypes.continuous
+        return stream_type
+
+    def create_enterprise(self) -> Enterprise:
+        """Creates the benchmark model.
+
+        Returns:
+            Enterprise: The benchmark model which is ready for simulation.
+        """
+        enterprise = Enterprise(
+            time_data=self.time_data,
+            name="Benchmark " + self.benchmark_model_parameters.get_name(),
+        )
+        network_level = enterprise.create_network_level()
+        raw_material = Commodity(name="Raw Material")
+        product = Commodity(name="Product")
+        order_generator = NOrderGenerator(
+            commodity=product,
+            mass_per_order=self.benchmark_model_parameters.mass_per_order,
+            production_deadline=self.time_data.global_end_date,
+            number_of_orders=self.benchmark_model_parameters.number_of_orders,
+            time_span_between_order=self.benchmark_model_parameters.time_span_between_orders,
+        )
+        sink = network_level.create_main_sink(
+            name="Product Sink",
+            commodity=product,
+            order_collection=order_generator.create_n_order_collection(),
+        )
+        source = network_level.create_main_source(
+            name="Raw Material Source", commodity=raw_material
+        )
+        for chain_number in range(
+            1, self.benchmark_model_parameters.number_of_parallel_chains + 1
+        ):
+            process_chain = network_level.create_process_chain(
+                process_chain_name="Chain " + str(chain_number)
+            )
+            self.fill_process_chain(
+                process_chain=process_chain,
+                chain_number=chain_number,
+                sink=sink,
+                source=source,
+                raw_material=raw_material,
+                product=product,
+            )
+        return enterprise
+
+    def fill_process_chain(
+        self,
+        process_chain: ProcessChain,
+        chain_number: int,
+        sink: Sink,
+        source: Source,
+        raw_material: Commodity,
+        product: Commodity,
+    ):
+        """Adds the sequential ProcessSteps and their streams to a chain.
+
+        Args:
+            process_chain (ProcessChain): The empty chain.
+            chain_number (int): Is appended to the names of all nodes
+                and streams of the chain.
+            sink (Sink): Main sink of the NetworkLevel.
+            source (Source): Main source of the NetworkLevel.
+            raw_material (Commodity): Commodity of the source.
+            product (Commodity): Commodity of the sink.
+        """
+        process_chain.add_sink(sink=sink)
+        process_chain.add_source(source=source)
+        number_of_process_steps = (
+            self.benchmark_model_parameters.number_of_process_steps_in_chain
+        )
+        list_of_process_steps: list[ProcessStep] = [
+            process_chain.create_process_step(
+                name="Step " + str(chain_number) + "." + str(step_number)
+            )
+            for step_number in range(1, number_of_process_steps + 1)
+        ]
+        list_of_node_names = (
+            [source.name]
+            + [process_step.name for process_step in list_of_process_steps]
+            + [sink.name]
+        )
+        list_of_commodities = (
+            [raw_material]
+            + [
+                Commodity(name="Intermediate " + str(step_number))
+                for step_number in range(1, number_of_process_steps)
+            ]
+            + [product]
+        )
+        list_of_streams: list[BatchStream | ContinuousStream] = []
+        for stream_number, commodity in enumerate(list_of_commodities):
+            stream = self.create_stream(
+                process_chain=process_chain,
+                start_process_step_name=list_of_node_names[stream_number],
+                end_process_step_name=list_of_node_names[stream_number + 1],
+                commodity=commodity,
+                stream_type=self.get_stream_type(stream_number=stream_number),
+            )
+            list_of_streams.append(stream)
+
+        for step_index, process_step in enumerate(list_of_process_steps):
+            input_stream = list_of_streams[step_index]
+            output_stream = list_of_streams[step_index + 1]
+            if isinstance(output_stream, ContinuousStream):
+                self.create_continuous_output_petri_net(process_step=process_step)
+            else:
+                self.create_batch_output_petri_net(
+                    process_step=process_step,
+                    input_stream_is_continuous=isinstance(
+                        input_stream, ContinuousStream
+                    ),
+                )
+            output_stream.create_stream_energy_data(
+                specific_energy_demand=self.specific_energy_demand,
+                load_type=self.electricity_load,
+                energy_unit="MJ",
+                mass_unit="metric_ton",
+            )
+            process_step.create_main_mass_balance(
+                commodity=output_stream.static_data.commodity,
+                input_to_output_conversion_factor=1,
+                main_input_stream=input_stream,
+                main_output_stream=output_stream,
+            )
+            process_step.process_state_handler.process_step_data.main_mass_balance.create_storage(
+                current_storage_level=0
+            )
+        source.add_output_stream(
+            output_stream=list_of_streams[0],
+            process_chain_identifier=process_chain.process_chain_identifier,
+        )
+        sink.add_input_stream(
+            input_stream=list_of_streams[-1],
+            process_chain_identifier=process_chain.process_chain_identifier,
+        )
+
+    def create_stream(
+        self,
+        process_chain: ProcessChain,
+        start_process_step_name: str,
+        end_process_step_name: str,
+        commodity: Commodity,
+        stream_type: str,
+    ) -> BatchStream | ContinuousStream:
+        """Creates a stream between two nodes of a chain.
+
+        Args:
+            process_chain (ProcessChain): The chain of the nodes.
+            start_process_step_name (str): Name of the upstream node.
+            end_process_step_name (str): Name of the downstream node.
+            commodity (Commodity): Commodity of the stream.
+            stream_type (str): Either BenchmarkStreamTypes.batch or
+                BenchmarkStreamTypes.continuous.
+
+        Returns:
+            BatchStream | ContinuousStream: The new stream.
+        """
+        if stream_type == BenchmarkStreamTypes.batch:
+            return process_chain.stream_handler.create_batch_stream(
+                batch_stream_static_data=BatchStreamStaticData(
+                    start_process_step_name=start_process_step_name,
+                    end_process_step_name=end_process_step_name,
+                    delay=self.batch_stream_delay,
+                    commodity=commodity,
+                    maximum_batch_mass_value=self.maximum_batch_mass_value,
+                )
+            )
+        return process_chain.stream_handler.create_continuous_stream(
+            continuous_stream_static_data=ContinuousStreamStaticData(
+                start_process_step_name=start_process_step_name,
+                end_process_step_name=end_process_step_name,
+                commodity=commodity,
+                maximum_operation_rate=self.maximum_operation_rate,
+            )
+        )
+
+    def create_continuous_output_petri_net(self, process_step: ProcessStep):
+        """Creates the states of a ProcessStep that provides a continuous
+        output stream while it receives its input stream.
+
+        Args:
+            process_step (ProcessStep): The ProcessStep without states.
+        """
+        process_state_handler = process_step.process_state_handler
+        switch_handler = (
+            process_state_handler.process_state_switch_selector_handler.process_state_switch_handler
+        )
+        processing_state = process_state_handler.create_state_for_parallel_input_and_output_stream_with_storage(
+            process_state_name="Processing"
+        )
+        idle_state = process_state_handler.create_idle_process_state(
+            process_state_name="Idle"
+        )
+        process_state_handler.process_state_switch_selector_handler.create_single_choice_selector(
+            process_state_switch=switch_handler.create_process_state_switch_at_next_discrete_event(
+                start_process_state=processing_state,
+                end_process_state=idle_state,
+            )
+        )
+        process_state_handler.process_state_switch_selector_handler.create_single_choice_selector(
+            process_state_switch=switch_handler.create_process_state_switch_at_input_stream(
+                start_process_state=idle_state,
+                end_process_state=processing_state,
+            )
+        )
+
+    def create_batch_output_petri_net(
+        self, process_step: ProcessStep, input_stream_is_continuous: bool
+    ):
+        """Creates the states of a ProcessStep that fills, processes
+        and discharges a batch.
+
+        Args:
+            process_step (ProcessStep): The ProcessStep without states.
+            input_stream_is_continuous (bool): Determines if the batch is
+                filled by a continuous or a batch stream.
+        """
+        process_state_handler = process_step.process_state_handler
+        switch_handler = (
+            process_state_handler.process_state_switch_selector_handler.process_state_switch_handler
+        )
+        idle_state = process_state_handler.create_idle_process_state(
+            process_state_name="Idle"
+        )
+        if input_stream_is_continuous is True:
+            filling_state = (
+                process_state_handler.create_continuous_input_stream_requesting_state(
+                    process_state_name="Filling"
+                )
+            )
+        else:
+            filling_state = (
+                process_state_handler.create_batch_input_stream_requesting_state(
+                    process_state_name="Filling"
+                )
+            )
+        processing_state = process_state_handler.create_intermediate_process_state(
+            process_state_name="Processing"
+        )
+        discharge_state = (
+            process_state_handler.create_batch_output_stream_providing_state(
+                process_state_name="Discharge"
+            )
+        )
+        for process_state_switch in (
+            switch_handler.create_process_state_switch_at_next_discrete_event(
+                start_process_state=discharge_state,
+                end_process_state=idle_state,
+            ),
+            switch_handler.create_process_state_switch_at_input_stream(
+                start_process_state=idle_state,
+                end_process_state=filling_state,
+            ),
+            switch_handler.create_process_state_switch_delay(
+                start_process_state=filling_state,
+                end_process_state=processing_state,
+                delay=self.processing_time_of_batch,
+            ),
+            switch_handler.create_process_state_switch_at_output_stream(
+                start_process_state=processing_state,
+                end_process_state=discharge_state,
+            ),
+        ):
+            process_state_handler.process_state_switch_selector_handler.create_single_choice_selector(
+                process_state_switch=process_state_switch
+            )
@@ -0,0 +1,380 @@
+"""Runs the synthetic benchmark models and stores the wall time of each phase,
+the peak memory consumption and the number of iterations as JSON. Is started
+by:
+
+    python -m ethos_penalps.benchmark.benchmark_runner --output_path benchmark.json
+"""
+
+import argparse
+import concurrent.futures
+import copy
+import datetime
+import importlib.metadata
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+import traceback
+from dataclasses import asdict, dataclass
+
+from ethos_penalps.benchmark.benchmark_model_generator import (
+    BenchmarkModelGenerator,
+    BenchmarkModelParameters,
+    BenchmarkStreamTypes,
+)
+from ethos_penalps.organizational_agents.enterprise import Enterprise
+from ethos_penalps.post_processing.post_processed_data_handler import (
+    PostProcessSimulationDataHandler,
+)
+from ethos_penalps.post_processing.report_generator.enterprise_report_generator import (
+    EnterpriseReportGenerator,
+)
+from ethos_penalps.post_processing.report_generator.report_options import (
+    ReportGeneratorOptions,
+    standard_simulation_report,
+)
+from ethos_penalps.time_data import TimeData
+from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
+
+logger = PeNALPSLogger.get_logger_without_handler()
+
+
+@dataclass
+class BenchmarkResult:
+    """Contains the measurements of a single benchmark model."""
+
+    name: str
+    parameters: dict
+    simulation_time: float
+    """Wall time of the simulation in seconds."""
+    post_processing_time: float
+    """Wall time of PostProcessSimulationDataHandler.start_post_processing in seconds."""
+    report_generation_time: float | None
+    """Wall time of the report generation in seconds. Is None if the
+    report has not been created."""
+    peak_resident_set_size: float | None
+    """Peak resident set size of the benchmark process in MB. Is None
+    on platforms without the resource module."""
+    number_of_iterations: int
+    number_of_fulfilled_orders: int
+    report_generation_error: str | None = None
+
+
+def get_peak_resident_set_size() -> float | None:
+    """Returns the peak resident set size of the current process.
+
+    Returns:
+        float | None: Peak resident set size in MB or None if it
+            can not be determined on the current platform.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak_resident_set_size = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # Is returned in bytes instead of kilobytes
+        return peak_resident_set_size / 1024**2
+    return peak_resident_set_size / 1024
+
+
+def create_benchmark_report_options(time_data: TimeData) -> ReportGeneratorOptions:
+    """Creates the report options for a benchmark model without modifying the
+    standard report options. The enterprise graph is not created because it
+    depends on an external LaTeX installation.
+
+    Args:
+        time_data (TimeData): Time data of the benchmark model.
+
+    Returns:
+        ReportGeneratorOptions: The options of the benchmark report.
+    """
+    report_generator_options = copy.deepcopy(standard_simulation_report)
+    report_generator_options.report_name = "benchmark_report"
+    report_generator_options.process_overview_page_options.include_enterprise_graph = (
+        False
+    )
+    report_generator_options.full_process_gantt_chart.add_plot_start_and_end_time(
+        start_time=time_data.global_start_date, end_time=time_data.global_end_date
+    )
+    report_generator_options.production_plan_data_frame.include_storage_data_frames = (
+        True
+    )
+    report_generator_options.carpet_plot_options.add_time_data(
+        start_date=time_data.global_start_date,
+        end_date=time_data.global_end_date,
+        x_axis_time_delta=datetime.timedelta(days=1),
+        resample_frequency="1h",
+    )
+    return report_generator_options
+
+
+def get_number_of_fulfilled_orders(enterprise: Enterprise) -> int:
+    """Sums the fulfilled orders of all chains of the first NetworkLevel.
+
+    Args:
+        enterprise (Enterprise): The simulated enterprise.
+
+    Returns:
+        int: Number of fulfilled orders.
+    """
+    main_sink = enterprise.list_of_network_level[0].get_main_sink()
+    return sum(
+        splitted_order.current_order_number
+        for splitted_order in main_sink.order_distributor.dict_of_splitted_order.values()
+    )
+
+
+def run_benchmark(
+    benchmark_model_parameters: BenchmarkModelParameters,
+    include_report_generation: bool = False,
+    report_directory: str | None = None,
+) -> BenchmarkResult:
+    """Creates, simulates and post processes a benchmark model and measures
+    the wall time of each phase.
+
+    Args:
+        benchmark_model_parameters (BenchmarkModelParameters): Determine the
+            size of the model.
+        include_report_generation (bool, optional): Determines if the time of
+            the report generation is measured. Defaults to False.
+        report_directory (str | None, optional): Directory of the report. A
+            temporary directory is used if None. Defaults to None.
+
+    Returns:
+        BenchmarkResult: The measurements of the benchmark.
+    """
+    benchmark_model_generator = BenchmarkModelGenerator(
+        benchmark_model_parameters=benchmark_model_parameters
+    )
+    enterprise = benchmark_model_generator.create_enterprise()
+    logger.info("Start benchmark: %s", benchmark_model_parameters.get_name())
+    start_time = time.perf_counter()
+    enterprise.start_simulation()
+    simulation_time = time.perf_counter() - start_time
+
+    report_generator_options = create_benchmark_report_options(
+        time_data=benchmark_model_generator.time_data
+    )
+    start_time = time.perf_counter()
+    post_process_simulation_data_handler = PostProcessSimulationDataHandler(
+        production_plan=enterprise.production_plan,
+        report_options=report_generator_options,
+    )
+    post_process_simulation_data_handler.start_post_processing()
+    post_processing_time = time.perf_counter() - start_time
+
+    report_generation_time = None
+    report_generation_error = None
+    if include_report_generation is True:
+        report_generator = EnterpriseReportGenerator(
+            production_plan=enterprise.production_plan,
+            enterprise_name=enterprise.name,
+            list_of_network_level=enterprise.list_of_network_level,
+            post_process_simulation_data_handler=post_process_simulation_data_handler,
+        )
+        report_generator.open_report_after_creation = False
+        if report_directory is None:
+            report_directory = tempfile.mkdtemp(prefix="ethos_penalps_benchmark_")
+        benchmark_report_directory = os.path.join(
+            report_directory, benchmark_model_parameters.get_name()
+        )
+        os.makedirs(benchmark_report_directory, exist_ok=True)
+        report_generator.add_output_directory(
+            output_directory=benchmark_report_directory
+        )
+        start_time = time.perf_counter()
+        try:
+            report_generator.generate_report(
+                report_generator_options=report_generator_options
+            )
+            report_generation_time = time.perf_counter() - start_time
+        except Exception:
+            report_generation_error = traceback.format_exc()
+            logger.warning(
+                "The report of the benchmark %s could not be created: %s",
+                benchmark_model_parameters.get_name(),
+                report_generation_error,
+            )
+
+    number_of_iterations = sum(
+        process_chain.number_of_iterations
+        for network_level in enterprise.list_of_network_level
+        for process_chain in network_level.list_of_process_chains
+    )
+    return BenchmarkResult(
+        name=benchmark_model_parameters.get_name(),
+        parameters=asdict(benchmark_model_parameters),
+        simulation_time=simulation_time,
+        post_processing_time=post_processing_time,
+        report_generation_time=report_generation_time,
+        peak_resident_set_size=get_peak_resident_set_size(),
+        number_of_iterations=number_of_iterations,
+        number_of_fulfilled_orders=get_number_of_fulfilled_orders(
+            enterprise=enterprise
+        ),
+        report_generation_error=report_generation_error,
+    )
+
+
+def create_default_benchmark_suite() -> list[BenchmarkModelParameters]:
+    """Creates the benchmark models which vary the number of orders, the
+    length of the chains, the number of parallel chains and the stream types
+    separately.
+
+    Returns:
+        list[BenchmarkModelParameters]: Parameters of all benchmark models.
+    """
+    list_of_benchmark_model_parameters = []
+    for number_of_orders in (10, 100, 500):
+        list_of_benchmark_model_parameters.append(
+            BenchmarkModelParameters(number_of_orders=number_of_orders)
+        )
+    for number_of_process_steps_in_chain in (1, 4, 8):
+        list_of_benchmark_model_parameters.append(
+            BenchmarkModelParameters(
+                number_of_process_steps_in_chain=number_of_process_steps_in_chain
+            )
+        )
+    for number_of_parallel_chains in (2, 4, 8):
+        list_of_benchmark_model_parameters.append(
+            BenchmarkModelParameters(
+                number_of_parallel_chains=number_of_parallel_chains
+            )
+        )
+    for stream_type in (BenchmarkStreamTypes.batch, BenchmarkStreamTypes.mixed):
+        list_of_benchmark_model_parameters.append(
+            BenchmarkModelParameters(stream_type=stream_type)
+        )
+    # A large model which combines all dimensions
+    list_of_benchmark_model_parameters.append(
+        BenchmarkModelParameters(
+            number_of_orders=100,
+            number_of_process_steps_in_chain=4,
+            number_of_parallel_chains=4,
+            stream_type=BenchmarkStreamTypes.mixed,
+        )
+    )
+    return list_of_benchmark_model_parameters
+
+
+class BenchmarkRunner:
+    """Runs a list of benchmark models and writes the results as JSON. By
+    default each model is simulated in a new process so that the peak
+    memory consumption of a model is not influenced by the previous ones.
+    """
+
+    def __init__(
+        self,
+        list_of_benchmark_model_parameters: list[BenchmarkModelParameters],
+        include_report_generation: bool = False,
+        report_directory: str | None = None,
+        run_in_separate_processes: bool = True,
+    ) -> None:
+        """
+
+        Args:
+            list_of_benchmark_model_parameters (list[BenchmarkModelParameters]): Parameters
+                of the benchmark models.
+            include_report_generation (bool, optional): Determines if the time of the
+                report generation is measured. Defaults to False.
+            report_directory (str | None, optional): Directory of the reports. Defaults
+                to None.
+            run_in_separate_processes (bool, optional): Determines if each model is
+                simulated in a new process. Otherwise the peak resident set size is the
+                maximum of all previous models. Defaults to True.
+        """
+        self.list_of_benchmark_model_parameters: list[BenchmarkModelParameters] = (
+            list_of_benchmark_model_parameters
+        )
+        self.include_report_generation: bool = include_report_generation
+        self.report_directory: str | None = report_directory
+        self.run_in_separate_processes: bool = run_in_separate_processes
+        self.list_of_benchmark_results: list[BenchmarkResult] = []
+
+    def run(self) -> list[BenchmarkResult]:
+        """Runs all benchmark models sequentially.
+
+        Returns:
+            list[BenchmarkResult]: The measurements of all models.
+        """
+        self.list_of_benchmark_results = []
+        for benchmark_model_parameters in self.list_of_benchmark_model_parameters:
+            if self.run_in_separate_processes is True:
+                with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as process_pool_executor:
+                    benchmark_result = process_pool_executor.submit(
+                        run_benchmark,
+                        benchmark_model_parameters,
+                        self.include_report_generation,
+                        self.report_directory,
+                    ).result()
+            else:
+                benchmark_result = run_benchmark(
+                    benchmark_model_parameters=benchmark_model_parameters,
+                    include_report_generation=self.include_report_generation,
+                    report_directory=self.report_directory,
+                )
+            logger.info(
+                "Benchmark %s is simulated in %s s",
+                benchmark_result.name,
+                benchmark_result.simulation_time,
+            )
+            self.list_of_benchmark_results.append(benchmark_result)
+        return self.list_of_benchmark_results
+
+    def get_result_dict(self) -> dict:
+        """Returns the results together with information about the
+        environment so that results of different versions can be compared.
+
+        Returns:
+            dict: The JSON serializable results.
+        """
+        try:
+            ethos_penalps_version = importlib.metadata.version("ethos_penalps")
+        except importlib.metadata.PackageNotFoundError:
+            ethos_penalps_version = None
+        return {
+            "ethos_penalps_version": ethos_penalps_version,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "creation_time": datetime.datetime.now().isoformat(),
+            "list_of_benchmark_results": [
+                asdict(benchmark_result)
+                for benchmark_result in self.list_of_benchmark_results
+            ],
+        }
+
+    def write_json(self, output_path: str):
+        """Writes the results to a JSON file.
+
+        Args:
+            output_path (str): Path of the JSON file.
+        """
+        with open(output_path, "w") as file:
+            json.dump(self.get_result_dict(), file, indent=4, default=str)
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument("--output_path", default="benchmark_results.json")
+    argument_parser.add_argument("--include_report_generation", action="store_true")
+    argument_parser.add_argument("--report_directory", default=None)
+    arguments = argument_parser.parse_args()
+    benchmark_runner = BenchmarkRunner(
+        list_of_benchmark_model_parameters=create_default_benchmark_suite(),
+        include_report_generation=arguments.include_report_generation,
+        report_directory=arguments.report_directory,
+    )
+    benchmark_runner.run()
+    benchmark_runner.write_json(output_path=arguments.output_path)
+    print("Benchmark results are written to: " + arguments.output_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Compares the iterations per second of the interpreted loop of the
+ProcessChain with the CompiledChainExecutionPlan on the synthetic benchmark
+models and stores the results as JSON. Is started by:
+
+    python -m ethos_penalps.benchmark.execution_plan_benchmark --output_path execution_plan_benchmark.json
+"""
+
+import argparse
+import json
+import time
+from dataclasses import asdict, dataclass
+
+from ethos_penalps.benchmark.benchmark_model_generator import (
+    BenchmarkModelGenerator,
+    BenchmarkModelParameters,
+    BenchmarkStreamTypes,
+)
+from ethos_penalps.organizational_agents.enterprise import Enterprise
+
+
+@dataclass
+class ExecutionPlanBenchmarkResult:
+    """Contains the measurements of the execution plan benchmark of a
+    single benchmark model.
+    """
+
+    name: str
+    parameters: dict
+    number_of_iterations: int
+    interpreted_simulation_time: float
+    """Shortest wall time of the simulations with the interpreted loop in seconds."""
+    compiled_simulation_time: float
+    """Shortest wall time of the simulations with the compiled execution
+    plan in seconds."""
+    interpreted_iterations_per_second: float
+    compiled_iterations_per_second: float
+
+
+def get_total_number_of_iterations(enterprise: Enterprise) -> int:
+    """Sums the iterations of all chains of a simulated enterprise.
+
+    Args:
+        enterprise (Enterprise): The simulated enterprise.
+
+    Returns:
+        int: Number of iterations of all chains.
+    """
+    return sum(
+        process_chain.number_of_iterations
+        for network_level in enterprise.list_of_network_level
+        for process_chain in network_level.list_of_process_chains
+    )
+
+
+def measure_simulation_time(
+    benchmark_model_parameters: BenchmarkModelParameters,
+    use_compiled_execution_plan: bool,
+    number_of_repetitions: int,
+) -> tuple[float, int]:
+    """Simulates a benchmark model repeatedly and returns the shortest
+    simulation time.
+
+    Args:
+        benchmark_model_parameters (BenchmarkModelParameters): Determine the
+            size of the model.
+        use_compiled_execution_plan (bool): Defines if the compiled
+            execution plan is used.
+        number_of_repetitions (int): Number of simulations.
+
+    Returns:
+        tuple[float, int]: The shortest simulation time in seconds and the
+            number of iterations of all chains.
+    """
+    list_of_simulation_times = []
+    for _ in range(number_of_repetitions):
+        enterprise = BenchmarkModelGenerator(
+            benchmark_model_parameters=benchmark_model_parameters
+        ).create_enterprise()
+        if use_compiled_execution_plan is True:
+            enterprise.enable_compiled_execution_plan()
+        start_time = time.perf_counter()
+        enterprise.start_simulation()
+        list_of_simulation_times.append(time.perf_counter() - start_time)
+    return min(list_of_simulation_times), get_total_number_of_iterations(
+        enterprise=enterprise
+    )
+
+
+def run_execution_plan_benchmark(
+    benchmark_model_parameters: BenchmarkModelParameters,
+    number_of_repetitions: int = 3,
+) -> ExecutionPlanBenchmarkResult:
+    """Simulates a benchmark model with the interpreted loop and with the
+    compiled execution plan and measures the iterations per second.
+
+    Args:
+        benchmark_model_parameters (BenchmarkModelParameters): Determine the
+            size of the model.
+        number_of_repetitions (int, optional): Number of simulations of each
+            execution mode. Defaults to 3.
+
+    Returns:
+        ExecutionPlanBenchmarkResult: The measurements of both execution modes.
+    """
+    interpreted_simulation_time, number_of_iterations = measure_simulation_time(
+        benchmark_model_parameters=benchmark_model_parameters,
+        use_compiled_execution_plan=False,
+        number_of_repetitions=number_of_repetitions,
+    )
+    compiled_simulation_time, _ = measure_simulation_time(
+        benchmark_model_parameters=benchmark_model_parameters,
+        use_compiled_execution_plan=True,
+        number_of_repetitions=number_of_repetitions,
+    )
+    return ExecutionPlanBenchmarkResult(
+        name=benchmark_model_parameters.get_name(),
+        parameters=asdict(benchmark_model_parameters),
+        number_of_iterations=number_of_iterations,
+        interpreted_simulation_time=interpreted_simulation_time,
+        compiled_simulation_time=compiled_simulation_time,
+        interpreted_iterations_per_second=number_of_iterations
+        / interpreted_simulation_time,
+        compiled_iterations_per_second=number_of_iterations / compiled_simulation_time,
+    )
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument(
+        "--output_path", default="execution_plan_benchmark.json"
+    )
+    argument_parser.add_argument("--number_of_repetitions", type=int, default=3)
+    argument_parser.add_argument("--number_of_orders", type=int, default=10)
+    argument_parser.add_argument(
+        "--number_of_process_steps_in_chain", type=int, default=4
+    )
+    arguments = argument_parser.parse_args()
+    list_of_benchmark_results = []
+    for stream_type in (
+        BenchmarkStreamTypes.continuous,
+        BenchmarkStreamTypes.batch,
+        BenchmarkStreamTypes.mixed,
+    ):
+        benchmark_result = run_execution_plan_benchmark(
+            benchmark_model_parameters=BenchmarkModelParameters(
+                number_of_orders=arguments.number_of_orders,
+                number_of_process_steps_in_chain=arguments.number_of_process_steps_in_chain,
+                stream_type=stream_type,
+            ),
+            number_of_repetitions=arguments.number_of_repetitions,
+        )
+        list_of_benchmark_results.append(asdict(benchmark_result))
+    with open(arguments.output_path, "w") as file:
+        json.dump(list_of_benchmark_results, file, indent=4, default=str)
+    print("Benchmark results are written to: " + arguments.output_path)
+
+
+if __name__ == "__main__":
+    main()
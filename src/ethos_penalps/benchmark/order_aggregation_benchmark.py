@@ -0,0 +1,139 @@
+"""Measures the wall time of the aggregation of orders for continuous and
+batch streams with a synthetic set of orders and stores it as JSON. Is
+started by:
+
+    python -m ethos_penalps.benchmark.order_aggregation_benchmark --output_path order_aggregation_benchmark.json
+"""
+
+import argparse
+import datetime
+import json
+import time
+from dataclasses import asdict, dataclass
+
+import numpy
+import pandas
+
+from ethos_penalps.data_classes import Commodity
+from ethos_penalps.order_aggregation import (
+    aggregate_orders_for_batch_streams,
+    aggregate_orders_for_continuous_streams,
+)
+from ethos_penalps.utilities.identifiers import get_new_identifier
+
+
+@dataclass
+class OrderAggregationBenchmarkResult:
+    """Contains the measurements of the order aggregation benchmark."""
+
+    number_of_orders: int
+    continuous_aggregation_time: float
+    """Wall time of the aggregation for continuous streams in seconds."""
+    number_of_continuous_aggregated_orders: int
+    batch_aggregation_time: float
+    """Wall time of the aggregation for batch streams in seconds."""
+    number_of_batch_aggregated_orders: int
+
+
+def create_synthetic_order_data_frame(
+    number_of_orders: int,
+    commodity: Commodity,
+    seed: int = 0,
+) -> pandas.DataFrame:
+    """Creates a data frame of orders with the columns of the ProductionOrder.
+    The production targets are between 0.5 and 1.5 and the deadlines are
+    between zero and two hours apart.
+
+    Args:
+        number_of_orders (int): Number of orders that are created.
+        commodity (Commodity): Commodity of all orders.
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+
+    Returns:
+        pandas.DataFrame: The synthetic orders.
+    """
+    random_generator = numpy.random.default_rng(seed=seed)
+    deadline_offsets = numpy.cumsum(
+        random_generator.integers(0, 120, size=number_of_orders)
+    )
+    deadlines = numpy.datetime64(datetime.datetime(2023, 1, 1)) + (
+        deadline_offsets.astype("timedelta64[m]")
+    )
+    commodity_dict = asdict(commodity)
+    return pandas.DataFrame(
+        data={
+            "production_target": random_generator.uniform(
+                0.5, 1.5, size=number_of_orders
+            ),
+            "production_deadline": deadlines.astype("datetime64[ns]"),
+            "order_number": numpy.arange(number_of_orders, dtype=numpy.int64),
+            "commodity": [commodity_dict] * number_of_orders,
+            "global_unique_identifier": [
+                get_new_identifier() for _ in range(number_of_orders)
+            ],
+            "produced_mass": numpy.zeros(number_of_orders, dtype=numpy.int64),
+        }
+    )
+
+
+def run_order_aggregation_benchmark(
+    number_of_orders: int = 10**6,
+    total_operation_rate_of_streams: float = 1.0,
+    order_target_mass: float = 10.0,
+) -> OrderAggregationBenchmarkResult:
+    """Aggregates a synthetic set of orders for continuous and batch streams
+    and measures the wall time of each aggregation.
+
+    Args:
+        number_of_orders (int, optional): Number of input orders. Defaults to 10**6.
+        total_operation_rate_of_streams (float, optional): Operation rate of
+            the continuous streams per hour. Defaults to 1.0.
+        order_target_mass (float, optional): Target mass of the batch
+            orders. Defaults to 10.0.
+
+    Returns:
+        OrderAggregationBenchmarkResult: The measured wall times.
+    """
+    order_data_frame = create_synthetic_order_data_frame(
+        number_of_orders=number_of_orders,
+        commodity=Commodity(name="Benchmark Commodity"),
+    )
+    start_time = time.perf_counter()
+    continuous_data_frame = aggregate_orders_for_continuous_streams(
+        order_data_frame=order_data_frame,
+        total_operation_rate_of_streams=total_operation_rate_of_streams,
+    )
+    continuous_aggregation_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    batch_data_frame = aggregate_orders_for_batch_streams(
+        order_data_frame=order_data_frame,
+        order_target_mass=order_target_mass,
+        commodity=Commodity(name="Benchmark Commodity"),
+    )
+    batch_aggregation_time = time.perf_counter() - start_time
+    return OrderAggregationBenchmarkResult(
+        number_of_orders=number_of_orders,
+        continuous_aggregation_time=continuous_aggregation_time,
+        number_of_continuous_aggregated_orders=continuous_data_frame.shape[0],
+        batch_aggregation_time=batch_aggregation_time,
+        number_of_batch_aggregated_orders=batch_data_frame.shape[0],
+    )
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument(
+        "--output_path", default="order_aggregation_benchmark.json"
+    )
+    argument_parser.add_argument("--number_of_orders", type=int, default=10**6)
+    arguments = argument_parser.parse_args()
+    benchmark_result = run_order_aggregation_benchmark(
+        number_of_orders=arguments.number_of_orders
+    )
+    with open(arguments.output_path, "w") as file:
+        json.dump(asdict(benchmark_result), file, indent=4)
+    print("Benchmark results are written to: " + arguments.output_path)
+
+
+if __name__ == "__main__":
+    main()
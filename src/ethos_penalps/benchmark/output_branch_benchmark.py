@@ -0,0 +1,203 @@
+"""Compares the copies of the OutputBranchProductionPlan, which share their
+entries, with copies of all lists of entries and stores the results as JSON.
+The entries of a simulated batch benchmark model are added to a single
+output branch and the production plan is copied after each added batch,
+as it is done for each temporal branch during the simulation. Is started by:
+
+    python -m ethos_penalps.benchmark.output_branch_benchmark --output_path output_branch_benchmark.json
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+from ethos_penalps.benchmark.benchmark_model_generator import (
+    BenchmarkModelGenerator,
+    BenchmarkModelParameters,
+    BenchmarkStreamTypes,
+)
+from ethos_penalps.production_plan import OutputBranchProductionPlan, ProductionPlan
+
+
+@dataclass
+class OutputBranchBenchmarkResult:
+    """Contains the measurements of the output branch benchmark for a
+    single number of batches.
+    """
+
+    number_of_batches: int
+    shared_entries_time: float
+    """Wall time to add and copy all batches with shared entries in seconds."""
+    copied_lists_time: float
+    """Wall time to add and copy all batches with copies of all lists in seconds."""
+
+
+def create_copy_of_all_lists(
+    output_branch_production_plan: OutputBranchProductionPlan,
+) -> OutputBranchProductionPlan:
+    """Copies all lists of entries of the production plan, so that the
+    effort increases with the number of entries.
+
+    Args:
+        output_branch_production_plan (OutputBranchProductionPlan): The
+            production plan that is copied.
+
+    Returns:
+        OutputBranchProductionPlan: Copy of the production plan.
+    """
+    return OutputBranchProductionPlan(
+        process_step_states_dict={
+            name: list(list_of_entries)
+            for name, list_of_entries in output_branch_production_plan.process_step_states_dict.items()
+        },
+        stream_state_dict={
+            name: list(list_of_entries)
+            for name, list_of_entries in output_branch_production_plan.stream_state_dict.items()
+        },
+        storage_state_dict={
+            name: {
+                commodity: list(list_of_entries)
+                for commodity, list_of_entries in commodity_dictionary.items()
+            }
+            for name, commodity_dictionary in output_branch_production_plan.storage_state_dict.items()
+        },
+    )
+
+
+def simulate_batch_production_plan(number_of_orders: int) -> ProductionPlan:
+    """Simulates a batch benchmark model to create realistic entries.
+
+    Args:
+        number_of_orders (int): Number of orders of the model.
+
+    Returns:
+        ProductionPlan: Production plan of the simulated model.
+    """
+    enterprise = BenchmarkModelGenerator(
+        benchmark_model_parameters=BenchmarkModelParameters(
+            number_of_orders=number_of_orders,
+            stream_type=BenchmarkStreamTypes.batch,
+        )
+    ).create_enterprise()
+    enterprise.start_simulation()
+    return enterprise.production_plan
+
+
+def measure_output_branch_copies(
+    production_plan: ProductionPlan,
+    number_of_batches: int,
+    copy_function: Callable[[OutputBranchProductionPlan], OutputBranchProductionPlan],
+) -> float:
+    """Adds the entries of the production plan batch by batch to a single
+    output branch and copies the output branch after each batch.
+
+    Args:
+        production_plan (ProductionPlan): Contains the entries that are added.
+        number_of_batches (int): Number of stream entries that are added
+            to each stream.
+        copy_function (Callable[[OutputBranchProductionPlan], OutputBranchProductionPlan]):
+            Creates the copy of the output branch.
+
+    Returns:
+        float: Time to add and copy all batches.
+    """
+    output_branch_production_plan = OutputBranchProductionPlan()
+    number_of_process_states_per_batch = max(
+        len(list_of_entries) // number_of_batches
+        for list_of_entries in production_plan.process_step_states_dict.values()
+    )
+    start_time = time.perf_counter()
+    for batch_index in range(number_of_batches):
+        for list_of_stream_entries in production_plan.stream_state_dict.values():
+            output_branch_production_plan.add_stream_state_entry(
+                stream_state_entry=list_of_stream_entries[
+                    batch_index % len(list_of_stream_entries)
+                ]
+            )
+        for (
+            process_step_name,
+            list_of_process_step_entries,
+        ) in production_plan.process_step_states_dict.items():
+            first_entry_index = (
+                batch_index * number_of_process_states_per_batch
+            ) % len(list_of_process_step_entries)
+            output_branch_production_plan.add_process_step_state_entries(
+                process_step_name=process_step_name,
+                list_of_process_step_entries=list_of_process_step_entries[
+                    first_entry_index : first_entry_index
+                    + number_of_process_states_per_batch
+                ],
+            )
+        output_branch_production_plan = copy_function(output_branch_production_plan)
+    return time.perf_counter() - start_time
+
+
+def run_output_branch_benchmark(
+    list_of_number_of_batches: list[int],
+    number_of_orders: int = 10,
+) -> list[OutputBranchBenchmarkResult]:
+    """Measures the copies of the output branch with shared entries and with
+    copies of all lists for each number of batches.
+
+    Args:
+        list_of_number_of_batches (list[int]): Numbers of batches that are
+            added to the output branch.
+        number_of_orders (int, optional): Number of orders of the simulated
+            batch model which provides the entries. Defaults to 10.
+
+    Returns:
+        list[OutputBranchBenchmarkResult]: The measurements for each number
+            of batches.
+    """
+    production_plan = simulate_batch_production_plan(number_of_orders=number_of_orders)
+    list_of_benchmark_results = []
+    for number_of_batches in list_of_number_of_batches:
+        list_of_benchmark_results.append(
+            OutputBranchBenchmarkResult(
+                number_of_batches=number_of_batches,
+                shared_entries_time=measure_output_branch_copies(
+                    production_plan=production_plan,
+                    number_of_batches=number_of_batches,
+                    copy_function=OutputBranchProductionPlan.create_self_copy,
+                ),
+                copied_lists_time=measure_output_branch_copies(
+                    production_plan=production_plan,
+                    number_of_batches=number_of_batches,
+                    copy_function=create_copy_of_all_lists,
+                ),
+            )
+        )
+    return list_of_benchmark_results
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument(
+        "--output_path", default="output_branch_benchmark.json"
+    )
+    argument_parser.add_argument(
+        "--list_of_number_of_batches",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 5000],
+    )
+    arguments = argument_parser.parse_args()
+    list_of_benchmark_results = run_output_branch_benchmark(
+        list_of_number_of_batches=arguments.list_of_number_of_batches
+    )
+    with open(arguments.output_path, "w") as file:
+        json.dump(
+            [
+                asdict(benchmark_result)
+                for benchmark_result in list_of_benchmark_results
+            ],
+            file,
+            indent=4,
+        )
+    print("Benchmark results are written to: " + arguments.output_path)
+
+
+if __name__ == "__main__":
+    main()
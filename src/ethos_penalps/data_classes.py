@@ -10,6 +10,8 @@ from dataclasses_json import DataClassJsonMixin, config, dataclass_json
 
 from ethos_penalps.utilities.exceptions_and_warnings import UnexpectedBehaviorWarning
 from ethos_penalps.utilities.general_functions import get_new_uuid
+from ethos_penalps.utilities.identifiers import get_new_identifier
+from ethos_penalps.utilities.json_coding_functions import RecordJsonMixin
 from ethos_penalps.utilities.units import Units
 
 
@@ -97,7 +99,7 @@ class StreamLoadEnergyData(DataClassJsonMixin):
 
 
 @dataclass(slots=True, frozen=True)
-class LoadProfileEntry(DataClassJsonMixin):
+class LoadProfileEntry(RecordJsonMixin):
     """Represents the energy demand of
     stream or process step in the given time
     period.
@@ -145,7 +147,7 @@ class LoopCounter:
 
 
 @dataclass(kw_only=True, frozen=True, slots=True)
-class ProcessStepProductionPlanEntry(DataClassJsonMixin):
+class ProcessStepProductionPlanEntry(RecordJsonMixin):
     """Summarizes the activity of a process step in
     a discrete time period.
     """
@@ -159,7 +161,7 @@ class ProcessStepProductionPlanEntry(DataClassJsonMixin):
 
 
 @dataclass(frozen=True, slots=True)
-class StorageProductionPlanEntry(DataClassJsonMixin):
+class StorageProductionPlanEntry(RecordJsonMixin):
     """Represents the storage level in a discrete
     time period.
     """
@@ -228,7 +230,7 @@ class OutputBranchIdentifier:
     """
 
     branch_number: float
-    global_unique_identifier: Optional[str] = field(default_factory=get_new_uuid)
+    global_unique_identifier: Optional[int] = field(default_factory=get_new_identifier)
 
 
 @dataclass(frozen=True, eq=True, slots=True)
@@ -238,7 +240,7 @@ class TemporalBranchIdentifier:
     """
 
     branch_number: float
-    global_unique_identifier: Optional[str] = field(default_factory=get_new_uuid)
+    global_unique_identifier: Optional[int] = field(default_factory=get_new_identifier)
 
 
 @dataclass(frozen=True, eq=True, slots=True)
@@ -248,7 +250,7 @@ class StreamBranchIdentifier:
     Multiple input streams are still in development."""
 
     stream_name: str
-    global_unique_identifier: Optional[str] = field(default_factory=get_new_uuid)
+    global_unique_identifier: Optional[int] = field(default_factory=get_new_identifier)
 
 
 @dataclass(frozen=True, eq=True, slots=True)
@@ -293,7 +295,7 @@ class ProductionOrder:
     production_deadline: datetime.datetime
     order_number: float
     commodity: Commodity
-    global_unique_identifier: str = field(default_factory=get_new_uuid)
+    global_unique_identifier: int = field(default_factory=get_new_identifier)
     produced_mass: float = 0
 
 
@@ -352,12 +354,30 @@ class OrderCollection:
             order_collection (OrderCollection): New collection that should
                 be appended.
         """
-        if self.commodity != order_collection.commodity:
-            warnings.warn("Tried to append order collection with different commodity.")
-        self.order_data_frame = pandas.concat(
-            [self.order_data_frame, order_collection.order_data_frame]
+        self.append_list_of_order_collections(
+            list_of_order_collections=[order_collection]
         )
-        new_sum = self.target_mass + order_collection.target_mass
+
+    def append_list_of_order_collections(
+        self, list_of_order_collections: list["OrderCollection"]
+    ):
+        """Appends multiple order collections to the current collection. The
+        data frames are concatenated at once instead of once per collection.
+
+        Args:
+            list_of_order_collections (list[OrderCollection]): New collections
+                that should be appended.
+        """
+        list_of_order_data_frames = [self.order_data_frame]
+        new_sum = self.target_mass
+        for order_collection in list_of_order_collections:
+            if self.commodity != order_collection.commodity:
+                warnings.warn(
+                    "Tried to append order collection with different commodity."
+                )
+            list_of_order_data_frames.append(order_collection.order_data_frame)
+            new_sum = new_sum + order_collection.target_mass
+        self.order_data_frame = pandas.concat(list_of_order_data_frames)
         self.target_mass = new_sum
 
 
@@ -0,0 +1,312 @@
+import datetime
+
+import numpy
+import pandas
+
+from ethos_penalps.data_classes import (
+    LoadProfileEntry,
+    LoadProfileMetaDataResampled,
+    LoadType,
+)
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+from ethos_penalps.utilities.integer_time import (
+    MICROSECONDS_PER_SECOND,
+    convert_datetime_to_integer_time,
+    convert_timedelta_to_integer_time,
+)
+from ethos_penalps.utilities.units import Units
+
+
+class LoadProfileObjectTypes:
+    """Contains the types of objects whose load profiles are accumulated.
+    They correspond to the object types of the post processing.
+    """
+
+    stream: str = "Stream"
+    process_step: str = "Process Step"
+
+
+class LoadProfileGridAccumulator:
+    """Adds the energy of each LoadProfileEntry to a fixed time grid while
+    the simulation runs. Each stream and process step has one array per load
+    type which contains the energy of each period of the grid. The energy of
+    an entry is distributed to the periods in proportion to the overlap, like
+    in LoadProfileEntryPostProcessor.resample_load_profile_meta_data, so that
+    the resampled load profiles are available without storing the entries.
+    Energy outside of the grid is ignored.
+    """
+
+    def __init__(
+        self,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        resample_frequency: str = "1min",
+    ) -> None:
+        """
+
+        Args:
+            start_date (datetime.datetime): Start of the first period of the grid.
+            end_date (datetime.datetime): The grid ends with the last period
+                that ends before or at the end date.
+            resample_frequency (str, optional): Duration of each period
+                in the pandas style, e.g. "15min" or "1h". Defaults to "1min".
+
+        Raises:
+            MisconfigurationError: Is raised if the grid does not contain a period.
+        """
+        self.start_date: datetime.datetime = start_date
+        self.end_date: datetime.datetime = end_date
+        self.resample_frequency: str = resample_frequency
+        self.time_step: datetime.timedelta = pandas.to_timedelta(
+            resample_frequency
+        ).to_pytimedelta()
+        self.integer_start_time: int = convert_datetime_to_integer_time(
+            date_time=start_date
+        )
+        self.integer_time_step: int = convert_timedelta_to_integer_time(
+            duration=self.time_step
+        )
+        if self.integer_time_step <= 0:
+            raise MisconfigurationError(
+                "The resample frequency must be positive: " + str(resample_frequency)
+            )
+        self.number_of_periods: int = (
+            convert_datetime_to_integer_time(date_time=end_date)
+            - self.integer_start_time
+        ) // self.integer_time_step
+        if self.number_of_periods <= 0:
+            raise MisconfigurationError(
+                "The load profile grid does not contain a period. Start date: "
+                + str(start_date)
+                + " End date: "
+                + str(end_date)
+                + " Resample frequency: "
+                + str(resample_frequency)
+            )
+        self.dict_of_energy_arrays: dict[tuple[str, str, str], numpy.ndarray] = {}
+        """Contains the energy of each period. The key consists of the object type,
+        the object name and the uuid of the load type.
+        """
+        self.dict_of_load_types: dict[str, LoadType] = {}
+        self.dict_of_energy_units: dict[tuple[str, str, str], str] = {}
+        self.dict_of_changed_period_ranges: dict[
+            tuple[str, str, str], tuple[int, int]
+        ] = {}
+        """Contains the first changed period and the period after the last changed
+        period of each array since the last call of pop_changed_period_ranges.
+        """
+
+    def add_load_profile_entry(
+        self,
+        object_type: str,
+        object_name: str,
+        load_profile_entry: LoadProfileEntry,
+    ):
+        """Adds the energy of a LoadProfileEntry to the periods of the grid.
+
+        Args:
+            object_type (str): One of the LoadProfileObjectTypes.
+            object_name (str): Name of the stream or process step.
+            load_profile_entry (LoadProfileEntry): Entry whose energy is added.
+        """
+        key = (object_type, object_name, load_profile_entry.load_type.uuid)
+        energy_array = self.dict_of_energy_arrays.get(key)
+        if energy_array is None:
+            energy_array = self._create_energy_array(
+                key=key, load_profile_entry=load_profile_entry
+            )
+        entry_start_time = convert_datetime_to_integer_time(
+            date_time=load_profile_entry.start_time
+        )
+        entry_end_time = convert_datetime_to_integer_time(
+            date_time=load_profile_entry.end_time
+        )
+        entry_duration = entry_end_time - entry_start_time
+        if entry_duration <= 0:
+            return
+        # The times are relative to the start of the grid and limited to the grid
+        grid_duration = self.number_of_periods * self.integer_time_step
+        relative_start_time = max(entry_start_time - self.integer_start_time, 0)
+        relative_end_time = min(entry_end_time - self.integer_start_time, grid_duration)
+        if relative_start_time >= relative_end_time:
+            return
+        energy_per_time = load_profile_entry.energy_quantity / entry_duration
+        time_step = self.integer_time_step
+        first_period = relative_start_time // time_step
+        last_period = (relative_end_time - 1) // time_step
+        self._add_changed_period_range(
+            key=key, first_period=first_period, stop_period=last_period + 1
+        )
+        if first_period == last_period:
+            energy_array[first_period] += energy_per_time * (
+                relative_end_time - relative_start_time
+            )
+            return
+        energy_array[first_period] += energy_per_time * (
+            (first_period + 1) * time_step - relative_start_time
+        )
+        if last_period > first_period + 1:
+            energy_array[first_period + 1 : last_period] += energy_per_time * time_step
+        energy_array[last_period] += energy_per_time * (
+            relative_end_time - last_period * time_step
+        )
+
+    def _create_energy_array(
+        self, key: tuple[str, str, str], load_profile_entry: LoadProfileEntry
+    ) -> numpy.ndarray:
+        """Creates the array of a new combination of object and load type.
+
+        Args:
+            key (tuple[str, str, str]): Object type, object name and load type uuid.
+            load_profile_entry (LoadProfileEntry): First entry of the combination.
+
+        Returns:
+            numpy.ndarray: Energy of each period, which is zero initially.
+        """
+        energy_array = numpy.zeros(self.number_of_periods, dtype=numpy.float64)
+        self.dict_of_energy_arrays[key] = energy_array
+        self.dict_of_load_types[load_profile_entry.load_type.uuid] = (
+            load_profile_entry.load_type
+        )
+        self.dict_of_energy_units[key] = load_profile_entry.energy_unit
+        return energy_array
+
+    def _add_changed_period_range(
+        self, key: tuple[str, str, str], first_period: int, stop_period: int
+    ):
+        """Extends the changed period range of an array.
+
+        Args:
+            key (tuple[str, str, str]): Object type, object name and load type uuid.
+            first_period (int): First changed period.
+            stop_period (int): Period after the last changed period.
+        """
+        changed_period_range = self.dict_of_changed_period_ranges.get(key)
+        if changed_period_range is not None:
+            first_period = min(first_period, changed_period_range[0])
+            stop_period = max(stop_period, changed_period_range[1])
+        self.dict_of_changed_period_ranges[key] = (first_period, stop_period)
+
+    def pop_changed_period_ranges(self) -> dict[tuple[str, str, str], tuple[int, int]]:
+        """Returns the periods of each array that have changed since the last call
+        and starts a new collection of changes. Is used by the SimulationCheckpointWriter
+        to write only the changed periods to the checkpoint.
+
+        Returns:
+            dict[tuple[str, str, str], tuple[int, int]]: The first changed period
+                and the period after the last changed period of each changed array.
+        """
+        dict_of_changed_period_ranges = self.dict_of_changed_period_ranges
+        self.dict_of_changed_period_ranges = {}
+        return dict_of_changed_period_ranges
+
+    def replicate_load_profiles(self, object_type: str, name_mapping: dict[str, str]):
+        """Adds the load profiles of objects to the load profiles of other
+        objects of the same type. Is used for replicated process chains.
+
+        Args:
+            object_type (str): One of the LoadProfileObjectTypes.
+            name_mapping (dict[str, str]): Maps the names of the copied objects
+                to the names of the objects which receive the load profiles.
+        """
+        for key, energy_array in list(self.dict_of_energy_arrays.items()):
+            key_object_type, object_name, load_type_uuid = key
+            if key_object_type != object_type or object_name not in name_mapping:
+                continue
+            target_key = (object_type, name_mapping[object_name], load_type_uuid)
+            self._add_changed_period_range(
+                key=target_key, first_period=0, stop_period=self.number_of_periods
+            )
+            if target_key in self.dict_of_energy_arrays:
+                self.dict_of_energy_arrays[target_key] += energy_array
+            else:
+                self.dict_of_energy_arrays[target_key] = energy_array.copy()
+                self.dict_of_energy_units[target_key] = self.dict_of_energy_units[key]
+
+    def get_period_start_times(self) -> pandas.DatetimeIndex:
+        """Returns the start time of each period of the grid.
+
+        Returns:
+            pandas.DatetimeIndex: Start times of the periods.
+        """
+        return pandas.date_range(
+            start=self.start_date, periods=self.number_of_periods, freq=self.time_step
+        )
+
+    def get_energy_array(
+        self, object_type: str, object_name: str, load_type_uuid: str
+    ) -> numpy.ndarray:
+        """Returns the energy of each period for an object and load type.
+
+        Args:
+            object_type (str): One of the LoadProfileObjectTypes.
+            object_name (str): Name of the stream or process step.
+            load_type_uuid (str): Uuid of the load type.
+
+        Returns:
+            numpy.ndarray: Energy of each period in the energy unit of the
+                load profile entries. The array is zero if no energy has
+                been added for the combination.
+        """
+        key = (object_type, object_name, load_type_uuid)
+        if key not in self.dict_of_energy_arrays:
+            return numpy.zeros(self.number_of_periods, dtype=numpy.float64)
+        return self.dict_of_energy_arrays[key]
+
+    def create_load_profile_meta_data_resampled(
+        self, object_type: str, object_name: str, load_type_uuid: str
+    ) -> LoadProfileMetaDataResampled:
+        """Provides the accumulated load profile in the format of
+        LoadProfileEntryPostProcessor.resample_load_profile_meta_data.
+
+        Args:
+            object_type (str): One of the LoadProfileObjectTypes.
+            object_name (str): Name of the stream or process step.
+            load_type_uuid (str): Uuid of the load type.
+
+        Returns:
+            LoadProfileMetaDataResampled: The resampled load profile.
+        """
+        key = (object_type, object_name, load_type_uuid)
+        energy_array = self.dict_of_energy_arrays[key]
+        energy_unit = self.dict_of_energy_units[key]
+        load_type = self.dict_of_load_types[load_type_uuid]
+        power_unit = str(
+            (
+                (1 * Units.get_unit(unit_string=energy_unit))
+                / (1 * Units.get_unit(unit_string="s"))
+            )
+            .to("W")
+            .to_compact()
+        )
+        power_array = energy_array / (self.integer_time_step / MICROSECONDS_PER_SECOND)
+        period_start_times = self.get_period_start_times()
+        list_of_load_profiles = [
+            LoadProfileEntry(
+                load_type=load_type,
+                start_time=start_time,
+                end_time=start_time + self.time_step,
+                energy_quantity=energy_quantity,
+                energy_unit=energy_unit,
+                average_power_consumption=average_power_consumption,
+                power_unit=power_unit,
+            )
+            for start_time, energy_quantity, average_power_consumption in zip(
+                period_start_times.to_pydatetime().tolist(),
+                energy_array.tolist(),
+                power_array.tolist(),
+            )
+        ]
+        return LoadProfileMetaDataResampled(
+            name=object_name,
+            object_type=object_type,
+            list_of_load_profiles=list_of_load_profiles,
+            data_frame=pandas.DataFrame(list_of_load_profiles),
+            power_unit=power_unit,
+            energy_unit=energy_unit,
+            total_energy=float(energy_array.sum()),
+            maximum_power=float(power_array.max()),
+            load_type=load_type,
+            time_step=self.time_step,
+            resample_frequency=self.resample_frequency,
+        )
@@ -16,6 +16,10 @@ from ethos_penalps.data_classes import (
     ProcessStepProductionPlanEntry,
     StreamLoadEnergyData,
 )
+from ethos_penalps.load_profile_accumulator import (
+    LoadProfileGridAccumulator,
+    LoadProfileObjectTypes,
+)
 from ethos_penalps.post_processing.load_profile_entry_post_processor import (
     LoadProfileEntryPostProcessor,
 )
@@ -26,8 +30,10 @@ from ethos_penalps.stream import (
     ProcessStepProductionPlanEntryWithInputStreamState,
     StreamEnergyData,
 )
+from ethos_penalps.utilities.columnar_entry_list import ColumnarEntryList
 from ethos_penalps.utilities.data_base_interactions import DataBaseInteractions
 from ethos_penalps.utilities.exceptions_and_warnings import UnexpectedBehaviorWarning
+from ethos_penalps.utilities.identifiers import InterningTable
 from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
 from ethos_penalps.utilities.units import Units
 
@@ -151,6 +157,13 @@ class LoadProfileCollection:
     ] = field(default_factory=dict)
     # Summarizes all load types for which load profiles were created
     list_of_load_type: list[LoadType] = field(default_factory=list)
+    load_profile_grid_accumulator: LoadProfileGridAccumulator | None = None
+    """Adds the energy of each appended entry to a fixed time grid if it is provided."""
+    retain_load_profile_entries: bool = True
+    """Determines if the appended entries are stored. Should only be set to False
+    if a load_profile_grid_accumulator is provided, because the post processing
+    and the report require the entries.
+    """
 
     def append_stream_load_profile_entry(
         self,
@@ -166,6 +179,14 @@ class LoadProfileCollection:
             load_type (LoadType): The load type of the energy carrier that is used.
             load_profile_entry (LoadProfileEntry): The actual LoadProfileEntry to be added.
         """
+        if self.load_profile_grid_accumulator is not None:
+            self.load_profile_grid_accumulator.add_load_profile_entry(
+                object_type=LoadProfileObjectTypes.stream,
+                object_name=stream_name,
+                load_profile_entry=load_profile_entry,
+            )
+        if self.retain_load_profile_entries is False:
+            return
         if stream_name not in self.dict_stream_load_profile_collections:
             stream_load_profile_entry_collection = StreamLoadProfileEntryCollection(
                 object_name=stream_name
@@ -188,6 +209,14 @@ class LoadProfileCollection:
         load_type: LoadType,
         load_profile_entry: LoadProfileEntry,
     ):
+        if self.load_profile_grid_accumulator is not None:
+            self.load_profile_grid_accumulator.add_load_profile_entry(
+                object_type=LoadProfileObjectTypes.process_step,
+                object_name=process_step_name,
+                load_profile_entry=load_profile_entry,
+            )
+        if self.retain_load_profile_entries is False:
+            return
         if process_step_name not in self.dict_process_step_load_profile_collections:
             process_step_lp_collection = (
                 self.dict_process_step_load_profile_collections[process_step_name]
@@ -202,6 +231,107 @@ class LoadProfileCollection:
             load_type=load_type, load_profile_entry=load_profile_entry
         )
 
+    def append_load_profile_collection(
+        self, load_profile_collection: "LoadProfileCollection"
+    ):
+        """Appends all entries of another LoadProfileCollection. The entries
+        are appended in the order of the other collection so that the result
+        is the same as if the entries were added directly to this collection.
+
+        Args:
+            load_profile_collection (LoadProfileCollection): Collection whose
+                entries should be appended.
+        """
+        for (
+            stream_name,
+            stream_load_profile_collection,
+        ) in load_profile_collection.dict_stream_load_profile_collections.items():
+            for (
+                load_type_uuid,
+                list_of_load_profile_entries,
+            ) in stream_load_profile_collection.dict_of_load_entry_lists.items():
+                load_type = stream_load_profile_collection.load_type_dict[
+                    load_type_uuid
+                ]
+                for load_profile_entry in list_of_load_profile_entries:
+                    self.append_stream_load_profile_entry(
+                        stream_name=stream_name,
+                        load_type=load_type,
+                        load_profile_entry=load_profile_entry,
+                    )
+        for (
+            process_step_name,
+            process_step_load_profile_collection,
+        ) in load_profile_collection.dict_process_step_load_profile_collections.items():
+            for (
+                load_type_uuid,
+                list_of_load_profile_entries,
+            ) in process_step_load_profile_collection.dict_of_load_entry_lists.items():
+                load_type = process_step_load_profile_collection.load_type_dict[
+                    load_type_uuid
+                ]
+                for load_profile_entry in list_of_load_profile_entries:
+                    self.append_process_step_energy_data_entry(
+                        process_step_name=process_step_name,
+                        load_type=load_type,
+                        load_profile_entry=load_profile_entry,
+                    )
+
+    def get_list_of_columnar_load_entry_lists(
+        self, interning_table: InterningTable
+    ) -> list[tuple[str, str, ColumnarEntryList]]:
+        """Returns the lists of load profile entries of all streams and process
+        steps so that they can be spilled to files. Lists that are not a
+        ColumnarEntryList yet are replaced by a ColumnarEntryList with the
+        same entries, to which the following entries are appended.
+
+        Args:
+            interning_table (InterningTable): Table of the codes of the names
+                and units that is used by the new lists.
+
+        Returns:
+            list[tuple[str, str, ColumnarEntryList]]: Contains the category of
+                the object, a name that consists of the object name and load
+                type name and the list of entries for each list.
+        """
+        list_of_columnar_load_entry_lists = []
+        for category_name, dict_of_load_profile_entry_collections in (
+            ("stream_load_profiles", self.dict_stream_load_profile_collections),
+            (
+                "process_step_load_profiles",
+                self.dict_process_step_load_profile_collections,
+            ),
+        ):
+            for (
+                object_name,
+                load_profile_entry_collection,
+            ) in dict_of_load_profile_entry_collections.items():
+                dict_of_load_entry_lists = (
+                    load_profile_entry_collection.dict_of_load_entry_lists
+                )
+                for load_type_uuid, list_of_load_profile_entries in list(
+                    dict_of_load_entry_lists.items()
+                ):
+                    if not isinstance(list_of_load_profile_entries, ColumnarEntryList):
+                        list_of_load_profile_entries = ColumnarEntryList(
+                            list_of_load_profile_entries,
+                            interning_table=interning_table,
+                        )
+                        dict_of_load_entry_lists[load_type_uuid] = (
+                            list_of_load_profile_entries
+                        )
+                    load_type_name = load_profile_entry_collection.load_type_dict[
+                        load_type_uuid
+                    ].name
+                    list_of_columnar_load_entry_lists.append(
+                        (
+                            category_name,
+                            object_name + "_" + load_type_name,
+                            list_of_load_profile_entries,
+                        )
+                    )
+        return list_of_columnar_load_entry_lists
+
 
 @dataclass
 class ProcessStepEnergyDataHandler:
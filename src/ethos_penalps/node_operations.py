@@ -24,15 +24,17 @@ from ethos_penalps.stream import (
 from ethos_penalps.utilities.general_functions import get_new_uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeOperation(ABC):
-    """Base class for all other node operations."""
+    """Base class for all other node operations. The node operations are slotted
+    because a new node operation is created in each iteration of a chain.
+    """
 
     next_node_name: str | None
     starting_node_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class UpstreamNewProductionOrder(NodeOperation):
     """This order is passed in upstream direction and
     requests a new output stream from the target node.
@@ -50,7 +52,7 @@ class UpstreamNewProductionOrder(NodeOperation):
             raise Exception("Wrong data type")
 
 
-@dataclass
+@dataclass(slots=True)
 class UpstreamAdaptionOrder(NodeOperation):
     """This order is passed in upstream direction
     as a response to a previous input stream adaption request which is
@@ -75,7 +77,7 @@ class UpstreamAdaptionOrder(NodeOperation):
             raise Exception("Wrong data type")
 
 
-@dataclass
+@dataclass(slots=True)
 class DownstreamAdaptionOrder(NodeOperation):
     """The order is passed downstream and requests an adaption of the previously
     requests input stream of the target node. The adaption is either a shift to
@@ -90,7 +92,7 @@ class DownstreamAdaptionOrder(NodeOperation):
     operation_type: str = "Downstream adaption operation"
 
 
-@dataclass
+@dataclass(slots=True)
 class DownstreamValidationOrder(NodeOperation):
     """This order is passed downstream and validates that the previously
     requested input stream can be delivered as requested.
@@ -103,7 +105,7 @@ class DownstreamValidationOrder(NodeOperation):
     operation_type: str = "Downstream validation operation"
 
 
-@dataclass
+@dataclass(slots=True)
 class TerminateProduction(NodeOperation):
     """Indicates the simulation of a ProcessChain is completed
     and should be terminated.
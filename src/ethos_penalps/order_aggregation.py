@@ -0,0 +1,332 @@
+import dataclasses
+import datetime
+import math
+import numbers
+import sys
+
+import numpy
+import pandas
+
+from ethos_penalps.data_classes import Commodity
+from ethos_penalps.utilities.identifiers import get_new_identifier
+
+MICROSECONDS_PER_HOUR = 3_600_000_000
+NANOSECONDS_PER_MICROSECOND = 1000
+RELATIVE_TOLERANCE = 1e-09
+"""Corresponds to the default relative tolerance of math.isclose."""
+NUMBER_OF_SINGLE_COMPARISONS = 8
+
+
+def aggregate_orders_for_continuous_streams(
+    order_data_frame: pandas.DataFrame,
+    total_operation_rate_of_streams: numbers.Number,
+) -> pandas.DataFrame:
+    """Aggregates a set of orders in case there are only continuous streams
+    connected to the sink. The orders are sorted from the latest to the
+    earliest deadline. Consecutive orders are combined into an aggregated
+    order until the deadline of an order is before or at the start time of
+    the aggregated order. The start time of the aggregated order is the
+    deadline of its first order minus the durations of all of its orders at
+    the total operation rate. Each aggregated order has the deadline of its
+    first order and the commodity of its last order.
+
+    The durations and the cumulative start times are determined column wise
+    in integer nanoseconds, so that only the end of each aggregated order
+    is searched in a loop.
+
+    Args:
+        order_data_frame (pandas.DataFrame): DataFrame of orders that
+            should be aggregated.
+        total_operation_rate_of_streams (numbers.Number): The combined operation
+            rate of all continuous streams that are connected to the sink.
+
+    Returns:
+        pandas.DataFrame: Aggregated data frame of orders.
+    """
+    sorted_data_frame = order_data_frame.sort_values(
+        by="production_deadline", ascending=False
+    )
+    sorted_data_frame.reset_index(inplace=True, drop=True)
+    number_of_orders = sorted_data_frame.shape[0]
+    if number_of_orders == 0:
+        return pandas.DataFrame(data=[])
+    production_target_series = sorted_data_frame.loc[:, "production_target"]
+    durations = _convert_hours_to_integer_nanoseconds(
+        hours=(production_target_series / total_operation_rate_of_streams).to_numpy(
+            dtype=numpy.float64
+        )
+    )
+    deadline_series = sorted_data_frame.loc[:, "production_deadline"]
+    deadlines = pandas.to_datetime(deadline_series).to_numpy(dtype="datetime64[ns]")
+    deadlines = deadlines.view(numpy.int64)
+    # The deadlines are relative to the latest deadline to prevent an overflow
+    relative_deadlines = deadlines - deadlines[0]
+    cumulative_durations = numpy.cumsum(durations)
+    # An aggregated order which starts at index i ends at the first index j
+    # with: deadline[j] <= deadline[i] - (cumulative_duration[j]
+    # - cumulative_duration[i - 1]). Both sides are shifted by the cumulative
+    # duration at index j, so that only the right side depends on index i.
+    cumulative_deadlines = relative_deadlines + cumulative_durations
+    aggregated_order_start_times = relative_deadlines.copy()
+    aggregated_order_start_times[1:] += cumulative_durations[:-1]
+
+    list_of_cumulative_deadlines = cumulative_deadlines.tolist()
+    list_of_aggregated_order_start_times = aggregated_order_start_times.tolist()
+    list_of_production_targets = production_target_series.tolist()
+    list_of_first_indices = []
+    list_of_last_indices = []
+    list_of_aggregated_production_targets = []
+    first_index = 0
+    while first_index < number_of_orders:
+        # The end of the first order is not checked
+        last_index = _find_first_index_at_or_below(
+            array=cumulative_deadlines,
+            list_of_values=list_of_cumulative_deadlines,
+            threshold=list_of_aggregated_order_start_times[first_index],
+            start_index=max(first_index, 1),
+        )
+        if last_index is None:
+            last_index = number_of_orders - 1
+        aggregated_production_target = 0
+        for production_target in list_of_production_targets[
+            first_index : last_index + 1
+        ]:
+            aggregated_production_target = (
+                aggregated_production_target + production_target
+            )
+        list_of_first_indices.append(first_index)
+        list_of_last_indices.append(last_index)
+        list_of_aggregated_production_targets.append(aggregated_production_target)
+        first_index = last_index + 1
+
+    list_of_commodities = sorted_data_frame.loc[:, "commodity"].tolist()
+    return _create_aggregated_order_data_frame(
+        list_of_production_targets=list_of_aggregated_production_targets,
+        deadline_series=deadline_series.iloc[list_of_first_indices],
+        list_of_commodities=[
+            _convert_commodity(commodity=list_of_commodities[last_index])
+            for last_index in list_of_last_indices
+        ],
+    )
+
+
+def aggregate_orders_for_batch_streams(
+    order_data_frame: pandas.DataFrame,
+    order_target_mass: numbers.Number,
+    commodity: Commodity,
+) -> pandas.DataFrame:
+    """Aggregates a set of orders in case there are only batch streams
+    connected to the sink. The orders are sorted from the latest to the
+    earliest deadline and the cumulative production target is divided into
+    aggregated orders of the target mass. The last aggregated order contains
+    the remaining mass. Each aggregated order has the deadline of the input
+    order at which its cumulative mass is reached.
+
+    The input orders of all aggregated orders are determined at once by a
+    binary search on the suffix minimum of the cumulative production target.
+
+    Args:
+        order_data_frame (pandas.DataFrame): DataFrame of orders that
+            should be aggregated.
+        order_target_mass (numbers.Number): The mass of each aggregated order.
+        commodity (Commodity): Commodity of the aggregated orders.
+
+    Raises:
+        Exception: Is raised if an aggregated order without production
+            target would be created.
+
+    Returns:
+        pandas.DataFrame: Aggregated data frame of orders.
+    """
+    sorted_data_frame = order_data_frame.sort_values(
+        by="production_deadline", ascending=False
+    )
+    sorted_data_frame.reset_index(inplace=True, drop=True)
+    production_target_series = sorted_data_frame.loc[:, "production_target"]
+    total_sum = production_target_series.sum()
+    number_of_output_orders = math.ceil(total_sum / order_target_mass)
+    if number_of_output_orders <= 0:
+        return pandas.DataFrame(data=[])
+    number_of_orders = sorted_data_frame.shape[0]
+    cumulative_targets = production_target_series.cumsum().to_numpy()
+    output_order_numbers = numpy.arange(1, number_of_output_orders + 1)
+    lower_bounds = numpy.float64(order_target_mass) * (
+        output_order_numbers.astype(numpy.float64) - numpy.float64(1)
+    )
+    upper_bounds = numpy.float64(order_target_mass) * output_order_numbers.astype(
+        numpy.float64
+    )
+    # The last index whose cumulative target is smaller or equal to the upper
+    # bound is the last index whose suffix minimum is smaller or equal to it.
+    # The suffix minimum is sorted, even if the cumulative target is not.
+    suffix_minimum = numpy.minimum.accumulate(cumulative_targets[::-1])[::-1]
+    upper_indices = numpy.searchsorted(suffix_minimum, upper_bounds, side="right") - 1
+    upper_indices[upper_indices < 0] = number_of_orders - 1
+
+    cumulative_masses_at_upper_indices = cumulative_targets[upper_indices]
+    increase_upper_index = (
+        (cumulative_masses_at_upper_indices < upper_bounds)
+        & ~_are_close(cumulative_masses_at_upper_indices, upper_bounds)
+        & (upper_indices < number_of_orders - 1)
+    )
+    upper_indices[increase_upper_index] += 1
+
+    available_masses = cumulative_targets[upper_indices] - lower_bounds
+    use_available_mass = (available_masses < order_target_mass) & ~_are_close(
+        available_masses, numpy.float64(order_target_mass)
+    )
+    if use_available_mass.any():
+        production_targets = numpy.where(
+            use_available_mass, available_masses, order_target_mass
+        )
+    else:
+        production_targets = numpy.full(number_of_output_orders, order_target_mass)
+    if numpy.any(production_targets == 0):
+        raise Exception(
+            "An aggregated order without production target would be created for "
+            "the commodity: " + str(commodity)
+        )
+    converted_commodity = _convert_commodity(commodity=commodity)
+    return _create_aggregated_order_data_frame(
+        list_of_production_targets=production_targets,
+        deadline_series=sorted_data_frame.loc[:, "production_deadline"].iloc[
+            upper_indices
+        ],
+        list_of_commodities=[converted_commodity] * number_of_output_orders,
+    )
+
+
+def _convert_hours_to_integer_nanoseconds(hours: numpy.ndarray) -> numpy.ndarray:
+    """Converts durations in hours to integer nanoseconds with the
+    microsecond resolution of datetime.timedelta. The result is identical
+    to the multiplication of datetime.timedelta(hours=1) by each duration,
+    which rounds half to even to whole microseconds.
+
+    Args:
+        hours (numpy.ndarray): Durations in hours.
+
+    Returns:
+        numpy.ndarray: Durations in nanoseconds.
+    """
+    microseconds = hours * MICROSECONDS_PER_HOUR
+    rounded_microseconds = numpy.rint(microseconds)
+    # The floating point product may differ from the exact product by its
+    # rounding error, which may change the rounding to whole microseconds
+    # close to a half microsecond. These durations are converted exactly.
+    rounding_error_bound = numpy.abs(microseconds) * sys.float_info.epsilon + 1e-12
+    distance_to_half = numpy.abs(
+        numpy.abs(microseconds - numpy.trunc(microseconds)) - 0.5
+    )
+    is_ambiguous = (distance_to_half <= rounding_error_bound) | (
+        numpy.abs(microseconds) >= 2**52
+    )
+    for index in numpy.flatnonzero(is_ambiguous):
+        rounded_microseconds[index] = (
+            float(hours[index]) * datetime.timedelta(hours=1)
+        ) // datetime.timedelta(microseconds=1)
+    return rounded_microseconds.astype(numpy.int64) * NANOSECONDS_PER_MICROSECOND
+
+
+def _find_first_index_at_or_below(
+    array: numpy.ndarray,
+    list_of_values: list,
+    threshold: numbers.Number,
+    start_index: int,
+) -> int | None:
+    """Returns the first index at or after the start index whose value is
+    smaller or equal to the threshold. Most aggregated orders consist of a
+    few orders, so that the first values are compared one by one. The
+    remaining values are searched in windows of growing size, so that the
+    effort depends on the distance to the result.
+
+    Args:
+        array (numpy.ndarray): Array that is searched.
+        list_of_values (list): The values of the array as list.
+        threshold (numbers.Number): Largest value that is accepted.
+        start_index (int): First index that is checked.
+
+    Returns:
+        int | None: The first matching index or None if there is no match.
+    """
+    number_of_values = len(list_of_values)
+    stop_index = min(start_index + NUMBER_OF_SINGLE_COMPARISONS, number_of_values)
+    for index in range(start_index, stop_index):
+        if list_of_values[index] <= threshold:
+            return index
+    start_index = stop_index
+    window_size = 4 * NUMBER_OF_SINGLE_COMPARISONS
+    while start_index < number_of_values:
+        stop_index = min(start_index + window_size, number_of_values)
+        matching_indices = numpy.flatnonzero(array[start_index:stop_index] <= threshold)
+        if matching_indices.size > 0:
+            return start_index + int(matching_indices[0])
+        start_index = stop_index
+        window_size = window_size * 2
+    return None
+
+
+def _are_close(array_1: numpy.ndarray, array_2: numpy.ndarray) -> numpy.ndarray:
+    """Applies math.isclose with the default tolerances element wise.
+
+    Args:
+        array_1 (numpy.ndarray): First values.
+        array_2 (numpy.ndarray): Second values.
+
+    Returns:
+        numpy.ndarray: True for each pair of values that is close.
+    """
+    difference = numpy.abs(array_1 - array_2)
+    return (
+        (array_1 == array_2)
+        | (difference <= numpy.abs(RELATIVE_TOLERANCE * array_2))
+        | (difference <= numpy.abs(RELATIVE_TOLERANCE * array_1))
+    )
+
+
+def _convert_commodity(commodity: Commodity | dict) -> dict:
+    """Converts the commodity of an order like pandas.DataFrame does
+    when it is created from a list of ProductionOrder.
+
+    Args:
+        commodity (Commodity | dict): Commodity of an order.
+
+    Returns:
+        dict: The commodity as dictionary.
+    """
+    if dataclasses.is_dataclass(commodity):
+        return dataclasses.asdict(commodity)
+    return commodity
+
+
+def _create_aggregated_order_data_frame(
+    list_of_production_targets: list | numpy.ndarray,
+    deadline_series: pandas.Series,
+    list_of_commodities: list,
+) -> pandas.DataFrame:
+    """Creates the data frame of the aggregated orders with
+    the columns of the ProductionOrder.
+
+    Args:
+        list_of_production_targets (list | numpy.ndarray): Production
+            target of each aggregated order.
+        deadline_series (pandas.Series): Deadline of each aggregated order.
+        list_of_commodities (list): Commodity of each aggregated order.
+
+    Returns:
+        pandas.DataFrame: Aggregated data frame of orders.
+    """
+    number_of_output_orders = len(list_of_commodities)
+    return pandas.DataFrame(
+        data={
+            "production_target": list_of_production_targets,
+            "production_deadline": deadline_series.to_numpy(),
+            "order_number": numpy.arange(
+                1, number_of_output_orders + 1, dtype=numpy.int64
+            ),
+            "commodity": list_of_commodities,
+            "global_unique_identifier": [
+                get_new_identifier() for _ in range(number_of_output_orders)
+            ],
+            "produced_mass": numpy.zeros(number_of_output_orders, dtype=numpy.int64),
+        }
+    )
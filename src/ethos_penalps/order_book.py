@@ -0,0 +1,108 @@
+import numbers
+
+import numpy
+import pandas
+
+from ethos_penalps.data_classes import ProductionOrder
+
+PRODUCED_MASS_COLUMN_NAME = "produced_mass"
+
+
+class OrderBook:
+    """Stores a set of orders in parallel numpy arrays and lists, so that
+    the sink can read and update an order without row access to a data frame.
+    The production targets, deadlines in nanoseconds and produced masses are
+    stored in arrays. The data frame of the orders is only created on
+    demand, e.g. for reports. Additional columns of the data frame the
+    book has been created from are kept in the data frame of the book.
+    """
+
+    def __init__(self, order_data_frame: pandas.DataFrame) -> None:
+        """
+
+        Args:
+            order_data_frame (pandas.DataFrame): Orders with the columns of the
+                ProductionOrder. The rows are stored in their positional order.
+        """
+        self._order_data_frame: pandas.DataFrame = order_data_frame
+        """The orders without the updates of the produced mass."""
+        self.production_targets: numpy.ndarray = order_data_frame[
+            "production_target"
+        ].to_numpy()
+        self.production_deadlines: numpy.ndarray = (
+            pandas.to_datetime(order_data_frame["production_deadline"])
+            .to_numpy(dtype="datetime64[ns]")
+            .view(numpy.int64)
+        )
+        """Deadlines in nanoseconds since the epoch."""
+        self.order_numbers: numpy.ndarray = order_data_frame["order_number"].to_numpy()
+        self.global_unique_identifiers: numpy.ndarray = order_data_frame[
+            "global_unique_identifier"
+        ].to_numpy()
+        self.list_of_commodities: list = order_data_frame["commodity"].tolist()
+        self.produced_masses: numpy.ndarray = order_data_frame[
+            PRODUCED_MASS_COLUMN_NAME
+        ].to_numpy(dtype=numpy.float64, copy=True)
+
+    def __len__(self) -> int:
+        return len(self.production_targets)
+
+    def get_order(self, order_number: int) -> ProductionOrder:
+        """Returns the order at a position of the book.
+
+        Args:
+            order_number (int): Position of the order.
+
+        Returns:
+            ProductionOrder: Order with the current produced mass.
+        """
+        return ProductionOrder(
+            production_target=self.production_targets[order_number],
+            production_deadline=pandas.Timestamp(
+                self.production_deadlines[order_number]
+            ),
+            order_number=self.order_numbers[order_number],
+            commodity=self.list_of_commodities[order_number],
+            global_unique_identifier=self.global_unique_identifiers[order_number],
+            produced_mass=self.produced_masses[order_number],
+        )
+
+    def add_produced_mass(self, order_number: int, produced_mass: numbers.Number):
+        """Adds mass to the produced mass of an order.
+
+        Args:
+            order_number (int): Position of the order.
+            produced_mass (numbers.Number): Mass that has been produced
+                for the order.
+        """
+        self.produced_masses[order_number] = (
+            self.produced_masses[order_number] + produced_mass
+        )
+
+    def get_total_produced_mass(self) -> float:
+        """Returns the mass that has been produced for all orders.
+
+        Returns:
+            float: Sum of the produced masses.
+        """
+        return float(self.produced_masses.sum())
+
+    def copy(self) -> "OrderBook":
+        """Returns an independent copy of the book.
+
+        Returns:
+            OrderBook: Book with the same orders and produced masses.
+        """
+        order_book = OrderBook(order_data_frame=self._order_data_frame)
+        order_book.produced_masses[:] = self.produced_masses
+        return order_book
+
+    def to_data_frame(self) -> pandas.DataFrame:
+        """Creates a data frame of the orders with the current produced masses.
+
+        Returns:
+            pandas.DataFrame: One row for each order.
+        """
+        order_data_frame = self._order_data_frame.copy()
+        order_data_frame[PRODUCED_MASS_COLUMN_NAME] = self.produced_masses.copy()
+        return order_data_frame
@@ -0,0 +1,237 @@
+import datetime
+import numbers
+from dataclasses import dataclass
+
+import numpy
+import pandas
+
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+from ethos_penalps.utilities.identifiers import get_new_identifier
+
+
+@dataclass
+class OrderCoalescingOptions:
+    """Determines which consecutive orders are merged. Each merged order has
+    the earliest deadline of its orders, so that the production of the later
+    orders is moved forward. The mass for an output stream of a storage is
+    therefore never due after the stream starts and the storage level can
+    only increase. At least one of the limits must be provided.
+    """
+
+    deadline_tolerance: datetime.timedelta | None = None
+    """Maximum time between the earliest and the latest deadline of the
+    orders of a merged order. The deadlines are not limited if None."""
+    maximum_merged_mass: numbers.Number | None = None
+    """Maximum production target of a merged order. Orders whose production
+    target exceeds the maximum are not merged. The mass is not limited
+    if None."""
+    time_bucket: datetime.timedelta | None = None
+    """Duration of the periods of a grid that starts at the Unix epoch, so
+    that daily periods start at midnight. Only orders whose deadlines are
+    in the same period are merged. The periods are not limited if None."""
+    maximum_storage_level_increase: numbers.Number | None = None
+    """Maximum mass that is delivered before it is due, which is the
+    production target of all but the first order of a merged order. Limits
+    the increase of the storage level that receives the merged orders. The
+    increase is not limited if None."""
+
+    def __post_init__(self):
+        """Checks the limits of the coalescing."""
+        if (
+            self.deadline_tolerance is None
+            and self.maximum_merged_mass is None
+            and self.time_bucket is None
+            and self.maximum_storage_level_increase is None
+        ):
+            raise MisconfigurationError(
+                "Either a deadline tolerance, a maximum merged mass, a time bucket "
+                "or a maximum storage level increase is required for the "
+                "coalescing of orders"
+            )
+        if (
+            self.deadline_tolerance is not None
+            and self.deadline_tolerance < datetime.timedelta(0)
+        ):
+            raise MisconfigurationError(
+                "The deadline tolerance of the order coalescing must not be negative: "
+                + str(self.deadline_tolerance)
+            )
+        if self.maximum_merged_mass is not None and self.maximum_merged_mass <= 0:
+            raise MisconfigurationError(
+                "The maximum merged mass of the order coalescing must be positive: "
+                + str(self.maximum_merged_mass)
+            )
+        if self.time_bucket is not None and self.time_bucket <= datetime.timedelta(0):
+            raise MisconfigurationError(
+                "The time bucket of the order coalescing must be positive: "
+                + str(self.time_bucket)
+            )
+        if (
+            self.maximum_storage_level_increase is not None
+            and self.maximum_storage_level_increase < 0
+        ):
+            raise MisconfigurationError(
+                "The maximum storage level increase of the order coalescing must "
+                "not be negative: " + str(self.maximum_storage_level_increase)
+            )
+
+
+@dataclass
+class OrderCoalescingReport:
+    """Describes the loss of temporal fidelity due to the coalescing of orders.
+    The deadline deviation of an order is the time by which its merged order
+    is due earlier than the order itself. The production and the load
+    profiles of the order are moved forward by up to this deviation.
+    """
+
+    number_of_orders: int
+    number_of_coalesced_orders: int
+    maximum_deadline_deviation: datetime.timedelta
+    mass_weighted_mean_deadline_deviation: datetime.timedelta
+    """Mean deadline deviation of the orders weighted by their production
+    target. Corresponds to the mean shift of the load profiles."""
+    shifted_mass: float
+    """Sum of the production targets of all orders whose deadline changed."""
+
+
+def coalesce_orders(
+    order_data_frame: pandas.DataFrame,
+    order_coalescing_options: OrderCoalescingOptions,
+) -> tuple[pandas.DataFrame, OrderCoalescingReport]:
+    """Merges consecutive orders within the limits of the options. The orders
+    are sorted from the earliest to the latest deadline and a merged order
+    starts with the earliest order which has not been merged yet. The end
+    of each merged order is the nearest end allowed by all limits, which is
+    determined by a binary search on the deadlines and the cumulative
+    production targets.
+
+    Args:
+        order_data_frame (pandas.DataFrame): Orders with the columns of the
+            ProductionOrder.
+        order_coalescing_options (OrderCoalescingOptions): Limits of
+            the merged orders.
+
+    Returns:
+        tuple[pandas.DataFrame, OrderCoalescingReport]: The merged orders
+            from the earliest to the latest deadline and the deviation
+            of the deadlines.
+    """
+    number_of_orders = order_data_frame.shape[0]
+    if number_of_orders == 0:
+        return order_data_frame.copy(), OrderCoalescingReport(
+            number_of_orders=0,
+            number_of_coalesced_orders=0,
+            maximum_deadline_deviation=datetime.timedelta(0),
+            mass_weighted_mean_deadline_deviation=datetime.timedelta(0),
+            shifted_mass=0.0,
+        )
+    sorted_data_frame = order_data_frame.sort_values(
+        by="production_deadline", kind="stable"
+    )
+    sorted_data_frame.reset_index(inplace=True, drop=True)
+    deadlines = (
+        pandas.to_datetime(sorted_data_frame.loc[:, "production_deadline"])
+        .to_numpy(dtype="datetime64[ns]")
+        .view(numpy.int64)
+    )
+    production_targets = sorted_data_frame.loc[:, "production_target"].to_numpy(
+        dtype=numpy.float64
+    )
+    cumulative_targets = numpy.concatenate(([0.0], numpy.cumsum(production_targets)))
+
+    list_of_first_indices = []
+    first_index = 0
+    while first_index < number_of_orders:
+        stop_index = number_of_orders
+        if order_coalescing_options.deadline_tolerance is not None:
+            latest_deadline = (
+                deadlines[first_index]
+                + pandas.Timedelta(order_coalescing_options.deadline_tolerance).value
+            )
+            stop_index = min(
+                stop_index,
+                int(numpy.searchsorted(deadlines, latest_deadline, side="right")),
+            )
+        if order_coalescing_options.maximum_merged_mass is not None:
+            maximum_cumulative_target = (
+                cumulative_targets[first_index]
+                + order_coalescing_options.maximum_merged_mass
+            )
+            stop_index = min(
+                stop_index,
+                int(
+                    numpy.searchsorted(
+                        cumulative_targets, maximum_cumulative_target, side="right"
+                    )
+                )
+                - 1,
+            )
+        if order_coalescing_options.time_bucket is not None:
+            time_bucket = pandas.Timedelta(order_coalescing_options.time_bucket).value
+            end_of_time_bucket = (
+                deadlines[first_index] // time_bucket + 1
+            ) * time_bucket
+            stop_index = min(
+                stop_index,
+                int(numpy.searchsorted(deadlines, end_of_time_bucket, side="left")),
+            )
+        if (
+            order_coalescing_options.maximum_storage_level_increase is not None
+            and first_index + 1 < number_of_orders
+        ):
+            maximum_cumulative_target = (
+                cumulative_targets[first_index + 1]
+                + order_coalescing_options.maximum_storage_level_increase
+            )
+            stop_index = min(
+                stop_index,
+                int(
+                    numpy.searchsorted(
+                        cumulative_targets, maximum_cumulative_target, side="right"
+                    )
+                )
+                - 1,
+            )
+        # Each merged order contains at least one order
+        stop_index = max(stop_index, first_index + 1)
+        list_of_first_indices.append(first_index)
+        first_index = stop_index
+
+    first_indices = numpy.array(list_of_first_indices, dtype=numpy.int64)
+    number_of_coalesced_orders = len(first_indices)
+    merged_order_numbers = numpy.repeat(
+        numpy.arange(number_of_coalesced_orders),
+        numpy.diff(numpy.append(first_indices, number_of_orders)),
+    )
+    coalesced_data_frame = sorted_data_frame.iloc[first_indices].copy()
+    coalesced_data_frame.reset_index(inplace=True, drop=True)
+    coalesced_data_frame["production_target"] = numpy.add.reduceat(
+        production_targets, first_indices
+    )
+    coalesced_data_frame["produced_mass"] = numpy.add.reduceat(
+        sorted_data_frame.loc[:, "produced_mass"].to_numpy(), first_indices
+    )
+    coalesced_data_frame["global_unique_identifier"] = [
+        get_new_identifier() for _ in range(number_of_coalesced_orders)
+    ]
+
+    deadline_deviations = deadlines - deadlines[first_indices][merged_order_numbers]
+    total_target = production_targets.sum()
+    if total_target > 0:
+        mass_weighted_mean_deadline_deviation = float(
+            (deadline_deviations * production_targets).sum() / total_target
+        )
+    else:
+        mass_weighted_mean_deadline_deviation = 0.0
+    order_coalescing_report = OrderCoalescingReport(
+        number_of_orders=number_of_orders,
+        number_of_coalesced_orders=number_of_coalesced_orders,
+        maximum_deadline_deviation=pandas.Timedelta(
+            int(deadline_deviations.max()), unit="ns"
+        ).to_pytimedelta(),
+        mass_weighted_mean_deadline_deviation=pandas.Timedelta(
+            round(mass_weighted_mean_deadline_deviation), unit="ns"
+        ).to_pytimedelta(),
+        shifted_mass=float(production_targets[deadline_deviations > 0].sum()),
+    )
+    return coalesced_data_frame, order_coalescing_report
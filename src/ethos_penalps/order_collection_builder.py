@@ -0,0 +1,327 @@
+import dataclasses
+import datetime
+import numbers
+from collections.abc import Iterable, Sequence
+
+import numpy
+import pandas
+
+from ethos_penalps.data_classes import Commodity, OrderCollection
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+from ethos_penalps.utilities.identifiers import get_block_of_new_identifiers
+
+
+class OrderCollectionBuilder:
+    """Creates OrderCollections of a commodity from arrays, time series,
+    shift calendars and files. The columns of the order data frame are
+    built directly, so that no ProductionOrder objects are created. The
+    data frame has the same columns as a data frame that is created from
+    a list of ProductionOrder.
+    """
+
+    def __init__(self, commodity: Commodity) -> None:
+        """
+
+        Args:
+            commodity (Commodity): Commodity of all orders. It must be the
+                commodity of the sink that receives the orders.
+        """
+        self.commodity: Commodity = commodity
+
+    def create_order_data_frame(
+        self,
+        production_targets: Sequence[numbers.Number] | numpy.ndarray,
+        production_deadlines: Sequence[datetime.datetime] | numpy.ndarray,
+    ) -> pandas.DataFrame:
+        """Creates the data frame of the orders from their production
+        targets and deadlines. The orders are numbered in the given order.
+
+        Args:
+            production_targets (Sequence[numbers.Number] | numpy.ndarray): Mass
+                that is required by each order.
+            production_deadlines (Sequence[datetime.datetime] | numpy.ndarray): Deadline
+                of each order.
+
+        Raises:
+            MisconfigurationError: Is raised if the number of production targets
+                and deadlines differ.
+
+        Returns:
+            pandas.DataFrame: Orders with the columns of the ProductionOrder.
+        """
+        production_targets = numpy.asarray(production_targets)
+        production_deadlines = pandas.to_datetime(production_deadlines)
+        number_of_orders = len(production_targets)
+        if len(production_deadlines) != number_of_orders:
+            raise MisconfigurationError(
+                "The number of production targets: "
+                + str(number_of_orders)
+                + " does not match the number of production deadlines: "
+                + str(len(production_deadlines))
+            )
+        # Corresponds to the conversion of the commodity by pandas if the
+        # data frame is created from a list of ProductionOrder
+        commodity_dict = dataclasses.asdict(self.commodity)
+        return pandas.DataFrame(
+            data={
+                "production_target": production_targets,
+                "production_deadline": production_deadlines,
+                "order_number": numpy.arange(number_of_orders, dtype=numpy.int64),
+                "commodity": [commodity_dict] * number_of_orders,
+                "global_unique_identifier": get_block_of_new_identifiers(
+                    number_of_identifiers=number_of_orders
+                ),
+                "produced_mass": numpy.zeros(number_of_orders, dtype=numpy.int64),
+            }
+        )
+
+    def create_order_collection(
+        self,
+        production_targets: Sequence[numbers.Number] | numpy.ndarray,
+        production_deadlines: Sequence[datetime.datetime] | numpy.ndarray,
+        target_mass: numbers.Number | None = None,
+    ) -> OrderCollection:
+        """Creates an OrderCollection from the production targets and
+        deadlines of the orders.
+
+        Args:
+            production_targets (Sequence[numbers.Number] | numpy.ndarray): Mass
+                that is required by each order.
+            production_deadlines (Sequence[datetime.datetime] | numpy.ndarray): Deadline
+                of each order.
+            target_mass (numbers.Number | None, optional): Total mass of all orders.
+                Is determined from the production targets if None is provided.
+                Defaults to None.
+
+        Returns:
+            OrderCollection: Contains the orders.
+        """
+        order_data_frame = self.create_order_data_frame(
+            production_targets=production_targets,
+            production_deadlines=production_deadlines,
+        )
+        if target_mass is None:
+            target_mass = float(order_data_frame.loc[:, "production_target"].sum())
+        return OrderCollection(
+            target_mass=target_mass,
+            commodity=self.commodity,
+            order_data_frame=order_data_frame,
+        )
+
+    def create_order_collection_from_deadline_series(
+        self, deadline_series: pandas.Series
+    ) -> OrderCollection:
+        """Creates an order for each entry of a time series of demands.
+        Entries without a positive demand are skipped.
+
+        Args:
+            deadline_series (pandas.Series): The index contains the deadlines
+                and the values contain the production targets.
+
+        Returns:
+            OrderCollection: Contains an order for each positive demand.
+        """
+        production_targets = deadline_series.to_numpy()
+        has_demand = production_targets > 0
+        return self.create_order_collection(
+            production_targets=production_targets[has_demand],
+            production_deadlines=pandas.DatetimeIndex(deadline_series.index)[
+                has_demand
+            ],
+        )
+
+    def create_order_collection_from_shift_calendar(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        mass_per_shift: numbers.Number,
+        shift_length: datetime.timedelta,
+        number_of_shifts_per_day: int,
+        first_shift_start_time: datetime.time,
+        weekend_work: bool = True,
+        list_of_holidays: Iterable[datetime.date] = (),
+    ) -> OrderCollection:
+        """Creates an order for each shift of the working days between the
+        start and the end date. The shifts of a day follow each other from
+        the first shift start time on. Each order is due at the end of its
+        shift.
+
+        Args:
+            start_date (datetime.date): First day of the calendar.
+            end_date (datetime.date): Last day of the calendar.
+            mass_per_shift (numbers.Number): Mass that is required in each shift.
+            shift_length (datetime.timedelta): Duration of each shift.
+            number_of_shifts_per_day (int): Number of shifts on each working day.
+            first_shift_start_time (datetime.time): Start of the first shift
+                of each working day.
+            weekend_work (bool, optional): Determines if Saturdays and Sundays are
+                working days. Defaults to True.
+            list_of_holidays (Iterable[datetime.date], optional): Days without
+                shifts, e.g. national holidays from workalendar. Defaults to ().
+
+        Raises:
+            MisconfigurationError: Is raised if there are no shifts in
+                the calendar.
+
+        Returns:
+            OrderCollection: Contains an order for each shift.
+        """
+        if number_of_shifts_per_day < 1 or shift_length <= datetime.timedelta(0):
+            raise MisconfigurationError(
+                "The shift calendar requires at least one shift per day and a "
+                "positive shift length. Number of shifts per day: "
+                + str(number_of_shifts_per_day)
+                + " Shift length: "
+                + str(shift_length)
+            )
+        working_days = pandas.date_range(start=start_date, end=end_date, freq="D")
+        if weekend_work is False:
+            working_days = working_days[working_days.dayofweek < 5]
+        working_days = working_days[
+            ~working_days.isin(pandas.DatetimeIndex(list(list_of_holidays)))
+        ]
+        first_shift_offset = pandas.Timedelta(
+            hours=first_shift_start_time.hour,
+            minutes=first_shift_start_time.minute,
+            seconds=first_shift_start_time.second,
+            microseconds=first_shift_start_time.microsecond,
+        )
+        shift_end_offsets = first_shift_offset.value + pandas.Timedelta(
+            shift_length
+        ).value * numpy.arange(1, number_of_shifts_per_day + 1, dtype=numpy.int64)
+        production_deadlines = (
+            working_days.to_numpy(dtype="datetime64[ns]").view(numpy.int64)[:, None]
+            + shift_end_offsets[None, :]
+        ).ravel()
+        if len(production_deadlines) == 0:
+            raise MisconfigurationError(
+                "There are no working days between: "
+                + str(start_date)
+                + " and: "
+                + str(end_date)
+            )
+        return self.create_order_collection(
+            production_targets=numpy.full(len(production_deadlines), mass_per_shift),
+            production_deadlines=production_deadlines.view("datetime64[ns]"),
+        )
+
+    def read_order_collection_from_csv(
+        self,
+        file_path: str,
+        chunk_size: int = 100_000,
+        production_deadline_column_name: str = "production_deadline",
+        production_target_column_name: str = "production_target",
+    ) -> OrderCollection:
+        """Reads the deadlines and production targets of the orders from a
+        CSV file in chunks of rows. Only the two columns of each chunk are kept,
+        so that large files can be read with little memory.
+
+        Args:
+            file_path (str): Path of the CSV file.
+            chunk_size (int, optional): Number of rows that are read at once.
+                Defaults to 100_000.
+            production_deadline_column_name (str, optional): Column that contains
+                the deadlines. Defaults to "production_deadline".
+            production_target_column_name (str, optional): Column that contains
+                the production targets. Defaults to "production_target".
+
+        Returns:
+            OrderCollection: Contains an order for each row of the file.
+        """
+        list_of_chunks = pandas.read_csv(
+            file_path,
+            usecols=[production_deadline_column_name, production_target_column_name],
+            chunksize=chunk_size,
+        )
+        return self._create_order_collection_from_chunks(
+            list_of_chunks=list_of_chunks,
+            production_deadline_column_name=production_deadline_column_name,
+            production_target_column_name=production_target_column_name,
+        )
+
+    def read_order_collection_from_parquet(
+        self,
+        file_path: str,
+        chunk_size: int = 100_000,
+        production_deadline_column_name: str = "production_deadline",
+        production_target_column_name: str = "production_target",
+    ) -> OrderCollection:
+        """Reads the deadlines and production targets of the orders from a
+        Parquet file in batches of rows. Requires the optional dependency pyarrow.
+
+        Args:
+            file_path (str): Path of the Parquet file.
+            chunk_size (int, optional): Number of rows that are read at once.
+                Defaults to 100_000.
+            production_deadline_column_name (str, optional): Column that contains
+                the deadlines. Defaults to "production_deadline".
+            production_target_column_name (str, optional): Column that contains
+                the production targets. Defaults to "production_target".
+
+        Raises:
+            MisconfigurationError: Is raised if pyarrow is not installed.
+
+        Returns:
+            OrderCollection: Contains an order for each row of the file.
+        """
+        try:
+            import pyarrow.parquet
+        except ImportError as import_error:
+            raise MisconfigurationError(
+                "Reading orders from Parquet files requires the package pyarrow"
+            ) from import_error
+        parquet_file = pyarrow.parquet.ParquetFile(file_path)
+        list_of_chunks = (
+            record_batch.to_pandas()
+            for record_batch in parquet_file.iter_batches(
+                batch_size=chunk_size,
+                columns=[
+                    production_deadline_column_name,
+                    production_target_column_name,
+                ],
+            )
+        )
+        return self._create_order_collection_from_chunks(
+            list_of_chunks=list_of_chunks,
+            production_deadline_column_name=production_deadline_column_name,
+            production_target_column_name=production_target_column_name,
+        )
+
+    def _create_order_collection_from_chunks(
+        self,
+        list_of_chunks: Iterable[pandas.DataFrame],
+        production_deadline_column_name: str,
+        production_target_column_name: str,
+    ) -> OrderCollection:
+        """Combines the columns of the chunks of a file into an OrderCollection.
+
+        Args:
+            list_of_chunks (Iterable[pandas.DataFrame]): Consecutive rows of the file.
+            production_deadline_column_name (str): Column that contains
+                the deadlines.
+            production_target_column_name (str): Column that contains
+                the production targets.
+
+        Returns:
+            OrderCollection: Contains an order for each row of the chunks.
+        """
+        list_of_production_targets = []
+        list_of_production_deadlines = []
+        for chunk in list_of_chunks:
+            list_of_production_targets.append(
+                chunk.loc[:, production_target_column_name].to_numpy(
+                    dtype=numpy.float64
+                )
+            )
+            list_of_production_deadlines.append(
+                pandas.to_datetime(
+                    chunk.loc[:, production_deadline_column_name]
+                ).to_numpy(dtype="datetime64[ns]")
+            )
+        if not list_of_production_targets:
+            list_of_production_targets.append(numpy.zeros(0, dtype=numpy.float64))
+            list_of_production_deadlines.append(numpy.zeros(0, dtype="datetime64[ns]"))
+        return self.create_order_collection(
+            production_targets=numpy.concatenate(list_of_production_targets),
+            production_deadlines=numpy.concatenate(list_of_production_deadlines),
+        )
@@ -4,7 +4,7 @@ import numpy as np
 import pandas
 
 from ethos_penalps.data_classes import Commodity, OrderCollection
-from ethos_penalps.node_operations import ProductionOrder
+from ethos_penalps.order_collection_builder import OrderCollectionBuilder
 from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
 
 logger = PeNALPSLogger.get_logger_without_handler()
@@ -387,30 +387,26 @@ class NOrderGenerator:
         self,
     ) -> OrderCollection:
         """Creates an order collection based on the attributes of this
-        class.
+        class. The columns of the orders are created at once by the
+        OrderCollectionBuilder.
 
         Returns:
             OrderCollection: Contains all orders that should be fulfilled during
                 the simulation.
         """
-        output_order_dict = {}
-        number_of_orders = self.number_of_orders
-        mass_per_order = self.mass_per_order
-
-        current_deadline = self.production_deadline
-        for order_number in range(number_of_orders):
-            output_order_dict[order_number] = ProductionOrder(
-                production_target=mass_per_order,
-                production_deadline=current_deadline,
-                order_number=order_number,
-                commodity=self.commodity,
-            )
-            current_deadline = current_deadline - self.time_span_between_order
-        order_data_frame = pandas.DataFrame(data=list(output_order_dict.values()))
-        order_collection = OrderCollection(
+        time_span_between_order = pandas.Timedelta(self.time_span_between_order)
+        production_deadlines = pandas.Timestamp(
+            self.production_deadline
+        ) - pandas.to_timedelta(
+            time_span_between_order.value
+            * np.arange(self.number_of_orders, dtype=np.int64),
+            unit="ns",
+        )
+        order_collection_builder = OrderCollectionBuilder(commodity=self.commodity)
+        order_collection = order_collection_builder.create_order_collection(
+            production_targets=np.full(self.number_of_orders, self.mass_per_order),
+            production_deadlines=production_deadlines,
             target_mass=self.target_mass,
-            commodity=self.commodity,
-            order_data_frame=order_data_frame,
         )
 
         return order_collection
@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING
+
+from ethos_penalps.node_operations import NodeOperation, TerminateProduction
+from ethos_penalps.process_nodes.process_node import ProcessNode
+
+if TYPE_CHECKING:
+    from ethos_penalps.organizational_agents.process_chain import ProcessChain
+
+
+class CompiledChainExecutionPlan:
+    """Is created once per ProcessChain before the node operations are passed
+    between the nodes. The nodes of the chain are mapped to integer ids in
+    advance, so that the loop in ProcessChain.process_node_operations does not
+    look up the nodes through the ProcessChain in each iteration. The results
+    are identical to the lookup by ProcessChain.get_node_from_node_operation.
+    """
+
+    def __init__(self, process_chain: "ProcessChain") -> None:
+        """
+
+        Args:
+            process_chain (ProcessChain): The chain that should be simulated.
+                All nodes and streams must be added before.
+        """
+        self.process_chain: "ProcessChain" = process_chain
+        self.list_of_nodes: list[ProcessNode] = []
+        self.dict_of_node_ids: dict[str, int] = {}
+        for node_id, (node_name, process_node) in enumerate(
+            process_chain.process_node_dict.items()
+        ):
+            self.list_of_nodes.append(process_node)
+            self.dict_of_node_ids[node_name] = node_id
+
+    def get_next_node_id(self, node_operation: NodeOperation) -> int | None:
+        """Returns the id of the node that receives the node operation.
+
+        Args:
+            node_operation (NodeOperation): The operation that is passed
+                to the next node.
+
+        Returns:
+            int | None: Id of the next node or None if the production
+                of the chain is terminated.
+        """
+        if isinstance(node_operation, TerminateProduction):
+            return None
+        try:
+            return self.dict_of_node_ids[node_operation.next_node_name]
+        except (KeyError, TypeError) as exc:
+            raise Exception(
+                "Unexpected next node name: "
+                + str(node_operation.next_node_name)
+                + " of node operation: "
+                + str(node_operation)
+            ) from exc
+
+    def get_next_node(self, node_operation: NodeOperation) -> ProcessNode | None:
+        """Returns the node that receives the node operation.
+
+        Args:
+            node_operation (NodeOperation): The operation that is passed
+                to the next node.
+
+        Returns:
+            ProcessNode | None: The next node or None if the production
+                of the chain is terminated.
+        """
+        next_node_id = self.get_next_node_id(node_operation=node_operation)
+        if next_node_id is None:
+            return None
+        return self.list_of_nodes[next_node_id]
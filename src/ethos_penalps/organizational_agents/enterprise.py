@@ -1,11 +1,34 @@
 import datetime
+import functools
 import numbers
+from collections.abc import Callable, Iterator
 
 import cloudpickle
 
+from ethos_penalps.data_classes import LoopCounter
+from ethos_penalps.load_profile_accumulator import LoadProfileGridAccumulator
 from ethos_penalps.load_profile_calculator import LoadProfileHandlerSimulation
+from ethos_penalps.order_coalescing import (
+    OrderCoalescingOptions,
+    OrderCoalescingReport,
+)
 from ethos_penalps.organizational_agents.network_level import NetworkLevel
+from ethos_penalps.organizational_agents.parallel_network_level_simulation import (
+    ParallelNetworkLevelSimulator,
+)
+from ethos_penalps.organizational_agents.process_chain_replication import (
+    ProcessChainReplicator,
+)
+from ethos_penalps.organizational_agents.simulation_checkpoint import (
+    SimulationCheckpoint,
+    SimulationCheckpointWriter,
+    load_simulation_checkpoint,
+)
 from ethos_penalps.organizational_agents.process_chain import ProcessChain
+from ethos_penalps.organizational_agents.simulation_progress import (
+    SimulationProgress,
+    SimulationProgressReporter,
+)
 from ethos_penalps.post_processing.post_processed_data_handler import (
     PostProcessSimulationDataHandler,
 )
@@ -23,9 +46,16 @@ from ethos_penalps.process_nodes.source import Source
 from ethos_penalps.production_plan import ProductionPlan
 from ethos_penalps.stream_handler import StreamHandler
 from ethos_penalps.time_data import TimeData
-from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+from ethos_penalps.utilities.debugging_information import NodeOperationTraceModes
+from ethos_penalps.utilities.exceptions_and_warnings import (
+    MisconfigurationError,
+    SimulationAbortedError,
+)
 from ethos_penalps.utilities.general_functions import ResultPathGenerator
+from ethos_penalps.utilities.identifiers import IdentifierCounter
 from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
+from ethos_penalps.utilities.simulation_profiler import SimulationProfiler
+from ethos_penalps.utilities.validation import check_validation_level
 
 logger = PeNALPSLogger.get_logger_without_handler()
 
@@ -76,37 +106,234 @@ class Enterprise:
             stream_state_dict={},
         )
         self.name: str = name
+        self.simulation_profiler: SimulationProfiler | None = None
+        self.simulation_checkpoint_writer: SimulationCheckpointWriter | None = None
+        self.simulation_progress_reporter: SimulationProgressReporter | None = None
 
     def start_simulation(
-        self, number_of_iterations_in_chain: numbers.Number | None = None
+        self,
+        number_of_iterations_in_chain: numbers.Number | None = None,
+        number_of_parallel_processes: int = 1,
+        replicate_identical_process_chains: bool = False,
     ):
         """Start the simulation after the enterprise model has been fully defined.
 
         Args:
             number_of_iterations_in_chain (numbers.Number | None, optional): Can set a maximum number of internal
                 simulation iterations. This can be useful to stop ill defined simulations. Defaults to None.
+            number_of_parallel_processes (int, optional): If larger than one the ProcessChains of
+                each NetworkLevel are simulated in worker processes. The NetworkLevel themselves are still
+                simulated sequentially because each level depends on the results of the previous one.
+                The results are identical to a sequential simulation. Defaults to 1.
+            replicate_identical_process_chains (bool, optional): If True, structurally identical
+                ProcessChains of a NetworkLevel, which receive the same splitted orders, are only
+                simulated once. The results of the first chain are copied to the identical chains
+                with their node and stream names replaced. Defaults to False.
         """
+        if number_of_parallel_processes < 1:
+            raise MisconfigurationError(
+                "The number of parallel processes must be at least 1 but is: "
+                + str(number_of_parallel_processes)
+            )
+        if (
+            self.simulation_checkpoint_writer is not None
+            and number_of_parallel_processes > 1
+        ):
+            raise MisconfigurationError(
+                "Checkpoints can only be written in a sequential simulation"
+            )
+        if (
+            self.simulation_progress_reporter is not None
+            and number_of_parallel_processes > 1
+        ):
+            raise MisconfigurationError(
+                "The progress can only be reported in a sequential simulation"
+            )
         self._prepare_process_chains_for_simulation()
+        self._simulate_network_levels(
+            number_of_iterations_in_chain=number_of_iterations_in_chain,
+            number_of_parallel_processes=number_of_parallel_processes,
+            replicate_identical_process_chains=replicate_identical_process_chains,
+        )
+
+    def resume_simulation_from_checkpoint(
+        self,
+        simulation_checkpoint: SimulationCheckpoint,
+    ):
+        """Continues a simulation from a checkpoint of this enterprise. The NetworkLevel
+        and ProcessChains that have been completed before the checkpoint are skipped.
+        Further checkpoints are written by the SimulationCheckpointWriter of
+        the enterprise. Node operations that have been appended to trace files
+        after the checkpoint are removed from the files.
+
+        Args:
+            simulation_checkpoint (SimulationCheckpoint): The checkpoint which contains
+                this enterprise.
+        """
+        if simulation_checkpoint.enterprise is not self:
+            raise MisconfigurationError(
+                "The checkpoint does not belong to the enterprise: " + self.name
+            )
+        LoopCounter.loop_number = simulation_checkpoint.loop_number
+        IdentifierCounter.continue_after(
+            next_identifier=simulation_checkpoint.next_identifier
+        )
+        if self.simulation_checkpoint_writer is not None:
+            self.simulation_checkpoint_writer.reset_checkpoint_interval()
         for network_level in self.list_of_network_level:
-            main_sink = network_level.get_main_sink()
-            main_sink.initialize_sink()
             for process_chain in network_level.list_of_process_chains:
-                try:
-                    main_sink.prepare_sink_for_next_chain(
-                        process_chain_identifier=process_chain.process_chain_identifier
-                    )
-                    main_source = network_level.get_main_source()
-                    main_source.prepare_source_for_next_chain(
-                        process_chain_identifier=process_chain.process_chain_identifier
-                    )
-                    process_chain.create_process_chain_production_plan(
-                        max_number_of_iterations=number_of_iterations_in_chain
+                process_chain.debugging_information_logger.truncate_trace_file()
+        self._simulate_network_levels(
+            number_of_iterations_in_chain=simulation_checkpoint.number_of_iterations_in_chain,
+            replicate_identical_process_chains=simulation_checkpoint.replicate_identical_process_chains,
+            simulation_checkpoint=simulation_checkpoint,
+        )
+
+    def _simulate_network_levels(
+        self,
+        number_of_iterations_in_chain: numbers.Number | None = None,
+        number_of_parallel_processes: int = 1,
+        replicate_identical_process_chains: bool = False,
+        simulation_checkpoint: SimulationCheckpoint | None = None,
+    ):
+        """Simulates the NetworkLevel sequentially. If a checkpoint is provided
+        the simulation starts at the position of the checkpoint.
+
+        Args:
+            number_of_iterations_in_chain (numbers.Number | None, optional): Maximum number
+                of iterations in each chain. Defaults to None.
+            number_of_parallel_processes (int, optional): Number of worker processes
+                for the chains of each NetworkLevel. Defaults to 1.
+            replicate_identical_process_chains (bool, optional): Defines if identical
+                chains are replicated. Defaults to False.
+            simulation_checkpoint (SimulationCheckpoint | None, optional): The checkpoint
+                from which the simulation is continued. Defaults to None.
+        """
+        for network_level_index, network_level in enumerate(
+            self.list_of_network_level
+        ):
+            resume_network_level = False
+            if simulation_checkpoint is not None:
+                if network_level_index < simulation_checkpoint.network_level_index:
+                    continue
+                if network_level_index == simulation_checkpoint.network_level_index:
+                    resume_network_level = True
+            main_sink = network_level.get_main_sink()
+            if resume_network_level is True:
+                # The orders have already been splitted before the checkpoint
+                process_chain_replicator = (
+                    simulation_checkpoint.process_chain_replicator
+                )
+            else:
+                main_sink.initialize_sink()
+                process_chain_replicator = None
+                if replicate_identical_process_chains is True:
+                    process_chain_replicator = ProcessChainReplicator(
+                        network_level=network_level
                     )
-                except:
-                    process_chain.create_failed_report()
+                    process_chain_replicator.detect_identical_process_chains()
+            if (
+                number_of_parallel_processes > 1
+                and len(network_level.list_of_process_chains) > 1
+            ):
+                parallel_network_level_simulator = ParallelNetworkLevelSimulator(
+                    number_of_processes=number_of_parallel_processes
+                )
+                parallel_network_level_simulator.simulate_network_level(
+                    network_level=network_level,
+                    max_number_of_iterations=number_of_iterations_in_chain,
+                    process_chain_replicator=process_chain_replicator,
+                )
+            else:
+                for process_chain_index, process_chain in enumerate(
+                    network_level.list_of_process_chains
+                ):
+                    resume_node_operation = None
+                    if resume_network_level is True:
+                        if (
+                            process_chain_index
+                            < simulation_checkpoint.process_chain_index
+                        ):
+                            continue
+                        if (
+                            process_chain_index
+                            == simulation_checkpoint.process_chain_index
+                        ):
+                            resume_node_operation = (
+                                simulation_checkpoint.current_node_operation
+                            )
+                    if (
+                        process_chain_replicator is not None
+                        and process_chain_replicator.check_if_process_chain_is_replica(
+                            process_chain=process_chain
+                        )
+                    ):
+                        process_chain_replicator.replicate_process_chain(
+                            process_chain=process_chain
+                        )
+                        network_level.production_plan.spill_finalized_entries()
+                        continue
+                    if self.simulation_checkpoint_writer is not None:
+                        self.simulation_checkpoint_writer.set_simulation_position(
+                            enterprise=self,
+                            network_level_index=network_level_index,
+                            process_chain_index=process_chain_index,
+                            process_chain_replicator=process_chain_replicator,
+                            number_of_iterations_in_chain=number_of_iterations_in_chain,
+                            replicate_identical_process_chains=replicate_identical_process_chains,
+                        )
+                    if self.simulation_progress_reporter is not None:
+                        self.simulation_progress_reporter.set_simulation_position(
+                            network_level_index=network_level_index,
+                            number_of_network_levels=len(self.list_of_network_level),
+                            process_chain_index=process_chain_index,
+                            number_of_process_chains=len(
+                                network_level.list_of_process_chains
+                            ),
+                            process_chain_name=process_chain.process_chain_identifier.chain_name,
+                        )
+                    try:
+                        if resume_node_operation is None:
+                            main_sink.prepare_sink_for_next_chain(
+                                process_chain_identifier=process_chain.process_chain_identifier
+                            )
+                            main_source = network_level.get_main_source()
+                            main_source.prepare_source_for_next_chain(
+                                process_chain_identifier=process_chain.process_chain_identifier
+                            )
+                            process_chain.create_process_chain_production_plan(
+                                max_number_of_iterations=number_of_iterations_in_chain,
+                            )
+                        else:
+                            process_chain.resume_process_chain_production_plan(
+                                current_node_operation=resume_node_operation,
+                                max_number_of_iterations=number_of_iterations_in_chain,
+                            )
+                    except SimulationAbortedError:
+                        raise
+                    except Exception as error:
+                        process_chain.set_simulation_failed(error=error)
+                        if self.simulation_checkpoint_writer is not None:
+                            logger.warning(
+                                "The simulation can be resumed from the checkpoint: %s",
+                                self.simulation_checkpoint_writer.checkpoint_path,
+                            )
+                        try:
+                            process_chain.create_failed_report()
+                        except Exception as report_error:
+                            # The failure of the chain is still recorded
+                            # if the report cannot be created
+                            logger.warning(
+                                "The failed report of %s could not be created: %s",
+                                process_chain.process_chain_identifier.chain_name,
+                                report_error,
+                            )
+                    # The entries of the terminated chain are not changed anymore
+                    network_level.production_plan.spill_finalized_entries()
 
             network_level.main_sink.create_storage_entries()
             network_level.main_source.create_storage_entries()
+            network_level.production_plan.spill_finalized_entries()
 
     def pickle_sink(
         self,
@@ -169,6 +396,380 @@ class Enterprise:
         with open(path_to_pickle_file, "rb") as input_file:
             self.production_plan = cloudpickle.load(input_file)
 
+    def set_node_operation_trace(
+        self,
+        trace_mode: str = NodeOperationTraceModes.ring_buffer,
+        ring_buffer_size: int = 100,
+        trace_directory: str | None = None,
+    ):
+        """Determines how the node operations of all chains are recorded for the
+        report of a failed simulation. Must be called after all chains have
+        been created.
+
+        Args:
+            trace_mode (str, optional): One of the NodeOperationTraceModes. The
+                ring buffer only keeps the latest operations of each chain, the file
+                mode appends all operations to a file per chain and the recording
+                is turned off in the off mode. Defaults to NodeOperationTraceModes.ring_buffer.
+            ring_buffer_size (int, optional): Number of the latest node operations
+                that are kept in the ring buffer. Defaults to 100.
+            trace_directory (str | None, optional): Directory of the trace files
+                in the file mode. Defaults to None.
+        """
+        for network_level in self.list_of_network_level:
+            for process_chain in network_level.list_of_process_chains:
+                process_chain.set_node_operation_trace(
+                    trace_mode=trace_mode,
+                    ring_buffer_size=ring_buffer_size,
+                    trace_directory=trace_directory,
+                )
+
+    def set_state_restoration_mode(self, state_restoration_mode: str):
+        """Determines how the simulation data of all ProcessSteps is restored
+        after an adaption. Must be called after all chains have been created.
+
+        Args:
+            state_restoration_mode (str): One of the StateRestorationModes. The
+                snapshot mode copies the time data and state data of a ProcessStep
+                before each decision. The undo log mode records the changes
+                instead and undoes them in reverse order.
+        """
+        for network_level in self.list_of_network_level:
+            for process_chain in network_level.list_of_process_chains:
+                process_chain.set_state_restoration_mode(
+                    state_restoration_mode=state_restoration_mode
+                )
+
+    def set_validation_level(self, validation_level: str):
+        """Determines which consistency checks of the simulation results are
+        conducted during the simulation. The boundary level only checks the new
+        entries and their junction with the existing entries, when entries are
+        added to the ProductionPlan. The full level checks all entries each time
+        and should only be used for debugging. Must be called after all chains
+        have been created.
+
+        Args:
+            validation_level (str): One of the ValidationLevels. The level also
+                determines if the storage levels of the ProcessSteps are checked.
+        """
+        check_validation_level(validation_level=validation_level)
+        self.production_plan.validation_level = validation_level
+        for network_level in self.list_of_network_level:
+            network_level.production_plan.validation_level = validation_level
+            for process_chain in network_level.list_of_process_chains:
+                process_chain.set_validation_level(validation_level=validation_level)
+
+    def set_spill_directory(self, spill_directory: str | None):
+        """Determines if the entries of the ProductionPlan are spilled to files
+        during the simulation. The entries of each chain are written to a
+        subdirectory per stream, process step and storage after the chain has
+        been simulated and are read from memory maps of the files afterwards.
+        The load profile entries are spilled in the same way to the
+        subdirectories stream_load_profiles and process_step_load_profiles.
+        The memory of the simulation results is then limited by the entries of
+        the currently simulated chain instead of all chains.
+
+        Args:
+            spill_directory (str | None): Directory of the files. The entries
+                stay in memory if None is provided.
+        """
+        self.production_plan.spill_directory = spill_directory
+        for network_level in self.list_of_network_level:
+            network_level.production_plan.spill_directory = spill_directory
+
+    def enable_load_profile_accumulation(
+        self,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        resample_frequency: str = "1min",
+        retain_load_profile_entries: bool = True,
+    ) -> LoadProfileGridAccumulator:
+        """Adds the energy of all load profile entries to a fixed time grid
+        during the simulation, so that the resampled load profiles are available
+        when the simulation ends. Must be called before the simulation is started.
+
+        Args:
+            start_date (datetime.datetime): Start of the first period of the grid.
+            end_date (datetime.datetime): The grid ends with the last period
+                that ends before or at the end date.
+            resample_frequency (str, optional): Duration of each period in the
+                pandas style. Defaults to "1min".
+            retain_load_profile_entries (bool, optional): Determines if the load
+                profile entries are stored in addition. The post processing and
+                the report require the entries. Defaults to True.
+
+        Returns:
+            LoadProfileGridAccumulator: Contains the accumulated load profiles
+                of all streams and process steps.
+        """
+        load_profile_grid_accumulator = LoadProfileGridAccumulator(
+            start_date=start_date,
+            end_date=end_date,
+            resample_frequency=resample_frequency,
+        )
+        load_profile_collection = self.load_profile_handler.load_profile_collection
+        load_profile_collection.load_profile_grid_accumulator = (
+            load_profile_grid_accumulator
+        )
+        load_profile_collection.retain_load_profile_entries = (
+            retain_load_profile_entries
+        )
+        return load_profile_grid_accumulator
+
+    def enable_order_coalescing(
+        self,
+        deadline_tolerance: datetime.timedelta | None = None,
+        maximum_merged_mass: numbers.Number | None = None,
+    ):
+        """Merges consecutive orders of the main sink of each NetworkLevel
+        before they are distributed among the process chains. A merged order
+        has the earliest deadline of its orders. Reduces the number of
+        iterations at the cost of earlier deadlines. The deviation is
+        provided by get_order_coalescing_reports after the simulation. Must
+        be called after the main sinks have been set.
+
+        Args:
+            deadline_tolerance (datetime.timedelta | None, optional): Maximum time
+                between the earliest and the latest deadline of a merged order.
+                Defaults to None.
+            maximum_merged_mass (numbers.Number | None, optional): Maximum production
+                target of a merged order. Defaults to None.
+        """
+        order_coalescing_options = OrderCoalescingOptions(
+            deadline_tolerance=deadline_tolerance,
+            maximum_merged_mass=maximum_merged_mass,
+        )
+        for network_level in self.list_of_network_level:
+            main_sink = network_level.get_main_sink()
+            if isinstance(main_sink, ProcessChainStorage):
+                main_sink = main_sink.sink
+            main_sink.order_distributor.enable_order_coalescing(
+                order_coalescing_options=order_coalescing_options
+            )
+
+    def get_order_coalescing_reports(self) -> dict[str, OrderCoalescingReport]:
+        """Returns the deviation of the deadlines due to the coalescing of
+        the orders of each main sink.
+
+        Returns:
+            dict[str, OrderCoalescingReport]: The reports by the names of
+                the main sinks whose orders have been merged.
+        """
+        dict_of_order_coalescing_reports = {}
+        for network_level in self.list_of_network_level:
+            main_sink = network_level.get_main_sink()
+            if isinstance(main_sink, ProcessChainStorage):
+                main_sink = main_sink.sink
+            order_distributor = main_sink.order_distributor
+            if order_distributor.order_coalescing_report is not None:
+                dict_of_order_coalescing_reports[order_distributor.node_name] = (
+                    order_distributor.order_coalescing_report
+                )
+        return dict_of_order_coalescing_reports
+
+    def enable_storage_order_aggregation(
+        self,
+        time_bucket: datetime.timedelta | None = None,
+        maximum_merged_mass: numbers.Number | None = None,
+        maximum_storage_level_increase: numbers.Number | None = None,
+        deadline_tolerance: datetime.timedelta | None = None,
+    ):
+        """Merges the output stream states of each ProcessChainStorage into
+        fewer orders when they are handed over to the upstream NetworkLevel.
+        A merged order is due at the start of its earliest stream state, so
+        that the storage is never emptied by the merging. Must be called after
+        the ProcessChainStorages have been created.
+
+        Args:
+            time_bucket (datetime.timedelta | None, optional): Only stream states
+                which start in the same period of this duration are merged.
+                Defaults to None.
+            maximum_merged_mass (numbers.Number | None, optional): Maximum production
+                target of a merged order. Defaults to None.
+            maximum_storage_level_increase (numbers.Number | None, optional): Maximum
+                mass of a merged order that is delivered before it is due.
+                Defaults to None.
+            deadline_tolerance (datetime.timedelta | None, optional): Maximum time
+                between the earliest and the latest stream state of a merged order.
+                Defaults to None.
+        """
+        order_coalescing_options = OrderCoalescingOptions(
+            deadline_tolerance=deadline_tolerance,
+            maximum_merged_mass=maximum_merged_mass,
+            time_bucket=time_bucket,
+            maximum_storage_level_increase=maximum_storage_level_increase,
+        )
+        for network_level in self.list_of_network_level:
+            main_source = network_level.get_main_source()
+            if isinstance(main_source, ProcessChainStorage):
+                main_source.set_order_coalescing_options(
+                    order_coalescing_options=order_coalescing_options
+                )
+
+    def get_storage_order_aggregation_reports(
+        self,
+    ) -> dict[str, OrderCoalescingReport]:
+        """Returns the deviation of the deadlines due to the merging of the
+        stream states of each ProcessChainStorage.
+
+        Returns:
+            dict[str, OrderCoalescingReport]: The reports by the names of the
+                ProcessChainStorages whose stream states have been merged.
+        """
+        dict_of_order_coalescing_reports = {}
+        for network_level in self.list_of_network_level:
+            main_source = network_level.get_main_source()
+            if (
+                isinstance(main_source, ProcessChainStorage)
+                and main_source.source.order_coalescing_report is not None
+            ):
+                dict_of_order_coalescing_reports[main_source.name] = (
+                    main_source.source.order_coalescing_report
+                )
+        return dict_of_order_coalescing_reports
+
+    def enable_simulation_profiler(self) -> SimulationProfiler:
+        """Assigns a SimulationProfiler to all chains which measures the wall time
+        of each call of the nodes during the simulation. The results are added to
+        the report and can be obtained as data frames from the returned profiler.
+        Must be called after all chains have been created. The calls in worker
+        processes of a parallel simulation are not recorded.
+
+        Returns:
+            SimulationProfiler: The profiler that records the calls of all chains.
+        """
+        self.simulation_profiler = SimulationProfiler()
+        for network_level in self.list_of_network_level:
+            for process_chain in network_level.list_of_process_chains:
+                process_chain.simulation_profiler = self.simulation_profiler
+        return self.simulation_profiler
+
+    def enable_compiled_execution_plan(self):
+        """Looks up the next nodes of all chains with a CompiledChainExecutionPlan,
+        which resolves the nodes of each chain in advance. The results are
+        identical. Must be called after all chains have been created.
+        """
+        for network_level in self.list_of_network_level:
+            for process_chain in network_level.list_of_process_chains:
+                process_chain.use_compiled_execution_plan = True
+
+    def enable_simulation_checkpoints(
+        self,
+        checkpoint_path: str,
+        number_of_orders_between_checkpoints: int | None = 10,
+        time_between_checkpoints: datetime.timedelta | None = None,
+    ) -> SimulationCheckpointWriter:
+        """Writes periodic checkpoints during the simulation from which it can be
+        continued with resume_simulation. Can only be used for a sequential
+        simulation. Must be called after all chains have been created.
+
+        Args:
+            checkpoint_path (str): Path of the checkpoint file.
+            number_of_orders_between_checkpoints (int | None, optional): A checkpoint is
+                written after this number of fulfilled orders. Defaults to 10.
+            time_between_checkpoints (datetime.timedelta | None, optional): A checkpoint
+                is written at the first fulfilled order after this time span
+                has passed since the last checkpoint. Defaults to None.
+
+        Returns:
+            SimulationCheckpointWriter: The writer that writes the checkpoints of all chains.
+        """
+        simulation_checkpoint_writer = SimulationCheckpointWriter(
+            checkpoint_path=checkpoint_path,
+            number_of_orders_between_checkpoints=number_of_orders_between_checkpoints,
+            time_between_checkpoints=time_between_checkpoints,
+        )
+        self.set_simulation_checkpoint_writer(
+            simulation_checkpoint_writer=simulation_checkpoint_writer
+        )
+        return simulation_checkpoint_writer
+
+    def set_simulation_checkpoint_writer(
+        self, simulation_checkpoint_writer: SimulationCheckpointWriter | None
+    ):
+        """Assigns the writer of the checkpoints to all chains. Must be called
+        after all chains have been created.
+
+        Args:
+            simulation_checkpoint_writer (SimulationCheckpointWriter | None): Writes
+                the checkpoints of all chains. No checkpoints are written if None
+                is provided.
+        """
+        self.simulation_checkpoint_writer = simulation_checkpoint_writer
+        for network_level in self.list_of_network_level:
+            for process_chain in network_level.list_of_process_chains:
+                process_chain.simulation_checkpoint_writer = (
+                    simulation_checkpoint_writer
+                )
+
+    def enable_simulation_progress(
+        self,
+        callback: Callable[[SimulationProgress], None] | None = None,
+        reporting_interval: datetime.timedelta = datetime.timedelta(seconds=10),
+        log_progress: bool = True,
+    ) -> SimulationProgressReporter:
+        """Reports the progress of the simulation in a fixed time interval to a
+        callback and the log. Alternatively the progress can be iterated with
+        iterate_simulation_progress. Raising a SimulationAbortedError in the
+        callback stops the simulation. Can only be used for a sequential
+        simulation. Must be called after all chains have been created.
+
+        Args:
+            callback (Callable[[SimulationProgress], None] | None, optional): Is
+                called with the current SimulationProgress in each reporting
+                interval and after each chain is terminated. Defaults to None.
+            reporting_interval (datetime.timedelta, optional): Minimum time between
+                two reports. Defaults to datetime.timedelta(seconds=10).
+            log_progress (bool, optional): Determines if the progress is logged
+                at info level in each report. Defaults to True.
+
+        Returns:
+            SimulationProgressReporter: The reporter of all chains.
+        """
+        self.simulation_progress_reporter = SimulationProgressReporter(
+            callback=callback,
+            reporting_interval=reporting_interval,
+            log_progress=log_progress,
+        )
+        for network_level in self.list_of_network_level:
+            for process_chain in network_level.list_of_process_chains:
+                process_chain.simulation_progress_reporter = (
+                    self.simulation_progress_reporter
+                )
+        return self.simulation_progress_reporter
+
+    def iterate_simulation_progress(
+        self,
+        number_of_iterations_in_chain: numbers.Number | None = None,
+        replicate_identical_process_chains: bool = False,
+    ) -> Iterator[SimulationProgress]:
+        """Starts the simulation in a background thread and yields each reported
+        SimulationProgress. The iteration ends when the simulation is completed.
+        Stopping the iteration early aborts the simulation. Requires that
+        enable_simulation_progress has been called before.
+
+        Args:
+            number_of_iterations_in_chain (numbers.Number | None, optional): Maximum
+                number of iterations in each chain. Defaults to None.
+            replicate_identical_process_chains (bool, optional): Defines if identical
+                chains are replicated. Defaults to False.
+
+        Returns:
+            Iterator[SimulationProgress]: The progress in each reporting interval and
+                after each chain is terminated.
+        """
+        if self.simulation_progress_reporter is None:
+            raise MisconfigurationError(
+                "enable_simulation_progress must be called before the progress can be iterated"
+            )
+        return self.simulation_progress_reporter.iterate_simulation_progress(
+            start_simulation=functools.partial(
+                self.start_simulation,
+                number_of_iterations_in_chain=number_of_iterations_in_chain,
+                replicate_identical_process_chains=replicate_identical_process_chains,
+            )
+        )
+
     def create_network_level(self) -> NetworkLevel:
         """Creates an instance of a NetworkLevel. NetworkLevel are container for ProcessChains
         that are used to model subsequent Production Steps in a Production Network. Two Network level
@@ -250,6 +851,8 @@ class Enterprise:
         - A page with a gantt chart for each stream and process step for a selected period
         - A page with a carpet plot for each energy carrier for each stream, process step
             and the sum for each energy carrier.
+        - A page with the wall time of the nodes and node operations if
+            enable_simulation_profiler has been called before the simulation.
 
         Args:
             gantt_chart_start_date (datetime.datetime): Determines the start for the displayed period
@@ -332,8 +935,31 @@ class Enterprise:
             enterprise_name=self.name,
             list_of_network_level=self.list_of_network_level,
             post_process_simulation_data_handler=post_process_simulation_data_handler,
+            simulation_profiler=self.simulation_profiler,
         )
         logger.info("Start to create report")
         report_generator.generate_report(
             report_generator_options=standard_simulation_report
         )
+
+
+def resume_simulation(
+    checkpoint_path: str,
+) -> Enterprise:
+    """Loads a checkpoint and continues the simulation from the last order that
+    was fulfilled before the checkpoint has been written. Further checkpoints
+    are written to the same path with the settings of the interrupted simulation.
+
+    Args:
+        checkpoint_path (str): Path to the checkpoint file.
+
+    Returns:
+        Enterprise: The enterprise after the simulation has been completed.
+    """
+    simulation_checkpoint = load_simulation_checkpoint(checkpoint_path=checkpoint_path)
+    enterprise = simulation_checkpoint.enterprise
+    enterprise.simulation_checkpoint_writer.checkpoint_path = checkpoint_path
+    enterprise.resume_simulation_from_checkpoint(
+        simulation_checkpoint=simulation_checkpoint,
+    )
+    return enterprise
@@ -0,0 +1,670 @@
+import collections
+import copy
+import datetime
+import numbers
+import os
+from dataclasses import dataclass, field
+
+import cloudpickle
+import pandas
+
+from ethos_penalps.data_classes import OrderCollection
+from ethos_penalps.node_operations import NodeOperation
+from ethos_penalps.organizational_agents.enterprise import Enterprise
+from ethos_penalps.organizational_agents.simulation_checkpoint import (
+    SimulationCheckpointWriter,
+    load_simulation_checkpoint,
+)
+from ethos_penalps.process_nodes.process_chain_storage import ProcessChainStorage
+from ethos_penalps.process_nodes.sink import Sink
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
+
+logger = PeNALPSLogger.get_logger_without_handler()
+
+ORDER_COLUMNS = ["production_target", "production_deadline"]
+STORAGE_ENTRY_PREFIX = "Storage: "
+
+
+@dataclass
+class OrderSnapshot:
+    """Refers to a checkpoint of the first NetworkLevel that has been
+    written directly after an order of a chain has been fulfilled.
+    """
+
+    record_number: int
+    """Number of the checkpoint record in the snapshot file."""
+    process_chain_index: int
+    number_of_processed_orders: int
+
+
+@dataclass
+class SimulationDifference:
+    """Describes which results of the production plan and the load profiles
+    have changed compared to the previous simulation.
+    """
+
+    start_time: datetime.datetime | None = None
+    end_time: datetime.datetime | None = None
+    list_of_changed_object_names: list[str] = field(default_factory=list)
+    number_of_added_entries: int = 0
+    number_of_removed_entries: int = 0
+    number_of_reused_orders: int = 0
+    number_of_simulated_orders: int = 0
+
+
+@dataclass
+class OrderUpdateSimulationResult:
+    """Contains the simulated enterprise and the difference to the previous
+    simulation. The difference is None for the first simulation.
+    """
+
+    enterprise: Enterprise
+    simulation_difference: SimulationDifference | None = None
+
+
+@dataclass
+class _OrderUpdateSimulationState:
+    """Is persisted in the snapshot directory so that a later process can
+    simulate the next order update.
+    """
+
+    base_enterprise_path: str
+    dict_of_result_entries: dict[str, list]
+    """Entries of the previous simulation which are compared to the entries
+    of the next simulation."""
+    list_of_order_snapshots: list[OrderSnapshot]
+    list_of_order_data_frames: list[pandas.DataFrame]
+    number_of_iterations_in_chain: numbers.Number | None = None
+
+
+def get_main_sink_of_first_network_level(enterprise: Enterprise) -> Sink:
+    """Returns the sink which receives the external orders of the enterprise.
+
+    Args:
+        enterprise (Enterprise): The enterprise of which the sink is returned.
+
+    Returns:
+        Sink: The main sink of the first NetworkLevel.
+    """
+    if not enterprise.list_of_network_level:
+        raise MisconfigurationError(
+            "The enterprise: " + enterprise.name + " has no NetworkLevel"
+        )
+    main_sink = enterprise.list_of_network_level[0].get_main_sink()
+    if not isinstance(main_sink, Sink):
+        raise MisconfigurationError(
+            "The first NetworkLevel of the enterprise: "
+            + enterprise.name
+            + " must have a Sink for an order update simulation"
+        )
+    return main_sink
+
+
+def set_orders_of_main_sink(enterprise: Enterprise, order_collection: OrderCollection):
+    """Replaces the orders of the main sink of the first NetworkLevel.
+
+    Args:
+        enterprise (Enterprise): The enterprise that receives the orders.
+        order_collection (OrderCollection): The complete set of orders.
+    """
+    main_sink = get_main_sink_of_first_network_level(enterprise=enterprise)
+    main_sink.order_collection = order_collection
+    main_sink.order_distributor.order_collection = order_collection
+
+
+def get_list_of_order_data_frames(enterprise: Enterprise) -> list[pandas.DataFrame]:
+    """Returns the splitted orders of each chain in the first NetworkLevel.
+    Only the targets and deadlines are returned because the order numbers
+    and identifiers are assigned anew each time the orders are splitted.
+
+    Args:
+        enterprise (Enterprise): An enterprise of which the main sink has
+            been initialized.
+
+    Returns:
+        list[pandas.DataFrame]: The orders in the order of the chains.
+    """
+    main_sink = get_main_sink_of_first_network_level(enterprise=enterprise)
+    list_of_order_data_frames = []
+    for process_chain in enterprise.list_of_network_level[0].list_of_process_chains:
+        splitted_order_collection = main_sink.order_distributor.dict_of_splitted_order[
+            process_chain.process_chain_identifier
+        ]
+        list_of_order_data_frames.append(
+            splitted_order_collection.get_order_data_frame()
+            .loc[:, ORDER_COLUMNS]
+            .reset_index(drop=True)
+            .copy()
+        )
+    return list_of_order_data_frames
+
+
+def get_number_of_equal_leading_orders(
+    previous_order_data_frame: pandas.DataFrame,
+    new_order_data_frame: pandas.DataFrame,
+) -> int:
+    """Counts the orders from the latest deadline on which are equal in both
+    sets of orders. These are processed first in the backward simulation.
+
+    Args:
+        previous_order_data_frame (pandas.DataFrame): Orders of the previous simulation.
+        new_order_data_frame (pandas.DataFrame): Orders of the new simulation.
+
+    Returns:
+        int: Number of equal leading orders.
+    """
+    number_of_equal_orders = 0
+    for previous_order, new_order in zip(
+        previous_order_data_frame.itertuples(index=False),
+        new_order_data_frame.itertuples(index=False),
+    ):
+        if previous_order != new_order:
+            break
+        number_of_equal_orders = number_of_equal_orders + 1
+    return number_of_equal_orders
+
+
+def get_dict_of_result_entries(enterprise: Enterprise) -> dict[str, list]:
+    """Collects all entries of the production plan and the load profiles
+    by the name of the object they belong to.
+
+    Args:
+        enterprise (Enterprise): The simulated enterprise.
+
+    Returns:
+        dict[str, list]: Maps an object name to its entries.
+    """
+    production_plan = enterprise.production_plan
+    dict_of_result_entries: dict[str, list] = {}
+    for (
+        object_name,
+        list_of_entries,
+    ) in production_plan.process_step_states_dict.items():
+        dict_of_result_entries["Process step: " + object_name] = list_of_entries
+    for object_name, list_of_entries in production_plan.stream_state_dict.items():
+        dict_of_result_entries["Stream: " + object_name] = list_of_entries
+    for object_name, dict_of_commodities in production_plan.storage_state_dict.items():
+        for commodity, list_of_entries in dict_of_commodities.items():
+            dict_of_result_entries[
+                STORAGE_ENTRY_PREFIX + object_name + " " + commodity.name
+            ] = list_of_entries
+    load_profile_collection = enterprise.load_profile_handler.load_profile_collection
+    for object_name, entry_collection in list(
+        load_profile_collection.dict_stream_load_profile_collections.items()
+    ) + list(
+        load_profile_collection.dict_process_step_load_profile_collections.items()
+    ):
+        for (
+            load_type_uuid,
+            list_of_entries,
+        ) in entry_collection.dict_of_load_entry_lists.items():
+            load_type_name = entry_collection.load_type_dict[load_type_uuid].name
+            dict_of_result_entries[
+                "Load profile: " + object_name + " " + load_type_name
+            ] = list_of_entries
+    return dict_of_result_entries
+
+
+def compare_simulation_results(
+    dict_of_previous_entries: dict[str, list], new_enterprise: Enterprise
+) -> SimulationDifference:
+    """Compares the entries of two simulations of the same model. The time
+    window of the difference spans all entries that have been added or
+    removed. The storage entries are not considered for the time window
+    because the storage levels are cumulative, so that a changed order
+    changes the levels of the main sink and source until the end of
+    the simulation.
+
+    Args:
+        dict_of_previous_entries (dict[str, list]): Entries of the previous
+            simulation as returned by get_dict_of_result_entries.
+        new_enterprise (Enterprise): Result of the new simulation.
+
+    Returns:
+        SimulationDifference: The changed objects and the affected time window.
+    """
+    simulation_difference = SimulationDifference()
+    dict_of_new_entries = get_dict_of_result_entries(enterprise=new_enterprise)
+    for object_name in sorted(set(dict_of_previous_entries) | set(dict_of_new_entries)):
+        list_of_previous_entries = list(dict_of_previous_entries.get(object_name, []))
+        list_of_new_entries = list(dict_of_new_entries.get(object_name, []))
+        # Some entries contain unhashable objects. Thus they are compared
+        # by their representation which contains all fields.
+        dict_of_entries = {
+            repr(entry): entry
+            for entry in list_of_previous_entries + list_of_new_entries
+        }
+        previous_entry_counter = collections.Counter(
+            repr(entry) for entry in list_of_previous_entries
+        )
+        new_entry_counter = collections.Counter(
+            repr(entry) for entry in list_of_new_entries
+        )
+        list_of_added_entries = [
+            dict_of_entries[entry_representation]
+            for entry_representation in (
+                new_entry_counter - previous_entry_counter
+            ).elements()
+        ]
+        list_of_removed_entries = [
+            dict_of_entries[entry_representation]
+            for entry_representation in (
+                previous_entry_counter - new_entry_counter
+            ).elements()
+        ]
+        if not list_of_added_entries and not list_of_removed_entries:
+            continue
+        simulation_difference.list_of_changed_object_names.append(object_name)
+        simulation_difference.number_of_added_entries = (
+            simulation_difference.number_of_added_entries + len(list_of_added_entries)
+        )
+        simulation_difference.number_of_removed_entries = (
+            simulation_difference.number_of_removed_entries
+            + len(list_of_removed_entries)
+        )
+        if object_name.startswith(STORAGE_ENTRY_PREFIX):
+            continue
+        for entry in list_of_added_entries + list_of_removed_entries:
+            if (
+                simulation_difference.start_time is None
+                or entry.start_time < simulation_difference.start_time
+            ):
+                simulation_difference.start_time = entry.start_time
+            if (
+                simulation_difference.end_time is None
+                or entry.end_time > simulation_difference.end_time
+            ):
+                simulation_difference.end_time = entry.end_time
+    return simulation_difference
+
+
+class _OrderSnapshotWriter(SimulationCheckpointWriter):
+    """Appends a snapshot to the snapshot file after the fulfilled orders of the
+    first NetworkLevel. The later NetworkLevel are always simulated completely
+    because their orders depend on the results of the first one.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        list_of_order_snapshots: list[OrderSnapshot],
+        number_of_orders_between_snapshots: int,
+    ) -> None:
+        """
+
+        Args:
+            snapshot_path (str): Path of the snapshot file.
+            list_of_order_snapshots (list[OrderSnapshot]): Receives the
+                written snapshots.
+            number_of_orders_between_snapshots (int): A snapshot is written
+                after this number of fulfilled orders.
+        """
+        super().__init__(
+            checkpoint_path=snapshot_path,
+            number_of_orders_between_checkpoints=number_of_orders_between_snapshots,
+        )
+        self.list_of_order_snapshots: list[OrderSnapshot] = list_of_order_snapshots
+
+    def write_checkpoint_if_due(
+        self,
+        sink: Sink | ProcessChainStorage,
+        current_node_operation: NodeOperation,
+    ):
+        if self.network_level_index != 0:
+            return
+        super().write_checkpoint_if_due(
+            sink=sink, current_node_operation=current_node_operation
+        )
+
+    def write_checkpoint(self, current_node_operation: NodeOperation):
+        super().write_checkpoint(current_node_operation=current_node_operation)
+        self.list_of_order_snapshots.append(
+            OrderSnapshot(
+                record_number=self.simulation_checkpoint_journal.number_of_records,
+                process_chain_index=self.process_chain_index,
+                number_of_processed_orders=self.last_order_number,
+            )
+        )
+
+
+class OrderUpdateSimulator:
+    """Simulates an enterprise repeatedly with an updated set of orders and
+    reports the difference to the previous results. Only the simulated orders
+    with the latest deadlines can be reused, it is not an incremental simulation
+    of arbitrary order changes. The state of the first NetworkLevel is appended
+    to a snapshot file after fulfilled orders.
+
+    The simulation schedules the orders backwards from the latest deadline.
+    Thus a snapshot can only be reused if the orders with later deadlines than
+    the changed orders are unchanged. The simulation of the update is then
+    continued from the latest of these snapshots, so that the entries of the
+    unchanged orders are kept. If orders with the latest deadlines are changed
+    or appended, e.g. the orders of the last day, no snapshot can be reused
+    and all orders are simulated again. The model apart from the orders of
+    the main sink must not change between the simulations.
+    """
+
+    state_file_name: str = "order_update_simulation_state.pckl"
+    base_enterprise_file_name: str = "base_enterprise.pckl"
+    snapshot_file_name: str = "order_snapshots.pckl"
+
+    def __init__(
+        self, snapshot_directory: str, number_of_orders_between_snapshots: int = 1
+    ) -> None:
+        """
+
+        Args:
+            snapshot_directory (str): Directory in which the snapshots and the
+                state of the order update simulation are stored. An existing state
+                in this directory is loaded.
+            number_of_orders_between_snapshots (int, optional): A snapshot is written
+                after this number of fulfilled orders. Fewer snapshots reduce the
+                overhead but increase the number of orders that are simulated
+                again. Defaults to 1.
+        """
+        self.snapshot_directory: str = snapshot_directory
+        self.number_of_orders_between_snapshots: int = (
+            number_of_orders_between_snapshots
+        )
+        self.state_path: str = os.path.join(snapshot_directory, self.state_file_name)
+        self.snapshot_path: str = os.path.join(
+            snapshot_directory, self.snapshot_file_name
+        )
+        self.order_update_simulation_state: _OrderUpdateSimulationState | None = None
+        if os.path.isfile(self.state_path):
+            with open(self.state_path, "rb") as file:
+                self.order_update_simulation_state = cloudpickle.load(file)
+
+    def simulate(
+        self,
+        enterprise: Enterprise,
+        number_of_iterations_in_chain: numbers.Number | None = None,
+    ) -> OrderUpdateSimulationResult:
+        """Simulates an enterprise completely and stores the snapshots for
+        later order updates. A previous state in the snapshot directory
+        is replaced. The enterprise is stored before the simulation as the
+        base of the later order updates.
+
+        Args:
+            enterprise (Enterprise): The enterprise that has not been simulated yet.
+            number_of_iterations_in_chain (numbers.Number | None, optional): Maximum
+                number of iterations in each chain. Defaults to None.
+
+        Returns:
+            OrderUpdateSimulationResult: The simulated enterprise.
+        """
+        get_main_sink_of_first_network_level(enterprise=enterprise)
+        os.makedirs(self.snapshot_directory, exist_ok=True)
+        base_enterprise_path = os.path.join(
+            self.snapshot_directory, self.base_enterprise_file_name
+        )
+        with open(base_enterprise_path, "wb") as file:
+            cloudpickle.dump(enterprise, file)
+        order_snapshot_writer = _OrderSnapshotWriter(
+            snapshot_path=self.snapshot_path,
+            list_of_order_snapshots=[],
+            number_of_orders_between_snapshots=self.number_of_orders_between_snapshots,
+        )
+        enterprise.set_simulation_checkpoint_writer(
+            simulation_checkpoint_writer=order_snapshot_writer
+        )
+        enterprise.start_simulation(
+            number_of_iterations_in_chain=number_of_iterations_in_chain
+        )
+        self._store_state(
+            order_update_simulation_state=_OrderUpdateSimulationState(
+                base_enterprise_path=base_enterprise_path,
+                dict_of_result_entries=get_dict_of_result_entries(
+                    enterprise=enterprise
+                ),
+                list_of_order_snapshots=order_snapshot_writer.list_of_order_snapshots,
+                list_of_order_data_frames=get_list_of_order_data_frames(
+                    enterprise=enterprise
+                ),
+                number_of_iterations_in_chain=number_of_iterations_in_chain,
+            )
+        )
+        return OrderUpdateSimulationResult(enterprise=enterprise)
+
+    def simulate_order_update(
+        self, order_collection: OrderCollection
+    ) -> OrderUpdateSimulationResult:
+        """Simulates the enterprise of the previous simulation with an updated
+        set of orders. The simulation is continued from the latest snapshot
+        whose processed orders are unchanged. All orders are simulated again
+        if no snapshot can be reused.
+
+        Args:
+            order_collection (OrderCollection): The complete set of orders
+                of the main sink, e.g. the previous orders and the new ones.
+
+        Returns:
+            OrderUpdateSimulationResult: The simulated enterprise and the
+                difference to the previous simulation.
+        """
+        if self.order_update_simulation_state is None:
+            raise MisconfigurationError(
+                "The enterprise must be simulated before the orders can be updated"
+            )
+        previous_state = self.order_update_simulation_state
+        with open(previous_state.base_enterprise_path, "rb") as file:
+            base_enterprise: Enterprise = cloudpickle.load(file)
+        set_orders_of_main_sink(
+            enterprise=base_enterprise, order_collection=copy.deepcopy(order_collection)
+        )
+        main_sink = get_main_sink_of_first_network_level(enterprise=base_enterprise)
+        first_network_level = base_enterprise.list_of_network_level[0]
+        first_network_level.combine_stream_handler_from_chains()
+        first_network_level.combine_node_dict()
+        main_sink.initialize_sink()
+        list_of_new_order_data_frames = get_list_of_order_data_frames(
+            enterprise=base_enterprise
+        )
+        order_snapshot = self._get_latest_valid_order_snapshot(
+            list_of_previous_order_data_frames=previous_state.list_of_order_data_frames,
+            list_of_new_order_data_frames=list_of_new_order_data_frames,
+        )
+        if order_snapshot is None:
+            logger.info(
+                "No order snapshot can be reused. The orders are simulated again"
+            )
+            list_of_order_snapshots_to_keep = []
+            number_of_reused_orders = 0
+        else:
+            logger.info("The simulation is continued from: %s", order_snapshot)
+            list_of_order_snapshots_to_keep = previous_state.list_of_order_snapshots[
+                : previous_state.list_of_order_snapshots.index(order_snapshot) + 1
+            ]
+            number_of_reused_orders = order_snapshot.number_of_processed_orders + sum(
+                len(order_data_frame)
+                for order_data_frame in list_of_new_order_data_frames[
+                    : order_snapshot.process_chain_index
+                ]
+            )
+        # The snapshots after the continued snapshot are overwritten
+        order_snapshot_writer = _OrderSnapshotWriter(
+            snapshot_path=self.snapshot_path,
+            list_of_order_snapshots=list_of_order_snapshots_to_keep,
+            number_of_orders_between_snapshots=self.number_of_orders_between_snapshots,
+        )
+        if order_snapshot is None:
+            enterprise = base_enterprise
+            enterprise.set_simulation_checkpoint_writer(
+                simulation_checkpoint_writer=order_snapshot_writer
+            )
+            enterprise.start_simulation(
+                number_of_iterations_in_chain=previous_state.number_of_iterations_in_chain
+            )
+        else:
+            enterprise = self._resume_from_order_snapshot(
+                order_snapshot=order_snapshot,
+                order_collection=copy.deepcopy(order_collection),
+                order_snapshot_writer=order_snapshot_writer,
+            )
+        simulation_difference = compare_simulation_results(
+            dict_of_previous_entries=previous_state.dict_of_result_entries,
+            new_enterprise=enterprise,
+        )
+        simulation_difference.number_of_reused_orders = number_of_reused_orders
+        simulation_difference.number_of_simulated_orders = (
+            sum(
+                len(order_data_frame)
+                for order_data_frame in list_of_new_order_data_frames
+            )
+            - number_of_reused_orders
+        )
+        self._store_state(
+            order_update_simulation_state=_OrderUpdateSimulationState(
+                base_enterprise_path=previous_state.base_enterprise_path,
+                dict_of_result_entries=get_dict_of_result_entries(
+                    enterprise=enterprise
+                ),
+                list_of_order_snapshots=order_snapshot_writer.list_of_order_snapshots,
+                list_of_order_data_frames=list_of_new_order_data_frames,
+                number_of_iterations_in_chain=previous_state.number_of_iterations_in_chain,
+            )
+        )
+        return OrderUpdateSimulationResult(
+            enterprise=enterprise, simulation_difference=simulation_difference
+        )
+
+    def _get_latest_valid_order_snapshot(
+        self,
+        list_of_previous_order_data_frames: list[pandas.DataFrame],
+        list_of_new_order_data_frames: list[pandas.DataFrame],
+    ) -> OrderSnapshot | None:
+        """Returns the latest snapshot that has only processed unchanged orders
+        and after which at least one order of its chain remains.
+
+        Args:
+            list_of_previous_order_data_frames (list[pandas.DataFrame]): Splitted
+                orders of the previous simulation.
+            list_of_new_order_data_frames (list[pandas.DataFrame]): Splitted orders
+                of the new simulation.
+
+        Returns:
+            OrderSnapshot | None: The snapshot from which the simulation can be
+                continued or None if no snapshot is valid.
+        """
+        if len(list_of_previous_order_data_frames) != len(
+            list_of_new_order_data_frames
+        ):
+            return None
+        list_of_number_of_equal_orders = [
+            get_number_of_equal_leading_orders(
+                previous_order_data_frame=previous_order_data_frame,
+                new_order_data_frame=new_order_data_frame,
+            )
+            for previous_order_data_frame, new_order_data_frame in zip(
+                list_of_previous_order_data_frames, list_of_new_order_data_frames
+            )
+        ]
+        valid_order_snapshot = None
+        for (
+            order_snapshot
+        ) in self.order_update_simulation_state.list_of_order_snapshots:
+            process_chain_index = order_snapshot.process_chain_index
+            previous_chains_are_unchanged = all(
+                list_of_number_of_equal_orders[chain_index]
+                == len(list_of_previous_order_data_frames[chain_index])
+                == len(list_of_new_order_data_frames[chain_index])
+                for chain_index in range(process_chain_index)
+            )
+            if (
+                previous_chains_are_unchanged
+                and order_snapshot.number_of_processed_orders
+                <= list_of_number_of_equal_orders[process_chain_index]
+                and order_snapshot.number_of_processed_orders
+                < len(list_of_new_order_data_frames[process_chain_index])
+            ):
+                valid_order_snapshot = order_snapshot
+        return valid_order_snapshot
+
+    def _resume_from_order_snapshot(
+        self,
+        order_snapshot: OrderSnapshot,
+        order_collection: OrderCollection,
+        order_snapshot_writer: _OrderSnapshotWriter,
+    ) -> Enterprise:
+        """Replaces the orders in the state of a snapshot and continues the
+        simulation. The splitted orders of the chains that have been completed
+        before the snapshot are unchanged. The orders of the snapshot chain
+        are replaced from the first unprocessed order on.
+
+        Args:
+            order_snapshot (OrderSnapshot): The snapshot which is continued.
+            order_collection (OrderCollection): The updated set of orders.
+            order_snapshot_writer (_OrderSnapshotWriter): Writes the new snapshots.
+
+        Returns:
+            Enterprise: The simulated enterprise.
+        """
+        simulation_checkpoint = load_simulation_checkpoint(
+            checkpoint_path=self.snapshot_path,
+            number_of_records=order_snapshot.record_number,
+        )
+        enterprise = simulation_checkpoint.enterprise
+        # The new snapshots are appended to the journal of the continued snapshot
+        order_snapshot_writer.simulation_checkpoint_journal = (
+            enterprise.simulation_checkpoint_writer.simulation_checkpoint_journal
+        )
+        main_sink = get_main_sink_of_first_network_level(enterprise=enterprise)
+        order_distributor = main_sink.order_distributor
+        dict_of_previous_splitted_order = dict(order_distributor.dict_of_splitted_order)
+        set_orders_of_main_sink(
+            enterprise=enterprise, order_collection=order_collection
+        )
+        order_distributor.split_production_order_dict()
+        list_of_process_chains = enterprise.list_of_network_level[
+            0
+        ].list_of_process_chains
+        for process_chain in list_of_process_chains[
+            : order_snapshot.process_chain_index
+        ]:
+            order_distributor.dict_of_splitted_order[
+                process_chain.process_chain_identifier
+            ] = dict_of_previous_splitted_order[process_chain.process_chain_identifier]
+        process_chain_identifier = list_of_process_chains[
+            order_snapshot.process_chain_index
+        ].process_chain_identifier
+        previous_splitted_order = dict_of_previous_splitted_order[
+            process_chain_identifier
+        ]
+        new_splitted_order = order_distributor.dict_of_splitted_order[
+            process_chain_identifier
+        ]
+        number_of_processed_orders = order_snapshot.number_of_processed_orders
+        new_splitted_order.order_book.produced_masses[:number_of_processed_orders] = (
+            previous_splitted_order.order_book.produced_masses[
+                :number_of_processed_orders
+            ]
+        )
+        new_splitted_order.current_order_number = number_of_processed_orders
+        order_distributor.current_splitted_order = new_splitted_order
+
+        # The sink has already planned the next order of the previous set of
+        # orders, so that the updated order is planned instead.
+        simulation_checkpoint.current_node_operation = (
+            main_sink.plan_current_production_order_again()
+        )
+        enterprise.set_simulation_checkpoint_writer(
+            simulation_checkpoint_writer=order_snapshot_writer
+        )
+        enterprise.resume_simulation_from_checkpoint(
+            simulation_checkpoint=simulation_checkpoint
+        )
+        return enterprise
+
+    def _store_state(self, order_update_simulation_state: _OrderUpdateSimulationState):
+        """Stores the state of the order update simulation in the snapshot directory.
+
+        Args:
+            order_update_simulation_state (_OrderUpdateSimulationState): The state
+                after the last simulation.
+        """
+        self.order_update_simulation_state = order_update_simulation_state
+        temporary_path = self.state_path + ".tmp"
+        with open(temporary_path, "wb") as file:
+            cloudpickle.dump(order_update_simulation_state, file)
+        os.replace(temporary_path, self.state_path)
@@ -0,0 +1,395 @@
+import concurrent.futures
+import numbers
+from dataclasses import dataclass, field
+
+import cloudpickle
+
+from ethos_penalps.data_classes import ProcessChainIdentifier
+from ethos_penalps.load_profile_calculator import LoadProfileCollection
+from ethos_penalps.organizational_agents.network_level import NetworkLevel
+from ethos_penalps.organizational_agents.process_chain_replication import (
+    ProcessChainReplicator,
+)
+from ethos_penalps.process_nodes.process_chain_storage import ProcessChainStorage
+from ethos_penalps.process_nodes.sink import Sink
+from ethos_penalps.process_nodes.source import Source
+from ethos_penalps.production_plan import ProductionPlan
+from ethos_penalps.stream import BatchStreamState, ContinuousStreamState
+from ethos_penalps.stream_node_distributor import SplittedOrderCollection
+from ethos_penalps.utilities.debugging_information import DebuggingInformationLogger
+from ethos_penalps.utilities.exceptions_and_warnings import IllogicalSimulationState
+from ethos_penalps.utilities.identifiers import IdentifierCounter
+from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
+
+logger = PeNALPSLogger.get_logger_without_handler()
+
+# Serialized NetworkLevel that is set once per worker process by the
+# initializer of the process pool.
+_worker_network_level_payload: bytes | None = None
+# Each chain creates its identifiers in a separate block, so that the identifiers
+# of chains which are simulated in different worker processes do not collide.
+NUMBER_OF_IDENTIFIERS_PER_CHAIN: int = 2**32
+
+
+@dataclass
+class ChainSimulationResult:
+    """Contains all results of a single ProcessChain that was simulated
+    in a worker process. It is merged into the NetworkLevel of the parent
+    process after the simulation.
+    """
+
+    process_chain_identifier: ProcessChainIdentifier
+    production_plan: ProductionPlan
+    load_profile_collection: LoadProfileCollection
+    splitted_order_collection: SplittedOrderCollection
+    list_of_sink_input_stream_states: list[ContinuousStreamState | BatchStreamState] = (
+        field(default_factory=list)
+    )
+    list_of_source_output_stream_states: list[
+        ContinuousStreamState | BatchStreamState
+    ] = field(default_factory=list)
+    debugging_information_logger: DebuggingInformationLogger = field(
+        default_factory=DebuggingInformationLogger
+    )
+    simulation_failed: bool = False
+    simulation_error_message: str = ""
+    number_of_iterations: int = 0
+    next_identifier: int = 0
+    """Next identifier of the worker process after the simulation of the chain."""
+
+
+def get_sink_of_network_level(network_level: NetworkLevel) -> Sink:
+    """Returns the Sink that collects the input streams of the NetworkLevel.
+
+    Args:
+        network_level (NetworkLevel): NetworkLevel that contains the sink.
+
+    Returns:
+        Sink: The main sink or the sink of the ProcessChainStorage.
+    """
+    main_sink = network_level.get_main_sink()
+    if isinstance(main_sink, ProcessChainStorage):
+        return main_sink.sink
+    return main_sink
+
+
+def get_source_of_network_level(network_level: NetworkLevel) -> Source:
+    """Returns the Source that provides the output streams of the NetworkLevel.
+
+    Args:
+        network_level (NetworkLevel): NetworkLevel that contains the source.
+
+    Returns:
+        Source: The main source or the source of the ProcessChainStorage.
+    """
+    main_source = network_level.get_main_source()
+    if isinstance(main_source, ProcessChainStorage):
+        return main_source.source
+    return main_source
+
+
+def create_network_level_payload(network_level: NetworkLevel) -> bytes:
+    """Serializes the NetworkLevel without the simulation results that have
+    already been stored in the shared ProductionPlan and LoadProfileHandlerSimulation.
+    The results of the previous NetworkLevel are not required by the chains
+    of the current NetworkLevel and would only increase the payload.
+
+    Args:
+        network_level (NetworkLevel): NetworkLevel that should be serialized.
+
+    Returns:
+        bytes: The serialized NetworkLevel.
+    """
+    production_plan = network_level.production_plan
+    load_profile_handler = network_level.load_profile_handler
+    process_step_states_dict = production_plan.process_step_states_dict
+    stream_state_dict = production_plan.stream_state_dict
+    storage_state_dict = production_plan.storage_state_dict
+    load_profile_collection = load_profile_handler.load_profile_collection
+    production_plan.process_step_states_dict = {}
+    production_plan.stream_state_dict = {}
+    production_plan.storage_state_dict = {}
+    load_profile_handler.load_profile_collection = LoadProfileCollection()
+    try:
+        payload = cloudpickle.dumps(network_level)
+    finally:
+        production_plan.process_step_states_dict = process_step_states_dict
+        production_plan.stream_state_dict = stream_state_dict
+        production_plan.storage_state_dict = storage_state_dict
+        load_profile_handler.load_profile_collection = load_profile_collection
+    return payload
+
+
+def _initialize_worker(network_level_payload: bytes):
+    """Stores the serialized NetworkLevel in the worker process so that
+    it is only transferred once per worker.
+
+    Args:
+        network_level_payload (bytes): The serialized NetworkLevel.
+    """
+    global _worker_network_level_payload
+    _worker_network_level_payload = network_level_payload
+
+
+def simulate_process_chain(
+    network_level: NetworkLevel,
+    chain_index: int,
+    max_number_of_iterations: numbers.Number | None = None,
+) -> ChainSimulationResult:
+    """Simulates a single ProcessChain of a NetworkLevel that has been
+    initialized before. The results are collected from the ProductionPlan,
+    the LoadProfileHandlerSimulation and the sink and source of the NetworkLevel.
+    It is expected that the ProductionPlan and LoadProfileCollection only contain
+    the results of this chain, which is given for an unpickled payload
+    of create_network_level_payload.
+
+    Args:
+        network_level (NetworkLevel): NetworkLevel that contains the chain.
+        chain_index (int): Position of the chain in the list_of_process_chains.
+        max_number_of_iterations (numbers.Number | None, optional): Maximum number
+            of iterations in the chain. Defaults to None.
+
+    Returns:
+        ChainSimulationResult: The results of the simulated chain.
+    """
+    process_chain = network_level.list_of_process_chains[chain_index]
+    sink = get_sink_of_network_level(network_level=network_level)
+    source = get_source_of_network_level(network_level=network_level)
+    number_of_previous_sink_states = len(sink.input_stream_state_list)
+    number_of_previous_source_states = len(source.list_of_output_stream_states)
+    try:
+        network_level.get_main_sink().prepare_sink_for_next_chain(
+            process_chain_identifier=process_chain.process_chain_identifier
+        )
+        network_level.get_main_source().prepare_source_for_next_chain(
+            process_chain_identifier=process_chain.process_chain_identifier
+        )
+        process_chain.create_process_chain_production_plan(
+            max_number_of_iterations=max_number_of_iterations,
+        )
+    except Exception as error:
+        process_chain.set_simulation_failed(error=error)
+        try:
+            process_chain.create_failed_report()
+        except Exception as report_error:
+            logger.warning(
+                "The failed report of %s could not be created: %s",
+                process_chain.process_chain_identifier.chain_name,
+                report_error,
+            )
+
+    chain_simulation_result = ChainSimulationResult(
+        process_chain_identifier=process_chain.process_chain_identifier,
+        production_plan=network_level.production_plan,
+        load_profile_collection=network_level.load_profile_handler.load_profile_collection,
+        splitted_order_collection=sink.order_distributor.dict_of_splitted_order[
+            process_chain.process_chain_identifier
+        ],
+        list_of_sink_input_stream_states=sink.input_stream_state_list[
+            number_of_previous_sink_states:
+        ],
+        list_of_source_output_stream_states=source.list_of_output_stream_states[
+            number_of_previous_source_states:
+        ],
+        debugging_information_logger=process_chain.debugging_information_logger,
+        simulation_failed=process_chain.simulation_failed,
+        simulation_error_message=process_chain.simulation_error_message,
+        number_of_iterations=process_chain.number_of_iterations,
+        next_identifier=IdentifierCounter.next_identifier,
+    )
+    return chain_simulation_result
+
+
+def _simulate_process_chain_in_worker(
+    chain_index: int,
+    max_number_of_iterations: numbers.Number | None,
+    first_identifier: int,
+) -> ChainSimulationResult:
+    """Unpickles a fresh copy of the NetworkLevel and simulates a single chain.
+    The identifiers of the chain are created from its own block of identifiers.
+
+    Args:
+        chain_index (int): Position of the chain in the list_of_process_chains.
+        max_number_of_iterations (numbers.Number | None): Maximum number
+            of iterations in the chain.
+        first_identifier (int): First identifier of the block of the chain.
+
+    Raises:
+        IllogicalSimulationState: Is raised if the chain has created more
+            identifiers than its block contains.
+
+    Returns:
+        ChainSimulationResult: The results of the simulated chain.
+    """
+    network_level: NetworkLevel = cloudpickle.loads(_worker_network_level_payload)
+    IdentifierCounter.next_identifier = first_identifier
+    chain_simulation_result = simulate_process_chain(
+        network_level=network_level,
+        chain_index=chain_index,
+        max_number_of_iterations=max_number_of_iterations,
+    )
+    if (
+        chain_simulation_result.next_identifier
+        > first_identifier + NUMBER_OF_IDENTIFIERS_PER_CHAIN
+    ):
+        raise IllogicalSimulationState(
+            "The chain: "
+            + str(chain_index)
+            + " has created more identifiers than its block contains: "
+            + str(NUMBER_OF_IDENTIFIERS_PER_CHAIN)
+        )
+    return chain_simulation_result
+
+
+class ParallelNetworkLevelSimulator:
+    """Simulates the ProcessChains of a NetworkLevel in a pool of worker processes.
+    The chains of a NetworkLevel only share the sink and source of the NetworkLevel.
+    Each chain receives its own SplittedOrderCollection and writes into its own
+    process steps and streams. Thus they can be simulated independently and the
+    results are merged in the order of the list_of_process_chains. This yields
+    the same results as a sequential simulation.
+    """
+
+    def __init__(self, number_of_processes: int) -> None:
+        """
+
+        Args:
+            number_of_processes (int): Maximum number of worker processes
+                that are used to simulate the chains.
+        """
+        self.number_of_processes: int = number_of_processes
+
+    def simulate_network_level(
+        self,
+        network_level: NetworkLevel,
+        max_number_of_iterations: numbers.Number | None = None,
+        process_chain_replicator: ProcessChainReplicator | None = None,
+    ):
+        """Simulates all chains of the NetworkLevel in worker processes and
+        merges the results into the NetworkLevel. The sink of the NetworkLevel
+        must be initialized before.
+
+        Args:
+            network_level (NetworkLevel): The NetworkLevel that should be simulated.
+            max_number_of_iterations (numbers.Number | None, optional): Maximum number
+                of iterations in each chain. Defaults to None.
+            process_chain_replicator (ProcessChainReplicator | None, optional): If provided,
+                the chains that are replicas of a previous chain are not simulated. Their
+                results are copied from the representative chain instead. Defaults to None.
+        """
+        network_level_payload = create_network_level_payload(
+            network_level=network_level
+        )
+        list_of_chain_indices = [
+            chain_index
+            for chain_index, process_chain in enumerate(
+                network_level.list_of_process_chains
+            )
+            if process_chain_replicator is None
+            or not process_chain_replicator.check_if_process_chain_is_replica(
+                process_chain=process_chain
+            )
+        ]
+        number_of_chains = len(list_of_chain_indices)
+        logger.info(
+            "Simulate %s process chains in %s worker processes",
+            number_of_chains,
+            min(self.number_of_processes, number_of_chains),
+        )
+        # The blocks of identifiers of the chains follow the identifiers
+        # of the parent process
+        first_identifier = IdentifierCounter.next_identifier
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(self.number_of_processes, number_of_chains),
+            initializer=_initialize_worker,
+            initargs=(network_level_payload,),
+        ) as executor:
+            dict_of_futures = {
+                chain_index: executor.submit(
+                    _simulate_process_chain_in_worker,
+                    chain_index,
+                    max_number_of_iterations,
+                    first_identifier + block_index * NUMBER_OF_IDENTIFIERS_PER_CHAIN,
+                )
+                for block_index, chain_index in enumerate(list_of_chain_indices)
+            }
+            dict_of_chain_simulation_results = {
+                chain_index: future.result()
+                for chain_index, future in dict_of_futures.items()
+            }
+        IdentifierCounter.continue_after(
+            next_identifier=max(
+                chain_simulation_result.next_identifier
+                for chain_simulation_result in dict_of_chain_simulation_results.values()
+            )
+        )
+
+        for chain_index, process_chain in enumerate(
+            network_level.list_of_process_chains
+        ):
+            if chain_index not in dict_of_chain_simulation_results:
+                process_chain_replicator.replicate_process_chain(
+                    process_chain=process_chain
+                )
+                continue
+            chain_simulation_result = dict_of_chain_simulation_results[chain_index]
+            process_chain.initialize_production_plan()
+            self.merge_chain_simulation_result(
+                network_level=network_level,
+                chain_simulation_result=chain_simulation_result,
+            )
+            network_level.production_plan.spill_finalized_entries()
+            process_chain.debugging_information_logger = (
+                chain_simulation_result.debugging_information_logger
+            )
+            process_chain.number_of_iterations = (
+                chain_simulation_result.number_of_iterations
+            )
+            if chain_simulation_result.simulation_failed is True:
+                # The partial results of the failed chain have been merged
+                # as in the sequential simulation
+                logger.warning(
+                    "The simulation of %s has failed: %s",
+                    process_chain.process_chain_identifier.chain_name,
+                    chain_simulation_result.simulation_error_message,
+                )
+                process_chain.simulation_failed = True
+                process_chain.simulation_error_message = (
+                    chain_simulation_result.simulation_error_message
+                )
+
+    def merge_chain_simulation_result(
+        self,
+        network_level: NetworkLevel,
+        chain_simulation_result: ChainSimulationResult,
+    ):
+        """Adds the results of a single chain to the NetworkLevel and the
+        shared ProductionPlan.
+
+        Args:
+            network_level (NetworkLevel): The NetworkLevel that contains the chain.
+            chain_simulation_result (ChainSimulationResult): The results of the chain.
+        """
+        network_level.production_plan.add_temporary_production_plan(
+            temporary_production_plan=chain_simulation_result.production_plan
+        )
+        network_level.load_profile_handler.load_profile_collection.append_load_profile_collection(
+            load_profile_collection=chain_simulation_result.load_profile_collection
+        )
+        sink = get_sink_of_network_level(network_level=network_level)
+        sink.input_stream_state_list.extend(
+            chain_simulation_result.list_of_sink_input_stream_states
+        )
+        sink.order_distributor.dict_of_splitted_order[
+            chain_simulation_result.process_chain_identifier
+        ] = chain_simulation_result.splitted_order_collection
+        sink.order_distributor.current_splitted_order = (
+            chain_simulation_result.splitted_order_collection
+        )
+        source = get_source_of_network_level(network_level=network_level)
+        source.list_of_output_stream_states.extend(
+            chain_simulation_result.list_of_source_output_stream_states
+        )
+        source.current_output_stream_name = source.dict_of_output_stream_names[
+            chain_simulation_result.process_chain_identifier
+        ]
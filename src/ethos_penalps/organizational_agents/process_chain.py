@@ -1,3 +1,6 @@
+import logging
+import os
+
 import cloudpickle
 
 from ethos_penalps.data_classes import (
@@ -16,6 +19,15 @@ from ethos_penalps.node_operations import (
     UpstreamAdaptionOrder,
     UpstreamNewProductionOrder,
 )
+from ethos_penalps.organizational_agents.compiled_execution_plan import (
+    CompiledChainExecutionPlan,
+)
+from ethos_penalps.organizational_agents.simulation_checkpoint import (
+    SimulationCheckpointWriter,
+)
+from ethos_penalps.organizational_agents.simulation_progress import (
+    SimulationProgressReporter,
+)
 from ethos_penalps.post_processing.report_generator.failed_simulation_report_generator import (
     FailedRunReportGenerator,
 )
@@ -27,8 +39,12 @@ from ethos_penalps.process_nodes.source import Source
 from ethos_penalps.production_plan import ProductionPlan
 from ethos_penalps.stream_handler import StreamHandler
 from ethos_penalps.time_data import TimeData
-from ethos_penalps.utilities.debugging_information import DebuggingInformationLogger
+from ethos_penalps.utilities.debugging_information import (
+    DebuggingInformationLogger,
+    NodeOperationTraceModes,
+)
 from ethos_penalps.utilities.general_functions import ResultPathGenerator
+from ethos_penalps.utilities.simulation_profiler import SimulationProfiler
 from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
 
 logger = PeNALPSLogger.get_logger_without_handler()
@@ -73,6 +89,13 @@ class ProcessChain:
         self.load_profile_handler: LoadProfileHandlerSimulation = load_profile_handler
         self.debugging_information_logger = DebuggingInformationLogger()
         self.source: Source | ProcessChainStorage
+        self.number_of_iterations: int = 0
+        self.simulation_failed: bool = False
+        self.simulation_error_message: str = ""
+        self.simulation_profiler: SimulationProfiler | None = None
+        self.simulation_checkpoint_writer: SimulationCheckpointWriter | None = None
+        self.use_compiled_execution_plan: bool = False
+        self.simulation_progress_reporter: SimulationProgressReporter | None = None
 
     def get_process_node_dict_without_sink_and_source(self) -> dict[str, ProcessNode]:
         """Returns a dictionary of the nodes of the process chain without the source
@@ -86,6 +109,61 @@ class ProcessChain:
         output_node_dict.pop(self.source.name, None)
         return output_node_dict
 
+    def set_node_operation_trace(
+        self,
+        trace_mode: str = NodeOperationTraceModes.ring_buffer,
+        ring_buffer_size: int = 100,
+        trace_directory: str | None = None,
+    ):
+        """Determines how the node operations of the chain are recorded
+        for the report of a failed simulation.
+
+        Args:
+            trace_mode (str, optional): One of the NodeOperationTraceModes.
+                Defaults to NodeOperationTraceModes.ring_buffer.
+            ring_buffer_size (int, optional): Number of the latest node operations
+                that are kept in the ring buffer. Defaults to 100.
+            trace_directory (str | None, optional): Directory of the trace file
+                of the chain in the file mode. Defaults to None.
+        """
+        trace_file_path = None
+        if trace_directory is not None:
+            trace_file_path = os.path.join(
+                trace_directory,
+                self.process_chain_identifier.chain_name + "_node_operations.jsonl",
+            )
+        self.debugging_information_logger = DebuggingInformationLogger(
+            trace_mode=trace_mode,
+            ring_buffer_size=ring_buffer_size,
+            trace_file_path=trace_file_path,
+        )
+
+    def set_state_restoration_mode(self, state_restoration_mode: str):
+        """Determines how the simulation data of the ProcessSteps of the chain
+        is restored after an adaption.
+
+        Args:
+            state_restoration_mode (str): One of the StateRestorationModes.
+        """
+        for process_node in self.process_node_dict.values():
+            if isinstance(process_node, ProcessStep):
+                process_node.process_state_handler.process_step_data.set_state_restoration_mode(
+                    state_restoration_mode=state_restoration_mode
+                )
+
+    def set_validation_level(self, validation_level: str):
+        """Determines if the storage levels of the ProcessSteps of the chain
+        are checked during the simulation.
+
+        Args:
+            validation_level (str): One of the ValidationLevels.
+        """
+        for process_node in self.process_node_dict.values():
+            if isinstance(process_node, ProcessStep):
+                process_node.process_state_handler.process_step_data.set_validation_level(
+                    validation_level=validation_level
+                )
+
     def create_failed_report(self):
         """Creates a report for failed simulation which summarizes the
         simulation.
@@ -97,6 +175,17 @@ class ProcessChain:
         )
         failed_report_generator.generate_report()
 
+    def set_simulation_failed(self, error: BaseException):
+        """Records that the simulation of the chain has been terminated
+        by an exception so that the failure can be detected after the
+        simulation of the enterprise.
+
+        Args:
+            error (BaseException): The exception that terminated the simulation.
+        """
+        self.simulation_failed = True
+        self.simulation_error_message = type(error).__name__ + ": " + str(error)
+
     def initialize_production_plan(self):
         """Collects steps that are necessary to conduct before each simulation.
         Creates empty entries for each process node and stream in the production plan.
@@ -108,14 +197,16 @@ class ProcessChain:
                 if process_node_name in self.production_plan.process_step_states_dict:
                     pass
                 else:
-                    self.production_plan.process_step_states_dict[process_node_name] = (
-                        []
+                    self.production_plan.initialize_process_step_production_plan_entry(
+                        process_step_name=process_node_name
                     )
         for stream_name in self.stream_handler.stream_dict:
             if stream_name in self.production_plan.stream_state_dict:
                 pass
             else:
-                self.production_plan.stream_state_dict[stream_name] = []
+                self.production_plan.initialize_stream_production_plan_entry(
+                    stream_name=stream_name
+                )
 
         self.collect_stream_energy_data()
         self.collect_process_state_energy_data()
@@ -220,7 +311,8 @@ class ProcessChain:
         return self.sink
 
     def create_process_chain_production_plan(
-        self, max_number_of_iterations: float | None = None
+        self,
+        max_number_of_iterations: float | None = None,
     ):
         """The method generates a production plan that confidently satisfies all
         orders in the Sink object for each process step between the Source and
@@ -242,6 +334,8 @@ class ProcessChain:
         logger.info(
             "Create production plan of: %s", self.process_chain_identifier.chain_name
         )
+        self.simulation_failed = False
+        self.simulation_error_message = ""
         # Loops over each order in the list
         self.initialize_production_plan()
         current_node = self.get_sink()
@@ -257,31 +351,94 @@ class ProcessChain:
             + " is not a ProcessStep. It is of type:"
             + str(type(current_node))
         )
+        self.process_node_operations(
+            current_node_operation=current_node_operation,
+            max_number_of_iterations=max_number_of_iterations,
+        )
+
+    def resume_process_chain_production_plan(
+        self,
+        current_node_operation: NodeOperation,
+        max_number_of_iterations: float | None = None,
+    ):
+        """Continues the simulation of the chain from a node operation that
+        has been stored in a checkpoint. The state of all nodes and the
+        production plan must be restored from the same checkpoint.
+
+        Args:
+            current_node_operation (NodeOperation): The node operation that
+                should be processed next.
+            max_number_of_iterations (float | None, optional): Sets the maximum number of
+                iterations that are allowed in the Simulation. Defaults to None.
+        """
+        logger.info(
+            "Resume production plan of: %s at iteration %s",
+            self.process_chain_identifier.chain_name,
+            LoopCounter.loop_number,
+        )
+        self.process_node_operations(
+            current_node_operation=current_node_operation,
+            max_number_of_iterations=max_number_of_iterations,
+        )
+
+    def process_node_operations(
+        self,
+        current_node_operation: NodeOperation,
+        max_number_of_iterations: float | None = None,
+    ):
+        """Passes the node operations between the nodes of the chain until the
+        production is terminated.
 
+        Args:
+            current_node_operation (NodeOperation): The node operation that
+                should be processed next.
+            max_number_of_iterations (float | None, optional): Sets the maximum number of
+                iterations that are allowed in the Simulation. Defaults to None.
+
+        Raises:
+            Exception: Raises an exception if the maximum number of iterations is surpassed.
+        """
+        if self.use_compiled_execution_plan is True:
+            get_next_node = CompiledChainExecutionPlan(process_chain=self).get_next_node
+        else:
+            get_next_node = self.get_node_from_node_operation
+        debug_logging_is_enabled = logger.isEnabledFor(logging.DEBUG)
+        current_node = get_next_node(node_operation=current_node_operation)
         CurrentProcessNode.node_name = current_node.name
         # loops over current node list
         while not isinstance(current_node_operation, TerminateProduction):
-            logger.debug(current_node)
-            logger.debug("Input node operation is: %s", str(current_node_operation))
-            logger.debug("Loop counter is: %s", str(LoopCounter.loop_number))
+            if debug_logging_is_enabled:
+                logger.debug(current_node)
+                logger.debug("Input node operation is: %s", current_node_operation)
+                logger.debug("Loop counter is: %s", LoopCounter.loop_number)
 
             self.debugging_information_logger.add_node_operation(
                 node_operation=current_node_operation
             )
-            current_node_operation: (
-                UpstreamNewProductionOrder
-                | DownstreamValidationOrder
-                | DownstreamAdaptionOrder
-                | UpstreamAdaptionOrder
-                | TerminateProduction
-            ) = current_node.process_input_order(
-                input_node_operation=current_node_operation,
-            )
+            if self.simulation_profiler is None:
+                current_node_operation: (
+                    UpstreamNewProductionOrder
+                    | DownstreamValidationOrder
+                    | DownstreamAdaptionOrder
+                    | UpstreamAdaptionOrder
+                    | TerminateProduction
+                ) = current_node.process_input_order(
+                    input_node_operation=current_node_operation,
+                )
+            else:
+                current_node_operation = (
+                    self.simulation_profiler.profile_process_input_order(
+                        process_chain_name=self.process_chain_identifier.chain_name,
+                        process_node=current_node,
+                        input_node_operation=current_node_operation,
+                    )
+                )
 
-            logger.debug("Output node operation: %s", str(current_node_operation))
+            if debug_logging_is_enabled:
+                logger.debug("Output node operation: %s", current_node_operation)
 
             current_node: Source | Sink | ProcessStep | ProcessChainStorage | None = (
-                self.get_node_from_node_operation(node_operation=current_node_operation)
+                get_next_node(node_operation=current_node_operation)
             )
 
             if hasattr(current_node, "name"):
@@ -298,7 +455,22 @@ class ProcessChain:
                         "Production could no be planned in maximum number of iterations"
                     )
             LoopCounter.loop_number = LoopCounter.loop_number + 1
-
+            self.number_of_iterations = LoopCounter.loop_number
+            if self.simulation_checkpoint_writer is not None:
+                self.simulation_checkpoint_writer.write_checkpoint_if_due(
+                    sink=self.get_sink(),
+                    current_node_operation=current_node_operation,
+                )
+            if self.simulation_progress_reporter is not None:
+                self.simulation_progress_reporter.report_progress_if_due(
+                    sink=self.get_sink()
+                )
+        if self.simulation_profiler is not None:
+            self.simulation_profiler.add_process_chain_summary(process_chain=self)
+        if self.simulation_progress_reporter is not None:
+            self.simulation_progress_reporter.report_process_chain_termination(
+                sink=self.get_sink()
+            )
         logger.info("Creation of production plan is terminated")
 
     def get_node_from_node_operation(
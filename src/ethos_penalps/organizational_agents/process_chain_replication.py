@@ -0,0 +1,519 @@
+import dataclasses
+import io
+import re
+from dataclasses import dataclass
+
+import cloudpickle
+
+from ethos_penalps.data_classes import ProcessChainIdentifier
+from ethos_penalps.load_profile_accumulator import LoadProfileObjectTypes
+from ethos_penalps.organizational_agents.network_level import NetworkLevel
+from ethos_penalps.organizational_agents.process_chain import ProcessChain
+from ethos_penalps.process_nodes.process_chain_storage import ProcessChainStorage
+from ethos_penalps.utilities.columnar_entry_list import ColumnarEntryList
+from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
+
+logger = PeNALPSLogger.get_logger_without_handler()
+
+UNIQUE_IDENTIFIER_PATTERN = re.compile(
+    "[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
+
+class _ProcessChainFingerprintPickler(cloudpickle.Pickler):
+    """Pickles the objects of a ProcessChain in a way that is independent
+    of the names of its nodes and streams. The names are replaced by their
+    position in the production route, unique identifiers by the position
+    of their first occurrence and objects that are shared by all chains
+    of the NetworkLevel by a marker.
+    """
+
+    def __init__(
+        self,
+        file: io.BytesIO,
+        dict_of_name_placeholders: dict[str, str],
+        dict_of_shared_objects: dict[int, str],
+    ) -> None:
+        """
+
+        Args:
+            file (io.BytesIO): Buffer that receives the pickled data.
+            dict_of_name_placeholders (dict[str, str]): Maps the names of the
+                chain to their placeholder.
+            dict_of_shared_objects (dict[int, str]): Maps the id of objects that
+                are shared between all chains to a marker.
+        """
+        super().__init__(file)
+        self.dict_of_name_placeholders: dict[str, str] = dict_of_name_placeholders
+        self.dict_of_shared_objects: dict[int, str] = dict_of_shared_objects
+        self.dict_of_unique_identifier_placeholders: dict[str, str] = {}
+
+    def persistent_id(self, obj: object) -> str | None:
+        if isinstance(obj, str):
+            if obj in self.dict_of_name_placeholders:
+                return self.dict_of_name_placeholders[obj]
+            if UNIQUE_IDENTIFIER_PATTERN.fullmatch(obj):
+                if obj not in self.dict_of_unique_identifier_placeholders:
+                    self.dict_of_unique_identifier_placeholders[obj] = "uuid " + str(
+                        len(self.dict_of_unique_identifier_placeholders)
+                    )
+                return self.dict_of_unique_identifier_placeholders[obj]
+            return None
+        return self.dict_of_shared_objects.get(id(obj))
+
+
+def get_list_of_process_chain_names(process_chain: ProcessChain) -> list[str] | None:
+    """Returns the names of all process steps and streams of the chain
+    in the order of the production route, followed by the display names
+    of the streams. The position of a name in this list is the same
+    for structurally identical chains.
+
+    Args:
+        process_chain (ProcessChain): The chain whose names are collected.
+
+    Returns:
+        list[str] | None: The list of names or None if the chain contains
+            process steps or streams that are not part of the main
+            production route.
+    """
+    # The last entry is the name of the source which is shared by all chains
+    list_of_route_names = process_chain.get_list_of_process_step_names()[:-1]
+    list_of_stream_names = list_of_route_names[0::2]
+    list_of_process_step_names = list_of_route_names[1::2]
+    if set(list_of_stream_names) != set(process_chain.stream_handler.stream_dict):
+        return None
+    if set(list_of_process_step_names) != set(
+        process_chain.get_process_node_dict_without_sink_and_source()
+    ):
+        return None
+    list_of_display_names = []
+    for stream_name in list_of_stream_names:
+        stream = process_chain.stream_handler.get_stream(stream_name=stream_name)
+        list_of_display_names.append(stream.static_data.name_to_display)
+    return list_of_route_names + list_of_display_names
+
+
+def create_process_chain_fingerprint(
+    process_chain: ProcessChain,
+    network_level: NetworkLevel,
+    list_of_process_chain_names: list[str],
+) -> bytes:
+    """Creates a fingerprint of the process state nets, stream static data,
+    energy data and splitted orders of a chain. Two chains with the same
+    fingerprint yield the same simulation results apart from their names.
+    The sink of the NetworkLevel must be initialized before.
+
+    Args:
+        process_chain (ProcessChain): The chain of which the fingerprint
+            is created.
+        network_level (NetworkLevel): The NetworkLevel that contains the chain.
+        list_of_process_chain_names (list[str]): The names of the chain
+            as returned by get_list_of_process_chain_names.
+
+    Returns:
+        bytes: The fingerprint of the chain.
+    """
+    dict_of_name_placeholders = {}
+    for name_position, name in enumerate(list_of_process_chain_names):
+        if name is not None and name not in dict_of_name_placeholders:
+            dict_of_name_placeholders[name] = "name " + str(name_position)
+    list_of_shared_objects = [
+        network_level,
+        network_level.production_plan,
+        network_level.load_profile_handler,
+        network_level.get_main_sink(),
+        network_level.get_main_source(),
+        process_chain.process_chain_identifier,
+        process_chain.time_data,
+    ]
+    for process_chain_storage in (
+        network_level.get_main_sink(),
+        network_level.get_main_source(),
+    ):
+        if isinstance(process_chain_storage, ProcessChainStorage):
+            list_of_shared_objects.append(process_chain_storage.sink)
+            list_of_shared_objects.append(process_chain_storage.source)
+    dict_of_shared_objects = {
+        id(shared_object): "shared " + str(object_position)
+        for object_position, shared_object in enumerate(list_of_shared_objects)
+    }
+    main_sink = network_level.get_main_sink()
+    if isinstance(main_sink, ProcessChainStorage):
+        main_sink = main_sink.sink
+    splitted_order_collection = main_sink.order_distributor.dict_of_splitted_order[
+        process_chain.process_chain_identifier
+    ]
+    list_of_process_steps = [
+        process_chain.process_node_dict[process_step_name]
+        for process_step_name in list_of_process_chain_names[1::2]
+        if process_step_name in process_chain.process_node_dict
+    ]
+    buffer = io.BytesIO()
+    fingerprint_pickler = _ProcessChainFingerprintPickler(
+        file=buffer,
+        dict_of_name_placeholders=dict_of_name_placeholders,
+        dict_of_shared_objects=dict_of_shared_objects,
+    )
+    fingerprint_pickler.dump(
+        (
+            list_of_process_steps,
+            process_chain.stream_handler,
+            splitted_order_collection.stream_name,
+            splitted_order_collection.commodity,
+            splitted_order_collection.target_mass,
+            splitted_order_collection.current_order_number,
+            splitted_order_collection.order_book.production_targets,
+            splitted_order_collection.order_book.production_deadlines,
+            splitted_order_collection.order_book.order_numbers,
+            splitted_order_collection.order_book.global_unique_identifiers,
+            splitted_order_collection.order_book.list_of_commodities,
+            splitted_order_collection.order_book.produced_masses,
+        )
+    )
+    return buffer.getvalue()
+
+
+def replace_names_in_entry(entry: object, name_mapping: dict[str, str]) -> object:
+    """Returns a copy of a dataclass entry in which all string fields
+    that are contained in the name mapping are replaced. Nested dataclasses
+    such as the input stream states of process step entries are
+    replaced recursively.
+
+    Args:
+        entry (object): The dataclass entry, e.g. a stream state or
+            process step production plan entry.
+        name_mapping (dict[str, str]): Maps the old names to the new names.
+
+    Returns:
+        object: The entry with replaced names. The entry itself is returned
+            if it does not contain any of the names.
+    """
+    dict_of_changes = {}
+    for entry_field in dataclasses.fields(entry):
+        if entry_field.init is False:
+            continue
+        value = getattr(entry, entry_field.name)
+        if isinstance(value, str):
+            if value in name_mapping:
+                dict_of_changes[entry_field.name] = name_mapping[value]
+        elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+            new_value = replace_names_in_entry(entry=value, name_mapping=name_mapping)
+            if new_value is not value:
+                dict_of_changes[entry_field.name] = new_value
+    if not dict_of_changes:
+        return entry
+    return dataclasses.replace(entry, **dict_of_changes)
+
+
+@dataclass
+class ProcessChainReplica:
+    """Describes a chain whose results are copied from a structurally
+    identical representative chain.
+    """
+
+    representative_process_chain: ProcessChain
+    name_mapping: dict[str, str]
+    """Maps the names of the representative chain to the names of the replica.
+    """
+
+
+class ProcessChainReplicator:
+    """Detects structurally identical ProcessChains in a NetworkLevel. Only the
+    first chain of a group of identical chains needs to be simulated. Its
+    production plan, storage and load profile entries are copied to the other
+    chains of the group with their node and stream names replaced. Identical
+    chains receive identical splitted orders if all streams into the sink
+    are continuous streams, which is the common case for templated lines.
+    """
+
+    def __init__(self, network_level: NetworkLevel) -> None:
+        """
+
+        Args:
+            network_level (NetworkLevel): The NetworkLevel whose chains are replicated.
+        """
+        self.network_level: NetworkLevel = network_level
+        self.dict_of_process_chain_replicas: dict[
+            ProcessChainIdentifier, ProcessChainReplica
+        ] = {}
+
+    def detect_identical_process_chains(self):
+        """Compares the fingerprints of all chains of the NetworkLevel. Each chain
+        whose fingerprint equals the one of a previous chain is registered as a
+        replica of the first chain with this fingerprint. The sink of the
+        NetworkLevel must be initialized before.
+        """
+        self.dict_of_process_chain_replicas = {}
+        dict_of_representatives: dict[bytes, tuple[ProcessChain, list[str]]] = {}
+        for process_chain in self.network_level.list_of_process_chains:
+            list_of_process_chain_names = get_list_of_process_chain_names(
+                process_chain=process_chain
+            )
+            if list_of_process_chain_names is None:
+                continue
+            fingerprint = create_process_chain_fingerprint(
+                process_chain=process_chain,
+                network_level=self.network_level,
+                list_of_process_chain_names=list_of_process_chain_names,
+            )
+            if fingerprint not in dict_of_representatives:
+                dict_of_representatives[fingerprint] = (
+                    process_chain,
+                    list_of_process_chain_names,
+                )
+                continue
+            (
+                representative_process_chain,
+                list_of_representative_names,
+            ) = dict_of_representatives[fingerprint]
+            name_mapping = self.create_name_mapping(
+                list_of_representative_names=list_of_representative_names,
+                list_of_replica_names=list_of_process_chain_names,
+            )
+            if name_mapping is None:
+                continue
+            logger.info(
+                "Process chain %s is a replica of process chain %s",
+                process_chain.process_chain_identifier.chain_name,
+                representative_process_chain.process_chain_identifier.chain_name,
+            )
+            self.dict_of_process_chain_replicas[
+                process_chain.process_chain_identifier
+            ] = ProcessChainReplica(
+                representative_process_chain=representative_process_chain,
+                name_mapping=name_mapping,
+            )
+
+    def create_name_mapping(
+        self,
+        list_of_representative_names: list[str | None],
+        list_of_replica_names: list[str | None],
+    ) -> dict[str, str] | None:
+        """Maps the names of the representative chain to the names at the same
+        position of the replica chain.
+
+        Args:
+            list_of_representative_names (list[str | None]): Names of the representative.
+            list_of_replica_names (list[str | None]): Names of the replica.
+
+        Returns:
+            dict[str, str] | None: The name mapping or None if the names
+                can not be mapped unambiguously.
+        """
+        if len(list_of_representative_names) != len(list_of_replica_names):
+            return None
+        name_mapping = {}
+        for representative_name, replica_name in zip(
+            list_of_representative_names, list_of_replica_names
+        ):
+            if representative_name is None or replica_name is None:
+                if representative_name is not replica_name:
+                    return None
+                continue
+            if name_mapping.setdefault(representative_name, replica_name) != (
+                replica_name
+            ):
+                return None
+        return name_mapping
+
+    def check_if_process_chain_is_replica(self, process_chain: ProcessChain) -> bool:
+        """Checks if the results of the chain can be copied from a representative.
+
+        Args:
+            process_chain (ProcessChain): The chain to check.
+
+        Returns:
+            bool: True if the chain is a replica of a previous chain.
+        """
+        return (
+            process_chain.process_chain_identifier
+            in self.dict_of_process_chain_replicas
+        )
+
+    def replicate_process_chain(self, process_chain: ProcessChain):
+        """Copies the results of the representative chain to the replica chain.
+        The representative must have been simulated before. The entries are
+        added in the same order as in a simulation of the replica so that the
+        results are identical to a sequential simulation.
+
+        Args:
+            process_chain (ProcessChain): The replica chain.
+        """
+        process_chain_replica = self.dict_of_process_chain_replicas[
+            process_chain.process_chain_identifier
+        ]
+        representative_process_chain = (
+            process_chain_replica.representative_process_chain
+        )
+        name_mapping = process_chain_replica.name_mapping
+        logger.info(
+            "Replicate results of process chain %s for process chain %s",
+            representative_process_chain.process_chain_identifier.chain_name,
+            process_chain.process_chain_identifier.chain_name,
+        )
+        main_sink = self.network_level.get_main_sink()
+        main_source = self.network_level.get_main_source()
+        main_sink.prepare_sink_for_next_chain(
+            process_chain_identifier=process_chain.process_chain_identifier
+        )
+        main_source.prepare_source_for_next_chain(
+            process_chain_identifier=process_chain.process_chain_identifier
+        )
+        process_chain.initialize_production_plan()
+        process_chain.number_of_iterations = (
+            representative_process_chain.number_of_iterations
+        )
+        production_plan = self.network_level.production_plan
+        for process_step_name in (
+            representative_process_chain.get_process_node_dict_without_sink_and_source()
+        ):
+            production_plan.process_step_states_dict[
+                name_mapping[process_step_name]
+            ].extend(
+                replace_names_in_entry(entry=entry, name_mapping=name_mapping)
+                for entry in production_plan.process_step_states_dict[
+                    process_step_name
+                ]
+            )
+        for stream_name in representative_process_chain.stream_handler.stream_dict:
+            production_plan.stream_state_dict[name_mapping[stream_name]].extend(
+                replace_names_in_entry(entry=entry, name_mapping=name_mapping)
+                for entry in production_plan.stream_state_dict[stream_name]
+            )
+        for process_step_name, commodity_storage_state_dict in list(
+            production_plan.storage_state_dict.items()
+        ):
+            if process_step_name not in name_mapping:
+                continue
+            production_plan.storage_state_dict[name_mapping[process_step_name]] = {
+                commodity: ColumnarEntryList(
+                    (
+                        replace_names_in_entry(entry=entry, name_mapping=name_mapping)
+                        for entry in list_of_storage_entries
+                    ),
+                    interning_table=production_plan.interning_table,
+                )
+                for commodity, list_of_storage_entries in (
+                    commodity_storage_state_dict.items()
+                )
+            }
+        self._replicate_load_profiles(name_mapping=name_mapping)
+        self._replicate_sink_and_source_states(
+            representative_process_chain=representative_process_chain,
+            process_chain=process_chain,
+            name_mapping=name_mapping,
+        )
+
+    def _replicate_load_profiles(self, name_mapping: dict[str, str]):
+        """Copies the load profile entries of the streams and process steps
+        of the representative chain.
+
+        Args:
+            name_mapping (dict[str, str]): Maps the names of the representative
+                chain to the names of the replica chain.
+        """
+        load_profile_collection = (
+            self.network_level.load_profile_handler.load_profile_collection
+        )
+        load_profile_grid_accumulator = (
+            load_profile_collection.load_profile_grid_accumulator
+        )
+        if (
+            load_profile_grid_accumulator is not None
+            and load_profile_collection.retain_load_profile_entries is False
+        ):
+            # The entries are not available, so that the accumulated
+            # load profiles are copied instead.
+            for object_type in (
+                LoadProfileObjectTypes.stream,
+                LoadProfileObjectTypes.process_step,
+            ):
+                load_profile_grid_accumulator.replicate_load_profiles(
+                    object_type=object_type, name_mapping=name_mapping
+                )
+        for stream_name, stream_load_profile_collection in list(
+            load_profile_collection.dict_stream_load_profile_collections.items()
+        ):
+            if stream_name not in name_mapping:
+                continue
+            for (
+                load_type_uuid,
+                list_of_load_profile_entries,
+            ) in stream_load_profile_collection.dict_of_load_entry_lists.items():
+                for load_profile_entry in list_of_load_profile_entries:
+                    load_profile_collection.append_stream_load_profile_entry(
+                        stream_name=name_mapping[stream_name],
+                        load_type=stream_load_profile_collection.load_type_dict[
+                            load_type_uuid
+                        ],
+                        load_profile_entry=load_profile_entry,
+                    )
+        for process_step_name, process_step_load_profile_collection in list(
+            load_profile_collection.dict_process_step_load_profile_collections.items()
+        ):
+            if process_step_name not in name_mapping:
+                continue
+            for (
+                load_type_uuid,
+                list_of_load_profile_entries,
+            ) in process_step_load_profile_collection.dict_of_load_entry_lists.items():
+                for load_profile_entry in list_of_load_profile_entries:
+                    load_profile_collection.append_process_step_energy_data_entry(
+                        process_step_name=name_mapping[process_step_name],
+                        load_type=process_step_load_profile_collection.load_type_dict[
+                            load_type_uuid
+                        ],
+                        load_profile_entry=load_profile_entry,
+                    )
+
+    def _replicate_sink_and_source_states(
+        self,
+        representative_process_chain: ProcessChain,
+        process_chain: ProcessChain,
+        name_mapping: dict[str, str],
+    ):
+        """Copies the input stream states of the sink, the output stream states
+        of the source and the progress of the splitted orders.
+
+        Args:
+            representative_process_chain (ProcessChain): The representative chain.
+            process_chain (ProcessChain): The replica chain.
+            name_mapping (dict[str, str]): Maps the names of the representative
+                chain to the names of the replica chain.
+        """
+        sink = self.network_level.get_main_sink()
+        if isinstance(sink, ProcessChainStorage):
+            sink = sink.sink
+        source = self.network_level.get_main_source()
+        if isinstance(source, ProcessChainStorage):
+            source = source.source
+        representative_sink_stream_name = sink.get_stream_to_process_chain(
+            process_chain_identifier=representative_process_chain.process_chain_identifier
+        ).name
+        sink.input_stream_state_list.extend(
+            [
+                replace_names_in_entry(entry=stream_state, name_mapping=name_mapping)
+                for stream_state in sink.input_stream_state_list
+                if stream_state.name == representative_sink_stream_name
+            ]
+        )
+        representative_source_stream_name = source.dict_of_output_stream_names[
+            representative_process_chain.process_chain_identifier
+        ]
+        source.list_of_output_stream_states.extend(
+            [
+                replace_names_in_entry(entry=stream_state, name_mapping=name_mapping)
+                for stream_state in source.list_of_output_stream_states
+                if stream_state.name == representative_source_stream_name
+            ]
+        )
+        representative_splitted_order = sink.order_distributor.dict_of_splitted_order[
+            representative_process_chain.process_chain_identifier
+        ]
+        splitted_order = sink.order_distributor.dict_of_splitted_order[
+            process_chain.process_chain_identifier
+        ]
+        splitted_order.order_book = representative_splitted_order.order_book.copy()
+        splitted_order.current_order_number = (
+            representative_splitted_order.current_order_number
+        )
@@ -0,0 +1,845 @@
+import datetime
+import io
+import numbers
+import os
+import pickle
+import struct
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import cloudpickle
+import numpy
+
+from ethos_penalps.data_classes import LoopCounter
+from ethos_penalps.load_profile_accumulator import LoadProfileGridAccumulator
+from ethos_penalps.load_profile_calculator import (
+    ProcessStepLoadProfileEntryCollection,
+    StreamLoadProfileEntryCollection,
+)
+from ethos_penalps.node_operations import NodeOperation, TerminateProduction
+from ethos_penalps.process_nodes.process_chain_storage import ProcessChainStorage
+from ethos_penalps.process_nodes.sink import Sink
+from ethos_penalps.process_nodes.source import Source
+from ethos_penalps.simulation_data.container_branch_data import BranchDataContainer
+from ethos_penalps.utilities.columnar_entry_list import ColumnarEntryList
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+from ethos_penalps.utilities.identifiers import IdentifierCounter, InterningTable
+from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
+
+if TYPE_CHECKING:
+    from ethos_penalps.organizational_agents.enterprise import Enterprise
+    from ethos_penalps.organizational_agents.process_chain_replication import (
+        ProcessChainReplicator,
+    )
+
+logger = PeNALPSLogger.get_logger_without_handler()
+
+
+@dataclass
+class SimulationCheckpoint:
+    """Contains the complete state of an interrupted simulation. The enterprise
+    is stored together with the node operation that is processed next, so that
+    the ProductionPlan, the LoadProfileHandlerSimulation, the state of all nodes
+    and the position of the OrderDistributor are consistent with each other.
+    The SimulationCheckpointJournal writes only the parts of the ProductionPlan
+    and the load profiles that have been added since the previous checkpoint.
+    """
+
+    enterprise: "Enterprise"
+    network_level_index: int
+    process_chain_index: int
+    current_node_operation: NodeOperation
+    loop_number: int
+    process_chain_replicator: "ProcessChainReplicator | None" = None
+    number_of_iterations_in_chain: numbers.Number | None = None
+    replicate_identical_process_chains: bool = False
+    creation_time: datetime.datetime | None = None
+    next_identifier: int = 0
+
+
+class JournaledObjectTypes:
+    """Contains the types of the objects whose content is written to the
+    checkpoint journal in parts.
+    """
+
+    append_only_list: str = "list"
+    interning_table: str = "InterningTable"
+    columnar_entry_list: str = "ColumnarEntryList"
+    load_profile_grid_accumulator: str = "LoadProfileGridAccumulator"
+
+
+@dataclass
+class JournaledObject:
+    """Stores which part of an object has already been written to the
+    checkpoint journal.
+    """
+
+    journal_identifier: int
+    object_type: str
+    journaled_object: Any
+    journaled_length: int = 0
+    """Number of elements of a list, InterningTable or ColumnarEntryList
+    that have been written to the journal."""
+    last_journaled_element: Any = None
+    """Last element of a list that has been written to the journal. Is used
+    to detect lists that have been changed by other operations than appending.
+    """
+    set_of_journaled_keys: set = field(default_factory=set)
+    """Keys of the energy arrays of a LoadProfileGridAccumulator
+    that have been written to the journal."""
+    is_referenced: bool = False
+    """Is True if the object is referenced by the current checkpoint."""
+
+
+def get_append_only_lists(owner: Any) -> list[list]:
+    """Returns the lists of an object which are only appended during the
+    simulation. Only the new elements of these lists are written to each
+    checkpoint.
+
+    Args:
+        owner (Any): The object that might own append only lists.
+
+    Returns:
+        list[list]: The append only lists of the object.
+    """
+    if isinstance(owner, Sink):
+        return [owner.input_stream_state_list]
+    if isinstance(owner, Source):
+        return [owner.list_of_output_stream_states]
+    if isinstance(owner, BranchDataContainer):
+        return [owner.list_of_complete_branch_data]
+    if isinstance(
+        owner,
+        (StreamLoadProfileEntryCollection, ProcessStepLoadProfileEntryCollection),
+    ):
+        # The lists that have been replaced by a ColumnarEntryList when the
+        # entries were spilled are journaled as ColumnarEntryList
+        return [
+            list_of_load_profile_entries
+            for list_of_load_profile_entries in owner.dict_of_load_entry_lists.values()
+            if isinstance(list_of_load_profile_entries, list)
+        ]
+    return []
+
+
+class _JournalPickler(cloudpickle.Pickler):
+    """Pickles the objects of the journal as references."""
+
+    def __init__(
+        self,
+        file: io.BytesIO,
+        simulation_checkpoint_journal: "SimulationCheckpointJournal",
+        register_new_objects: bool,
+    ) -> None:
+        """
+
+        Args:
+            file (io.BytesIO): The buffer of the pickle.
+            simulation_checkpoint_journal (SimulationCheckpointJournal): The journal
+                which contains the objects that are pickled as references.
+            register_new_objects (bool): Determines if objects which are not in the
+                journal yet are added.
+        """
+        super().__init__(file)
+        self.simulation_checkpoint_journal: SimulationCheckpointJournal = (
+            simulation_checkpoint_journal
+        )
+        self.register_new_objects: bool = register_new_objects
+
+    def persistent_id(self, obj: Any) -> tuple | None:
+        return self.simulation_checkpoint_journal.get_persistent_identifier(
+            obj=obj, register_new_objects=self.register_new_objects
+        )
+
+
+class _JournalUnpickler(pickle.Unpickler):
+    """Resolves the references to the objects of the journal."""
+
+    def __init__(
+        self,
+        file: io.BytesIO,
+        simulation_checkpoint_journal: "SimulationCheckpointJournal",
+    ) -> None:
+        """
+
+        Args:
+            file (io.BytesIO): The buffer of the pickle.
+            simulation_checkpoint_journal (SimulationCheckpointJournal): The journal
+                which contains the referenced objects.
+        """
+        super().__init__(file)
+        self.simulation_checkpoint_journal: SimulationCheckpointJournal = (
+            simulation_checkpoint_journal
+        )
+
+    def persistent_load(self, pid: tuple) -> Any:
+        return self.simulation_checkpoint_journal.get_journaled_object(
+            persistent_identifier=pid
+        )
+
+
+class SimulationCheckpointJournal:
+    """Writes checkpoints as records that are appended to the checkpoint file.
+    The production plan entries, the load profile entries, the accumulated load
+    profiles, the stream states of the sinks and sources and the completed branches
+    of the process steps only grow during the simulation. Only the part of them
+    that has been added since the previous checkpoint is written to a record.
+    The remaining state, which consists of the node data and the position of the
+    OrderDistributor, is pickled completely and references the journaled objects.
+    A checkpoint is restored by replaying the journaled parts of all records and
+    unpickling the remaining state of the last record. Each record starts with its
+    length and a checksum, so that an incomplete last record is ignored.
+    """
+
+    record_header_format: str = ">QI"
+    delta_length_format: str = ">Q"
+
+    def __init__(self, checkpoint_path: str) -> None:
+        """
+
+        Args:
+            checkpoint_path (str): Path of the checkpoint file.
+        """
+        self.checkpoint_path: str = checkpoint_path
+        self.journal_length: int = 0
+        """Length of the complete records in the checkpoint file."""
+        self.dict_of_journaled_objects: dict[int, JournaledObject] = {}
+        """The key is the id of the journaled object."""
+        self.dict_of_objects_by_journal_identifier: dict[int, Any] = {}
+        """Contains the restored objects during the loading of the journal."""
+        self.next_journal_identifier: int = 0
+        self.number_of_records: int = 0
+        """Number of complete records in the checkpoint file."""
+
+    def get_persistent_identifier(
+        self, obj: Any, register_new_objects: bool
+    ) -> tuple | None:
+        """Returns the reference of a journaled object. The append only lists
+        of owners are added to the journal before the lists are pickled.
+
+        Args:
+            obj (Any): The object that is pickled.
+            register_new_objects (bool): Determines if objects which are not in the
+                journal yet are added.
+
+        Returns:
+            tuple | None: The reference if the object is journaled, else None.
+        """
+        journaled_object = self.dict_of_journaled_objects.get(id(obj))
+        if journaled_object is None:
+            if register_new_objects is False:
+                return None
+            if isinstance(obj, ColumnarEntryList):
+                journaled_object = self._add_journaled_object(
+                    obj=obj, object_type=JournaledObjectTypes.columnar_entry_list
+                )
+            elif isinstance(obj, InterningTable):
+                journaled_object = self._add_journaled_object(
+                    obj=obj, object_type=JournaledObjectTypes.interning_table
+                )
+            elif isinstance(obj, LoadProfileGridAccumulator):
+                journaled_object = self._add_journaled_object(
+                    obj=obj,
+                    object_type=JournaledObjectTypes.load_profile_grid_accumulator,
+                )
+            else:
+                for append_only_list in get_append_only_lists(owner=obj):
+                    if id(append_only_list) not in self.dict_of_journaled_objects:
+                        self._add_journaled_object(
+                            obj=append_only_list,
+                            object_type=JournaledObjectTypes.append_only_list,
+                        )
+                return None
+        if journaled_object.is_referenced is False:
+            if register_new_objects is False:
+                return None
+            if self._is_changed_by_other_operations(journaled_object=journaled_object):
+                journaled_object = self._add_journaled_object(
+                    obj=obj, object_type=journaled_object.object_type
+                )
+            journaled_object.is_referenced = True
+        return self._create_persistent_identifier(journaled_object=journaled_object)
+
+    def _add_journaled_object(self, obj: Any, object_type: str) -> JournaledObject:
+        """Adds an object to the journal. Its complete content is written
+        to the next record.
+
+        Args:
+            obj (Any): The new journaled object.
+            object_type (str): One of the JournaledObjectTypes.
+
+        Returns:
+            JournaledObject: The journal data of the object.
+        """
+        journaled_object = JournaledObject(
+            journal_identifier=self.next_journal_identifier,
+            object_type=object_type,
+            journaled_object=obj,
+        )
+        self.next_journal_identifier = self.next_journal_identifier + 1
+        self.dict_of_journaled_objects[id(obj)] = journaled_object
+        return journaled_object
+
+    def _is_changed_by_other_operations(
+        self, journaled_object: JournaledObject
+    ) -> bool:
+        """Checks if the journaled part of a list has been changed, so that the
+        list must be written completely again.
+
+        Args:
+            journaled_object (JournaledObject): The journal data of the object.
+
+        Returns:
+            bool: True if the journaled part has been changed.
+        """
+        if (
+            journaled_object.object_type
+            == JournaledObjectTypes.load_profile_grid_accumulator
+        ):
+            return False
+        current_length = len(journaled_object.journaled_object)
+        if current_length < journaled_object.journaled_length:
+            return True
+        if (
+            journaled_object.object_type == JournaledObjectTypes.append_only_list
+            and journaled_object.journaled_length > 0
+            and journaled_object.journaled_object[journaled_object.journaled_length - 1]
+            is not journaled_object.last_journaled_element
+        ):
+            return True
+        return False
+
+    def _create_persistent_identifier(self, journaled_object: JournaledObject) -> tuple:
+        """Creates the reference of a journaled object. The reference of
+        a ColumnarEntryList contains the reference of its InterningTable.
+
+        Args:
+            journaled_object (JournaledObject): The journal data of the object.
+
+        Returns:
+            tuple: The reference of the object.
+        """
+        if journaled_object.object_type == JournaledObjectTypes.columnar_entry_list:
+            interning_table_identifier = self.get_persistent_identifier(
+                obj=journaled_object.journaled_object.interning_table,
+                register_new_objects=True,
+            )
+            return (
+                journaled_object.object_type,
+                journaled_object.journal_identifier,
+                interning_table_identifier,
+            )
+        return (journaled_object.object_type, journaled_object.journal_identifier)
+
+    def _create_delta(self, journaled_object: JournaledObject) -> tuple:
+        """Creates the part of a journaled object that has been added since
+        the last record and marks it as journaled.
+
+        Args:
+            journaled_object (JournaledObject): The journal data of the object.
+
+        Returns:
+            tuple: The reference of the object, the number of elements that have
+                been journaled before and the new part of the object.
+        """
+        obj = journaled_object.journaled_object
+        start = journaled_object.journaled_length
+        if (
+            journaled_object.object_type
+            == JournaledObjectTypes.load_profile_grid_accumulator
+        ):
+            dict_of_changed_period_ranges = obj.pop_changed_period_ranges()
+            dict_of_array_parts = {}
+            for key, energy_array in obj.dict_of_energy_arrays.items():
+                if key not in journaled_object.set_of_journaled_keys:
+                    dict_of_array_parts[key] = (0, energy_array.copy())
+                    journaled_object.set_of_journaled_keys.add(key)
+                elif key in dict_of_changed_period_ranges:
+                    first_period, stop_period = dict_of_changed_period_ranges[key]
+                    dict_of_array_parts[key] = (
+                        first_period,
+                        energy_array[first_period:stop_period].copy(),
+                    )
+            dict_of_attributes = {
+                attribute_name: value
+                for attribute_name, value in obj.__dict__.items()
+                if attribute_name
+                not in ("dict_of_energy_arrays", "dict_of_changed_period_ranges")
+            }
+            return (
+                self._create_persistent_identifier(journaled_object=journaled_object),
+                start,
+                (dict_of_attributes, dict_of_array_parts),
+            )
+        if journaled_object.object_type == JournaledObjectTypes.interning_table:
+            new_part = obj.list_of_values[start:]
+        else:
+            new_part = list(obj[start : len(obj)])
+        journaled_object.journaled_length = start + len(new_part)
+        if (
+            journaled_object.object_type == JournaledObjectTypes.append_only_list
+            and new_part
+        ):
+            journaled_object.last_journaled_element = new_part[-1]
+        return (
+            self._create_persistent_identifier(journaled_object=journaled_object),
+            start,
+            new_part,
+        )
+
+    def create_record(self, simulation_checkpoint: SimulationCheckpoint) -> bytes:
+        """Creates the record of a checkpoint. Objects that are not referenced
+        by the checkpoint anymore are removed from the journal.
+
+        Args:
+            simulation_checkpoint (SimulationCheckpoint): The checkpoint.
+
+        Returns:
+            bytes: The record which is appended to the checkpoint file.
+        """
+        for journaled_object in self.dict_of_journaled_objects.values():
+            journaled_object.is_referenced = False
+        state_buffer = io.BytesIO()
+        _JournalPickler(
+            file=state_buffer,
+            simulation_checkpoint_journal=self,
+            register_new_objects=True,
+        ).dump(simulation_checkpoint)
+        self.dict_of_journaled_objects = {
+            object_id: journaled_object
+            for object_id, journaled_object in self.dict_of_journaled_objects.items()
+            if journaled_object.is_referenced is True
+        }
+        # The interning tables are replayed first, so that the ColumnarEntryLists
+        # find the codes of their values in the tables.
+        list_of_deltas = [
+            self._create_delta(journaled_object=journaled_object)
+            for journaled_object in sorted(
+                self.dict_of_journaled_objects.values(),
+                key=lambda journaled_object: journaled_object.object_type
+                != JournaledObjectTypes.interning_table,
+            )
+        ]
+        delta_buffer = io.BytesIO()
+        _JournalPickler(
+            file=delta_buffer,
+            simulation_checkpoint_journal=self,
+            register_new_objects=False,
+        ).dump(list_of_deltas)
+        payload = (
+            struct.pack(self.delta_length_format, len(delta_buffer.getbuffer()))
+            + delta_buffer.getvalue()
+            + state_buffer.getvalue()
+        )
+        return (
+            struct.pack(self.record_header_format, len(payload), zlib.crc32(payload))
+            + payload
+        )
+
+    def append_record(self, record: bytes):
+        """Appends a record to the checkpoint file. An incomplete record
+        of a previous crash is overwritten.
+
+        Args:
+            record (bytes): The record of the checkpoint.
+        """
+        checkpoint_directory = os.path.dirname(os.path.abspath(self.checkpoint_path))
+        os.makedirs(checkpoint_directory, exist_ok=True)
+        if self.journal_length == 0 or not os.path.exists(self.checkpoint_path):
+            file_mode = "wb"
+        else:
+            file_mode = "r+b"
+        with open(self.checkpoint_path, file_mode) as file:
+            file.seek(self.journal_length)
+            file.truncate()
+            file.write(record)
+            file.flush()
+            os.fsync(file.fileno())
+        self.journal_length = self.journal_length + len(record)
+        self.number_of_records = self.number_of_records + 1
+
+    def get_journaled_object(self, persistent_identifier: tuple) -> Any:
+        """Returns a restored object of the journal. An empty object is created
+        if the object is referenced for the first time.
+
+        Args:
+            persistent_identifier (tuple): The reference of the object.
+
+        Returns:
+            Any: The restored object.
+        """
+        object_type = persistent_identifier[0]
+        journal_identifier = persistent_identifier[1]
+        obj = self.dict_of_objects_by_journal_identifier.get(journal_identifier)
+        if obj is None:
+            if object_type == JournaledObjectTypes.append_only_list:
+                obj = []
+            elif object_type == JournaledObjectTypes.interning_table:
+                obj = InterningTable()
+            elif object_type == JournaledObjectTypes.columnar_entry_list:
+                obj = ColumnarEntryList(
+                    interning_table=self.get_journaled_object(
+                        persistent_identifier=persistent_identifier[2]
+                    )
+                )
+            elif object_type == JournaledObjectTypes.load_profile_grid_accumulator:
+                obj = LoadProfileGridAccumulator.__new__(LoadProfileGridAccumulator)
+                obj.dict_of_energy_arrays = {}
+                obj.dict_of_changed_period_ranges = {}
+            else:
+                raise MisconfigurationError(
+                    "Unexpected type of a journaled object: " + str(object_type)
+                )
+            self.dict_of_objects_by_journal_identifier[journal_identifier] = obj
+            self.dict_of_journaled_objects[id(obj)] = JournaledObject(
+                journal_identifier=journal_identifier,
+                object_type=object_type,
+                journaled_object=obj,
+            )
+            self.next_journal_identifier = max(
+                self.next_journal_identifier, journal_identifier + 1
+            )
+        self.dict_of_journaled_objects[id(obj)].is_referenced = True
+        return obj
+
+    def _apply_delta(self, persistent_identifier: tuple, start: int, new_part: Any):
+        """Adds the journaled part of a record to a restored object.
+
+        Args:
+            persistent_identifier (tuple): The reference of the object.
+            start (int): Number of elements that have been journaled before.
+            new_part (Any): The part of the object that has been added.
+        """
+        obj = self.get_journaled_object(persistent_identifier=persistent_identifier)
+        journaled_object = self.dict_of_journaled_objects[id(obj)]
+        if (
+            journaled_object.object_type
+            == JournaledObjectTypes.load_profile_grid_accumulator
+        ):
+            dict_of_attributes, dict_of_array_parts = new_part
+            obj.__dict__.update(dict_of_attributes)
+            for key, (first_period, array_part) in dict_of_array_parts.items():
+                if key not in obj.dict_of_energy_arrays:
+                    obj.dict_of_energy_arrays[key] = numpy.zeros(
+                        obj.number_of_periods, dtype=numpy.float64
+                    )
+                    journaled_object.set_of_journaled_keys.add(key)
+                obj.dict_of_energy_arrays[key][
+                    first_period : first_period + len(array_part)
+                ] = array_part
+            return
+        if start != journaled_object.journaled_length:
+            raise MisconfigurationError(
+                "The checkpoint file is inconsistent: " + self.checkpoint_path
+            )
+        if journaled_object.object_type == JournaledObjectTypes.interning_table:
+            for value in new_part:
+                obj.get_code(value)
+        else:
+            obj.extend(new_part)
+        journaled_object.journaled_length = start + len(new_part)
+        if (
+            journaled_object.object_type == JournaledObjectTypes.append_only_list
+            and new_part
+        ):
+            journaled_object.last_journaled_element = new_part[-1]
+
+    def read_checkpoint(
+        self, number_of_records: int | None = None
+    ) -> SimulationCheckpoint:
+        """Replays the complete records of the checkpoint file and restores
+        the checkpoint of the last replayed record. Records which follow the
+        replayed records are overwritten by the next appended record.
+
+        Args:
+            number_of_records (int | None, optional): Number of records that are
+                replayed. All complete records are replayed if None is provided.
+                Defaults to None.
+
+        Raises:
+            MisconfigurationError: Is raised if the file does not contain
+                a complete record.
+
+        Returns:
+            SimulationCheckpoint: The state of the interrupted simulation.
+        """
+        header_length = struct.calcsize(self.record_header_format)
+        delta_length_size = struct.calcsize(self.delta_length_format)
+        last_state = None
+        with open(self.checkpoint_path, "rb") as file:
+            while (
+                number_of_records is None or self.number_of_records < number_of_records
+            ):
+                header = file.read(header_length)
+                if len(header) < header_length:
+                    break
+                payload_length, checksum = struct.unpack(
+                    self.record_header_format, header
+                )
+                payload = file.read(payload_length)
+                if len(payload) < payload_length or zlib.crc32(payload) != checksum:
+                    break
+                (delta_length,) = struct.unpack(
+                    self.delta_length_format, payload[:delta_length_size]
+                )
+                list_of_deltas = _JournalUnpickler(
+                    file=io.BytesIO(
+                        payload[delta_length_size : delta_length_size + delta_length]
+                    ),
+                    simulation_checkpoint_journal=self,
+                ).load()
+                for persistent_identifier, start, new_part in list_of_deltas:
+                    self._apply_delta(
+                        persistent_identifier=persistent_identifier,
+                        start=start,
+                        new_part=new_part,
+                    )
+                last_state = payload[delta_length_size + delta_length :]
+                self.journal_length = file.tell()
+                self.number_of_records = self.number_of_records + 1
+        if last_state is None:
+            raise MisconfigurationError(
+                "The checkpoint file does not contain a complete checkpoint: "
+                + self.checkpoint_path
+            )
+        for journaled_object in self.dict_of_journaled_objects.values():
+            journaled_object.is_referenced = False
+        simulation_checkpoint: SimulationCheckpoint = _JournalUnpickler(
+            file=io.BytesIO(last_state), simulation_checkpoint_journal=self
+        ).load()
+        self.dict_of_journaled_objects = {
+            object_id: journaled_object
+            for object_id, journaled_object in self.dict_of_journaled_objects.items()
+            if journaled_object.is_referenced is True
+        }
+        self.dict_of_objects_by_journal_identifier = {}
+        return simulation_checkpoint
+
+
+def load_simulation_checkpoint(
+    checkpoint_path: str, number_of_records: int | None = None
+) -> SimulationCheckpoint:
+    """Loads a checkpoint that has been written by the SimulationCheckpointWriter.
+    The SimulationCheckpointWriter of the restored enterprise continues the
+    journal of the checkpoint file after the loaded checkpoint.
+
+    Args:
+        checkpoint_path (str): Path to the checkpoint file.
+        number_of_records (int | None, optional): Number of the record of the
+            checkpoint in the file. The last complete checkpoint is loaded if
+            None is provided. Defaults to None.
+
+    Returns:
+        SimulationCheckpoint: The state of the interrupted simulation.
+    """
+    simulation_checkpoint_journal = SimulationCheckpointJournal(
+        checkpoint_path=checkpoint_path
+    )
+    simulation_checkpoint = simulation_checkpoint_journal.read_checkpoint(
+        number_of_records=number_of_records
+    )
+    simulation_checkpoint_writer = (
+        simulation_checkpoint.enterprise.simulation_checkpoint_writer
+    )
+    if simulation_checkpoint_writer is not None:
+        simulation_checkpoint_writer.simulation_checkpoint_journal = (
+            simulation_checkpoint_journal
+        )
+    return simulation_checkpoint
+
+
+class SimulationCheckpointWriter:
+    """Writes checkpoints of a running simulation. A checkpoint is only written
+    directly after an order of the current chain has been fulfilled, so that a
+    resumed simulation continues from the last fulfilled order. Each checkpoint
+    is appended as a record to the checkpoint file by a SimulationCheckpointJournal,
+    so that the cost of a checkpoint does not grow with the simulated time span.
+    A crash during writing leaves an incomplete record which is ignored.
+    """
+
+    def __init__(
+        self,
+        checkpoint_path: str,
+        number_of_orders_between_checkpoints: int | None = 10,
+        time_between_checkpoints: datetime.timedelta | None = None,
+    ) -> None:
+        """
+
+        Args:
+            checkpoint_path (str): Path of the checkpoint file.
+            number_of_orders_between_checkpoints (int | None, optional): A checkpoint is
+                written after this number of fulfilled orders. Defaults to 10.
+            time_between_checkpoints (datetime.timedelta | None, optional): A checkpoint
+                is written at the first fulfilled order after this time span
+                has passed since the last checkpoint. Defaults to None.
+        """
+        if (
+            number_of_orders_between_checkpoints is None
+            and time_between_checkpoints is None
+        ):
+            raise MisconfigurationError(
+                "Either the number of orders or the time between checkpoints must be provided"
+            )
+        if (
+            number_of_orders_between_checkpoints is not None
+            and number_of_orders_between_checkpoints < 1
+        ):
+            raise MisconfigurationError(
+                "The number of orders between checkpoints must be at least 1 but is: "
+                + str(number_of_orders_between_checkpoints)
+            )
+        self.checkpoint_path: str = checkpoint_path
+        self.number_of_orders_between_checkpoints: int | None = (
+            number_of_orders_between_checkpoints
+        )
+        self.time_between_checkpoints: datetime.timedelta | None = (
+            time_between_checkpoints
+        )
+        self.number_of_written_checkpoints: int = 0
+        self.enterprise: "Enterprise"
+        self.network_level_index: int = 0
+        self.process_chain_index: int = 0
+        self.process_chain_replicator: "ProcessChainReplicator | None" = None
+        self.number_of_iterations_in_chain: numbers.Number | None = None
+        self.replicate_identical_process_chains: bool = False
+        self.last_order_number: int | None = None
+        self.number_of_orders_since_last_checkpoint: int = 0
+        self.time_of_last_checkpoint: float = time.monotonic()
+        self.simulation_checkpoint_journal: SimulationCheckpointJournal | None = None
+        """Contains the objects whose new parts are written to the next checkpoint.
+        Is not pickled with the enterprise."""
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["simulation_checkpoint_journal"] = None
+        return state
+
+    def set_simulation_position(
+        self,
+        enterprise: "Enterprise",
+        network_level_index: int,
+        process_chain_index: int,
+        process_chain_replicator: "ProcessChainReplicator | None" = None,
+        number_of_iterations_in_chain: numbers.Number | None = None,
+        replicate_identical_process_chains: bool = False,
+    ):
+        """Sets the chain that is simulated next. Must be called before the
+        simulation of each chain.
+
+        Args:
+            enterprise (Enterprise): The simulated enterprise.
+            network_level_index (int): Position of the NetworkLevel in the enterprise.
+            process_chain_index (int): Position of the chain in the NetworkLevel.
+            process_chain_replicator (ProcessChainReplicator | None, optional): The
+                replicator of the NetworkLevel. Defaults to None.
+            number_of_iterations_in_chain (numbers.Number | None, optional): Maximum
+                number of iterations in each chain. Defaults to None.
+            replicate_identical_process_chains (bool, optional): Defines if identical
+                chains are replicated. Defaults to False.
+        """
+        self.enterprise = enterprise
+        self.network_level_index = network_level_index
+        self.process_chain_index = process_chain_index
+        self.process_chain_replicator = process_chain_replicator
+        self.number_of_iterations_in_chain = number_of_iterations_in_chain
+        self.replicate_identical_process_chains = replicate_identical_process_chains
+        self.last_order_number = None
+
+    def reset_checkpoint_interval(self):
+        """Starts the count of the orders and the time until the next checkpoint."""
+        self.number_of_orders_since_last_checkpoint = 0
+        self.time_of_last_checkpoint = time.monotonic()
+
+    def write_checkpoint_if_due(
+        self,
+        sink: Sink | ProcessChainStorage,
+        current_node_operation: NodeOperation,
+    ):
+        """Is called after each iteration of the chain. Writes a checkpoint
+        if an order has been fulfilled in this iteration and the number of
+        orders or the time since the last checkpoint is reached.
+
+        Args:
+            sink (Sink | ProcessChainStorage): The sink of the simulated chain.
+            current_node_operation (NodeOperation): The node operation that
+                is processed next.
+        """
+        if isinstance(sink, ProcessChainStorage):
+            sink = sink.sink
+        current_order_number = (
+            sink.order_distributor.current_splitted_order.current_order_number
+        )
+        if self.last_order_number is None:
+            self.last_order_number = current_order_number
+            return
+        if current_order_number == self.last_order_number:
+            return
+        self.number_of_orders_since_last_checkpoint = (
+            self.number_of_orders_since_last_checkpoint
+            + current_order_number
+            - self.last_order_number
+        )
+        self.last_order_number = current_order_number
+        if isinstance(current_node_operation, TerminateProduction):
+            return
+        checkpoint_is_due = False
+        if (
+            self.number_of_orders_between_checkpoints is not None
+            and self.number_of_orders_since_last_checkpoint
+            >= self.number_of_orders_between_checkpoints
+        ):
+            checkpoint_is_due = True
+        if (
+            self.time_between_checkpoints is not None
+            and time.monotonic() - self.time_of_last_checkpoint
+            >= self.time_between_checkpoints.total_seconds()
+        ):
+            checkpoint_is_due = True
+        if checkpoint_is_due is True:
+            self.write_checkpoint(current_node_operation=current_node_operation)
+
+    def write_checkpoint(self, current_node_operation: NodeOperation):
+        """Appends the enterprise and the current position of the simulation
+        to the checkpoint file. A new journal is started if the checkpoint
+        path has changed.
+
+        Args:
+            current_node_operation (NodeOperation): The node operation that
+                is processed next.
+        """
+        simulation_checkpoint = SimulationCheckpoint(
+            enterprise=self.enterprise,
+            network_level_index=self.network_level_index,
+            process_chain_index=self.process_chain_index,
+            current_node_operation=current_node_operation,
+            loop_number=LoopCounter.loop_number,
+            process_chain_replicator=self.process_chain_replicator,
+            number_of_iterations_in_chain=self.number_of_iterations_in_chain,
+            replicate_identical_process_chains=self.replicate_identical_process_chains,
+            creation_time=datetime.datetime.now(),
+            next_identifier=IdentifierCounter.next_identifier,
+        )
+        for network_level in self.enterprise.list_of_network_level:
+            for process_chain in network_level.list_of_process_chains:
+                process_chain.debugging_information_logger.store_trace_file_length()
+        if (
+            self.simulation_checkpoint_journal is None
+            or self.simulation_checkpoint_journal.checkpoint_path
+            != self.checkpoint_path
+        ):
+            self.simulation_checkpoint_journal = SimulationCheckpointJournal(
+                checkpoint_path=self.checkpoint_path
+            )
+        record = self.simulation_checkpoint_journal.create_record(
+            simulation_checkpoint=simulation_checkpoint
+        )
+        self.simulation_checkpoint_journal.append_record(record=record)
+        self.number_of_written_checkpoints = self.number_of_written_checkpoints + 1
+        self.reset_checkpoint_interval()
+        logger.info(
+            "Checkpoint %s has been written to: %s",
+            self.number_of_written_checkpoints,
+            self.checkpoint_path,
+        )
@@ -0,0 +1,322 @@
+import datetime
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+from ethos_penalps.process_nodes.process_chain_storage import ProcessChainStorage
+from ethos_penalps.process_nodes.sink import Sink
+from ethos_penalps.utilities.exceptions_and_warnings import (
+    MisconfigurationError,
+    SimulationAbortedError,
+)
+from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
+
+logger = PeNALPSLogger.get_logger_without_handler()
+
+
+@dataclass
+class SimulationProgress:
+    """Describes the progress of a running simulation at the time
+    it is reported.
+    """
+
+    network_level_index: int
+    number_of_network_levels: int
+    process_chain_name: str
+    process_chain_index: int
+    number_of_process_chains: int
+    number_of_fulfilled_orders: int
+    number_of_orders: int
+    produced_mass: float
+    target_mass: float
+    number_of_iterations: int
+    """Number of iterations of the current chain."""
+    total_number_of_iterations: int
+    """Number of iterations of all chains that have been simulated
+    since the start of the reporter."""
+    elapsed_time: datetime.timedelta
+    """Time since the start of the simulation of the current chain."""
+    iterations_per_second: float
+    """Iteration rate of the current chain."""
+    estimated_remaining_time: datetime.timedelta | None
+    """Estimate for the current chain based on the mass produced so far.
+    Is None as long as no mass has been produced."""
+    process_chain_is_terminated: bool = False
+
+
+class SimulationProgressReporter:
+    """Is assigned to the chains by Enterprise.enable_simulation_progress to
+    report the progress of the simulation in a fixed time interval. The progress
+    is passed to a callback, optionally logged and can be iterated while the
+    simulation runs in a background thread. Raising a SimulationAbortedError in
+    the callback or stopping the iteration stops the simulation, so that runs
+    which are too slow can be terminated early. The time is only compared after
+    each iteration of a chain, so that the reporter does not slow down the
+    simulation.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[SimulationProgress], None] | None = None,
+        reporting_interval: datetime.timedelta = datetime.timedelta(seconds=10),
+        log_progress: bool = True,
+    ) -> None:
+        """
+
+        Args:
+            callback (Callable[[SimulationProgress], None] | None, optional): Is
+                called with the current SimulationProgress in each reporting
+                interval and after each chain is terminated. Defaults to None.
+            reporting_interval (datetime.timedelta, optional): Minimum time between
+                two reports. Defaults to datetime.timedelta(seconds=10).
+            log_progress (bool, optional): Determines if the progress is logged
+                at info level in each report. Defaults to True.
+        """
+        if reporting_interval.total_seconds() < 0:
+            raise MisconfigurationError(
+                "The reporting interval must not be negative but is: "
+                + str(reporting_interval)
+            )
+        self.callback: Callable[[SimulationProgress], None] | None = callback
+        self.reporting_interval_in_seconds: float = reporting_interval.total_seconds()
+        self.log_progress: bool = log_progress
+        self.network_level_index: int = 0
+        self.number_of_network_levels: int = 0
+        self.process_chain_index: int = 0
+        self.number_of_process_chains: int = 0
+        self.process_chain_name: str = ""
+        self.number_of_iterations: int = 0
+        self.number_of_iterations_of_terminated_chains: int = 0
+        self.start_time_of_process_chain: float = time.monotonic()
+        self.time_of_next_report: float = self.start_time_of_process_chain
+        self.queue_of_simulation_progress: queue.Queue | None = None
+        self.simulation_is_aborted: bool = False
+
+    def __getstate__(self) -> dict:
+        """Excludes the queue of a running iteration, which can not be pickled
+        when the enterprise is stored in a checkpoint.
+
+        Returns:
+            dict: The attributes of the reporter.
+        """
+        state = self.__dict__.copy()
+        state["queue_of_simulation_progress"] = None
+        state["simulation_is_aborted"] = False
+        return state
+
+    def iterate_simulation_progress(
+        self, start_simulation: Callable[[], None]
+    ) -> Iterator[SimulationProgress]:
+        """Runs the simulation in a background thread and yields the progress
+        of each report. An exception of the simulation is raised after the
+        last progress has been yielded. If the iteration is stopped early the
+        simulation is aborted at the next iteration of the current chain.
+
+        Args:
+            start_simulation (Callable[[], None]): Starts the simulation of the
+                enterprise whose chains are assigned to this reporter.
+
+        Yields:
+            Iterator[SimulationProgress]: The progress in each reporting interval and
+                after each chain is terminated.
+        """
+        queue_of_simulation_progress = queue.Queue()
+        list_of_exceptions: list[BaseException] = []
+
+        def simulate():
+            try:
+                start_simulation()
+            except BaseException as exception:
+                list_of_exceptions.append(exception)
+            finally:
+                queue_of_simulation_progress.put(None)
+
+        self.queue_of_simulation_progress = queue_of_simulation_progress
+        self.simulation_is_aborted = False
+        simulation_thread = threading.Thread(target=simulate, daemon=True)
+        simulation_thread.start()
+        simulation_is_completed = False
+        try:
+            while True:
+                simulation_progress = queue_of_simulation_progress.get()
+                if simulation_progress is None:
+                    simulation_is_completed = True
+                    break
+                yield simulation_progress
+        finally:
+            if simulation_is_completed is False:
+                self.simulation_is_aborted = True
+            simulation_thread.join()
+            self.queue_of_simulation_progress = None
+            self.simulation_is_aborted = False
+        if list_of_exceptions:
+            raise list_of_exceptions[0]
+
+    def set_simulation_position(
+        self,
+        network_level_index: int,
+        number_of_network_levels: int,
+        process_chain_index: int,
+        number_of_process_chains: int,
+        process_chain_name: str,
+    ):
+        """Sets the chain that is simulated next. Must be called before the
+        simulation of each chain.
+
+        Args:
+            network_level_index (int): Position of the NetworkLevel in the enterprise.
+            number_of_network_levels (int): Number of NetworkLevel of the enterprise.
+            process_chain_index (int): Position of the chain in the NetworkLevel.
+            number_of_process_chains (int): Number of chains in the NetworkLevel.
+            process_chain_name (str): Name of the chain.
+        """
+        self.network_level_index = network_level_index
+        self.number_of_network_levels = number_of_network_levels
+        self.process_chain_index = process_chain_index
+        self.number_of_process_chains = number_of_process_chains
+        self.process_chain_name = process_chain_name
+        self.number_of_iterations = 0
+        self.start_time_of_process_chain = time.monotonic()
+        self.time_of_next_report = (
+            self.start_time_of_process_chain + self.reporting_interval_in_seconds
+        )
+
+    def report_progress_if_due(self, sink: Sink | ProcessChainStorage):
+        """Is called after each iteration of the chain. Reports the progress
+        if the reporting interval has passed since the last report.
+
+        Args:
+            sink (Sink | ProcessChainStorage): The sink of the simulated chain.
+        """
+        self.number_of_iterations = self.number_of_iterations + 1
+        if self.simulation_is_aborted is True:
+            raise SimulationAbortedError(
+                "The iteration of the simulation progress has been stopped"
+            )
+        if time.monotonic() >= self.time_of_next_report:
+            self.report_progress(sink=sink)
+
+    def report_process_chain_termination(self, sink: Sink | ProcessChainStorage):
+        """Reports the final progress of a chain after its simulation
+        is terminated.
+
+        Args:
+            sink (Sink | ProcessChainStorage): The sink of the simulated chain.
+        """
+        self.report_progress(sink=sink, process_chain_is_terminated=True)
+        self.number_of_iterations_of_terminated_chains = (
+            self.number_of_iterations_of_terminated_chains + self.number_of_iterations
+        )
+        self.number_of_iterations = 0
+
+    def report_progress(
+        self,
+        sink: Sink | ProcessChainStorage,
+        process_chain_is_terminated: bool = False,
+    ) -> SimulationProgress:
+        """Determines the current progress from the orders of the chain and
+        passes it to the callback.
+
+        Args:
+            sink (Sink | ProcessChainStorage): The sink of the simulated chain.
+            process_chain_is_terminated (bool, optional): Is True if the
+                simulation of the chain is terminated. Defaults to False.
+
+        Returns:
+            SimulationProgress: The reported progress.
+        """
+        simulation_progress = self.get_simulation_progress(
+            sink=sink, process_chain_is_terminated=process_chain_is_terminated
+        )
+        if self.log_progress is True:
+            logger.info(
+                "Progress of %s in NetworkLevel %s/%s: %s/%s orders, %.1f%% of the"
+                " target mass, %.1f iterations per second, estimated remaining time: %s",
+                simulation_progress.process_chain_name,
+                simulation_progress.network_level_index + 1,
+                simulation_progress.number_of_network_levels,
+                simulation_progress.number_of_fulfilled_orders,
+                simulation_progress.number_of_orders,
+                self.get_percentage_of_target_mass(
+                    simulation_progress=simulation_progress
+                ),
+                simulation_progress.iterations_per_second,
+                simulation_progress.estimated_remaining_time,
+            )
+        if self.callback is not None:
+            self.callback(simulation_progress)
+        if self.queue_of_simulation_progress is not None:
+            self.queue_of_simulation_progress.put(simulation_progress)
+        self.time_of_next_report = time.monotonic() + self.reporting_interval_in_seconds
+        return simulation_progress
+
+    def get_simulation_progress(
+        self,
+        sink: Sink | ProcessChainStorage,
+        process_chain_is_terminated: bool = False,
+    ) -> SimulationProgress:
+        """Creates the SimulationProgress of the current chain.
+
+        Args:
+            sink (Sink | ProcessChainStorage): The sink of the simulated chain.
+            process_chain_is_terminated (bool, optional): Is True if the
+                simulation of the chain is terminated. Defaults to False.
+
+        Returns:
+            SimulationProgress: The current progress.
+        """
+        if isinstance(sink, ProcessChainStorage):
+            sink = sink.sink
+        splitted_order = sink.order_distributor.current_splitted_order
+        produced_mass = splitted_order.order_book.get_total_produced_mass()
+        target_mass = float(splitted_order.target_mass)
+        elapsed_time_in_seconds = time.monotonic() - self.start_time_of_process_chain
+        if elapsed_time_in_seconds > 0:
+            iterations_per_second = self.number_of_iterations / elapsed_time_in_seconds
+        else:
+            iterations_per_second = 0.0
+        if process_chain_is_terminated is True:
+            estimated_remaining_time = datetime.timedelta(0)
+        elif produced_mass > 0:
+            estimated_remaining_time = datetime.timedelta(
+                seconds=elapsed_time_in_seconds
+                * max(target_mass - produced_mass, 0)
+                / produced_mass
+            )
+        else:
+            estimated_remaining_time = None
+        return SimulationProgress(
+            network_level_index=self.network_level_index,
+            number_of_network_levels=self.number_of_network_levels,
+            process_chain_name=self.process_chain_name,
+            process_chain_index=self.process_chain_index,
+            number_of_process_chains=self.number_of_process_chains,
+            number_of_fulfilled_orders=splitted_order.current_order_number,
+            number_of_orders=len(splitted_order.order_book),
+            produced_mass=produced_mass,
+            target_mass=target_mass,
+            number_of_iterations=self.number_of_iterations,
+            total_number_of_iterations=self.number_of_iterations_of_terminated_chains
+            + self.number_of_iterations,
+            elapsed_time=datetime.timedelta(seconds=elapsed_time_in_seconds),
+            iterations_per_second=iterations_per_second,
+            estimated_remaining_time=estimated_remaining_time,
+            process_chain_is_terminated=process_chain_is_terminated,
+        )
+
+    def get_percentage_of_target_mass(
+        self, simulation_progress: SimulationProgress
+    ) -> float:
+        """Returns the share of the target mass that has been produced.
+
+        Args:
+            simulation_progress (SimulationProgress): The progress of the chain.
+
+        Returns:
+            float: Produced mass in percent of the target mass.
+        """
+        if simulation_progress.target_mass == 0:
+            return 100.0
+        return 100 * simulation_progress.produced_mass / simulation_progress.target_mass
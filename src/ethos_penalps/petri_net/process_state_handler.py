@@ -40,6 +40,10 @@ from ethos_penalps.simulation_data.container_simulation_data import (
 )
 from ethos_penalps.stream import BatchStreamState, ContinuousStreamState
 from ethos_penalps.time_data import TimeData
+from ethos_penalps.utilities.integer_time import (
+    convert_datetime_to_integer_time,
+    convert_integer_time_to_datetime,
+)
 from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
 
 logger = PeNALPSLogger.get_logger_without_handler()
@@ -241,11 +245,11 @@ class ProcessStateHandler:
             current_process_state_switch_selector.select_state_switch()
         )
 
-        next_backward_event_time = (
-            current_process_state_switch.calculate_next_event_time_backward()
+        next_backward_event_integer_time = (
+            current_process_state_switch.calculate_next_event_integer_time_backward()
         )
-        self.process_step_data.time_data.set_next_process_state_switch_time(
-            next_discrete_event_time=next_backward_event_time
+        self.process_step_data.time_data.set_next_process_state_switch_integer_time(
+            next_discrete_event_integer_time=next_backward_event_integer_time
         )
         end_state_name_of_switch = (
             current_process_state_switch.state_connector.end_state_name
@@ -260,11 +264,11 @@ class ProcessStateHandler:
 
         self.deactivate_state(
             state_name_to_deactivate=end_state_name_of_switch,
-            time_to_deactivate=next_backward_event_time,
+            integer_time_to_deactivate=next_backward_event_integer_time,
         )
         new_active_state = self.activate_state(
             state_name_to_activate=start_state_name_of_switch,
-            time_to_activate=next_backward_event_time,
+            integer_time_to_activate=next_backward_event_integer_time,
         )
         logger.debug(
             "State after switch is: %s",
@@ -273,13 +277,14 @@ class ProcessStateHandler:
         return new_active_state
 
     def activate_state(
-        self, state_name_to_activate: str, time_to_activate: datetime.datetime
+        self, state_name_to_activate: str, integer_time_to_activate: int
     ) -> ProcessState:
         """Activates a new state in the Petri net.
 
         Args:
             state_name_to_activate (str): The new state to be activated.
-            time_to_activate (datetime.datetime): End time of the activated state.
+            integer_time_to_activate (int): End time of the activated state
+                in microseconds since the EPOCH.
 
         Returns:
             ProcessState: Activated state.
@@ -288,7 +293,7 @@ class ProcessStateHandler:
             "State: %s of process step: %s is activated at: %s",
             state_name_to_activate,
             self.process_step_data.process_step_name,
-            time_to_activate,
+            integer_time_to_activate,
         )
 
         self.process_step_data.state_data_container.update_current_process_state(
@@ -301,16 +306,17 @@ class ProcessStateHandler:
         return state_to_activate
 
     def deactivate_state(
-        self, state_name_to_deactivate: str, time_to_deactivate: datetime.datetime
+        self, state_name_to_deactivate: str, integer_time_to_deactivate: int
     ):
-        """Deactivates the current state at time_to_deactivate provided. It is assumed that
-        the state to be deactivated has already an end_time. Time to deactivate is then set
-        and the state is stored to process state list."""
+        """Deactivates the current state at integer_time_to_deactivate provided. It is
+        assumed that the state to be deactivated has already an end_time. Time to deactivate
+        is then set and the state is stored to process state list. The integer times are
+        converted to datetime objects for the entry of the process state."""
         logger.debug(
             "State: %s of process step: %s is deactivated at: %s",
             state_name_to_deactivate,
             self.process_step_data.process_step_name,
-            time_to_deactivate,
+            integer_time_to_deactivate,
         )
 
         state_data = (
@@ -319,13 +325,12 @@ class ProcessStateHandler:
         current_process_state = self.get_process_state(
             process_state_name=state_data.current_process_state_name
         )
-        last_process_state_switch_time = (
-            self.process_step_data.time_data.get_last_process_state_switch_time()
-        )
         process_state_state = ProcessStateData(
             process_state_name=current_process_state.process_state_name,
-            start_time=time_to_deactivate,
-            end_time=last_process_state_switch_time,
+            start_time=convert_integer_time_to_datetime(
+                integer_time=integer_time_to_deactivate
+            ),
+            end_time=self.process_step_data.time_data.get_last_process_state_switch_time(),
         )
         self.process_step_data.state_data_container.add_process_state_state(
             process_state_state=process_state_state
@@ -390,7 +395,9 @@ class ProcessStateHandler:
             self.process_step_data.state_data_container.initialize_production_data()
             self.activate_state(
                 state_name_to_activate=self.process_step_data.state_data_container.initialization_data_collector.current_process_state_name,
-                time_to_activate=self.process_step_data.time_data.global_end_date,
+                integer_time_to_activate=convert_datetime_to_integer_time(
+                    date_time=self.process_step_data.time_data.global_end_date
+                ),
             )
             self.process_step_data.state_data_container.prepare_for_new_output_branch(
                 parent_branch_data=incomplete_output_branch_data,
@@ -148,13 +148,20 @@ class ProcessStateNetworkNavigator:
         return output_stream_adaption_decider
 
     def store_current_simulation_data(self):
-        """Stores the current simulation data so it can be restored at a later point of the simulation."""
-        self.time_data_at_start = (
-            self.process_state_handler.process_step_data.time_data.create_self_copy()
-        )
-        self.simulation_state_data_at_start = (
-            self.process_state_handler.process_step_data.state_data_container.state_data.create_self_copy()
-        )
+        """Stores the current simulation data so it can be restored at a later point of the simulation.
+        In the undo log mode only the recorded changes are discarded instead of copying
+        the time data and the state data.
+        """
+        undo_log = self.process_state_handler.process_step_data.undo_log
+        if undo_log is None:
+            self.time_data_at_start = (
+                self.process_state_handler.process_step_data.time_data.create_self_copy()
+            )
+            self.simulation_state_data_at_start = (
+                self.process_state_handler.process_step_data.state_data_container.state_data.create_self_copy()
+            )
+        else:
+            undo_log.clear()
         self.branch_data_at_start = (
             self.process_state_handler.process_step_data.state_data_container.current_branch_data.create_copy()
         )
@@ -551,11 +558,18 @@ class ProcessStateNetworkNavigator:
 
     def reset_temporal_branch(self):
         """Restores the process step data to previously stored state."""
-        self.process_state_handler.restore_process_step_data(
-            time_data_at_start=self.time_data_at_start,
-            simulation_state_data_at_start=self.simulation_state_data_at_start,
-            branch_data_at_start=self.branch_data_at_start,
-        )
+        undo_log = self.process_state_handler.process_step_data.undo_log
+        if undo_log is None:
+            self.process_state_handler.restore_process_step_data(
+                time_data_at_start=self.time_data_at_start,
+                simulation_state_data_at_start=self.simulation_state_data_at_start,
+                branch_data_at_start=self.branch_data_at_start,
+            )
+        else:
+            undo_log.rollback()
+            self.process_state_handler.process_step_data.state_data_container.restore_branch_data(
+                branch_data_at_start=self.branch_data_at_start
+            )
 
         logger.debug("Temporal branch has been reset")
 
@@ -645,7 +659,9 @@ class ProcessStateNetworkNavigator:
                     self.process_state_handler.process_step_data.main_mass_balance.main_input_stream_name
                 )
                 input_stream_production_plan_entry = (
-                    temporary_production_plan.stream_state_dict[input_stream_name][-1]
+                    temporary_production_plan.get_last_stream_state_entry(
+                        stream_name=input_stream_name
+                    )
                 )
                 process_state_entry = (
                     process_state._create_process_step_production_plan_entry(
@@ -661,14 +677,10 @@ class ProcessStateNetworkNavigator:
                     )
                 )
             process_state_entry_list.append(process_state_entry)
-        if process_step_name in temporary_production_plan.process_step_states_dict:
-            temporary_production_plan.process_step_states_dict[
-                process_step_name
-            ].extend(process_state_entry_list)
-        else:
-            temporary_production_plan.process_step_states_dict[process_step_name] = (
-                process_state_entry_list
-            )
+        temporary_production_plan.add_process_step_state_entries(
+            process_step_name=process_step_name,
+            list_of_process_step_entries=process_state_entry_list,
+        )
 
         self.process_state_handler.process_step_data.state_data_container.update_temporary_production_plan(
             updated_temporary_production_plan=temporary_production_plan
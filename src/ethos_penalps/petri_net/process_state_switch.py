@@ -9,6 +9,11 @@ from ethos_penalps.simulation_data.container_simulation_data import (
     ValidatedPostProductionStateData,
 )
 from ethos_penalps.stream import BatchStreamState, ContinuousStreamState
+from ethos_penalps.utilities.integer_time import (
+    convert_datetime_to_integer_time,
+    convert_integer_time_to_datetime,
+    convert_timedelta_to_integer_time,
+)
 from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
 
 logger = PeNALPSLogger.get_logger_without_handler()
@@ -23,6 +28,15 @@ class ProcessStateSwitch(ABC):
     state_connector: StateConnector
     process_step_data: ProcessStepData
 
+    def calculate_next_event_integer_time_backward(self) -> int:
+        """Determines the switch time to the next state.
+
+        Returns:
+            int: Time in microseconds since the EPOCH when a switch occurs
+                from the end state to the start state.
+        """
+        raise NotImplementedError
+
     def calculate_next_event_time_backward(self) -> datetime.datetime:
         """Determines the switch time to the next state.
 
@@ -30,7 +44,9 @@ class ProcessStateSwitch(ABC):
             datetime.datetime: Time when a switch occurs from the
                 end state to the start state.
         """
-        raise NotImplementedError
+        return convert_integer_time_to_datetime(
+            integer_time=self.calculate_next_event_integer_time_backward()
+        )
 
 
 class ProcessStateSwitchDelay(ProcessStateSwitch):
@@ -65,24 +81,26 @@ class ProcessStateSwitchDelay(ProcessStateSwitch):
         self.process_step_data: ProcessStepData = process_step_data
         self.state_connector: StateConnector = state_connector
         self.delay: datetime.timedelta = delay
+        self.integer_delay: int = convert_timedelta_to_integer_time(duration=delay)
 
     def __str__(self):
         return "ProcessStateSwitchDelay " + str(self.state_connector)
 
-    def calculate_next_event_time_backward(self) -> datetime.datetime:
+    def calculate_next_event_integer_time_backward(self) -> int:
         """This method calculates the time until the next storage event occurs
         for each storage of the process step
         """
 
-        next_event_time = (
-            self.process_step_data.time_data.last_process_state_switch_time - self.delay
+        next_event_integer_time = (
+            self.process_step_data.time_data.last_process_state_switch_integer_time
+            - self.integer_delay
         )
         logger.debug(
             "Next event time is at: %s and last process state switch time is at: %s",
-            next_event_time,
-            self.process_step_data.time_data.last_process_state_switch_time,
+            next_event_integer_time,
+            self.process_step_data.time_data.last_process_state_switch_integer_time,
         )
-        return next_event_time
+        return next_event_integer_time
 
 
 class ProcessStateSwitchAtOutputStreamProvided(ProcessStateSwitch):
@@ -117,15 +135,15 @@ class ProcessStateSwitchAtOutputStreamProvided(ProcessStateSwitch):
     def __str__(self):
         return "ProcessStateSwitchAtTimeProvided " + str(self.state_connector)
 
-    def calculate_next_event_time_backward(
+    def calculate_next_event_integer_time_backward(
         self,
-    ) -> datetime.datetime:
+    ) -> int:
         """This method calculates the process state switch time. It triggers the switch
         at the start time of the output stream state.
 
         Returns:
-            datetime.datetime: The new switch time at the start time of the
-                output stream state.
+            int: The new switch time in microseconds since the EPOCH at the
+                start time of the output stream state.
         """
         if not isinstance(self.state_connector.start_state_name, str):
             raise Exception(
@@ -144,12 +162,12 @@ class ProcessStateSwitchAtOutputStreamProvided(ProcessStateSwitch):
         logger.debug(
             "Next event time is at: %s and last process state switch time is at: %s at process step: %s with the current process state: %s",
             next_event_time,
-            self.process_step_data.time_data.last_process_state_switch_time,
+            self.process_step_data.time_data.last_process_state_switch_integer_time,
             self.process_step_data.process_step_name,
             state_data.current_output_stream_state,
         )
 
-        return next_event_time
+        return convert_datetime_to_integer_time(date_time=next_event_time)
 
 
 class ProcessStateSwitchAtInputStreamProvided(ProcessStateSwitch):
@@ -185,15 +203,15 @@ class ProcessStateSwitchAtInputStreamProvided(ProcessStateSwitch):
     def __str__(self):
         return "ProcessStateSwitchAtTimeProvided " + str(self.state_connector)
 
-    def calculate_next_event_time_backward(
+    def calculate_next_event_integer_time_backward(
         self,
-    ) -> datetime.datetime:
+    ) -> int:
         """This method calculates the next process state switch time. It switches at the
         start time of the input stream state.
 
         Returns:
-            datetime.datetime: The process state switch time at the start time
-                of the input stream state.
+            int: The process state switch time in microseconds since the EPOCH
+                at the start time of the input stream state.
         """
         if not isinstance(self.state_connector.start_state_name, str):
             raise Exception(
@@ -216,12 +234,12 @@ class ProcessStateSwitchAtInputStreamProvided(ProcessStateSwitch):
         logger.debug(
             "Next event time is at: %s and last process state switch time is at: %s at process step: %s with the current process state: %s",
             next_event_time,
-            self.process_step_data.time_data.last_process_state_switch_time,
+            self.process_step_data.time_data.last_process_state_switch_integer_time,
             self.process_step_data.process_step_name,
             state_data.current_process_state_name,
         )
 
-        return next_event_time
+        return convert_datetime_to_integer_time(date_time=next_event_time)
 
 
 class ProcessStateSwitchAfterInputAndOutputStream(ProcessStateSwitch):
@@ -259,16 +277,16 @@ class ProcessStateSwitchAfterInputAndOutputStream(ProcessStateSwitch):
     def __str__(self):
         return "ProcessStateSwitchAtTimeProvided " + str(self.state_connector)
 
-    def calculate_next_event_time_backward(
+    def calculate_next_event_integer_time_backward(
         self,
-    ) -> datetime.datetime:
+    ) -> int:
         """This method calculates the next process state switch time. It switches at the
         start time of the input stream state or output stream state. If they do not
         start at the same time, the earlier start date is chosen.
 
         Returns:
-            datetime.datetime: The new process state switch time. It is the start time
-                of the input stream state or the output stream state. If they do not
+            int: The new process state switch time in microseconds since the EPOCH.
+                It is the start time of the input stream state or the output stream state. If they do not
                 start at the same time, the earlier start date is chosen.
         """
         if not isinstance(self.state_connector.start_state_name, str):
@@ -298,12 +316,12 @@ class ProcessStateSwitchAfterInputAndOutputStream(ProcessStateSwitch):
         logger.debug(
             "Next event time is at: %s and last process state switch time is at: %s at process step: %s with the current process state: %s",
             next_event_time,
-            self.process_step_data.time_data.last_process_state_switch_time,
+            self.process_step_data.time_data.last_process_state_switch_integer_time,
             self.process_step_data.process_step_name,
             state_data.current_process_state_name,
         )
 
-        return next_event_time
+        return convert_datetime_to_integer_time(date_time=next_event_time)
 
 
 class ProcessStateSwitchAtNextDiscreteEvent(ProcessStateSwitch):
@@ -340,14 +358,15 @@ class ProcessStateSwitchAtNextDiscreteEvent(ProcessStateSwitch):
     def __str__(self):
         return "ProcessStateSwitchAtTimeProvided " + str(self.state_connector)
 
-    def calculate_next_event_time_backward(
+    def calculate_next_event_integer_time_backward(
         self,
-    ) -> datetime.datetime:
+    ) -> int:
         """This method determines the switch time from the idle state.
 
         Returns:
-            datetime.datetime: The time when the switch from the idle state must
-                occur so that the output stream sate can be delivered just in time.
+            int: The time in microseconds since the EPOCH when the switch from the
+                idle state must occur so that the output stream sate can be delivered
+                just in time.
         """
         if not isinstance(self.state_connector.start_state_name, str):
             raise Exception(
@@ -357,18 +376,18 @@ class ProcessStateSwitchAtNextDiscreteEvent(ProcessStateSwitch):
             raise Exception(
                 "A name of typ string should be supplied for process state identification"
             )
-        next_event_time = (
-            self.process_step_data.time_data.get_next_process_state_switch_time()
+        next_event_integer_time = (
+            self.process_step_data.time_data.next_process_state_switch_integer_time
         )
         state_data = (
             self.process_step_data.state_data_container.get_pre_or_post_production_state_data()
         )
         logger.debug(
             "Next event time is at: %s and last process state switch time is at: %s at process step: %s with the current process state: %s",
-            next_event_time,
-            self.process_step_data.time_data.last_process_state_switch_time,
+            next_event_integer_time,
+            self.process_step_data.time_data.last_process_state_switch_integer_time,
             self.process_step_data.process_step_name,
             state_data.current_process_state_name,
         )
 
-        return next_event_time
+        return next_event_integer_time
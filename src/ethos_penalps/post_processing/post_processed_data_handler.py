@@ -22,6 +22,7 @@ from ethos_penalps.stream import (
     ContinuousStreamProductionPlanEntry,
     StreamDataFrameMetaInformation,
 )
+from ethos_penalps.utilities.columnar_entry_list import convert_entries_to_data_frame
 from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
 
 logger = PeNALPSLogger.get_logger_without_handler()
@@ -70,7 +71,9 @@ class PostProcessSimulationDataHandler:
             stream_name,
             list_of_stream_entries,
         ) in self.production_plan.stream_state_dict.items():
-            stream_data_frame = pandas.DataFrame(list_of_stream_entries)
+            stream_data_frame = convert_entries_to_data_frame(
+                entries=list_of_stream_entries
+            )
             stream_data_frame_meta_information: (
                 EmptyMetaDataInformation | StreamDataFrameMetaInformation
             )
@@ -121,7 +124,9 @@ class PostProcessSimulationDataHandler:
             process_step_name,
             list_of_process_state_entries,
         ) in self.production_plan.process_step_states_dict.items():
-            process_state_data_frame = pandas.DataFrame(list_of_process_state_entries)
+            process_state_data_frame = convert_entries_to_data_frame(
+                entries=list_of_process_state_entries
+            )
             if process_state_data_frame.empty is True:
                 process_step_data_meta_information = EmptyMetaDataInformation(
                     name=process_step_name, object_type="process step"
@@ -156,7 +161,9 @@ class PostProcessSimulationDataHandler:
                 list_of_storage_entries = self.production_plan.storage_state_dict[
                     process_step_name
                 ][commodity]
-                storage_entry_data_frame = pandas.DataFrame(list_of_storage_entries)
+                storage_entry_data_frame = convert_entries_to_data_frame(
+                    entries=list_of_storage_entries
+                )
                 if storage_entry_data_frame.empty is True:
                     storage_meta_data = EmptyMetaDataInformation(
                         name=process_step_name, object_type="storage"
@@ -2,7 +2,6 @@ import datetime
 import json
 import numbers
 
-import datetimerange
 import jsonpickle
 import pandas
 import pint
@@ -96,9 +95,6 @@ class StreamPostProcessor:
                     current_operation_rate=0,
                     start_time=start_date,
                     end_date=first_entry.start_time,
-                    date_time_range=datetimerange.DateTimeRange(
-                        start_datetime=start_date, end_datetime=first_entry.start_time
-                    ),
                 )
                 production_plan_entry = self.stream.create_production_plan_entry(
                     state=stream_state
@@ -108,9 +104,6 @@ class StreamPostProcessor:
                     batch_mass_value=0,
                     start_time=start_date,
                     end_date=first_entry.start_time,
-                    date_time_range=datetimerange.DateTimeRange(
-                        start_datetime=start_date, end_datetime=first_entry.start_time
-                    ),
                 )
                 production_plan_entry = self.stream.create_production_plan_entry(
                     state=stream_state
@@ -143,9 +136,6 @@ class StreamPostProcessor:
                     current_operation_rate=0,
                     start_time=last_entry.end_time,
                     end_date=end_date,
-                    date_time_range=datetimerange.DateTimeRange(
-                        start_datetime=last_entry.end_time, end_datetime=end_date
-                    ),
                 )
                 production_plan_entry = self.stream.create_production_plan_entry(
                     state=stream_state
@@ -155,9 +145,6 @@ class StreamPostProcessor:
                     batch_mass_value=0,
                     start_time=last_entry.end_time,
                     end_date=end_date,
-                    date_time_range=datetimerange.DateTimeRange(
-                        start_datetime=last_entry.end_time, end_datetime=end_date
-                    ),
                 )
                 production_plan_entry = self.stream.create_production_plan_entry(
                     state=stream_state
@@ -42,6 +42,9 @@ from ethos_penalps.post_processing.report_generator.production_plan_data_frame_p
 from ethos_penalps.post_processing.report_generator.report_options import (
     ReportGeneratorOptions,
 )
+from ethos_penalps.post_processing.report_generator.simulation_profile_page import (
+    SimulationProfilePageGenerator,
+)
 from ethos_penalps.post_processing.tikz_visualizations.enterprise_graph_builder import (
     EnterpriseGraphBuilderTikz,
 )
@@ -59,6 +62,7 @@ from ethos_penalps.utilities.debugging_information import (
 )
 from ethos_penalps.utilities.general_functions import ResultPathGenerator
 from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
+from ethos_penalps.utilities.simulation_profiler import SimulationProfiler
 
 logger = PeNALPSLogger.get_logger_without_handler()
 
@@ -78,6 +82,7 @@ class EnterpriseReportGenerator:
         list_of_network_level: list[NetworkLevel],
         post_process_simulation_data_handler: PostProcessSimulationDataHandler,
         # production_order_dict: dict[float, ProductionOrder],
+        simulation_profiler: SimulationProfiler | None = None,
     ) -> None:
         """
 
@@ -88,7 +93,11 @@ class EnterpriseReportGenerator:
                 Enterprise.
             post_process_simulation_data_handler (PostProcessSimulationDataHandler): Contains
                 the post processed simulation results.
+            simulation_profiler (SimulationProfiler | None, optional): Contains the
+                wall time of the nodes during the simulation. A page with the profile
+                is added to the report if it has recorded any calls. Defaults to None.
         """
+        self.simulation_profiler: SimulationProfiler | None = simulation_profiler
         self.production_plan: ProductionPlan = production_plan
         self.group_list: list[datapane.Group] = []
         self.list_of_network_level: list[NetworkLevel] = list_of_network_level
@@ -200,6 +209,18 @@ class EnterpriseReportGenerator:
         )
         self.group_list.append(carpet_plot_page)
 
+        # Create Simulation Profile Page
+        if (
+            self.simulation_profiler is not None
+            and self.simulation_profiler.check_if_calls_are_recorded()
+        ):
+            simulation_profile_page_generator = SimulationProfilePageGenerator(
+                simulation_profiler=self.simulation_profiler
+            )
+            self.group_list.append(
+                simulation_profile_page_generator.create_simulation_profile_page()
+            )
+
         if self.report_directory is None:
             result_path_generator = ResultPathGenerator()
             path_to_main_file = (
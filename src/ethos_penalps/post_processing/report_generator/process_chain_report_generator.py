@@ -33,6 +33,7 @@ from ethos_penalps.post_processing.time_series_visualizations.gantt_chart import
 )
 from ethos_penalps.production_plan import ProductionPlan
 from ethos_penalps.stream_handler import StreamHandler
+from ethos_penalps.utilities.columnar_entry_list import convert_entries_to_data_frame
 from ethos_penalps.utilities.debugging_information import (
     DebuggingInformationLogger,
     NodeOperationViewer,
@@ -353,8 +354,8 @@ class ReportGeneratorProcessChain:
             storage_state_dictionary = self.production_plan.storage_state_dict
             for process_step_name in storage_state_dictionary:
                 for commodity in storage_state_dictionary[process_step_name]:
-                    storage_data_frame = pd.DataFrame(
-                        storage_state_dictionary[process_step_name][commodity]
+                    storage_data_frame = convert_entries_to_data_frame(
+                        entries=storage_state_dictionary[process_step_name][commodity]
                     )
                     storage_block_list.append(dp.DataTable(storage_data_frame))
             if storage_block_list:
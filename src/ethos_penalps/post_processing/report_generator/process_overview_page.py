@@ -171,7 +171,7 @@ class ProcessOverviewPage:
                 ):
                     list_of_order_tables.append(
                         datapane.DataTable(
-                            df=splitted_order.order_data_frame,
+                            df=splitted_order.get_order_data_frame(),
                             caption="Orders for chain: "
                             + str(splitted_order.process_chain_identifier.chain_name),
                             # name="Orders for chain: "
@@ -179,8 +179,8 @@ class ProcessOverviewPage:
                         )
                     )
                     splitted_order_mass = (
-                        splitted_order.order_data_frame.loc[:, "production_target"]
-                    ).sum()
+                        splitted_order.order_book.production_targets.sum()
+                    )
                     list_of_order_tables.append(
                         datapane.HTML(
                             "The splitted order mass of "
@@ -1,5 +1,4 @@
 import datapane
-import pandas
 
 from ethos_penalps.data_classes import EmptyMetaDataInformation
 from ethos_penalps.post_processing.post_processed_data_handler import (
@@ -15,6 +14,7 @@ from ethos_penalps.stream import (
     ContinuousStream,
     ContinuousStreamProductionPlanEntry,
 )
+from ethos_penalps.utilities.columnar_entry_list import convert_entries_to_data_frame
 from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
 
 logger = PeNALPSLogger.get_logger_without_handler()
@@ -206,8 +206,8 @@ class DataFramePageGenerator:
             storage_state_dictionary = self.production_plan.storage_state_dict
             for process_step_name in storage_state_dictionary:
                 for commodity in storage_state_dictionary[process_step_name]:
-                    storage_data_frame = pandas.DataFrame(
-                        storage_state_dictionary[process_step_name][commodity]
+                    storage_data_frame = convert_entries_to_data_frame(
+                        entries=storage_state_dictionary[process_step_name][commodity]
                     )
                     storage_state_block_list.append(
                         datapane.DataTable(
@@ -0,0 +1,51 @@
+import datapane
+
+from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
+from ethos_penalps.utilities.simulation_profiler import SimulationProfiler
+
+logger = PeNALPSLogger.get_logger_without_handler()
+
+
+class SimulationProfilePageGenerator:
+    """Creates the report page that shows which nodes and node operations
+    required the most wall time during the simulation.
+    """
+
+    def __init__(self, simulation_profiler: SimulationProfiler) -> None:
+        """
+
+        Args:
+            simulation_profiler (SimulationProfiler): Contains the recorded
+                calls of the nodes.
+        """
+        self.simulation_profiler: SimulationProfiler = simulation_profiler
+
+    def create_simulation_profile_page(self) -> datapane.Group:
+        """Creates the page with the profile data frames of the chains,
+        nodes and node operations.
+
+        Returns:
+            datapane.Group: DataPane object of the simulation profile page.
+        """
+        logger.info("Start generation of simulation profile page")
+        simulation_profile_page = datapane.Group(
+            label="Simulation Profile",
+            blocks=[
+                "# Process chains",
+                datapane.DataTable(
+                    self.simulation_profiler.get_process_chain_profile_data_frame(),
+                    label="Process chains",
+                ),
+                "# Nodes",
+                datapane.DataTable(
+                    self.simulation_profiler.get_node_profile_data_frame(),
+                    label="Nodes",
+                ),
+                "# Node operations",
+                datapane.DataTable(
+                    self.simulation_profiler.get_node_operation_profile_data_frame(),
+                    label="Node operations",
+                ),
+            ],
+        )
+        return simulation_profile_page
@@ -45,21 +45,25 @@ def create_order_gantt_plot(
 def post_process_order_collection(
     order_collection: OrderCollection | SplittedOrderCollection,
 ) -> ProductionOrderMetadata:
+    if isinstance(order_collection, SplittedOrderCollection):
+        order_data_frame = order_collection.get_order_data_frame()
+    else:
+        order_data_frame = order_collection.order_data_frame
     list_of_all_unique_deadlines = list(
-        order_collection.order_data_frame.loc[:, "production_deadline"].unique()
+        order_data_frame.loc[:, "production_deadline"].unique()
     )
     list_of_aggregated_order_targets = []
     for unique_dead_line in list_of_all_unique_deadlines:
-        all_rows_with_deadline = order_collection.order_data_frame.loc[
-            order_collection.order_data_frame["production_deadline"] == unique_dead_line
+        all_rows_with_deadline = order_data_frame.loc[
+            order_data_frame["production_deadline"] == unique_dead_line
         ]
         aggregated_target = all_rows_with_deadline.loc[:, "production_target"].sum()
         list_of_aggregated_order_targets.append(aggregated_target)
 
-    latest_deadline = order_collection.order_data_frame["production_deadline"].max()
-    earliest_deadline = order_collection.order_data_frame["production_deadline"].min()
+    latest_deadline = order_data_frame["production_deadline"].max()
+    earliest_deadline = order_data_frame["production_deadline"].min()
     production_order_meta_data = ProductionOrderMetadata(
-        data_frame=order_collection.order_data_frame,
+        data_frame=order_data_frame,
         list_of_aggregated_production_order=list_of_aggregated_order_targets,
         list_of_unique_deadlines=list_of_all_unique_deadlines,
         commodity=order_collection.commodity,
@@ -10,6 +10,7 @@ from ethos_penalps.node_operations import (
     UpstreamAdaptionOrder,
     UpstreamNewProductionOrder,
 )
+from ethos_penalps.order_coalescing import OrderCoalescingOptions
 from ethos_penalps.process_nodes.process_node import ProcessNode
 from ethos_penalps.process_nodes.sink import Sink
 from ethos_penalps.process_nodes.source import Source
@@ -94,6 +95,21 @@ class ProcessChainStorage(ProcessNode):
             time_data=time_data,
         )
 
+    def set_order_coalescing_options(
+        self, order_coalescing_options: OrderCoalescingOptions | None
+    ):
+        """Determines if the output stream states of the downstream NetworkLevel
+        are merged into fewer orders for the upstream NetworkLevel. Each merged
+        order is due at the start of its earliest stream state, so that the
+        storage level can not fall below the level without merging.
+
+        Args:
+            order_coalescing_options (OrderCoalescingOptions | None): Limits of
+                the merged orders. Each stream state is converted into an
+                order if None is provided.
+        """
+        self.source.order_coalescing_options = order_coalescing_options
+
     def switch_from_source_to_sink(self):
         """Switches the behavior of the process_input_order method
         from source to sink.
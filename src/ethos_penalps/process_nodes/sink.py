@@ -149,6 +149,20 @@ class Sink(ProcessNode):
 
         return upstream_order
 
+    def plan_current_production_order_again(self) -> UpstreamNewProductionOrder:
+        """Discards the branch numbers of the latest planned order and plans the
+        current order of the OrderDistributor again. Is used if the orders have
+        been replaced after plan_production has been called, e.g. when a
+        simulation is continued with updated orders.
+
+        Returns:
+            UpstreamNewProductionOrder: UpstreamNewProductionOrder that requests
+                the input stream state of the current order.
+        """
+        self.temporal_branch_number = self.temporal_branch_number - 1
+        self.production_branch_number = self.production_branch_number - 1
+        return self.plan_production()
+
     def convert_order_to_stream(
         self, production_order: ProductionOrder
     ) -> ContinuousStreamState | BatchStreamState:
@@ -424,7 +438,7 @@ class Sink(ProcessNode):
             parent_output_identifier=None,
             parent_input_identifier=None,
             dict_of_complete_stream_branch={},
-            production_branch_production_plan=OutputBranchProductionPlan,
+            production_branch_production_plan=OutputBranchProductionPlan(),
             current_stream_branch=incomplete_stream_branch_data,
             identifier=current_output_branch_identifier,
         )
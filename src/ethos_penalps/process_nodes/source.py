@@ -21,6 +21,11 @@ from ethos_penalps.node_operations import (
     UpstreamAdaptionOrder,
     UpstreamNewProductionOrder,
 )
+from ethos_penalps.order_coalescing import (
+    OrderCoalescingOptions,
+    OrderCoalescingReport,
+    coalesce_orders,
+)
 from ethos_penalps.process_node_communicator import (
     EmptyProductionBranch,
     ProcessNodeCommunicator,
@@ -93,6 +98,10 @@ class Source(ProcessNode):
             stream_handler=stream_handler,
             input_to_output_conversion_factor=1,
         )
+        self.order_coalescing_options: OrderCoalescingOptions | None = None
+        """Determines if the output stream states are merged into fewer orders
+        when they are converted into orders for the upstream NetworkLevel."""
+        self.order_coalescing_report: OrderCoalescingReport | None = None
 
     def __str__(self) -> str:
         return "Source: " + self.name
@@ -257,7 +266,9 @@ class Source(ProcessNode):
     def create_production_order_collection_from_input_states(
         self,
     ) -> OrderCollection:
-        """Converts the requested output streams into new orders.
+        """Converts the requested output streams into new orders. Each order
+        is due at the start of its stream state. The orders are merged if
+        order coalescing options are set.
 
         Returns:
             OrderCollection: Orders that were created from the output stream
@@ -277,6 +288,11 @@ class Source(ProcessNode):
             production_order_dict[order_number] = production_order
             order_number = order_number + 1
         order_data_frame = pandas.DataFrame(data=list(production_order_dict.values()))
+        if self.order_coalescing_options is not None and not order_data_frame.empty:
+            order_data_frame, self.order_coalescing_report = coalesce_orders(
+                order_data_frame=order_data_frame,
+                order_coalescing_options=self.order_coalescing_options,
+            )
         order_data_frame.sort_values(
             by="production_deadline", ascending=False, inplace=True
         )
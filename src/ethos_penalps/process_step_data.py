@@ -14,6 +14,22 @@ from ethos_penalps.storage import Storage
 from ethos_penalps.stream import BatchStreamState, ContinuousStreamState
 from ethos_penalps.stream_handler import StreamHandler
 from ethos_penalps.time_data import TimeData
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+from ethos_penalps.utilities.undo_log import UndoLog
+from ethos_penalps.utilities.validation import check_validation_level
+
+
+class StateRestorationModes:
+    """Contains the modes in which the simulation data of a ProcessStep
+    is restored after an adaption.
+    """
+
+    snapshot: str = "snapshot"
+    """Copies of the time data and state data are stored before each
+    decision and are restored after an adaption."""
+    undo_log: str = "undo_log"
+    """The changes of the time data and state data are recorded in an
+    undo log and are undone after an adaption."""
 
 
 class ProcessStepData:
@@ -34,6 +50,35 @@ class ProcessStepData:
         )
         self.main_mass_balance: MassBalance
         self.load_profile_handler: LoadProfileHandlerSimulation = load_profile_handler
+        self.undo_log: UndoLog | None = None
+
+    def set_state_restoration_mode(self, state_restoration_mode: str):
+        """Determines how the time data and the state data are restored
+        after an adaption.
+
+        Args:
+            state_restoration_mode (str): One of the StateRestorationModes.
+        """
+        if state_restoration_mode == StateRestorationModes.snapshot:
+            self.undo_log = None
+        elif state_restoration_mode == StateRestorationModes.undo_log:
+            self.undo_log = UndoLog()
+        else:
+            raise MisconfigurationError(
+                "Unknown state restoration mode: " + str(state_restoration_mode)
+            )
+        self.time_data.undo_log = self.undo_log
+        self.state_data_container.undo_log = self.undo_log
+
+    def set_validation_level(self, validation_level: str):
+        """Determines if the storage level of the ProcessStep is checked
+        during the simulation.
+
+        Args:
+            validation_level (str): One of the ValidationLevels.
+        """
+        check_validation_level(validation_level=validation_level)
+        self.state_data_container.validation_level = validation_level
 
     def restore_time_data(self, new_time_data: TimeData):
         """Resets the time data to a previous state.
@@ -41,12 +86,12 @@ class ProcessStepData:
         Args:
             new_time_data (TimeData): TimeData which contains the new state.
         """
-        self.time_data.last_idle_time = new_time_data.last_idle_time
-        self.time_data.last_process_state_switch_time = (
-            new_time_data.last_process_state_switch_time
+        self.time_data.last_idle_integer_time = new_time_data.last_idle_integer_time
+        self.time_data.last_process_state_switch_integer_time = (
+            new_time_data.last_process_state_switch_integer_time
         )
-        self.time_data.next_process_state_switch_time = (
-            new_time_data.next_process_state_switch_time
+        self.time_data.next_process_state_switch_integer_time = (
+            new_time_data.next_process_state_switch_integer_time
         )
         if hasattr(new_time_data, "next_stream_end_time"):
             self.time_data.next_stream_end_time = new_time_data.next_stream_end_time
@@ -1,9 +1,12 @@
 import datetime
 import os
 import pathlib
+import re
+import tempfile
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+import numpy
 import pandas as pd
 
 import __main__
@@ -24,9 +27,15 @@ from ethos_penalps.stream import (
     ContinuousStreamProductionPlanEntry,
     StreamDataFrameMetaInformation,
 )
+from ethos_penalps.utilities.columnar_entry_list import (
+    ColumnarEntryList,
+    convert_entries_to_data_frame,
+)
 from ethos_penalps.utilities.data_base_interactions import DataBaseInteractions
 from ethos_penalps.utilities.general_functions import ResultPathGenerator
+from ethos_penalps.utilities.identifiers import InterningTable
 from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
+from ethos_penalps.utilities.persistent_entry_list import PersistentEntryList
 from ethos_penalps.utilities.to_dataclass_conversions import (
     create_batch_stream_production_plan_entry,
     create_continuous_stream_production_plan_entry,
@@ -34,6 +43,12 @@ from ethos_penalps.utilities.to_dataclass_conversions import (
     create_process_step_production_plan_entry_with_stream_state,
     create_storage_production_plan_entry,
 )
+from ethos_penalps.utilities.validation import (
+    ValidationLevels,
+    check_process_step_entry_alignment,
+    check_storage_entry_consistency,
+    get_last_entry,
+)
 
 logger = PeNALPSLogger.get_logger_without_handler()
 
@@ -117,7 +132,7 @@ class ResultBaseClass:
             path_to_database=full_path_to_data_base
         )
         for stream_name, stream_entries in self.stream_state_dict.items():
-            stream_df = pd.DataFrame(stream_entries)
+            stream_df = convert_entries_to_data_frame(entries=stream_entries)
             data_base_handler.write_to_database(
                 data_frame=stream_df, table_name=stream_name
             )
@@ -156,7 +171,7 @@ class ResultBaseClass:
             process_step_name,
             process_step_entries,
         ) in self.process_step_states_dict.items():
-            stream_df = pd.DataFrame(process_step_entries)
+            stream_df = convert_entries_to_data_frame(entries=process_step_entries)
             data_base_handler.write_to_database(
                 data_frame=stream_df, table_name=process_step_name
             )
@@ -245,7 +260,7 @@ class ResultBaseClass:
         writer = pd.ExcelWriter(full_path_to_xlsx_file, engine="xlsxwriter")
 
         for stream_entries in self.stream_state_dict.values():
-            stream_df = pd.DataFrame(stream_entries)
+            stream_df = convert_entries_to_data_frame(entries=stream_entries)
             sheet_name = "stream_" + str(iterator)
             stream_df.to_excel(writer, sheet_name=sheet_name)
             iterator = iterator + 1
@@ -255,9 +270,42 @@ class ResultBaseClass:
             print("The stream plan has been saved to:\n" + full_path_to_xlsx_file)
 
 
-@dataclass
+@dataclass(kw_only=True)
 class OutputBranchProductionPlan(ResultBaseClass):
-    """Production Plan for the results of a single output stream request."""
+    """Production Plan for the results of a single output stream request.
+    The entries are stored in PersistentEntryList objects so that a copy of
+    the production plan shares all entries with the original. A copy is
+    created for each temporal branch of a process step, so that copying
+    all lists would increase the simulation time quadratically with the number
+    of entries in an output branch.
+    """
+
+    process_step_states_dict: dict[str, PersistentEntryList] = field(
+        default_factory=dict
+    )
+    stream_state_dict: dict[str, PersistentEntryList] = field(default_factory=dict)
+    storage_state_dict: dict[str, dict[Commodity, PersistentEntryList]] = field(
+        default_factory=dict
+    )
+
+    def add_process_step_state_entries(
+        self,
+        process_step_name: str,
+        list_of_process_step_entries: list[ProcessStepProductionPlanEntry],
+    ):
+        """Adds process step entries to the production plan.
+
+        Args:
+            process_step_name (str): Name of the process step that created
+                the entries.
+            list_of_process_step_entries (list[ProcessStepProductionPlanEntry]): Entries
+                that should be added to the production plan.
+        """
+        if process_step_name not in self.process_step_states_dict:
+            self.process_step_states_dict[process_step_name] = PersistentEntryList()
+        self.process_step_states_dict[process_step_name].extend(
+            list_of_process_step_entries
+        )
 
     def add_stream_state_entry(
         self,
@@ -271,10 +319,23 @@ class OutputBranchProductionPlan(ResultBaseClass):
             stream_state_entry (ContinuousStreamProductionPlanEntry  |  BatchStreamProductionPlanEntry):
             StreamEntry that is added to the production plan.
         """
-        if stream_state_entry.name in self.stream_state_dict:
-            self.stream_state_dict[stream_state_entry.name].append(stream_state_entry)
-        else:
-            self.stream_state_dict[stream_state_entry.name] = [stream_state_entry]
+        if stream_state_entry.name not in self.stream_state_dict:
+            self.stream_state_dict[stream_state_entry.name] = PersistentEntryList()
+        self.stream_state_dict[stream_state_entry.name].append(stream_state_entry)
+
+    def get_last_stream_state_entry(
+        self, stream_name: str
+    ) -> ContinuousStreamProductionPlanEntry | BatchStreamProductionPlanEntry:
+        """Returns the stream entry that has been added last for a stream.
+
+        Args:
+            stream_name (str): Name of the stream.
+
+        Returns:
+            ContinuousStreamProductionPlanEntry | BatchStreamProductionPlanEntry: The
+                last stream entry of the stream.
+        """
+        return self.stream_state_dict[stream_name][-1]
 
     def add_storage_entry(
         self, process_step_name: str, storage_entry: StorageProductionPlanEntry
@@ -290,14 +351,18 @@ class OutputBranchProductionPlan(ResultBaseClass):
         if process_step_name not in self.storage_state_dict:
             self.storage_state_dict[process_step_name] = {}
         if storage_entry.commodity not in self.storage_state_dict[process_step_name]:
-            self.storage_state_dict[process_step_name][storage_entry.commodity] = []
+            self.storage_state_dict[process_step_name][
+                storage_entry.commodity
+            ] = PersistentEntryList()
 
         self.storage_state_dict[process_step_name][storage_entry.commodity].append(
             storage_entry
         )
 
     def create_self_copy(self) -> "OutputBranchProductionPlan":
-        """Creates a copy of the current OutputBranchProductionPlan
+        """Creates a copy of the current OutputBranchProductionPlan. The
+        copy shares the entries with the original, so that the effort does
+        not depend on the number of entries.
 
         Returns:
             OutputBranchProductionPlan: Copy of the current OutputBranchProductionPlan.
@@ -315,45 +380,45 @@ class OutputBranchProductionPlan(ResultBaseClass):
 
     def _copy_process_step_states(
         self,
-    ) -> dict[str, list[ProcessStepProductionPlanEntry]]:
+    ) -> dict[str, PersistentEntryList]:
         """Copies all ProcessStepProductionPlan entries
 
         Returns:
-            dict[str, list[ProcessStepProductionPlanEntry]]: dictionary of all
+            dict[str, PersistentEntryList]: dictionary of all
                 ProcessStepProductionPlanEntry. The keys are the names of the respective
                 ProcessSteps.
 
         """
         copy_of_process_step_state_dictionary = {}
         for name, process_step_state_list in self.process_step_states_dict.items():
-            copy_of_process_step_state_dictionary[name] = list(process_step_state_list)
+            copy_of_process_step_state_dictionary[name] = (
+                process_step_state_list.create_copy()
+            )
         return copy_of_process_step_state_dictionary
 
     def _copy_stream_states(
         self,
-    ) -> dict[
-        str,
-        list[ContinuousStreamProductionPlanEntry]
-        | list[BatchStreamProductionPlanEntry],
-    ]:
+    ) -> dict[str, PersistentEntryList]:
         """Copies all stream states.
 
         Returns:
-            dict[ str, list[ContinuousStreamProductionPlanEntry] | list[BatchStreamProductionPlanEntry], ]: A dictionary
-                that contains all stream states. The keys are the names of the respective streams.
+            dict[str, PersistentEntryList]: A dictionary that contains all stream
+                states. The keys are the names of the respective streams.
         """
         copy_of_stream_state_dictionary = {}
         for stream_name, stream_state_list in self.stream_state_dict.items():
-            copy_of_stream_state_dictionary[stream_name] = list(stream_state_list)
+            copy_of_stream_state_dictionary[stream_name] = (
+                stream_state_list.create_copy()
+            )
         return copy_of_stream_state_dictionary
 
     def _copy_storage_state_dictionaries(
         self,
-    ) -> dict[str, dict[Commodity, list[StorageProductionPlanEntry]]]:
+    ) -> dict[str, dict[Commodity, PersistentEntryList]]:
         """Copies all storage entries.
 
         Returns:
-            dict[str, dict[Commodity, list[StorageProductionPlanEntry]]]:  A dictionary
+            dict[str, dict[Commodity, PersistentEntryList]]:  A dictionary
                 that contains all storage states. The keys are the names of the respective process steps.
         """
         copy_of_storage_state_dictionary = {}
@@ -361,13 +426,14 @@ class OutputBranchProductionPlan(ResultBaseClass):
             process_step_name,
             commodity_storage_state_dictionary,
         ) in self.storage_state_dict.items():
+            copy_of_storage_state_dictionary[process_step_name] = {}
             for (
                 commodity,
                 storage_state_list,
             ) in commodity_storage_state_dictionary.items():
-                copy_of_storage_state_dictionary[process_step_name] = {
-                    commodity: list(storage_state_list)
-                }
+                copy_of_storage_state_dictionary[process_step_name][
+                    commodity
+                ] = storage_state_list.create_copy()
         return copy_of_storage_state_dictionary
 
     def __get_list_of_all_start_and_end_times(self) -> list[datetime.datetime]:
@@ -415,12 +481,77 @@ class OutputBranchProductionPlan(ResultBaseClass):
 @dataclass
 class ProductionPlan(ResultBaseClass):
     """Collects all final simulation results of the streams, process steps
-    and storages.
+    and storages. The entries are stored in ColumnarEntryList objects which
+    store the fields of the entries in typed columns. They can be used like
+    lists of entries and provide the data frames of the entries without
+    converting each entry.
     """
 
     load_profile_handler: LoadProfileHandlerSimulation
     path_to_stream_xlsx_file: Optional[str] = ""
     path_to_process_state_xlsx_file: Optional[str] = ""
+    interning_table: InterningTable = field(default_factory=InterningTable)
+    """Contains the codes of the names and commodities that are shared by
+    all lists of entries of the production plan.
+    """
+    validation_level: str = ValidationLevels.boundary
+    """One of the ValidationLevels. Determines which entries are checked
+    for consistency when entries are added to the production plan.
+    """
+    spill_directory: str | None = None
+    """Directory to which the entries are spilled by spill_finalized_entries.
+    The entries stay in memory if it is None.
+    """
+
+    def spill_finalized_entries(self):
+        """Writes the entries of all streams, process steps and storages and
+        the load profile entries that have been added since the last spill to
+        new chunk files in the spill directory.
+        The entries are read from memory maps of the files afterwards, so that
+        the memory of the production plan does not grow with the number of
+        simulated chains. Does nothing if no spill directory is set.
+        """
+        if self.spill_directory is None:
+            return
+        list_of_spilled_lists = [
+            ("streams", stream_name, list_of_entries)
+            for stream_name, list_of_entries in self.stream_state_dict.items()
+        ]
+        list_of_spilled_lists.extend(
+            ("process_steps", process_step_name, list_of_entries)
+            for process_step_name, list_of_entries in self.process_step_states_dict.items()
+        )
+        for (
+            storage_name,
+            commodity_storage_state_dict,
+        ) in self.storage_state_dict.items():
+            list_of_spilled_lists.extend(
+                ("storages", storage_name + "_" + commodity.name, list_of_entries)
+                for commodity, list_of_entries in commodity_storage_state_dict.items()
+            )
+        load_profile_collection = self.load_profile_handler.load_profile_collection
+        list_of_spilled_lists.extend(
+            load_profile_collection.get_list_of_columnar_load_entry_lists(
+                interning_table=self.interning_table
+            )
+        )
+        for category_name, list_name, list_of_entries in list_of_spilled_lists:
+            if not isinstance(list_of_entries, ColumnarEntryList):
+                continue
+            spill_directory_path = list_of_entries.spill_directory_path
+            if spill_directory_path is None:
+                category_directory_path = os.path.join(
+                    self.spill_directory, category_name
+                )
+                os.makedirs(category_directory_path, exist_ok=True)
+                # Names can contain characters that are not valid in paths
+                # and a unique suffix is added because different names
+                # can result in the same directory name.
+                spill_directory_path = tempfile.mkdtemp(
+                    prefix=re.sub(r"[^\w\-]", "_", list_name) + "_",
+                    dir=category_directory_path,
+                )
+            list_of_entries.spill_to_directory(directory_path=spill_directory_path)
 
     def convert_temporary_production_plan_to_load_profile(
         self, temporary_production_plan: OutputBranchProductionPlan
@@ -454,6 +585,13 @@ class ProductionPlan(ResultBaseClass):
             Exception: Raises an exception if a gap or inconsistency was found.
         """
         for process_step_state_list in self.process_step_states_dict.values():
+            if isinstance(process_step_state_list, ColumnarEntryList):
+                if len(process_step_state_list) > 1 and numpy.any(
+                    process_step_state_list.get_column_values("end_time")[1:]
+                    != process_step_state_list.get_column_values("start_time")[:-1]
+                ):
+                    raise Exception("Process step states do no align")
+                continue
             last_entry = None
             for process_step_entry in process_step_state_list:
                 if last_entry is not None:
@@ -461,6 +599,16 @@ class ProductionPlan(ResultBaseClass):
                         raise Exception("Process step states do no align")
                 last_entry = process_step_entry
 
+    def check_storage_consistency(self):
+        """Checks the mass balance and the storage levels of all storage
+        entries. Warnings are issued for inconsistent entries.
+        """
+        for commodity_storage_state_dict in self.storage_state_dict.values():
+            for list_of_storage_entries in commodity_storage_state_dict.values():
+                check_storage_entry_consistency(
+                    list_of_storage_entries=list_of_storage_entries
+                )
+
     def add_list_of_storage_entries(
         self,
         storage_name: str,
@@ -477,12 +625,22 @@ class ProductionPlan(ResultBaseClass):
             list_of_storage_entries (list[StorageProductionPlanEntry]): List of storage
                 entries that should be added to the production plan.
         """
-        self.storage_state_dict[storage_name] = {commodity: list_of_storage_entries}
+        if self.validation_level != ValidationLevels.off:
+            check_storage_entry_consistency(
+                list_of_storage_entries=list_of_storage_entries
+            )
+        self.storage_state_dict[storage_name] = {
+            commodity: ColumnarEntryList(
+                list_of_storage_entries, interning_table=self.interning_table
+            )
+        }
 
     def add_temporary_production_plan(
         self, temporary_production_plan: OutputBranchProductionPlan
     ):
         """Adds all entries from a temporary production plan to the final production plan.
+        Depending on the validation level only the new entries and their junction
+        with the existing entries or all entries are checked for consistency.
 
         Args:
             temporary_production_plan (OutputBranchProductionPlan): Temporary production plan
@@ -494,10 +652,22 @@ class ProductionPlan(ResultBaseClass):
                     temporary_production_plan.stream_state_dict[stream_name]
                 )
             else:
-                self.stream_state_dict[stream_name] = (
-                    temporary_production_plan.stream_state_dict[stream_name]
+                self.stream_state_dict[stream_name] = ColumnarEntryList(
+                    temporary_production_plan.stream_state_dict[stream_name],
+                    interning_table=self.interning_table,
                 )
         for process_step_name in temporary_production_plan.process_step_states_dict:
+            if self.validation_level == ValidationLevels.boundary:
+                check_process_step_entry_alignment(
+                    list_of_process_step_entries=temporary_production_plan.process_step_states_dict[
+                        process_step_name
+                    ],
+                    previous_entry=get_last_entry(
+                        list_of_entries=self.process_step_states_dict.get(
+                            process_step_name, ()
+                        )
+                    ),
+                )
             if process_step_name in self.process_step_states_dict:
                 self.process_step_states_dict[process_step_name].extend(
                     temporary_production_plan.process_step_states_dict[
@@ -505,10 +675,11 @@ class ProductionPlan(ResultBaseClass):
                     ]
                 )
             else:
-                self.process_step_states_dict[process_step_name] = (
+                self.process_step_states_dict[process_step_name] = ColumnarEntryList(
                     temporary_production_plan.process_step_states_dict[
                         process_step_name
-                    ]
+                    ],
+                    interning_table=self.interning_table,
                 )
 
         for process_step_name in temporary_production_plan.storage_state_dict:
@@ -518,13 +689,29 @@ class ProductionPlan(ResultBaseClass):
                 process_step_name
             ]:
                 if commodity not in self.storage_state_dict[process_step_name]:
-                    self.storage_state_dict[process_step_name][commodity] = []
-                self.storage_state_dict[process_step_name][commodity].extend(
+                    self.storage_state_dict[process_step_name][commodity] = (
+                        ColumnarEntryList(interning_table=self.interning_table)
+                    )
+                list_of_new_storage_entries = (
                     temporary_production_plan.storage_state_dict[process_step_name][
                         commodity
                     ]
                 )
-        self.check_process_state_consistency()
+                if self.validation_level == ValidationLevels.boundary:
+                    check_storage_entry_consistency(
+                        list_of_storage_entries=list_of_new_storage_entries,
+                        previous_entry=get_last_entry(
+                            list_of_entries=self.storage_state_dict[process_step_name][
+                                commodity
+                            ]
+                        ),
+                    )
+                self.storage_state_dict[process_step_name][commodity].extend(
+                    list_of_new_storage_entries
+                )
+        if self.validation_level == ValidationLevels.full:
+            self.check_process_state_consistency()
+            self.check_storage_consistency()
 
     # def read_xlsx_to_list_of_data_frames(
     #     self, path_to_xlsx_file: str
@@ -543,7 +730,9 @@ class ProductionPlan(ResultBaseClass):
             process_step_name (str): Name of the process step that should
                 requires an initial list.
         """
-        self.process_step_states_dict[process_step_name] = []
+        self.process_step_states_dict[process_step_name] = ColumnarEntryList(
+            interning_table=self.interning_table
+        )
 
     def initialize_stream_production_plan_entry(self, stream_name: str):
         """Creates an empty list for each stream to store the simulation results.
@@ -551,7 +740,9 @@ class ProductionPlan(ResultBaseClass):
         Args:
             stream_name (str): Name of the stream that should be initialized.
         """
-        self.stream_state_dict[stream_name] = []
+        self.stream_state_dict[stream_name] = ColumnarEntryList(
+            interning_table=self.interning_table
+        )
 
     # def save_list_of_process_states_to_xlsx(
     #     self,
@@ -0,0 +1,524 @@
+import concurrent.futures
+import datetime
+import math
+import numbers
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+import cloudpickle
+import pandas
+
+from ethos_penalps.automatic_sizer.automatic_setter import ProcessStepSetter
+from ethos_penalps.data_classes import LoadProfileEntry
+from ethos_penalps.order_generator import NOrderGenerator
+from ethos_penalps.organizational_agents.enterprise import Enterprise
+from ethos_penalps.process_nodes.sink import Sink
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+from ethos_penalps.utilities.general_functions import ResultPathGenerator
+from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
+from ethos_penalps.utilities.units import Units
+
+logger = PeNALPSLogger.get_logger_without_handler()
+
+ParameterSetter = Callable[[Enterprise, Any], None]
+"""Applies the value of a scenario parameter to the enterprise
+before the simulation is started.
+"""
+
+# Serialized base enterprise and parameter setters that are set once per
+# worker process by the initializer of the process pool.
+_worker_scenario_payload: bytes | None = None
+
+
+def create_order_generator_setter(sink_name: str) -> ParameterSetter:
+    """Creates a setter that replaces the orders of a sink by the orders
+    of a NOrderGenerator. The values of the scenario parameter must be
+    instances of NOrderGenerator.
+
+    Args:
+        sink_name (str): Name of the main sink whose orders are replaced.
+
+    Returns:
+        ParameterSetter: The setter of the orders.
+    """
+
+    def set_order_generator(enterprise: Enterprise, order_generator: NOrderGenerator):
+        for network_level in enterprise.list_of_network_level:
+            main_sink = network_level.get_main_sink()
+            if isinstance(main_sink, Sink) and main_sink.name == sink_name:
+                order_collection = order_generator.create_n_order_collection()
+                main_sink.order_collection = order_collection
+                main_sink.order_distributor.order_collection = order_collection
+                return
+        raise MisconfigurationError(
+            "The enterprise has no main sink with the name: " + sink_name
+        )
+
+    return set_order_generator
+
+
+def create_stream_maximum_operation_rate_setter(stream_name: str) -> ParameterSetter:
+    """Creates a setter for the maximum operation rate of a continuous stream.
+
+    Args:
+        stream_name (str): Name of the continuous stream.
+
+    Returns:
+        ParameterSetter: The setter of the maximum operation rate.
+    """
+
+    def set_maximum_operation_rate(
+        enterprise: Enterprise, maximum_operation_rate: numbers.Number
+    ):
+        for network_level in enterprise.list_of_network_level:
+            for process_chain in network_level.list_of_process_chains:
+                if stream_name in process_chain.stream_handler.stream_dict:
+                    stream = process_chain.stream_handler.get_stream(
+                        stream_name=stream_name
+                    )
+                    stream.static_data.maximum_operation_rate = maximum_operation_rate
+                    return
+        raise MisconfigurationError(
+            "The enterprise has no stream with the name: " + stream_name
+        )
+
+    return set_maximum_operation_rate
+
+
+def create_batch_mass_setter(
+    process_step_name: str, set_input_stream: bool = False
+) -> ParameterSetter:
+    """Creates a setter for the maximum batch mass of the output or input
+    stream of a process step using the ProcessStepSetter.
+
+    Args:
+        process_step_name (str): Name of the process step.
+        set_input_stream (bool, optional): Sets the batch mass of the input
+            stream instead of the output stream. Defaults to False.
+
+    Returns:
+        ParameterSetter: The setter of the batch mass.
+    """
+
+    def set_batch_mass(enterprise: Enterprise, batch_mass: numbers.Number):
+        dict_of_process_steps = enterprise.get_all_process_steps()
+        if process_step_name not in dict_of_process_steps:
+            raise MisconfigurationError(
+                "The enterprise has no process step with the name: "
+                + process_step_name
+            )
+        process_step = dict_of_process_steps[process_step_name]
+        process_step_setter = ProcessStepSetter(
+            process_step=process_step, stream_handler=process_step.stream_handler
+        )
+        if set_input_stream is True:
+            process_step_setter.set_batch_input_stream_value(batch_mass=batch_mass)
+        else:
+            process_step_setter.set_batch_output_stream_value(batch_mass=batch_mass)
+
+    return set_batch_mass
+
+
+@dataclass
+class ScenarioSummary:
+    """Compact summary of the results of a single scenario."""
+
+    scenario_name: str
+    total_energy_per_load_type: dict[str, float] = field(default_factory=dict)
+    """Total energy demand of each load type in the energy unit of the simulation.
+    """
+    peak_power_per_load_type: dict[str, float] = field(default_factory=dict)
+    """Maximum of the combined power demand of all streams and process steps
+    of each load type in the power unit of the simulation.
+    """
+    makespan: datetime.timedelta | None = None
+    """Time between the earliest start and latest end of all process step states.
+    """
+    number_of_iterations: int = 0
+    energy_unit: str = str(Units.energy_unit)
+    power_unit: str = str(Units.power_unit)
+    simulation_failed: bool = False
+    error_message: str = ""
+    result_path: str | None = None
+    """Path to the pickled enterprise if the scenario was selected for persistence.
+    """
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the summary to a flat dictionary which can be used
+        as a row of a DataFrame.
+
+        Returns:
+            dict[str, Any]: Flat representation of the summary.
+        """
+        output_dict = {"scenario_name": self.scenario_name}
+        for load_type_name, total_energy in self.total_energy_per_load_type.items():
+            output_dict[
+                "Total energy " + load_type_name + " [" + self.energy_unit + "]"
+            ] = total_energy
+        for load_type_name, peak_power in self.peak_power_per_load_type.items():
+            output_dict["Peak power " + load_type_name + " [" + self.power_unit + "]"] = (
+                peak_power
+            )
+        output_dict["makespan"] = self.makespan
+        output_dict["number_of_iterations"] = self.number_of_iterations
+        output_dict["simulation_failed"] = self.simulation_failed
+        output_dict["error_message"] = self.error_message
+        output_dict["result_path"] = self.result_path
+        return output_dict
+
+
+def calculate_peak_power(
+    list_of_load_profile_entries: list[LoadProfileEntry],
+    dict_of_energy_conversion_factors: dict[str, float],
+) -> float:
+    """Calculates the maximum of the sum of the average power of overlapping
+    load profile entries. Entries that end at the same time at which other
+    entries start do not overlap.
+
+    Args:
+        list_of_load_profile_entries (list[LoadProfileEntry]): Entries of a
+            single load type.
+        dict_of_energy_conversion_factors (dict[str, float]): Conversion factors
+            from the energy unit of the entries to the energy unit of the simulation.
+
+    Returns:
+        float: The peak power of the combined entries.
+    """
+    list_of_power_changes = []
+    for load_profile_entry in list_of_load_profile_entries:
+        power = (
+            load_profile_entry.average_power_consumption
+            * dict_of_energy_conversion_factors[load_profile_entry.energy_unit]
+        )
+        list_of_power_changes.append((load_profile_entry.start_time, power))
+        list_of_power_changes.append((load_profile_entry.end_time, -power))
+    # Decreases are sorted before increases at the same time
+    list_of_power_changes.sort()
+    current_power = 0
+    peak_power = 0
+    for _, power_change in list_of_power_changes:
+        current_power = current_power + power_change
+        peak_power = max(peak_power, current_power)
+    return peak_power
+
+
+def create_scenario_summary(
+    enterprise: Enterprise, scenario_name: str
+) -> ScenarioSummary:
+    """Creates the compact summary of a simulated enterprise.
+
+    Args:
+        enterprise (Enterprise): The simulated enterprise.
+        scenario_name (str): Name of the scenario.
+
+    Returns:
+        ScenarioSummary: The summary of the scenario.
+    """
+    dict_of_load_profile_entries: dict[str, list[LoadProfileEntry]] = {}
+    load_profile_collection = enterprise.load_profile_handler.load_profile_collection
+    for entry_collection in list(
+        load_profile_collection.dict_stream_load_profile_collections.values()
+    ) + list(load_profile_collection.dict_process_step_load_profile_collections.values()):
+        for (
+            load_type_uuid,
+            list_of_load_profile_entries,
+        ) in entry_collection.dict_of_load_entry_lists.items():
+            load_type_name = entry_collection.load_type_dict[load_type_uuid].name
+            dict_of_load_profile_entries.setdefault(load_type_name, []).extend(
+                list_of_load_profile_entries
+            )
+    dict_of_energy_conversion_factors = {}
+    scenario_summary = ScenarioSummary(scenario_name=scenario_name)
+    for (
+        load_type_name,
+        list_of_load_profile_entries,
+    ) in dict_of_load_profile_entries.items():
+        for load_profile_entry in list_of_load_profile_entries:
+            if load_profile_entry.energy_unit not in dict_of_energy_conversion_factors:
+                dict_of_energy_conversion_factors[load_profile_entry.energy_unit] = (
+                    Units.unit_registry.Quantity(1, load_profile_entry.energy_unit)
+                    .to(Units.energy_unit)
+                    .magnitude
+                )
+        scenario_summary.total_energy_per_load_type[load_type_name] = sum(
+            load_profile_entry.energy_quantity
+            * dict_of_energy_conversion_factors[load_profile_entry.energy_unit]
+            for load_profile_entry in list_of_load_profile_entries
+        )
+        scenario_summary.peak_power_per_load_type[load_type_name] = (
+            calculate_peak_power(
+                list_of_load_profile_entries=list_of_load_profile_entries,
+                dict_of_energy_conversion_factors=dict_of_energy_conversion_factors,
+            )
+        )
+    list_of_start_times = []
+    list_of_end_times = []
+    for (
+        list_of_process_step_entries
+    ) in enterprise.production_plan.process_step_states_dict.values():
+        for process_step_entry in list_of_process_step_entries:
+            list_of_start_times.append(process_step_entry.start_time)
+            list_of_end_times.append(process_step_entry.end_time)
+    if list_of_start_times:
+        scenario_summary.makespan = max(list_of_end_times) - min(list_of_start_times)
+    list_of_error_messages = []
+    for network_level in enterprise.list_of_network_level:
+        for process_chain in network_level.list_of_process_chains:
+            scenario_summary.number_of_iterations = (
+                scenario_summary.number_of_iterations
+                + process_chain.number_of_iterations
+            )
+            if process_chain.simulation_failed is True:
+                list_of_error_messages.append(
+                    process_chain.process_chain_identifier.chain_name
+                    + ": "
+                    + process_chain.simulation_error_message
+                )
+    # The results of a failed chain are incomplete
+    if list_of_error_messages:
+        scenario_summary.simulation_failed = True
+        scenario_summary.error_message = "; ".join(list_of_error_messages)
+    return scenario_summary
+
+
+def _initialize_worker(scenario_payload: bytes):
+    """Stores the serialized base enterprise and parameter setters in the
+    worker process so that they are only transferred once per worker.
+
+    Args:
+        scenario_payload (bytes): The serialized base enterprise and setters.
+    """
+    global _worker_scenario_payload
+    _worker_scenario_payload = scenario_payload
+
+
+def _check_if_value_is_missing(value: Any) -> bool:
+    """Checks if a cell of the scenario table is empty.
+
+    Args:
+        value (Any): Value of the cell.
+
+    Returns:
+        bool: True if the parameter is not overridden in the scenario.
+    """
+    if value is None:
+        return True
+    if isinstance(value, float) and math.isnan(value):
+        return True
+    return False
+
+
+def _run_scenario(
+    scenario_name: str,
+    dict_of_parameter_values: dict[str, Any],
+    number_of_iterations_in_chain: numbers.Number | None,
+    persist_results: bool,
+    result_directory: str | None,
+) -> ScenarioSummary:
+    """Unpickles a fresh copy of the base enterprise, applies the parameter
+    values of the scenario and simulates it.
+
+    Args:
+        scenario_name (str): Name of the scenario.
+        dict_of_parameter_values (dict[str, Any]): Values of the overridden parameters.
+        number_of_iterations_in_chain (numbers.Number | None): Maximum number
+            of iterations in each chain.
+        persist_results (bool): Pickles the simulated enterprise if True.
+        result_directory (str | None): Directory of the pickled enterprise. The
+            default result folder is used if None.
+
+    Returns:
+        ScenarioSummary: The summary of the scenario.
+    """
+    enterprise, dict_of_parameter_setters = cloudpickle.loads(_worker_scenario_payload)
+    enterprise: Enterprise
+    try:
+        for parameter_name, value in dict_of_parameter_values.items():
+            if _check_if_value_is_missing(value=value):
+                continue
+            dict_of_parameter_setters[parameter_name](enterprise, value)
+        enterprise.start_simulation(
+            number_of_iterations_in_chain=number_of_iterations_in_chain
+        )
+    except Exception as error:
+        logger.warning("Scenario %s failed: %s", scenario_name, error)
+        return ScenarioSummary(
+            scenario_name=scenario_name,
+            simulation_failed=True,
+            error_message=str(error),
+        )
+    scenario_summary = create_scenario_summary(
+        enterprise=enterprise, scenario_name=scenario_name
+    )
+    if scenario_summary.simulation_failed is True:
+        logger.warning(
+            "Scenario %s failed: %s", scenario_name, scenario_summary.error_message
+        )
+    if persist_results is True:
+        if result_directory is None:
+            result_path = (
+                ResultPathGenerator().create_path_to_file_relative_to_main_file(
+                    file_name=scenario_name,
+                    subdirectory_name="scenario_results",
+                    file_extension=".pckl",
+                )
+            )
+        else:
+            os.makedirs(result_directory, exist_ok=True)
+            result_path = os.path.join(result_directory, scenario_name + ".pckl")
+        with open(result_path, "wb") as file:
+            cloudpickle.dump(enterprise, file)
+        scenario_summary.result_path = result_path
+    return scenario_summary
+
+
+class ScenarioRunner:
+    """Simulates variants of an enterprise model. The base model is created once
+    by the enterprise factory and serialized. Each scenario starts from a fresh copy
+    of the serialized model to which the parameter overrides of the scenario are
+    applied by the parameter setters. The scenarios are simulated in a pool of worker
+    processes and only a compact ScenarioSummary is returned for each scenario.
+    """
+
+    def __init__(
+        self,
+        enterprise_factory: Callable[[], Enterprise],
+        dict_of_parameter_setters: dict[str, ParameterSetter],
+        number_of_processes: int = 1,
+        number_of_iterations_in_chain: numbers.Number | None = None,
+    ) -> None:
+        """
+
+        Args:
+            enterprise_factory (Callable[[], Enterprise]): Creates the base model
+                which has not been simulated.
+            dict_of_parameter_setters (dict[str, ParameterSetter]): Maps the column names
+                of the scenario table to the setter that applies the value to the model.
+            number_of_processes (int, optional): Maximum number of worker processes. The
+                scenarios are simulated in the current process if it is 1. Defaults to 1.
+            number_of_iterations_in_chain (numbers.Number | None, optional): Maximum number
+                of iterations in each chain. Defaults to None.
+        """
+        if number_of_processes < 1:
+            raise MisconfigurationError(
+                "The number of processes must be at least 1 but is: "
+                + str(number_of_processes)
+            )
+        self.enterprise_factory: Callable[[], Enterprise] = enterprise_factory
+        self.dict_of_parameter_setters: dict[str, ParameterSetter] = (
+            dict_of_parameter_setters
+        )
+        self.number_of_processes: int = number_of_processes
+        self.number_of_iterations_in_chain: numbers.Number | None = (
+            number_of_iterations_in_chain
+        )
+        self._scenario_payload: bytes | None = None
+
+    def get_scenario_payload(self) -> bytes:
+        """Builds and serializes the base model and the parameter setters.
+        The model is only built once per ScenarioRunner.
+
+        Returns:
+            bytes: The serialized base model and parameter setters.
+        """
+        if self._scenario_payload is None:
+            enterprise = self.enterprise_factory()
+            self._scenario_payload = cloudpickle.dumps(
+                (enterprise, self.dict_of_parameter_setters)
+            )
+        return self._scenario_payload
+
+    def iterate_scenarios(
+        self,
+        scenario_table: pandas.DataFrame,
+        list_of_scenarios_to_persist: list[str] | None = None,
+        result_directory: str | None = None,
+    ) -> Iterator[ScenarioSummary]:
+        """Simulates all scenarios of the table and yields the summary of each
+        scenario as soon as it is finished.
+
+        Args:
+            scenario_table (pandas.DataFrame): Each row is a scenario. The index
+                contains the scenario names and the columns the names of the
+                parameter setters. Empty cells keep the value of the base model.
+            list_of_scenarios_to_persist (list[str] | None, optional): Names of the
+                scenarios whose simulated enterprise is pickled. Defaults to None.
+            result_directory (str | None, optional): Directory of the pickled
+                enterprises. The default result folder is used if None. Defaults to None.
+
+        Yields:
+            Iterator[ScenarioSummary]: The summaries in the order of completion.
+        """
+        for parameter_name in scenario_table.columns:
+            if parameter_name not in self.dict_of_parameter_setters:
+                raise MisconfigurationError(
+                    "No parameter setter is defined for the column: "
+                    + str(parameter_name)
+                )
+        if list_of_scenarios_to_persist is None:
+            list_of_scenarios_to_persist = []
+        list_of_scenario_arguments = []
+        for scenario_name, scenario_row in scenario_table.iterrows():
+            list_of_scenario_arguments.append(
+                (
+                    str(scenario_name),
+                    scenario_row.to_dict(),
+                    self.number_of_iterations_in_chain,
+                    scenario_name in list_of_scenarios_to_persist,
+                    result_directory,
+                )
+            )
+        scenario_payload = self.get_scenario_payload()
+        if self.number_of_processes == 1:
+            _initialize_worker(scenario_payload=scenario_payload)
+            for scenario_arguments in list_of_scenario_arguments:
+                yield _run_scenario(*scenario_arguments)
+            return
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(self.number_of_processes, len(list_of_scenario_arguments)),
+            initializer=_initialize_worker,
+            initargs=(scenario_payload,),
+        ) as executor:
+            list_of_futures = [
+                executor.submit(_run_scenario, *scenario_arguments)
+                for scenario_arguments in list_of_scenario_arguments
+            ]
+            for future in concurrent.futures.as_completed(list_of_futures):
+                yield future.result()
+
+    def run_scenarios(
+        self,
+        scenario_table: pandas.DataFrame,
+        list_of_scenarios_to_persist: list[str] | None = None,
+        result_directory: str | None = None,
+    ) -> pandas.DataFrame:
+        """Simulates all scenarios of the table and returns their summaries.
+
+        Args:
+            scenario_table (pandas.DataFrame): Each row is a scenario. The index
+                contains the scenario names and the columns the names of the
+                parameter setters. Empty cells keep the value of the base model.
+            list_of_scenarios_to_persist (list[str] | None, optional): Names of the
+                scenarios whose simulated enterprise is pickled. Defaults to None.
+            result_directory (str | None, optional): Directory of the pickled
+                enterprises. The default result folder is used if None. Defaults to None.
+
+        Returns:
+            pandas.DataFrame: One row per scenario in the order of the scenario table.
+        """
+        dict_of_summaries = {}
+        for scenario_summary in self.iterate_scenarios(
+            scenario_table=scenario_table,
+            list_of_scenarios_to_persist=list_of_scenarios_to_persist,
+            result_directory=result_directory,
+        ):
+            logger.info("Scenario %s is finished", scenario_summary.scenario_name)
+            dict_of_summaries[scenario_summary.scenario_name] = scenario_summary
+        summary_data_frame = pandas.DataFrame(
+            [
+                dict_of_summaries[str(scenario_name)].to_dict()
+                for scenario_name in scenario_table.index
+            ]
+        )
+        return summary_data_frame.set_index("scenario_name")
@@ -21,6 +21,11 @@ from ethos_penalps.utilities.exceptions_and_warnings import (
     UnexpectedDataType,
 )
 from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
+from ethos_penalps.utilities.undo_log import UndoLog
+from ethos_penalps.utilities.validation import (
+    MINIMUM_VALID_STORAGE_LEVEL,
+    ValidationLevels,
+)
 
 logger = PeNALPSLogger.get_logger_without_handler()
 
@@ -68,9 +73,26 @@ class ProcessStateNetworkContainer:
     """_summary_"""
 
     def __init__(self) -> None:
-        self.state_data: CurrentProductionStateData = UninitializedCurrentStateData()
+        self.undo_log: UndoLog | None = None
+        """Records the changes of the state data which are restored after
+        an adaption, if the undo log state restoration mode is used."""
+        self.validation_level: str = ValidationLevels.boundary
+        """One of the ValidationLevels. The storage level is not checked
+        if the validation is turned off."""
+        self._state_data: CurrentProductionStateData = UninitializedCurrentStateData()
         self.initialization_data_collector = InitializationDataCollector()
 
+    @property
+    def state_data(self) -> CurrentProductionStateData:
+        """The current simulation data of the process step."""
+        return self._state_data
+
+    @state_data.setter
+    def state_data(self, new_state_data: CurrentProductionStateData):
+        if self.undo_log is not None:
+            self.undo_log.record_attribute(owner=self, attribute_name="_state_data")
+        self._state_data = new_state_data
+
     def update_storage_level(self, new_storage_level: numbers.Number):
         """Updates the storage level in the simulation data.
 
@@ -78,7 +100,10 @@ class ProcessStateNetworkContainer:
             new_storage_level (numbers.Number): New storage level.
 
         """
-        if new_storage_level < -1:
+        if (
+            self.validation_level != ValidationLevels.off
+            and new_storage_level < MINIMUM_VALID_STORAGE_LEVEL
+        ):
             warnings.warn(
                 "Storage level went below zero at level: "
                 + str(new_storage_level)
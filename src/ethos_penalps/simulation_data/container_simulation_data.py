@@ -66,6 +66,11 @@ class ProductionProcessStateContainer(
             PostProductionStateData,
             ValidatedPostProductionStateData,
         ):
+            if self.undo_log is not None:
+                self.undo_log.record_dictionary_item(
+                    dictionary=self.state_data.process_state_data_dictionary,
+                    key=process_state_state.process_state_name,
+                )
             self.state_data.process_state_data_dictionary[
                 process_state_state.process_state_name
             ] = process_state_state
@@ -333,4 +338,8 @@ class ProductionProcessStateContainer(
                 expected_data_type=(PostProductionStateData, PreProductionStateData),
             )
 
+        if self.undo_log is not None:
+            self.undo_log.record_attribute(
+                owner=self.state_data, attribute_name="process_state_data_dictionary"
+            )
         self.state_data.process_state_data_dictionary = {}
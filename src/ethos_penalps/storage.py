@@ -1,3 +1,4 @@
+import bisect
 import datetime
 import itertools
 import numbers
@@ -28,6 +29,10 @@ from ethos_penalps.utilities.general_functions import (
     check_if_date_1_is_before_or_at_date_2,
     format_timedelta,
 )
+from ethos_penalps.utilities.integer_time import (
+    convert_date_time_range_to_integer_times,
+    convert_datetime_to_integer_time,
+)
 from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
 
 logger = PeNALPSLogger.get_logger_without_handler()
@@ -88,10 +93,16 @@ class BaseStorage:
             # back_calculation=True,
         )
 
-        for storage_date_time_range in list_of_date_time_ranges:
-            storage_entry = self.create_storage_entry_from_start_to_end(
-                list_of_input_stream_states=list_of_input_stream_states,
-                list_of_output_stream_states=list_of_output_stream_states,
+        list_of_net_masses = self.determine_net_masses_of_date_ranges(
+            list_of_input_stream_states=list_of_input_stream_states,
+            list_of_output_stream_states=list_of_output_stream_states,
+            list_of_date_time_ranges=list_of_date_time_ranges,
+        )
+        for storage_date_time_range, net_mass in zip(
+            list_of_date_time_ranges, list_of_net_masses
+        ):
+            storage_entry = self.create_storage_entry_from_net_mass(
+                net_mass=net_mass,
                 storage_date_range=storage_date_time_range,
             )
 
@@ -302,6 +313,27 @@ class BaseStorage:
             storage_date_range=storage_date_range,
             from_start_to_end=True,
         )
+        return self.create_storage_entry_from_net_mass(
+            net_mass=net_mass, storage_date_range=storage_date_range
+        )
+
+    def create_storage_entry_from_net_mass(
+        self,
+        net_mass: numbers.Number,
+        storage_date_range: datetimerange.DateTimeRange,
+    ) -> StorageProductionPlanEntry:
+        """Creates a single StorageProductionPlanEntry from the net mass
+        that is added to the storage in the storage date range and updates
+        the current storage level.
+
+        Args:
+            net_mass (numbers.Number): Mass that is added to the storage
+                in the storage date range. Removed mass is negative.
+            storage_date_range (datetimerange.DateTimeRange): The time range of the output StorageProductionPlanEntry.
+
+        Returns:
+            StorageProductionPlanEntry: Describes the storage level in the storage_date_range.
+        """
         storage_level_at_start = self.current_storage_level
         new_storage_level_at_end = net_mass + self.current_storage_level
         storage_entry = StorageProductionPlanEntry(
@@ -365,20 +397,213 @@ class BaseStorage:
         Returns:
             numbers.Number: Net mass in the date range.
         """
+        storage_start_time, storage_end_time = convert_date_time_range_to_integer_times(
+            date_time_range=storage_date_range
+        )
+        list_of_input_states_and_streams = [
+            (
+                input_stream_state,
+                self.stream_handler.get_stream(stream_name=input_stream_state.name),
+            )
+            for input_stream_state in list_of_input_stream_states
+        ]
+        list_of_output_states_and_streams = [
+            (
+                output_stream_state,
+                self.stream_handler.get_stream(stream_name=output_stream_state.name),
+            )
+            for output_stream_state in list_of_output_stream_states
+        ]
+        return self.determine_net_mass_of_stream_states_in_integer_time_period(
+            list_of_input_states_and_streams=list_of_input_states_and_streams,
+            list_of_output_states_and_streams=list_of_output_states_and_streams,
+            storage_start_time=storage_start_time,
+            storage_end_time=storage_end_time,
+            from_start_to_end=from_start_to_end,
+        )
+
+    def determine_net_masses_of_date_ranges(
+        self,
+        list_of_input_stream_states: list[ContinuousStreamState | BatchStreamState],
+        list_of_output_stream_states: list[ContinuousStreamState | BatchStreamState],
+        list_of_date_time_ranges: list[datetimerange.DateTimeRange],
+    ) -> list[numbers.Number]:
+        """Determines the net mass in each of the date ranges from start to end.
+        The date ranges must be sorted in ascending temporal order and must not
+        overlap, like the date ranges of
+        create_a_list_of_datetime_ranges_from_list_of_stream_states. Instead of
+        checking each stream state for each date range, each stream state is
+        assigned to the date ranges in which it transfers mass by a binary
+        search on the sorted start and end times of the date ranges. The mass
+        share of each assigned stream state is determined in the same order as
+        by determine_net_mass_in_date_range, so that the net masses are the same.
+
+        Args:
+            list_of_input_stream_states (list[ContinuousStreamState  |  BatchStreamState]): List of
+                stream states that add mass to the storage.
+            list_of_output_stream_states (list[ContinuousStreamState  |  BatchStreamState]): List of
+                all states that remove mass from the storage.
+            list_of_date_time_ranges (list[datetimerange.DateTimeRange]): Sorted
+                date ranges for which the net mass is determined.
+
+        Returns:
+            list[numbers.Number]: Net mass of each date range.
+        """
+        if not list_of_date_time_ranges:
+            return []
+        list_of_start_times = []
+        list_of_end_times = []
+        dict_of_instantaneous_range_indices: dict[int, list[int]] = {}
+        for range_index, date_time_range in enumerate(list_of_date_time_ranges):
+            start_time, end_time = convert_date_time_range_to_integer_times(
+                date_time_range=date_time_range
+            )
+            list_of_start_times.append(start_time)
+            list_of_end_times.append(end_time)
+            if start_time == end_time:
+                dict_of_instantaneous_range_indices.setdefault(start_time, []).append(
+                    range_index
+                )
+        list_of_active_input_states_and_streams = (
+            self._assign_stream_states_to_date_ranges(
+                list_of_stream_states=list_of_input_stream_states,
+                is_input_stream=True,
+                list_of_start_times=list_of_start_times,
+                list_of_end_times=list_of_end_times,
+                dict_of_instantaneous_range_indices=dict_of_instantaneous_range_indices,
+            )
+        )
+        list_of_active_output_states_and_streams = (
+            self._assign_stream_states_to_date_ranges(
+                list_of_stream_states=list_of_output_stream_states,
+                is_input_stream=False,
+                list_of_start_times=list_of_start_times,
+                list_of_end_times=list_of_end_times,
+                dict_of_instantaneous_range_indices=dict_of_instantaneous_range_indices,
+            )
+        )
+        list_of_net_masses = []
+        for range_index, (start_time, end_time) in enumerate(
+            zip(list_of_start_times, list_of_end_times)
+        ):
+            list_of_net_masses.append(
+                self.determine_net_mass_of_stream_states_in_integer_time_period(
+                    list_of_input_states_and_streams=list_of_active_input_states_and_streams[
+                        range_index
+                    ],
+                    list_of_output_states_and_streams=list_of_active_output_states_and_streams[
+                        range_index
+                    ],
+                    storage_start_time=start_time,
+                    storage_end_time=end_time,
+                    from_start_to_end=True,
+                )
+            )
+        return list_of_net_masses
+
+    def _assign_stream_states_to_date_ranges(
+        self,
+        list_of_stream_states: list[ContinuousStreamState | BatchStreamState],
+        is_input_stream: bool,
+        list_of_start_times: list[int],
+        list_of_end_times: list[int],
+        dict_of_instantaneous_range_indices: dict[int, list[int]],
+    ) -> list[list[tuple[BaseStreamState, ContinuousStream | BatchStream]]]:
+        """Assigns each stream state and its stream to the date ranges in which
+        the mass share of the stream state is determined. A continuous stream
+        state is assigned to all date ranges which intersect or touch it, like in
+        get_integer_time_overlap_share. A batch stream state is assigned to the
+        date ranges without duration at its time of mass transfer. The stream
+        states of each date range keep the order of the list of stream states.
+
+        Args:
+            list_of_stream_states (list[ContinuousStreamState  |  BatchStreamState]): Input
+                or output stream states of the storage.
+            is_input_stream (bool): Determines if the stream states add mass to
+                or remove mass from the storage.
+            list_of_start_times (list[int]): Sorted integer start times of
+                the date ranges.
+            list_of_end_times (list[int]): Sorted integer end times of
+                the date ranges.
+            dict_of_instantaneous_range_indices (dict[int, list[int]]): Indices of the
+                date ranges without duration with their integer time as key.
+
+        Raises:
+            Exception: Is raised if a stream is neither a continuous
+                nor a batch stream.
+
+        Returns:
+            list[list[tuple[BaseStreamState, ContinuousStream | BatchStream]]]: The
+                stream states and their streams for each date range.
+        """
+        list_of_active_states_and_streams = [[] for _ in list_of_start_times]
+        for stream_state in list_of_stream_states:
+            stream = self.stream_handler.get_stream(stream_name=stream_state.name)
+            if isinstance(stream, ContinuousStream):
+                state_start_time = convert_datetime_to_integer_time(
+                    date_time=stream_state.start_time
+                )
+                state_end_time = convert_datetime_to_integer_time(
+                    date_time=stream_state.end_time
+                )
+                list_of_range_indices = range(
+                    bisect.bisect_left(list_of_end_times, state_start_time),
+                    bisect.bisect_right(list_of_start_times, state_end_time),
+                )
+            elif isinstance(stream, BatchStream):
+                if is_input_stream is True:
+                    mass_transfer_time = stream_state.end_time
+                else:
+                    mass_transfer_time = stream_state.start_time
+                list_of_range_indices = dict_of_instantaneous_range_indices.get(
+                    convert_datetime_to_integer_time(date_time=mass_transfer_time), []
+                )
+            else:
+                raise Exception("Unexpected datatype")
+            for range_index in list_of_range_indices:
+                list_of_active_states_and_streams[range_index].append(
+                    (stream_state, stream)
+                )
+        return list_of_active_states_and_streams
+
+    def determine_net_mass_of_stream_states_in_integer_time_period(
+        self,
+        list_of_input_states_and_streams: list[
+            tuple[BaseStreamState, ContinuousStream | BatchStream]
+        ],
+        list_of_output_states_and_streams: list[
+            tuple[BaseStreamState, ContinuousStream | BatchStream]
+        ],
+        storage_start_time: int,
+        storage_end_time: int,
+        from_start_to_end: bool,
+    ) -> numbers.Number:
+        """Determines the net mass in the period, which is provided in integer times.
+
+        Args:
+            list_of_input_states_and_streams (list[tuple[BaseStreamState, ContinuousStream | BatchStream]]): Stream
+                states that add mass to the storage and their streams.
+            list_of_output_states_and_streams (list[tuple[BaseStreamState, ContinuousStream | BatchStream]]): Stream
+                states that remove mass from the storage and their streams.
+            storage_start_time (int): Integer start time of the period.
+            storage_end_time (int): Integer end time of the period.
+            from_start_to_end (bool): Determines the direction of analysis.
+
+        Returns:
+            numbers.Number: Net mass in the period.
+        """
         continuous_input_mass_share_output_commodity = 0
         batch_input_mass_share_output_commodity = 0
-        for input_stream_state in list_of_input_stream_states:
-            input_stream = self.stream_handler.get_stream(
-                stream_name=input_stream_state.name
-            )
+        for input_stream_state, input_stream in list_of_input_states_and_streams:
             if isinstance(input_stream, ContinuousStream):
-                if input_stream_state.date_time_range.get_timedelta_second() == 0:
+                if input_stream_state.end_time == input_stream_state.start_time:
                     raise Exception(
                         "infinitesimal continuous input stream is requested"
                     )
                 continuous_input_mass_share_input_commodity = (
-                    input_stream.get_mass_share_in_time_period(
-                        numerator_date_range=storage_date_range,
+                    input_stream.get_mass_share_in_integer_time_period(
+                        numerator_start_time=storage_start_time,
+                        numerator_end_time=storage_end_time,
                         stream_state=input_stream_state,
                     )
                 )
@@ -393,10 +618,11 @@ class BaseStorage:
                 )
             elif isinstance(input_stream, BatchStream):
                 batch_input_mass_share_input_commodity = (
-                    input_stream.get_mass_share_in_time_period(
+                    input_stream.get_mass_share_in_integer_time_period(
                         stream_state=input_stream_state,
                         is_input_stream=True,
-                        target_date_range=storage_date_range,
+                        target_start_time=storage_start_time,
+                        target_end_time=storage_end_time,
                     )
                 )
                 batch_input_mass_share_output_commodity = (
@@ -414,14 +640,12 @@ class BaseStorage:
         )
         continuous_output_mass_share = 0
         batch_output_mass_output_commodity = 0
-        for output_stream_state in list_of_output_stream_states:
-            output_stream = self.stream_handler.get_stream(
-                stream_name=output_stream_state.name
-            )
+        for output_stream_state, output_stream in list_of_output_states_and_streams:
             if isinstance(output_stream, ContinuousStream):
                 continuous_output_stream_mass_share = (
-                    output_stream.get_mass_share_in_time_period(
-                        numerator_date_range=storage_date_range,
+                    output_stream.get_mass_share_in_integer_time_period(
+                        numerator_start_time=storage_start_time,
+                        numerator_end_time=storage_end_time,
                         stream_state=output_stream_state,
                     )
                 )
@@ -431,10 +655,11 @@ class BaseStorage:
             elif isinstance(output_stream, BatchStream):
                 batch_output_mass_output_commodity = (
                     batch_output_mass_output_commodity
-                    + output_stream.get_mass_share_in_time_period(
+                    + output_stream.get_mass_share_in_integer_time_period(
                         stream_state=output_stream_state,
                         is_input_stream=False,
-                        target_date_range=storage_date_range,
+                        target_start_time=storage_start_time,
+                        target_end_time=storage_end_time,
                     )
                 )
 
@@ -23,10 +23,14 @@ from ethos_penalps.utilities.general_functions import (
     check_if_date_1_is_before_date_2,
     check_if_date_1_is_before_or_at_date_2,
 )
+from ethos_penalps.utilities.integer_time import (
+    convert_date_time_range_to_integer_times,
+    convert_datetime_to_integer_time,
+    get_integer_time_overlap_share,
+)
 from ethos_penalps.utilities.json_coding_functions import (
+    RecordJsonMixin,
     json_datetime_deserialization_function,
-    json_datetime_range_deserialization_function,
-    json_datetime_range_serialization_function,
     json_datetime_serialization_function,
     json_pint_unit_deserialization_function,
     json_pint_unit_serialization_function,
@@ -36,9 +40,13 @@ from ethos_penalps.utilities.json_coding_functions import (
 from ethos_penalps.utilities.units import Units
 
 
-@dataclass(kw_only=True, frozen=True)
-class BaseStreamState(DataClassJsonMixin):
-    """A StreamState represents a discrete activity of the stream."""
+@dataclass(kw_only=True, frozen=True, slots=True)
+class BaseStreamState(RecordJsonMixin):
+    """A StreamState represents a discrete activity of the stream. The stream
+    states are slotted records without a __dict__ because a large number of them
+    is created during the simulation. They are converted to json by
+    the RecordJsonMixin.
+    """
 
     name: str
     """Name and Identifier of a StreamState.
@@ -59,14 +67,15 @@ class BaseStreamState(DataClassJsonMixin):
     )
     """End time of the discrete activity.
     """
-    date_time_range: datetimerange.DateTimeRange = field(
-        metadata=config(
-            encoder=json_datetime_range_serialization_function,
-            decoder=json_datetime_range_deserialization_function,
+
+    @property
+    def date_time_range(self) -> datetimerange.DateTimeRange:
+        """DateTimeRange of the discrete activity. It is only created
+        when it is requested.
+        """
+        return datetimerange.DateTimeRange(
+            start_datetime=self.start_time, end_datetime=self.end_time
         )
-    )
-    """DateTimeRange of the discrete activity.
-    """
 
 
 # @dataclass(kw_only=True)
@@ -158,7 +167,7 @@ class BatchStreamState(BaseStreamState):
 
 
 @dataclass(frozen=True, slots=True)
-class BatchStreamProductionPlanEntry(DataClassJsonMixin):
+class BatchStreamProductionPlanEntry(RecordJsonMixin):
     """Simulation Result for a discrete time span of the BatchStream."""
 
     name: str
@@ -344,13 +353,47 @@ class BatchStream(DataClassJsonMixin):
         Returns:
             numbers.Number: The total transferred mass within the target_date_range.
         """
+        target_start_time, target_end_time = convert_date_time_range_to_integer_times(
+            date_time_range=target_date_range
+        )
+        return self.get_mass_share_in_integer_time_period(
+            stream_state=stream_state,
+            is_input_stream=is_input_stream,
+            target_start_time=target_start_time,
+            target_end_time=target_end_time,
+        )
+
+    def get_mass_share_in_integer_time_period(
+        self,
+        stream_state: BatchStreamState,
+        is_input_stream: bool,
+        target_start_time: int,
+        target_end_time: int,
+    ) -> numbers.Number:
+        """Returns the mass that is transferred by the stream state
+        within the target period, which is provided in integer times.
+        The mass is only allocated to a target period without duration
+        that is located at the time of the mass transfer.
+
+        Args:
+            stream_state (BatchStreamState): The stream state that should
+                be analyzed for its mass.
+            is_input_stream (bool): Determines if the mass transfer behavior
+                should be analyzed at the start or target node.
+            target_start_time (int): Integer start time of the target period.
+            target_end_time (int): Integer end time of the target period.
+
+        Returns:
+            numbers.Number: The total transferred mass within the target period.
+        """
         if is_input_stream is True:
             mass_transfer_time = stream_state.end_time
         else:
             mass_transfer_time = stream_state.start_time
         if (
-            mass_transfer_time in target_date_range
-            and target_date_range.timedelta == datetime.timedelta(hours=0)
+            target_start_time == target_end_time
+            and convert_datetime_to_integer_time(date_time=mass_transfer_time)
+            == target_start_time
         ):
             overlap_share = 1
         else:
@@ -380,9 +423,6 @@ class BatchStream(DataClassJsonMixin):
             start_time=start_time,
             end_time=end_time,
             batch_mass_value=batch_mass_value,
-            date_time_range=datetimerange.DateTimeRange(
-                start_datetime=start_time, end_datetime=end_time
-            ),
         )
         return batch_stream_state
 
@@ -558,7 +598,7 @@ class ContinuousStreamStaticData(StreamStaticData):
 
 
 @dataclass(frozen=True, slots=True)
-class ContinuousStreamProductionPlanEntry(DataClassJsonMixin):
+class ContinuousStreamProductionPlanEntry(RecordJsonMixin):
     """Represents a single discrete simulation result for a stream."""
 
     name: str
@@ -679,9 +719,6 @@ class ContinuousStream(DataClassJsonMixin):
             start_time=start_time,
             total_mass=commodity_amount,
             current_operation_rate=operation_rate,
-            date_time_range=datetimerange.DateTimeRange(
-                start_datetime=start_time, end_datetime=end_time
-            ),
         )
         return continuous_stream_state
 
@@ -730,16 +767,47 @@ class ContinuousStream(DataClassJsonMixin):
         Returns:
             numbers.Number: Mass produced in the numerator date range.
         """
-        denominator_date_range = stream_state.date_time_range
-        if denominator_date_range.is_intersection(numerator_date_range):
-            intersection = denominator_date_range.intersection(x=numerator_date_range)
-            overlap_share = (
-                intersection.get_timedelta_second()
-                / denominator_date_range.get_timedelta_second()
+        numerator_start_time, numerator_end_time = (
+            convert_date_time_range_to_integer_times(
+                date_time_range=numerator_date_range
             )
+        )
+        return self.get_mass_share_in_integer_time_period(
+            numerator_start_time=numerator_start_time,
+            numerator_end_time=numerator_end_time,
+            stream_state=stream_state,
+        )
 
-        else:
-            overlap_share = 0
+    def get_mass_share_in_integer_time_period(
+        self,
+        numerator_start_time: int,
+        numerator_end_time: int,
+        stream_state: ContinuousStreamState,
+    ) -> numbers.Number:
+        """Returns the mass of the stream that was produced during the
+        numerator period, which is provided in integer times.
+
+        Args:
+            numerator_start_time (int): Integer start time of the period
+                for which the produced mass should be determined.
+            numerator_end_time (int): Integer end time of the period
+                for which the produced mass should be determined.
+            stream_state (ContinuousStreamState): Stream state that contains should be checked
+                for the mass in the numerator period.
+
+        Returns:
+            numbers.Number: Mass produced in the numerator period.
+        """
+        overlap_share = get_integer_time_overlap_share(
+            numerator_start_time=numerator_start_time,
+            numerator_end_time=numerator_end_time,
+            denominator_start_time=convert_datetime_to_integer_time(
+                date_time=stream_state.start_time
+            ),
+            denominator_end_time=convert_datetime_to_integer_time(
+                date_time=stream_state.end_time
+            ),
+        )
         mass_share = overlap_share * stream_state.total_mass
         return mass_share
 
@@ -925,9 +993,6 @@ class ContinuousStream(DataClassJsonMixin):
             end_time=end_time,
             total_mass=produced_amount,
             current_operation_rate=current_operation_rate,
-            date_time_range=datetimerange.DateTimeRange(
-                start_datetime=start_time, end_datetime=end_time
-            ),
         )
 
     def get_upstream_node_name(self) -> str:
@@ -1032,7 +1097,7 @@ class ContinuousStream(DataClassJsonMixin):
         return stream_state
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class ProcessStepProductionPlanEntryWithInputStreamState(
     ProcessStepProductionPlanEntry
 ):
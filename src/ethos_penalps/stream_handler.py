@@ -164,16 +164,17 @@ class StreamHandler:
             ContinuousStream | BatchStream: Returns the stream with the
                 input key.
         """
-        if not isinstance(stream_name, str):
-            raise Exception(
-                "Expected string as a stream name but got type : "
-                + str(type(stream_name))
-                + " instead"
-            )
-
+        # The type of the name is only checked if the lookup fails
+        # because this method is called in each iteration of the simulation.
         try:
             stream = self.stream_dict[stream_name]
-        except KeyError as exc:
+        except (KeyError, TypeError) as exc:
+            if not isinstance(stream_name, str):
+                raise Exception(
+                    "Expected string as a stream name but got type : "
+                    + str(type(stream_name))
+                    + " instead"
+                ) from exc
             all_stream_name_list = self.get_list_of_all_stream_names_in_stream_handler()
             raise Exception(
                 "Stream: "
@@ -1,11 +1,8 @@
-import datetime
-import math
 import numbers
 import warnings
 from collections.abc import Iterator
 from dataclasses import dataclass, field
 
-import numpy
 import pandas
 
 from ethos_penalps.data_classes import (
@@ -14,13 +11,22 @@ from ethos_penalps.data_classes import (
     ProcessChainIdentifier,
     ProductionOrder,
 )
+from ethos_penalps.order_aggregation import (
+    aggregate_orders_for_batch_streams,
+    aggregate_orders_for_continuous_streams,
+)
+from ethos_penalps.order_book import OrderBook
+from ethos_penalps.order_coalescing import (
+    OrderCoalescingOptions,
+    OrderCoalescingReport,
+    coalesce_orders,
+)
 from ethos_penalps.stream import BatchStream, ContinuousStream
 from ethos_penalps.stream_handler import StreamHandler
 from ethos_penalps.time_data import TimeData
 from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
 from ethos_penalps.utilities.general_functions import (
     check_if_date_1_is_before_date_2,
-    check_if_date_1_is_before_or_at_date_2,
 )
 
 
@@ -33,17 +39,27 @@ class SplittedOrderCollection:
     stream_name: str
     commodity: Commodity
     process_chain_identifier: ProcessChainIdentifier
-    order_data_frame: pandas.DataFrame
+    order_book: OrderBook
     target_mass: numbers.Number
     current_order_number: int = 0
 
+    def get_order_data_frame(self) -> pandas.DataFrame:
+        """Creates a data frame of the orders with the current produced masses.
+        The data frame is a copy of the order book, so that changes of the
+        data frame do not change the orders.
+
+        Returns:
+            pandas.DataFrame: One row for each order.
+        """
+        return self.order_book.to_data_frame()
+
     def check_if_order_are_empty(self):
         """Raises an error if an order is empty.
 
         Raises:
             MisconfigurationError: Is raised if the order is empty.
         """
-        if self.order_data_frame.empty:
+        if len(self.order_book) == 0:
             raise MisconfigurationError(
                 "A splitted order of chain: "
                 + self.process_chain_identifier.chain_name
@@ -59,18 +75,7 @@ class SplittedOrderCollection:
         Returns:
             ProductionOrder: Order for a product oder intermediate product.
         """
-        order_data_frame_row = self.order_data_frame.iloc[order_number]
-        production_order = ProductionOrder(
-            production_target=order_data_frame_row.loc["production_target"],
-            production_deadline=order_data_frame_row.loc["production_deadline"],
-            order_number=order_data_frame_row.loc["order_number"],
-            commodity=order_data_frame_row.loc["commodity"],
-            global_unique_identifier=order_data_frame_row.loc[
-                "global_unique_identifier"
-            ],
-            produced_mass=order_data_frame_row.loc["produced_mass"],
-        )
-        return production_order
+        return self.order_book.get_order(order_number=order_number)
 
     def update_order(self, produced_mass: numbers.Number):
         """Updates the mass that is already produced.
@@ -79,9 +84,8 @@ class SplittedOrderCollection:
             produced_mass (numbers.Number): The additional mass that has been
                 produced and should be added to the order.
         """
-        self.order_data_frame.at[self.current_order_number, "produced_mass"] = (
-            self.order_data_frame.at[self.current_order_number, "produced_mass"]
-            + produced_mass
+        self.order_book.add_produced_mass(
+            order_number=self.current_order_number, produced_mass=produced_mass
         )
 
 
@@ -112,6 +116,25 @@ class OrderDistributor:
             ProcessChainIdentifier, SplittedOrderCollection
         ] = {}
         self.current_splitted_order: SplittedOrderCollection
+        self.order_coalescing_options: OrderCoalescingOptions | None = None
+        self.order_coalescing_report: OrderCoalescingReport | None = None
+        """Describes the deviation of the deadlines due to the coalescing
+        of the latest distributed orders."""
+
+    def enable_order_coalescing(
+        self, order_coalescing_options: OrderCoalescingOptions | None
+    ):
+        """Determines if consecutive orders are merged before they are
+        aggregated and distributed among the process chains. Reduces the
+        number of orders that are simulated at the cost of earlier deadlines.
+
+        Args:
+            order_coalescing_options (OrderCoalescingOptions | None): Limits
+                of the merged orders. The orders are not merged if None
+                is provided.
+        """
+        self.order_coalescing_options = order_coalescing_options
+        self.order_coalescing_report = None
 
     def update_order_collection(self, new_order_collection: OrderCollection):
         """Adds new orders to the current set of orders.
@@ -174,8 +197,14 @@ class OrderDistributor:
 
         all_streams_are_continuous = False
         all_streams_are_batch = False
+        order_data_frame = self.order_collection.order_data_frame
         # Aggregate orders
-        if not self.order_collection.order_data_frame.empty:
+        if not order_data_frame.empty:
+            if self.order_coalescing_options is not None:
+                order_data_frame, self.order_coalescing_report = coalesce_orders(
+                    order_data_frame=order_data_frame,
+                    order_coalescing_options=self.order_coalescing_options,
+                )
             if all(
                 isinstance(current_stream, ContinuousStream)
                 for current_stream in list_of_all_streams
@@ -188,7 +217,7 @@ class OrderDistributor:
                     * len(list_of_all_streams)
                 )
                 aggregated_data_frame = self.aggregate_order_continuos_streams(
-                    order_data_frame=self.order_collection.order_data_frame,
+                    order_data_frame=order_data_frame,
                     total_operation_rate_of_streams=total_operation_rate_of_streams,
                 )
             elif all(
@@ -202,7 +231,7 @@ class OrderDistributor:
                     current_stream.static_data.maximum_batch_mass_value
                 )
                 aggregated_data_frame = self.aggregate_order_batch_streams(
-                    input_order_data_frame=self.order_collection.order_data_frame,
+                    input_order_data_frame=order_data_frame,
                     order_target_mass=aggregation_target_mass,
                 )
             else:
@@ -229,7 +258,7 @@ class OrderDistributor:
                     splitted_order = SplittedOrderCollection(
                         stream_name=stream_name,
                         process_chain_identifier=process_chain_identifier,
-                        order_data_frame=splitted_data_frame,
+                        order_book=OrderBook(order_data_frame=splitted_data_frame),
                         commodity=self.order_collection.commodity,
                         target_mass=splitted_target_mass,
                     )
@@ -250,7 +279,7 @@ class OrderDistributor:
                     splitted_order = SplittedOrderCollection(
                         stream_name=stream_name,
                         process_chain_identifier=process_chain_identifier,
-                        order_data_frame=splitted_data_frame,
+                        order_book=OrderBook(order_data_frame=splitted_data_frame),
                         commodity=self.order_collection.commodity,
                         target_mass=splitted_target_mass,
                     )
@@ -281,113 +310,10 @@ class OrderDistributor:
         Returns:
             pandas.DataFrame: Aggregated data frame of orders.
         """
-        intermediate_data_frame = order_data_frame.copy()
-        intermediate_data_frame.sort_values(
-            by="production_deadline", ascending=False, inplace=True
+        return aggregate_orders_for_continuous_streams(
+            order_data_frame=order_data_frame,
+            total_operation_rate_of_streams=total_operation_rate_of_streams,
         )
-        intermediate_data_frame.reset_index(inplace=True, drop=True)
-        series_of_operation_rate_multiplier = (
-            intermediate_data_frame.loc[:, "production_target"]
-            / total_operation_rate_of_streams
-        )
-        duration_list = []
-        for multiplier in series_of_operation_rate_multiplier:
-            duration_list.append(multiplier * datetime.timedelta(hours=1))
-        intermediate_data_frame.loc[:, "duration_list"] = duration_list
-        intermediate_data_frame.loc[:, "start_time"] = (
-            intermediate_data_frame.loc[:, "production_deadline"]
-            - intermediate_data_frame.loc[:, "duration_list"]
-        )
-        storage_level = 0
-        previous_deadline = None
-        previous_start_time = None
-        current_deadline = None
-        current_start_time = None
-        aggregated_production_target = 0
-        output_order_list = []
-        current_order_number = 1
-        stream_finishes_before_next_deadline = True
-        first_deadline_has_been_set = False
-        second_deadline_has_been_set = False
-        deadline_accumulated_order = None
-        start_time_agglomerated_order = None
-        for index, current_row in intermediate_data_frame.iterrows():
-            current_deadline = current_row["production_deadline"]
-            current_start_time = current_row["start_time"]
-            current_duration = current_row["duration_list"]
-            # if deadline_accumulated_order is None:
-            #     deadline_accumulated_order = current_deadline
-            if (
-                first_deadline_has_been_set is False
-                and second_deadline_has_been_set is False
-            ):
-                deadline_accumulated_order = current_deadline
-                first_deadline_has_been_set = True
-            if (
-                first_deadline_has_been_set is True
-                and second_deadline_has_been_set is False
-            ):
-                deadline_accumulated_order = current_deadline
-                second_deadline_has_been_set = True
-            if start_time_agglomerated_order is None:
-                start_time_agglomerated_order = current_start_time
-            else:
-                start_time_agglomerated_order = (
-                    start_time_agglomerated_order - current_duration
-                )
-
-            aggregated_production_target = (
-                aggregated_production_target + current_row["production_target"]
-            )
-
-            # To skip agglomeration on first entry
-            if previous_deadline is not None and previous_start_time is not None:
-                stream_finishes_before_next_deadline = (
-                    check_if_date_1_is_before_or_at_date_2(
-                        date_1=current_deadline,
-                        date_2=start_time_agglomerated_order,
-                    )
-                )
-
-                if stream_finishes_before_next_deadline is True:
-                    production_order = ProductionOrder(
-                        production_target=aggregated_production_target,
-                        production_deadline=deadline_accumulated_order,
-                        order_number=current_order_number,
-                        commodity=current_row["commodity"],
-                    )
-                    output_order_list.append(production_order)
-                    current_order_number = current_order_number + 1
-                    aggregated_production_target = 0
-                    deadline_accumulated_order = None
-                    start_time_agglomerated_order = None
-                    first_deadline_has_been_set = False
-                    second_deadline_has_been_set = False
-
-                # else:
-                #     aggregated_production_target = (
-                #         aggregated_production_target + current_row["production_target"]
-                #     )
-                #     combined_start_time_of_output_order = (
-                #         combined_start_time_of_output_order
-                #         - current_row["duration_list"]
-                #     )
-
-            previous_deadline = current_row["production_deadline"]
-            previous_start_time = current_row["start_time"]
-        if aggregated_production_target < 0 or isinstance(
-            deadline_accumulated_order, datetime.datetime
-        ):
-            production_order = ProductionOrder(
-                production_target=aggregated_production_target,
-                production_deadline=deadline_accumulated_order,
-                order_number=current_order_number,
-                commodity=current_row["commodity"],
-            )
-            output_order_list.append(production_order)
-
-        aggregated_data_frame = pandas.DataFrame(data=output_order_list)
-        return aggregated_data_frame
 
     def aggregate_order_batch_streams(
         self,
@@ -400,131 +326,18 @@ class OrderDistributor:
         Args:
             input_order_data_frame (pandas.DataFrame): DataFrame of orders that
                 should be aggregated.
-            order_target_mass (numbers.Number): The combined operation
-                rate of all continuous streams that are connected to the sink.
+            order_target_mass (numbers.Number): The mass of each aggregated order.
 
 
         Returns:
             pandas.DataFrame: Aggregated data frame of orders.
         """
-
-        input_order_data_frame = input_order_data_frame.copy()
-        input_order_data_frame.sort_values(
-            by="production_deadline", ascending=False, inplace=True
-        )
-        input_order_data_frame.reset_index(inplace=True, drop=True)
-        # It is expected that the data frame is ordered from the latest order at index[0]
-        # to the newest at index [-1]
-
-        total_sum = input_order_data_frame.loc[:, "production_target"].sum()
-        number_of_output_order = math.ceil(total_sum / order_target_mass)
-        input_order_data_frame.loc[:, "Cumulative Target Upper Bound"] = (
-            input_order_data_frame.loc[:, "production_target"].cumsum()
+        return aggregate_orders_for_batch_streams(
+            order_data_frame=input_order_data_frame,
+            order_target_mass=order_target_mass,
+            commodity=self.order_collection.commodity,
         )
 
-        # input_order_data_frame.loc[:, "Cumulative Target Lower Bound"] = (
-        #     input_order_data_frame.loc[:, "Cumulative Target Upper Bound"]
-        #     - input_order_data_frame.loc[:, "production_target"]
-        # )
-
-        list_of_aggregated_production_order = []
-        for current_output_order_number in range(1, number_of_output_order + 1):
-            # Determine the upper and lower bound for the cumulative mass cumulative mass for the
-            lower_bound_required_cumulative_mass = numpy.float64(order_target_mass) * (
-                numpy.float64(current_output_order_number) - numpy.float64(1)
-            )
-            upper_bound_required_cumulative_mass = numpy.float64(
-                order_target_mass
-            ) * numpy.float64(current_output_order_number)
-
-            # Determine the index of the
-            # selection_lower_index = input_order_data_frame.loc[
-            #     input_order_data_frame.loc[:, "Cumulative Target Lower Bound"]
-            #     >= lower_bound_required_cumulative_mass
-            # ]
-            # Determine indices of relevant input orders
-            # Determine lower index
-
-            # Decrease
-
-            # if selection_lower_index.empty is True:
-            #     lower_index = input_order_data_frame.index[-1]
-            # else:
-            #     lower_index = selection_lower_index.index[0]
-            #     if (
-            #         selection_lower_index.loc[
-            #             lower_index, "Cumulative Target Lower Bound"
-            #         ]
-            #         != lower_bound_required_cumulative_mass
-            #     ):
-            #         lower_index = lower_index - 1
-
-            # Determine Upper index
-            selection_upper_index = input_order_data_frame.loc[
-                input_order_data_frame.loc[:, "Cumulative Target Upper Bound"]
-                <= upper_bound_required_cumulative_mass
-            ]
-
-            # Determine upper index
-            if selection_upper_index.empty is True:
-                upper_index = input_order_data_frame.index[-1]
-            else:
-                upper_index = selection_upper_index.index[-1]
-
-            # Determine production target of output order
-            cumulative_mass_at_upper_index = input_order_data_frame.at[
-                upper_index, "Cumulative Target Upper Bound"
-            ]
-
-            if (
-                cumulative_mass_at_upper_index < upper_bound_required_cumulative_mass
-                and not math.isclose(
-                    cumulative_mass_at_upper_index, upper_bound_required_cumulative_mass
-                )
-            ):
-                if upper_index < input_order_data_frame.shape[0] - 1:
-                    upper_index = upper_index + 1
-
-            updated_cumulative_mass_at_upper_index = input_order_data_frame.at[
-                upper_index, "Cumulative Target Upper Bound"
-            ]
-
-            available_mass_in_order_range = (
-                updated_cumulative_mass_at_upper_index
-                - lower_bound_required_cumulative_mass
-            )
-
-            if available_mass_in_order_range < order_target_mass and not math.isclose(
-                available_mass_in_order_range, order_target_mass
-            ):
-                production_target = available_mass_in_order_range
-            else:
-                production_target = order_target_mass
-
-            # Create
-            deadline = input_order_data_frame.loc[upper_index, "production_deadline"]
-            if production_target == 0 or not isinstance(deadline, datetime.datetime):
-                raise Exception("asd")
-            production_order = ProductionOrder(
-                production_target=production_target,
-                production_deadline=deadline,
-                commodity=self.order_collection.commodity,
-                order_number=current_output_order_number,
-            )
-
-            list_of_aggregated_production_order.append(production_order)
-
-        output_data_frame = pandas.DataFrame(data=list_of_aggregated_production_order)
-
-        # print("input_order_data_frame", input_order_data_frame)
-        # print(input_order_data_frame.loc[:, "production_target"].sum())
-        # print("output_data_frame", output_data_frame)
-        # print(
-        #     output_data_frame.loc[:, "production_target"].sum(),
-        # )
-        # print("")
-        return output_data_frame
-
     def get_current_production_order(self) -> ProductionOrder:
         """Returns the current production order.
 
@@ -601,7 +414,7 @@ class OrderDistributor:
         """
         process_chain_orders_are_satisfied = (
             self.current_splitted_order.current_order_number
-            >= self.current_splitted_order.order_data_frame.shape[0]
+            >= len(self.current_splitted_order.order_book)
         )
         return process_chain_orders_are_satisfied
 
@@ -1,6 +1,11 @@
 import datetime
 
+from ethos_penalps.utilities.integer_time import (
+    convert_datetime_to_integer_time,
+    convert_integer_time_to_datetime,
+)
 from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
+from ethos_penalps.utilities.undo_log import UndoLog
 
 logger = PeNALPSLogger.get_logger_without_handler()
 
@@ -9,7 +14,13 @@ class TimeData:
     """Each instance of process step data contains an own instance of the this class.
     It contains the temporal information of the discrete event simulation
     of the current process step. Global start and end date is the same
-    for each process step in the Enterprise.
+    for each process step in the Enterprise. The idle time and the process
+    state switch times are stored as integer microseconds since the EPOCH,
+    because they are compared and shifted by each process state switch. They
+    are converted to datetime objects when they are read by the datetime
+    getters, e.g. to create the entries of the process states. The stream end
+    time and the storage update time are datetime objects like the times of
+    the stream states they are derived from.
     """
 
     def __init__(
@@ -24,11 +35,38 @@ class TimeData:
         """
         self.global_start_date: datetime.datetime = global_start_date
         self.global_end_date: datetime.datetime = global_end_date
-        self.last_idle_time: datetime.datetime = global_end_date
-        self.last_process_state_switch_time: datetime.datetime = global_end_date
-        self.next_process_state_switch_time: datetime.datetime = global_end_date
+        global_end_integer_time = convert_datetime_to_integer_time(
+            date_time=global_end_date
+        )
+        self.last_idle_integer_time: int = global_end_integer_time
+        self.last_process_state_switch_integer_time: int = global_end_integer_time
+        self.next_process_state_switch_integer_time: int = global_end_integer_time
         self.next_stream_end_time: datetime.datetime
         self.storage_last_update_time: datetime.datetime = global_end_date
+        self.undo_log: UndoLog | None = None
+        """Records the changes of the attributes which are restored after
+        an adaption, if the undo log state restoration mode is used."""
+
+    @property
+    def last_idle_time(self) -> datetime.datetime:
+        """Last idle time of the process step as datetime."""
+        return convert_integer_time_to_datetime(
+            integer_time=self.last_idle_integer_time
+        )
+
+    @property
+    def last_process_state_switch_time(self) -> datetime.datetime:
+        """Last process state switch time as datetime."""
+        return convert_integer_time_to_datetime(
+            integer_time=self.last_process_state_switch_integer_time
+        )
+
+    @property
+    def next_process_state_switch_time(self) -> datetime.datetime:
+        """Next process state switch time as datetime."""
+        return convert_integer_time_to_datetime(
+            integer_time=self.next_process_state_switch_integer_time
+        )
 
     def set_current_process_time(self, current_process_time: datetime.datetime):
         """Sets the current process time of a process step.
@@ -64,12 +102,16 @@ class TimeData:
     def set_next_event_time_as_last_idle_time(self):
         logger.debug(
             "Current process time has been set to: %s from: %s",
-            self.last_idle_time,
-            self.next_process_state_switch_time,
+            self.last_idle_integer_time,
+            self.next_process_state_switch_integer_time,
         )
-        if self.next_process_state_switch_time > self.last_idle_time:
+        if self.next_process_state_switch_integer_time > self.last_idle_integer_time:
             raise Exception("Next discrete event time is after last idle time")
-        self.last_idle_time = self.next_process_state_switch_time
+        if self.undo_log is not None:
+            self.undo_log.record_attribute(
+                owner=self, attribute_name="last_idle_integer_time"
+            )
+        self.last_idle_integer_time = self.next_process_state_switch_integer_time
 
     def set_next_process_state_switch_time(
         self, next_discrete_event_time: datetime.datetime
@@ -81,19 +123,49 @@ class TimeData:
                 + " was received",
                 next_discrete_event_time,
             )
-        if next_discrete_event_time > self.last_idle_time:
+        self.set_next_process_state_switch_integer_time(
+            next_discrete_event_integer_time=convert_datetime_to_integer_time(
+                date_time=next_discrete_event_time
+            )
+        )
+
+    def set_next_process_state_switch_integer_time(
+        self, next_discrete_event_integer_time: int
+    ):
+        """Sets the next process state switch time.
+
+        Args:
+            next_discrete_event_integer_time (int): Next process state switch
+                time in microseconds since the EPOCH.
+        """
+        if next_discrete_event_integer_time > self.last_idle_integer_time:
             raise Exception("Next discrete event time is after last idle time")
-        self.next_process_state_switch_time = next_discrete_event_time
-        logger.debug("Next event time is set to: %s", next_discrete_event_time)
+        if self.undo_log is not None:
+            self.undo_log.record_attribute(
+                owner=self, attribute_name="next_process_state_switch_integer_time"
+            )
+        self.next_process_state_switch_integer_time = next_discrete_event_integer_time
+        logger.debug("Next event time is set to: %s", next_discrete_event_integer_time)
 
     def set_last_process_state_switch_time(
         self,
     ):
-        new_last_process_state_switch_time = self.get_next_process_state_switch_time()
+        new_last_process_state_switch_integer_time = (
+            self.next_process_state_switch_integer_time
+        )
 
-        if new_last_process_state_switch_time > self.last_process_state_switch_time:
+        if (
+            new_last_process_state_switch_integer_time
+            > self.last_process_state_switch_integer_time
+        ):
             raise Exception("New last process_state_switch_time is before old time")
-        self.last_process_state_switch_time = new_last_process_state_switch_time
+        if self.undo_log is not None:
+            self.undo_log.record_attribute(
+                owner=self, attribute_name="last_process_state_switch_integer_time"
+            )
+        self.last_process_state_switch_integer_time = (
+            new_last_process_state_switch_integer_time
+        )
 
     def get_last_process_state_switch_time(self) -> datetime.datetime:
         """Returns the last process_state_switch time.
@@ -109,6 +181,10 @@ class TimeData:
         Args:
             next_stream_end_time (datetime.datetime): Next stream end time.
         """
+        if self.undo_log is not None:
+            self.undo_log.record_attribute(
+                owner=self, attribute_name="next_stream_end_time"
+            )
         self.next_stream_end_time = next_stream_end_time
 
     def get_next_stream_end_time(self) -> datetime.datetime:
@@ -133,6 +209,10 @@ class TimeData:
         Args:
             updated_storage_datetime (datetime.datetime): Updated storage time.
         """
+        if self.undo_log is not None:
+            self.undo_log.record_attribute(
+                owner=self, attribute_name="storage_last_update_time"
+            )
         self.storage_last_update_time = updated_storage_datetime
 
     def create_self_copy(self) -> "TimeData":
@@ -145,9 +225,13 @@ class TimeData:
             global_start_date=self.global_start_date,
             global_end_date=self.global_end_date,
         )
-        self_copy.last_idle_time = self.last_idle_time
-        self_copy.last_process_state_switch_time = self.last_process_state_switch_time
-        self_copy.next_process_state_switch_time = self.next_process_state_switch_time
+        self_copy.last_idle_integer_time = self.last_idle_integer_time
+        self_copy.last_process_state_switch_integer_time = (
+            self.last_process_state_switch_integer_time
+        )
+        self_copy.next_process_state_switch_integer_time = (
+            self.next_process_state_switch_integer_time
+        )
 
         self_copy.storage_last_update_time = self.storage_last_update_time
 
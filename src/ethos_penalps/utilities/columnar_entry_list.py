@@ -0,0 +1,905 @@
+import dataclasses
+import datetime
+import itertools
+import numbers
+import operator
+import os
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from typing import Any
+
+import numpy
+import pandas
+
+from ethos_penalps.utilities.identifiers import InterningTable
+from ethos_penalps.utilities.integer_time import EPOCH, ONE_MICROSECOND
+
+MISSING_TIME_VALUE = int(numpy.iinfo(numpy.int64).min)
+MAXIMUM_TIME_VALUE = int(numpy.iinfo(numpy.int64).max)
+INITIAL_CAPACITY = 16
+MAXIMUM_NUMBER_OF_PENDING_ENTRIES = 1024
+
+
+class _BufferColumn:
+    """Base class of the columns that store their values in a growable
+    numpy buffer. The buffer is doubled when it is full, so that data frames
+    that have been handed out keep referencing the previous buffer and are
+    not changed by later appends. Spilled values are stored in read only
+    memory maps of chunk files and the buffer only contains the values
+    that have been appended since the last spill.
+    """
+
+    buffer_dtype: Any = numpy.float64
+    missing_value: Any = numpy.nan
+
+    def __init__(self) -> None:
+        self.buffer: numpy.ndarray = numpy.empty(
+            INITIAL_CAPACITY, dtype=self.buffer_dtype
+        )
+        self.length: int = 0
+        self.list_of_spilled_chunks: list[numpy.ndarray] = []
+        """Memory maps of the chunk files in the order of the rows."""
+        self.number_of_spilled_values: int = 0
+
+    def convert_values(self, list_of_values: list) -> numpy.ndarray | list:
+        """Converts values of entries to the representation in the buffer.
+
+        Args:
+            list_of_values (list): Values of the entries.
+
+        Raises:
+            TypeError: Is raised if a value can not be stored in the column.
+
+        Returns:
+            numpy.ndarray | list: Representation of the values in the buffer.
+        """
+        raise NotImplementedError
+
+    def extend(self, list_of_values: list) -> bool:
+        """Appends the values to the column.
+
+        Args:
+            list_of_values (list): Values that are appended.
+
+        Returns:
+            bool: False if a value can not be stored in the column. The
+                values are not appended in this case.
+        """
+        try:
+            raw_values = self.convert_values(list_of_values)
+        except (TypeError, ValueError, OverflowError):
+            return False
+        self._write_raw_values(raw_values=raw_values)
+        return True
+
+    def extend_missing_values(self, number_of_values: int):
+        """Appends rows that do not contain a value of this column.
+
+        Args:
+            number_of_values (int): Number of rows.
+        """
+        self._write_raw_values(
+            raw_values=numpy.full(
+                number_of_values, self.missing_value, dtype=self.buffer_dtype
+            )
+        )
+
+    def _write_raw_values(self, raw_values: numpy.ndarray | list):
+        buffer_length = self.length - self.number_of_spilled_values
+        new_buffer_length = buffer_length + len(raw_values)
+        if new_buffer_length > len(self.buffer):
+            new_buffer = numpy.empty(
+                max(2 * len(self.buffer), new_buffer_length), dtype=self.buffer_dtype
+            )
+            new_buffer[:buffer_length] = self.buffer[:buffer_length]
+            self.buffer = new_buffer
+        self.buffer[buffer_length:new_buffer_length] = raw_values
+        self.length = self.length + len(raw_values)
+
+    def get_raw_values(self, start: int, stop: int) -> numpy.ndarray:
+        """Returns the buffer representation of a range of rows. Rows of a
+        single chunk or of the buffer are returned as view.
+
+        Args:
+            start (int): First row.
+            stop (int): Row after the last row.
+
+        Returns:
+            numpy.ndarray: Values of the rows.
+        """
+        list_of_parts = _get_parts_of_chunks(
+            list_of_chunks=self.list_of_spilled_chunks
+            + [self.buffer[: self.length - self.number_of_spilled_values]],
+            start=start,
+            stop=stop,
+        )
+        if len(list_of_parts) == 1:
+            return list_of_parts[0]
+        if not list_of_parts:
+            return self.buffer[:0]
+        return numpy.concatenate(list_of_parts)
+
+    def get_list_of_values(self, start: int, stop: int) -> list:
+        """Returns the values of the entries in a range of rows.
+
+        Args:
+            start (int): First row.
+            stop (int): Row after the last row.
+
+        Returns:
+            list: Values of the entries.
+        """
+        return self.get_raw_values(start=start, stop=stop).tolist()
+
+    def get_array(self) -> numpy.ndarray:
+        """Returns the values of all rows. It is a view of the buffer or of
+        the memory map if the values are not split into several chunks.
+
+        Returns:
+            numpy.ndarray: Values of the column.
+        """
+        return self.get_raw_values(start=0, stop=self.length)
+
+    def spill(self, file_path_prefix: str) -> list[str]:
+        """Writes the values that have been appended since the last spill to
+        a new chunk file and replaces the buffer by an empty buffer.
+
+        Args:
+            file_path_prefix (str): Path of the file without the extension.
+
+        Returns:
+            list[str]: Paths of the written files.
+        """
+        buffer_length = self.length - self.number_of_spilled_values
+        if buffer_length == 0:
+            return []
+        file_path = file_path_prefix + ".npy"
+        self.list_of_spilled_chunks.append(
+            _spill_array(array=self.buffer[:buffer_length], file_path=file_path)
+        )
+        self.number_of_spilled_values = self.length
+        # Data frames that reference the previous buffer stay valid
+        self.buffer = numpy.empty(INITIAL_CAPACITY, dtype=self.buffer_dtype)
+        return [file_path]
+
+
+class _FloatColumn(_BufferColumn):
+    """Stores real numbers as float64."""
+
+    def convert_values(self, list_of_values: list) -> numpy.ndarray:
+        if not set(map(type, list_of_values)) <= {float, int}:
+            for value in list_of_values:
+                if isinstance(value, bool) or not isinstance(value, numbers.Real):
+                    raise TypeError("Only real numbers can be stored")
+        return numpy.array(list_of_values, dtype=numpy.float64)
+
+
+class _PandasValueFlagColumn(_BufferColumn):
+    """Marks the values of a time or duration column that are pandas values."""
+
+    buffer_dtype = numpy.bool_
+    missing_value = False
+
+    def convert_values(self, list_of_values: list) -> list[bool]:
+        return [bool(value) for value in list_of_values]
+
+
+class _TimeColumn(_BufferColumn):
+    """Stores naive datetimes and pandas Timestamps as int64 nanoseconds since
+    the epoch. The pandas values are marked, so that each value is recreated
+    with its original type.
+    """
+
+    buffer_dtype = numpy.int64
+    missing_value = MISSING_TIME_VALUE
+    python_type: type = datetime.datetime
+    pandas_type: type = pandas.Timestamp
+    nanosecond_dtype: str = "datetime64[ns]"
+    microsecond_dtype: str = "datetime64[us]"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pandas_value_flag_column: _PandasValueFlagColumn = _PandasValueFlagColumn()
+
+    def convert_python_value(self, value: Any) -> int:
+        """Converts a value of the python type to microseconds.
+
+        Args:
+            value (Any): Value of the python type.
+
+        Raises:
+            TypeError: Is raised if the value is timezone aware.
+
+        Returns:
+            int: Microseconds of the value.
+        """
+        if value.tzinfo is not None:
+            raise TypeError("Only naive datetimes can be stored")
+        return (value - EPOCH) // ONE_MICROSECOND
+
+    def convert_values(self, list_of_values: list) -> numpy.ndarray:
+        set_of_types = set(map(type, list_of_values))
+        if not set_of_types <= {self.python_type, self.pandas_type}:
+            raise TypeError("Only " + str(self.python_type) + " can be stored")
+        if self.pandas_type in set_of_types:
+            return numpy.array(
+                [self._convert_value(value=value) for value in list_of_values],
+                dtype=numpy.int64,
+            )
+        list_of_microseconds = list(map(self.convert_python_value, list_of_values))
+        if list_of_microseconds and (
+            min(list_of_microseconds) <= MISSING_TIME_VALUE // 1000
+            or max(list_of_microseconds) > MAXIMUM_TIME_VALUE // 1000
+        ):
+            raise OverflowError("The time exceeds the range of int64 nanoseconds")
+        return numpy.array(list_of_microseconds, dtype=numpy.int64) * 1000
+
+    def _convert_value(self, value: Any) -> int:
+        """Converts a single value to nanoseconds.
+
+        Args:
+            value (Any): Value of the python or the pandas type.
+
+        Returns:
+            int: Nanoseconds of the value.
+        """
+        if type(value) is self.pandas_type:
+            if getattr(value, "tzinfo", None) is not None:
+                raise TypeError("Only naive datetimes can be stored")
+            return value.value
+        return int(self.convert_values([value])[0])
+
+    def extend(self, list_of_values: list) -> bool:
+        if super().extend(list_of_values) is False:
+            return False
+        pandas_type = self.pandas_type
+        self.pandas_value_flag_column.extend(
+            [type(value) is pandas_type for value in list_of_values]
+        )
+        return True
+
+    def extend_missing_values(self, number_of_values: int):
+        super().extend_missing_values(number_of_values=number_of_values)
+        self.pandas_value_flag_column.extend_missing_values(
+            number_of_values=number_of_values
+        )
+
+    def get_list_of_values(self, start: int, stop: int) -> list:
+        raw_values = self.get_raw_values(start=start, stop=stop)
+        list_of_values = (
+            raw_values.view(self.nanosecond_dtype)
+            .astype(self.microsecond_dtype)
+            .tolist()
+        )
+        pandas_value_flags = self.pandas_value_flag_column.get_raw_values(
+            start=start, stop=stop
+        )
+        if pandas_value_flags.any():
+            pandas_type = self.pandas_type
+            list_of_values = [
+                pandas_type(raw_value) if is_pandas_value else value
+                for value, raw_value, is_pandas_value in zip(
+                    list_of_values,
+                    raw_values.tolist(),
+                    pandas_value_flags.tolist(),
+                )
+            ]
+        return list_of_values
+
+    def get_array(self) -> numpy.ndarray:
+        return super().get_array().view(self.nanosecond_dtype)
+
+    def spill(self, file_path_prefix: str) -> list[str]:
+        list_of_file_paths = super().spill(file_path_prefix=file_path_prefix)
+        list_of_file_paths.extend(
+            self.pandas_value_flag_column.spill(
+                file_path_prefix=file_path_prefix + "_pandas_value_flags"
+            )
+        )
+        return list_of_file_paths
+
+
+class _DurationColumn(_TimeColumn):
+    """Stores timedeltas and pandas Timedeltas as int64 nanoseconds."""
+
+    python_type = datetime.timedelta
+    pandas_type = pandas.Timedelta
+    nanosecond_dtype = "timedelta64[ns]"
+    microsecond_dtype = "timedelta64[us]"
+
+    def convert_python_value(self, value: Any) -> int:
+        return value // ONE_MICROSECOND
+
+
+class _CategoryColumn(_BufferColumn):
+    """Stores hashable values like state names and commodities as int32
+    codes of an InterningTable. All category columns of a list share the
+    table. None is stored as the code -1 which is also used for missing
+    values.
+    """
+
+    buffer_dtype = numpy.int32
+    missing_value = -1
+
+    def __init__(self, interning_table: InterningTable) -> None:
+        super().__init__()
+        self.interning_table: InterningTable = interning_table
+
+    def convert_values(self, list_of_values: list) -> list[int]:
+        get_code = self.interning_table.get_code
+        return [-1 if value is None else get_code(value) for value in list_of_values]
+
+    def get_list_of_values(self, start: int, stop: int) -> list:
+        list_of_values = self.interning_table.list_of_values
+        return [
+            None if code == -1 else list_of_values[code]
+            for code in self.get_raw_values(start=start, stop=stop).tolist()
+        ]
+
+    def get_array(self) -> pandas.Categorical | numpy.ndarray:
+        codes = self.get_raw_values(start=0, stop=self.length)
+        # Only the values of the column become categories of the column
+        used_codes, column_codes = numpy.unique(codes, return_inverse=True)
+        list_of_categories = [
+            self.interning_table.list_of_values[code]
+            for code in used_codes.tolist()
+            if code != -1
+        ]
+        if len(used_codes) > 0 and used_codes[0] == -1:
+            column_codes = column_codes - 1
+        if any(dataclasses.is_dataclass(category) for category in list_of_categories):
+            # pandas converts dataclasses like commodities to dictionaries
+            # when a data frame is created from a list of entries.
+            list_of_categories = [
+                (
+                    dataclasses.asdict(category)
+                    if dataclasses.is_dataclass(category)
+                    else category
+                )
+                for category in list_of_categories
+            ]
+            return _create_object_array(
+                list_of_values=[
+                    None if code == -1 else list_of_categories[code]
+                    for code in column_codes.tolist()
+                ]
+            )
+        try:
+            return pandas.Categorical.from_codes(
+                codes=column_codes.astype(numpy.int32, copy=False),
+                categories=list_of_categories,
+            )
+        except (TypeError, ValueError):
+            # The categories of pandas must be unique and must not contain
+            # null values.
+            return _create_object_array(
+                list_of_values=self.get_list_of_values(start=0, stop=self.length)
+            )
+
+
+class _ObjectColumn:
+    """Stores all values that do not fit into a typed column as references.
+    The references are not spilled to files.
+    """
+
+    def __init__(self, list_of_values: list | None = None) -> None:
+        """
+
+        Args:
+            list_of_values (list | None, optional): Values of the previous rows.
+                Defaults to None.
+        """
+        if list_of_values is None:
+            list_of_values = []
+        self.list_of_values: list = list_of_values
+
+    @property
+    def length(self) -> int:
+        return len(self.list_of_values)
+
+    def extend(self, list_of_values: list) -> bool:
+        self.list_of_values.extend(list_of_values)
+        return True
+
+    def extend_missing_values(self, number_of_values: int):
+        self.list_of_values.extend([None] * number_of_values)
+
+    def get_list_of_values(self, start: int, stop: int) -> list:
+        return self.list_of_values[start:stop]
+
+    def get_array(self) -> numpy.ndarray:
+        return _create_object_array(list_of_values=self.list_of_values)
+
+
+def _create_object_array(list_of_values: list) -> numpy.ndarray:
+    """Creates a one dimensional array of references. numpy.array would
+    create a multidimensional array from values that are sequences.
+
+    Args:
+        list_of_values (list): Values of the array.
+
+    Returns:
+        numpy.ndarray: Array of references to the values.
+    """
+    array = numpy.empty(len(list_of_values), dtype=object)
+    array[:] = list_of_values
+    return array
+
+
+def _get_parts_of_chunks(list_of_chunks: list, start: int, stop: int) -> list:
+    """Selects the parts of consecutive chunks that contain a range of rows.
+
+    Args:
+        list_of_chunks (list): Arrays or lists that contain the rows in order.
+        start (int): First row.
+        stop (int): Row after the last row.
+
+    Returns:
+        list: Slices of the chunks that contain the rows.
+    """
+    list_of_parts = []
+    chunk_start = 0
+    for chunk in list_of_chunks:
+        if chunk_start >= stop:
+            break
+        chunk_stop = chunk_start + len(chunk)
+        if chunk_stop > start:
+            list_of_parts.append(
+                chunk[max(start - chunk_start, 0) : min(stop, chunk_stop) - chunk_start]
+            )
+        chunk_start = chunk_stop
+    return list_of_parts
+
+
+def _spill_array(array: numpy.ndarray, file_path: str) -> numpy.ndarray:
+    """Writes an array to a .npy file and returns a read only memory map
+    of the file. Empty arrays are returned unchanged because empty files
+    can not be mapped.
+
+    Args:
+        array (numpy.ndarray): One dimensional array that is written.
+        file_path (str): Path of the .npy file.
+
+    Returns:
+        numpy.ndarray: Memory map of the file.
+    """
+    if len(array) == 0:
+        return array.copy()
+    numpy.save(file_path, array)
+    return numpy.load(file_path, mmap_mode="r")
+
+
+def _create_column(
+    first_value: Any,
+    number_of_missing_values: int,
+    interning_table: InterningTable,
+) -> _BufferColumn | _ObjectColumn:
+    """Selects the column type by the first value of a field.
+
+    Args:
+        first_value (Any): First value of the field.
+        number_of_missing_values (int): Number of previous rows that
+            do not contain the field.
+        interning_table (InterningTable): Table of the codes of
+            category columns.
+
+    Returns:
+        _BufferColumn | _ObjectColumn: New column that only contains
+            the missing values.
+    """
+    column: _BufferColumn | _ObjectColumn
+    if type(first_value) in (datetime.datetime, pandas.Timestamp):
+        column = _TimeColumn()
+    elif type(first_value) in (datetime.timedelta, pandas.Timedelta):
+        column = _DurationColumn()
+    elif isinstance(first_value, numbers.Real) and not isinstance(first_value, bool):
+        column = _FloatColumn()
+    elif first_value is None or isinstance(first_value, Hashable):
+        column = _CategoryColumn(interning_table=interning_table)
+    else:
+        column = _ObjectColumn()
+    column.extend_missing_values(number_of_values=number_of_missing_values)
+    return column
+
+
+class ColumnarEntryList(Sequence):
+    """Append only list of production plan entries that stores the fields
+    of the entries in typed columns instead of storing the entry objects.
+    Times and durations are stored as int64 nanoseconds, numbers as float64
+    and names and commodities as codes of an InterningTable. Fields of other types
+    are stored as references. Appended entries are collected and written to
+    the columns in blocks. The entries are recreated when they are accessed,
+    so that the list can be used like a list of entries. Numbers are returned
+    as floats. The columns are provided as data frame by to_data_frame without
+    copying the time and number columns. The typed columns can be spilled to
+    files by spill_to_directory, so that they are read from memory maps of
+    the files afterwards. Each spill only writes the rows that have been
+    appended since the previous spill to new chunk files.
+    """
+
+    __slots__ = (
+        "_length",
+        "_list_of_entry_types",
+        "_dict_of_entry_type_codes",
+        "_dict_of_field_names",
+        "_entry_type_codes",
+        "_list_of_entry_type_code_chunks",
+        "_dict_of_columns",
+        "_list_of_pending_entries",
+        "_number_of_spilled_rows",
+        "_list_of_spilled_file_paths",
+        "interning_table",
+        "spill_directory_path",
+    )
+
+    def __init__(
+        self,
+        entries: Iterable[Any] = (),
+        interning_table: InterningTable | None = None,
+    ) -> None:
+        """
+
+        Args:
+            entries (Iterable[Any], optional): Entries that are appended to the
+                new list. Defaults to ().
+            interning_table (InterningTable | None, optional): Table of the
+                codes of names and commodities. It can be shared by all lists
+                of a production plan. A new table is created if None is
+                provided. Defaults to None.
+        """
+        if interning_table is None:
+            interning_table = InterningTable()
+        self.interning_table: InterningTable = interning_table
+        self._length: int = 0
+        self._list_of_entry_types: list[type] = []
+        self._dict_of_entry_type_codes: dict[type, int] = {}
+        self._dict_of_field_names: dict[type, tuple[str, ...]] = {}
+        self._entry_type_codes: list[int] = []
+        """Entry type codes of the rows that have not been spilled yet."""
+        self._list_of_entry_type_code_chunks: list[numpy.ndarray] = []
+        self._dict_of_columns: dict[str, _BufferColumn | _ObjectColumn] = {}
+        self._list_of_pending_entries: list[Any] = []
+        self._number_of_spilled_rows: int = 0
+        self._list_of_spilled_file_paths: list[str] = []
+        self.spill_directory_path: str | None = None
+        """Directory of the files of the spilled columns. Is None if the
+        list has not been spilled."""
+        self.extend(entries)
+
+    def append(self, entry: Any):
+        """Appends an entry to the end of the list.
+
+        Args:
+            entry (Any): Dataclass entry that is appended.
+        """
+        entry_type_code = self._dict_of_entry_type_codes.get(type(entry))
+        if entry_type_code is None:
+            entry_type_code = self._add_entry_type(entry_type=type(entry))
+        self._entry_type_codes.append(entry_type_code)
+        self._list_of_pending_entries.append(entry)
+        self._length = self._length + 1
+        if len(self._list_of_pending_entries) >= MAXIMUM_NUMBER_OF_PENDING_ENTRIES:
+            self._write_pending_entries()
+
+    def extend(self, entries: Iterable[Any]):
+        """Appends all entries to the end of the list.
+
+        Args:
+            entries (Iterable[Any]): Entries that are appended.
+        """
+        for entry in entries:
+            self.append(entry)
+
+    def _add_entry_type(self, entry_type: type) -> int:
+        """Registers a new type of entries.
+
+        Args:
+            entry_type (type): Dataclass of the entries.
+
+        Raises:
+            TypeError: Is raised if the entry is not a dataclass.
+
+        Returns:
+            int: Code of the entry type.
+        """
+        if not dataclasses.is_dataclass(entry_type):
+            raise TypeError(
+                "Only dataclass entries can be stored in a ColumnarEntryList, got: "
+                + str(entry_type)
+            )
+        entry_type_code = len(self._list_of_entry_types)
+        self._list_of_entry_types.append(entry_type)
+        self._dict_of_entry_type_codes[entry_type] = entry_type_code
+        self._dict_of_field_names[entry_type] = tuple(
+            field.name for field in dataclasses.fields(entry_type) if field.init
+        )
+        return entry_type_code
+
+    def _write_pending_entries(self):
+        """Writes the collected entries to the columns. Consecutive entries
+        of the same type are written together.
+        """
+        list_of_pending_entries = self._list_of_pending_entries
+        if not list_of_pending_entries:
+            return
+        number_of_written_rows = self._length - len(list_of_pending_entries)
+        for entry_type_code, group in itertools.groupby(
+            zip(
+                self._entry_type_codes[
+                    number_of_written_rows - self._number_of_spilled_rows :
+                ],
+                list_of_pending_entries,
+            ),
+            key=operator.itemgetter(0),
+        ):
+            list_of_entries = [entry for _, entry in group]
+            self._write_entries_of_one_type(
+                entry_type=self._list_of_entry_types[entry_type_code],
+                list_of_entries=list_of_entries,
+                number_of_written_rows=number_of_written_rows,
+            )
+            number_of_written_rows = number_of_written_rows + len(list_of_entries)
+        self._list_of_pending_entries = []
+
+    def _write_entries_of_one_type(
+        self,
+        entry_type: type,
+        list_of_entries: list[Any],
+        number_of_written_rows: int,
+    ):
+        """Writes the fields of entries of the same type to the columns.
+
+        Args:
+            entry_type (type): Type of all entries.
+            list_of_entries (list[Any]): Entries that are written.
+            number_of_written_rows (int): Number of rows that have already
+                been written to the columns.
+        """
+        dict_of_columns = self._dict_of_columns
+        for field_name in self._dict_of_field_names[entry_type]:
+            list_of_values = list(map(operator.attrgetter(field_name), list_of_entries))
+            column = dict_of_columns.get(field_name)
+            if column is None:
+                column = _create_column(
+                    first_value=list_of_values[0],
+                    number_of_missing_values=number_of_written_rows,
+                    interning_table=self.interning_table,
+                )
+                dict_of_columns[field_name] = column
+            if column.extend(list_of_values) is False:
+                column = self._convert_to_object_column(field_name=field_name)
+                column.extend(list_of_values)
+        new_number_of_rows = number_of_written_rows + len(list_of_entries)
+        for column in dict_of_columns.values():
+            if column.length < new_number_of_rows:
+                column.extend_missing_values(
+                    number_of_values=new_number_of_rows - column.length
+                )
+
+    def _convert_to_object_column(self, field_name: str) -> _ObjectColumn:
+        """Replaces a typed column by a column of references because a value
+        does not fit into the typed column.
+
+        Args:
+            field_name (str): Name of the field of the column.
+
+        Returns:
+            _ObjectColumn: The new column.
+        """
+        column = self._dict_of_columns[field_name]
+        list_of_values = column.get_list_of_values(start=0, stop=column.length)
+        for index, entry_type_code in enumerate(
+            self._get_entry_type_codes(start=0, stop=column.length)
+        ):
+            entry_type = self._list_of_entry_types[entry_type_code]
+            if field_name not in self._dict_of_field_names[entry_type]:
+                list_of_values[index] = None
+        object_column = _ObjectColumn(list_of_values=list_of_values)
+        self._dict_of_columns[field_name] = object_column
+        return object_column
+
+    def _get_entry_type_codes(self, start: int, stop: int) -> list[int]:
+        """Returns the entry type codes of a range of rows.
+
+        Args:
+            start (int): First row.
+            stop (int): Row after the last row.
+
+        Returns:
+            list[int]: Codes of the entry types.
+        """
+        list_of_entry_type_codes = []
+        for part in _get_parts_of_chunks(
+            list_of_chunks=self._list_of_entry_type_code_chunks
+            + [self._entry_type_codes],
+            start=start,
+            stop=stop,
+        ):
+            if isinstance(part, numpy.ndarray):
+                part = part.tolist()
+            list_of_entry_type_codes.extend(part)
+        return list_of_entry_type_codes
+
+    def _create_entries(self, start: int, stop: int) -> list[Any]:
+        """Recreates the entries of a range of rows.
+
+        Args:
+            start (int): First row.
+            stop (int): Row after the last row.
+
+        Returns:
+            list[Any]: The recreated entries.
+        """
+        self._write_pending_entries()
+        dict_of_values = {
+            field_name: column.get_list_of_values(start=start, stop=stop)
+            for field_name, column in self._dict_of_columns.items()
+        }
+        list_of_entries = []
+        for row_index, entry_type_code in enumerate(
+            self._get_entry_type_codes(start=start, stop=stop)
+        ):
+            entry_type = self._list_of_entry_types[entry_type_code]
+            list_of_entries.append(
+                entry_type(
+                    **{
+                        field_name: dict_of_values[field_name][row_index]
+                        for field_name in self._dict_of_field_names[entry_type]
+                    }
+                )
+            )
+        return list_of_entries
+
+    def get_last_entry(self) -> Any | None:
+        """Returns the last entry without writing the collected entries to
+        the columns. If the last entry has not been written yet, the appended
+        entry itself is returned, so that its numbers are not converted
+        to floats.
+
+        Returns:
+            Any | None: The last entry or None if the list is empty.
+        """
+        if self._list_of_pending_entries:
+            return self._list_of_pending_entries[-1]
+        if self._length == 0:
+            return None
+        return self._create_entries(start=self._length - 1, stop=self._length)[0]
+
+    def spill_to_directory(self, directory_path: str):
+        """Writes the typed columns and the entry types of the rows that have
+        been appended since the previous spill to new .npy chunk files in the
+        directory and frees their buffers. The spilled rows are read from read
+        only memory maps of the chunk files afterwards, so that the operating
+        system only loads the accessed parts of the files. Entries that are
+        appended after a spill are stored in new buffers in memory until the
+        next spill. Columns of references and the InterningTable stay
+        in memory.
+
+        Args:
+            directory_path (str): Directory of the files. It is created
+                if it does not exist.
+        """
+        self._write_pending_entries()
+        if self._length == self._number_of_spilled_rows:
+            return
+        os.makedirs(directory_path, exist_ok=True)
+        # The first row of the chunk is part of the file names, so that the
+        # chunks of different spills do not overwrite each other.
+        file_name_suffix = "_" + str(self._number_of_spilled_rows)
+        entry_type_code_file_path = os.path.join(
+            directory_path, "entry_type_codes" + file_name_suffix + ".npy"
+        )
+        self._list_of_entry_type_code_chunks.append(
+            _spill_array(
+                array=numpy.array(self._entry_type_codes, dtype=numpy.int16),
+                file_path=entry_type_code_file_path,
+            )
+        )
+        self._entry_type_codes = []
+        self._list_of_spilled_file_paths.append(entry_type_code_file_path)
+        for field_name, column in self._dict_of_columns.items():
+            if isinstance(column, _BufferColumn):
+                self._list_of_spilled_file_paths.extend(
+                    column.spill(
+                        file_path_prefix=os.path.join(
+                            directory_path, field_name + file_name_suffix
+                        )
+                    )
+                )
+        self._number_of_spilled_rows = self._length
+        self.spill_directory_path = directory_path
+
+    def get_column_values(self, field_name: str) -> numpy.ndarray:
+        """Returns the values of a field of all entries without creating
+        the entries. Times and durations are returned as datetime64[ns] and
+        timedelta64[ns] views of the column.
+
+        Args:
+            field_name (str): Name of the field.
+
+        Returns:
+            numpy.ndarray: Values of the field.
+        """
+        self._write_pending_entries()
+        column = self._dict_of_columns[field_name]
+        if isinstance(column, _CategoryColumn):
+            return _create_object_array(
+                list_of_values=column.get_list_of_values(start=0, stop=column.length)
+            )
+        return column.get_array()
+
+    def to_data_frame(self) -> pandas.DataFrame:
+        """Provides the entries as data frame. The time, duration and number
+        columns reference the column buffers without a copy unless the rows
+        are split into several spilled chunks. Fields that are not part of
+        an entry are NaN, NaT or None.
+
+        Returns:
+            pandas.DataFrame: One row for each entry and one column for each field.
+        """
+        self._write_pending_entries()
+        if self._length == 0:
+            return pandas.DataFrame()
+        return pandas.DataFrame(
+            {
+                field_name: column.get_array()
+                for field_name, column in self._dict_of_columns.items()
+            },
+            copy=False,
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        # The entries are created in blocks, so that iterating over
+        # spilled lists does not load all columns at once.
+        for start in range(0, self._length, MAXIMUM_NUMBER_OF_PENDING_ENTRIES):
+            yield from self._create_entries(
+                start=start,
+                stop=min(start + MAXIMUM_NUMBER_OF_PENDING_ENTRIES, self._length),
+            )
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self._create_entries(start=0, stop=self._length))
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step == 1:
+                return self._create_entries(start=start, stop=max(start, stop))
+            return self._create_entries(start=0, stop=self._length)[index]
+        if index < 0:
+            index = index + self._length
+        if index < 0 or index >= self._length:
+            raise IndexError("list index out of range")
+        return self._create_entries(start=index, stop=index + 1)[0]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ColumnarEntryList, list)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __add__(self, other: Iterable[Any]) -> list[Any]:
+        return list(self) + list(other)
+
+    def __radd__(self, other: Iterable[Any]) -> list[Any]:
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return "ColumnarEntryList(" + repr(list(self)) + ")"
+
+
+def convert_entries_to_data_frame(entries: Sequence[Any]) -> pandas.DataFrame:
+    """Creates a data frame from production plan entries. The columns of a
+    ColumnarEntryList are used directly, other sequences are converted
+    by pandas.
+
+    Args:
+        entries (Sequence[Any]): The entries of a stream, process step or storage.
+
+    Returns:
+        pandas.DataFrame: One row for each entry and one column for each field.
+    """
+    if isinstance(entries, ColumnarEntryList):
+        return entries.to_data_frame()
+    return pandas.DataFrame(entries)
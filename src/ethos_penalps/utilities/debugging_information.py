@@ -1,5 +1,9 @@
+import collections
+import json
+import os
 import warnings
-from dataclasses import fields
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, fields
 
 from ethos_penalps.data_classes import LoopCounter
 from ethos_penalps.node_operations import DownstreamAdaptionOrder, NodeOperation
@@ -9,14 +13,247 @@ from ethos_penalps.post_processing.enterprise_graph_for_failed_run import (
 )
 from ethos_penalps.process_nodes.process_node import ProcessNode
 from ethos_penalps.stream_handler import StreamHandler
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+
+
+class NodeOperationTraceModes:
+    """Contains the modes in which the DebuggingInformationLogger
+    records the node operations of a chain.
+    """
+
+    off: str = "off"
+    ring_buffer: str = "ring_buffer"
+    file: str = "file"
+
+
+@dataclass(slots=True)
+class NodeOperationRecord:
+    """Compact representation of a node operation that is written to the
+    trace file. The fields of the node operation, its stream state and its
+    production order are stored as strings. The output branch data
+    which is referenced by the node operation is not recorded.
+    """
+
+    loop_number: int
+    operation_type: str
+    starting_node_name: str
+    next_node_name: str | None
+    dict_of_node_operation_fields: dict[str, str]
+    """Remaining fields of the node operation, e.g. the branch identifiers."""
+    dict_of_stream_state_fields: dict[str, str] | None = None
+    dict_of_production_order_fields: dict[str, str] | None = None
+
+
+def convert_fields_to_strings(data_class_instance: object) -> dict[str, str]:
+    """Converts the fields of a dataclass to strings.
+
+    Args:
+        data_class_instance (object): E.g. a stream state or production order.
+
+    Returns:
+        dict[str, str]: The string of each field by its name.
+    """
+    return {
+        data_class_field.name: str(getattr(data_class_instance, data_class_field.name))
+        for data_class_field in fields(data_class_instance)
+    }
+
+
+def create_node_operation_record(
+    loop_number: int, node_operation: NodeOperation
+) -> NodeOperationRecord:
+    """Creates the compact record of a node operation.
+
+    Args:
+        loop_number (int): Loop number in which the operation is processed.
+        node_operation (NodeOperation): The recorded node operation.
+
+    Returns:
+        NodeOperationRecord: The record of the node operation.
+    """
+    node_operation_record = NodeOperationRecord(
+        loop_number=loop_number,
+        operation_type=node_operation.operation_type,
+        starting_node_name=node_operation.starting_node_name,
+        next_node_name=node_operation.next_node_name,
+        dict_of_node_operation_fields={},
+    )
+    for node_operation_field in fields(node_operation):
+        field_name = node_operation_field.name
+        if field_name in ("operation_type", "starting_node_name", "next_node_name"):
+            continue
+        elif field_name == "stream_state":
+            node_operation_record.dict_of_stream_state_fields = (
+                convert_fields_to_strings(
+                    data_class_instance=node_operation.stream_state
+                )
+            )
+        elif field_name == "production_order":
+            node_operation_record.dict_of_production_order_fields = (
+                convert_fields_to_strings(
+                    data_class_instance=node_operation.production_order
+                )
+            )
+        elif field_name.endswith("_branch_data"):
+            # The branch data contains the complete state of the output branch
+            continue
+        else:
+            node_operation_record.dict_of_node_operation_fields[field_name] = str(
+                getattr(node_operation, field_name)
+            )
+    return node_operation_record
 
 
 class DebuggingInformationLogger:
-    def __init__(self) -> None:
-        self.node_operation_dict: dict[str, NodeOperation] = {}
+    """Records the node operations of a chain which are shown in the report
+    of a failed simulation. By default only the last operations are kept in
+    a ring buffer, so that the memory consumption does not grow with the number
+    of iterations. Alternatively a NodeOperationRecord of each operation is
+    appended as a JSON line to a file or the recording is turned off.
+    """
+
+    def __init__(
+        self,
+        trace_mode: str = NodeOperationTraceModes.ring_buffer,
+        ring_buffer_size: int = 100,
+        trace_file_path: str | None = None,
+    ) -> None:
+        """
+
+        Args:
+            trace_mode (str, optional): One of the NodeOperationTraceModes.
+                Defaults to NodeOperationTraceModes.ring_buffer.
+            ring_buffer_size (int, optional): Number of the latest node operations
+                which are kept in the ring buffer. Defaults to 100.
+            trace_file_path (str | None, optional): Path of the file to which the
+                records of all node operations are appended. Is required for the
+                file mode. An existing file is overwritten. Defaults to None.
+        """
+        if trace_mode not in (
+            NodeOperationTraceModes.off,
+            NodeOperationTraceModes.ring_buffer,
+            NodeOperationTraceModes.file,
+        ):
+            raise MisconfigurationError(
+                "Unknown node operation trace mode: " + str(trace_mode)
+            )
+        if trace_mode == NodeOperationTraceModes.ring_buffer and ring_buffer_size < 1:
+            raise MisconfigurationError(
+                "The size of the ring buffer must be at least 1 but is: "
+                + str(ring_buffer_size)
+            )
+        if trace_mode == NodeOperationTraceModes.file:
+            if trace_file_path is None:
+                raise MisconfigurationError(
+                    "A trace file path is required for the file trace mode"
+                )
+            trace_directory = os.path.dirname(os.path.abspath(trace_file_path))
+            os.makedirs(trace_directory, exist_ok=True)
+            with open(trace_file_path, "wb"):
+                pass
+        self.trace_mode: str = trace_mode
+        self.ring_buffer_size: int = ring_buffer_size
+        self.trace_file_path: str | None = trace_file_path
+        self.node_operation_ring_buffer: collections.deque[
+            tuple[int, NodeOperation]
+        ] = collections.deque(maxlen=ring_buffer_size)
+        self._trace_file = None
+        self.trace_file_length_at_checkpoint: int | None = None
+        """Length of the trace file when the last simulation checkpoint has been written."""
 
     def add_node_operation(self, node_operation: NodeOperation):
-        self.node_operation_dict[LoopCounter.loop_number] = node_operation
+        """Records a node operation with the current loop number.
+
+        Args:
+            node_operation (NodeOperation): The operation which is
+                processed in the current iteration.
+        """
+        if self.trace_mode == NodeOperationTraceModes.ring_buffer:
+            self.node_operation_ring_buffer.append(
+                (LoopCounter.loop_number, node_operation)
+            )
+        elif self.trace_mode == NodeOperationTraceModes.file:
+            if self._trace_file is None:
+                self._trace_file = open(self.trace_file_path, "ab")
+            node_operation_record = create_node_operation_record(
+                loop_number=LoopCounter.loop_number, node_operation=node_operation
+            )
+            self._trace_file.write(
+                (json.dumps(asdict(node_operation_record)) + "\n").encode("utf-8")
+            )
+
+    def get_node_operations(self) -> Iterator[tuple[int, NodeOperation]]:
+        """Returns the node operations of the ring buffer in the order of
+        their creation. The file mode only stores the records of the node
+        operations, which are returned by get_node_operation_records.
+
+        Raises:
+            MisconfigurationError: Is raised in the file mode.
+
+        Returns:
+            Iterator[tuple[int, NodeOperation]]: The loop number and the node operation.
+        """
+        if self.trace_mode == NodeOperationTraceModes.file:
+            raise MisconfigurationError(
+                "The file trace only contains the records of the node operations"
+            )
+        if self.trace_mode == NodeOperationTraceModes.ring_buffer:
+            yield from list(self.node_operation_ring_buffer)
+
+    def get_node_operation_records(self) -> Iterator[NodeOperationRecord]:
+        """Returns the records of the recorded node operations in the order
+        of their creation.
+
+        Returns:
+            Iterator[NodeOperationRecord]: The record of each node operation.
+        """
+        if self.trace_mode == NodeOperationTraceModes.ring_buffer:
+            for loop_number, node_operation in list(self.node_operation_ring_buffer):
+                yield create_node_operation_record(
+                    loop_number=loop_number, node_operation=node_operation
+                )
+        elif self.trace_mode == NodeOperationTraceModes.file:
+            self.close_trace_file()
+            with open(self.trace_file_path, "rb") as trace_file:
+                for line in trace_file:
+                    yield NodeOperationRecord(**json.loads(line))
+
+    def close_trace_file(self):
+        """Writes the buffered node operations to the trace file and closes it.
+        The file is opened again for the next node operation.
+        """
+        if self._trace_file is not None:
+            self._trace_file.close()
+            self._trace_file = None
+
+    def store_trace_file_length(self):
+        """Stores the current length of the trace file. Is called when
+        a simulation checkpoint is written.
+        """
+        if self.trace_mode == NodeOperationTraceModes.file:
+            if self._trace_file is not None:
+                self._trace_file.flush()
+            self.trace_file_length_at_checkpoint = os.path.getsize(self.trace_file_path)
+
+    def truncate_trace_file(self):
+        """Removes the node operations that have been recorded after the
+        last simulation checkpoint from the trace file. Is called when the
+        simulation is resumed from the checkpoint, so that these operations
+        are not recorded twice.
+        """
+        if (
+            self.trace_mode == NodeOperationTraceModes.file
+            and self.trace_file_length_at_checkpoint is not None
+        ):
+            self.close_trace_file()
+            with open(self.trace_file_path, "ab") as trace_file:
+                trace_file.truncate(self.trace_file_length_at_checkpoint)
+
+    def __getstate__(self) -> dict:
+        # The open file can not be pickled, e.g. for checkpoints or
+        # the transfer from a worker process.
+        self.close_trace_file()
+        return self.__dict__.copy()
 
 
 class NodeOperationViewer:
@@ -42,8 +279,7 @@ class NodeOperationViewer:
 
     def create_node_visualization(
         self,
-        node_operation: NodeOperation,
-        loop_number: float,
+        node_operation_record: NodeOperationRecord,
         file_name: str = "Node_visualization",
     ):
         graph_visualization = GraphVisualization(
@@ -52,64 +288,48 @@ class NodeOperationViewer:
             output_file_extension="svg",
         )
         node_operation_table_creator = GraphVizTableCreator()
+        node_operation_table_creator.add_first_row(
+            [node_operation_record.operation_type]
+        )
+        node_operation_table_creator.add_row(
+            ["next_node_name", str(node_operation_record.next_node_name)]
+        )
+        node_operation_table_creator.add_row(
+            ["starting_node_name", node_operation_record.starting_node_name]
+        )
+        for (
+            field_name,
+            field_value,
+        ) in node_operation_record.dict_of_node_operation_fields.items():
+            node_operation_table_creator.add_row([field_name, field_value])
 
         stream_state_table_creator = None
-        production_order_table_creator = None
         active_stream_name = None
-        starting_node_output_branch_data_table_creator = None
-        for field in fields(node_operation):
-            if field.name == "stream_state":
-                stream_state_table_creator = GraphVizTableCreator()
-                stream_state = getattr(node_operation, field.name)
-
-                stream_state_table_creator.add_row(["Stream state"])
-                for stream_state_field in fields(stream_state):
-                    stream_state_table_creator.add_row(
-                        [
-                            str(stream_state_field.name),
-                            str(getattr(stream_state, stream_state_field.name)),
-                        ]
-                    )
-
-                active_stream_name = stream_state.name
-            elif field.name == "operation_type":
-                node_operation_table_creator.add_first_row(
-                    [str(getattr(node_operation, field.name))]
-                )
-            elif field.name == "production_order":
-                production_order_table_creator = GraphVizTableCreator()
-                production_order_table_creator.add_first_row(
-                    list_of_columns=["Production order"]
-                )
-                production_order = getattr(node_operation, field.name)
-                for production_order_field in fields(production_order):
-                    production_order_table_creator.add_row(
-                        [
-                            str(production_order_field.name),
-                            str(getattr(production_order, production_order_field.name)),
-                        ]
-                    )
-            elif field.name == "starting_node_output_branch_data":
-                # starting_node_output_branch_data_table_creator = GraphVizTableCreator()
-                # starting_node_output_branch_data_table_creator.add_first_row(
-                #     ["starting_node_output_branch_data"]
-                # )
-                # production_order = getattr(node_operation, field.name)
-                # for production_order_field in fields(production_order):
-                #     starting_node_output_branch_data_table_creator.add_row(
-                #         [
-                #             str(production_order_field.name),
-                #             str(getattr(production_order, production_order_field.name)),
-                #         ]
-                #     )
-                pass
-            elif field.name == "target_node_output_branch_data":
-                pass
-            else:
-                node_operation_table_creator.add_row(
-                    [str(field.name), str(getattr(node_operation, field.name))]
-                )
-        node_operation_table_creator.add_row(["Loop number", str(loop_number)])
+        if node_operation_record.dict_of_stream_state_fields is not None:
+            stream_state_table_creator = GraphVizTableCreator()
+            stream_state_table_creator.add_row(["Stream state"])
+            for (
+                field_name,
+                field_value,
+            ) in node_operation_record.dict_of_stream_state_fields.items():
+                stream_state_table_creator.add_row([field_name, field_value])
+            active_stream_name = node_operation_record.dict_of_stream_state_fields[
+                "name"
+            ]
+        production_order_table_creator = None
+        if node_operation_record.dict_of_production_order_fields is not None:
+            production_order_table_creator = GraphVizTableCreator()
+            production_order_table_creator.add_first_row(
+                list_of_columns=["Production order"]
+            )
+            for (
+                field_name,
+                field_value,
+            ) in node_operation_record.dict_of_production_order_fields.items():
+                production_order_table_creator.add_row([field_name, field_value])
+        node_operation_table_creator.add_row(
+            ["Loop number", str(node_operation_record.loop_number)]
+        )
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             graph_visualization.create_enterprise_structure_graph(
@@ -117,8 +337,8 @@ class NodeOperationViewer:
                 stream_state_table_creator=stream_state_table_creator,
                 node_operation_table_creator=node_operation_table_creator,
                 production_order_table_creator=production_order_table_creator,
-                current_node_operation_name=node_operation.starting_node_name,
-                starting_node_output_branch_data_table_creator=starting_node_output_branch_data_table_creator,
+                current_node_operation_name=node_operation_record.starting_node_name,
+                starting_node_output_branch_data_table_creator=None,
                 active_stream_name=active_stream_name,
                 graph_directory=self.graph_directory,
                 file_name=file_name,
@@ -127,11 +347,9 @@ class NodeOperationViewer:
 
     def create_all_node_visualizations(self):
         for (
-            loop_number,
-            node_operation,
-        ) in self.debugging_information_logger.node_operation_dict.items():
+            node_operation_record
+        ) in self.debugging_information_logger.get_node_operation_records():
             self.create_node_visualization(
-                node_operation=node_operation,
-                loop_number=loop_number,
-                file_name=str(loop_number) + "Node_visualization",
+                node_operation_record=node_operation_record,
+                file_name=str(node_operation_record.loop_number) + "Node_visualization",
             )
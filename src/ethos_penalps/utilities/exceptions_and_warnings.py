@@ -19,6 +19,10 @@ class MisconfigurationError(Exception):
     pass
 
 
+class SimulationAbortedError(Exception):
+    pass
+
+
 class UnexpectedCase(Exception):
     pass
 
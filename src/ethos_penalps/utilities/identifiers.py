@@ -0,0 +1,106 @@
+import sys
+from collections.abc import Hashable
+
+import numpy
+
+
+class IdentifierCounter:
+    """Creates the identifiers of branches and orders. A large number of
+    branches is created during the simulation, so that consecutive integers
+    are used instead of uuids. The identifiers are unique within a process.
+    The next identifier is stored in simulation checkpoints, so that restored
+    and newly created identifiers can not collide. Worker processes create
+    the identifiers of each chain in a separate block after the next identifier.
+    """
+
+    next_identifier: int = 0
+
+    @classmethod
+    def continue_after(cls, next_identifier: int):
+        """Ensures that the following identifiers are not smaller than the
+        next identifier of another process or of a restored simulation.
+
+        Args:
+            next_identifier (int): Next identifier of the other process
+                or of the restored simulation.
+        """
+        if next_identifier > cls.next_identifier:
+            cls.next_identifier = next_identifier
+
+
+def get_new_identifier() -> int:
+    """Returns an identifier that has not been returned before in this process.
+
+    Returns:
+        int: The new identifier.
+    """
+    identifier = IdentifierCounter.next_identifier
+    IdentifierCounter.next_identifier = identifier + 1
+    return identifier
+
+
+def get_block_of_new_identifiers(number_of_identifiers: int) -> numpy.ndarray:
+    """Returns consecutive identifiers that have not been returned before
+    in this process. Is used to create the identifiers of many orders at once.
+
+    Args:
+        number_of_identifiers (int): Number of identifiers in the block.
+
+    Returns:
+        numpy.ndarray: The new identifiers.
+    """
+    first_identifier = IdentifierCounter.next_identifier
+    IdentifierCounter.next_identifier = first_identifier + number_of_identifiers
+    return numpy.arange(
+        first_identifier, first_identifier + number_of_identifiers, dtype=numpy.int64
+    )
+
+
+class InterningTable:
+    """Assigns consecutive integer codes to names and other hashable values.
+    Each value is stored only once, so that columns of production plan
+    entries can store the codes instead of the values. Strings are interned,
+    so that all entries which are recreated from the codes share the same
+    string objects.
+    """
+
+    def __init__(self) -> None:
+        self.list_of_values: list[Hashable] = []
+        """Contains the value of each code at the index of the code."""
+        # The type is part of the key so that equal values of different
+        # types like 1 and 1.0 are not merged.
+        self.dict_of_codes: dict[tuple[type, Hashable], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.list_of_values)
+
+    def get_code(self, value: Hashable) -> int:
+        """Returns the code of a value. Values without a code
+        are added to the table.
+
+        Args:
+            value (Hashable): Value whose code is requested.
+
+        Returns:
+            int: Code of the value.
+        """
+        key = (type(value), value)
+        code = self.dict_of_codes.get(key)
+        if code is None:
+            code = len(self.list_of_values)
+            self.dict_of_codes[key] = code
+            if type(value) is str:
+                value = sys.intern(value)
+            self.list_of_values.append(value)
+        return code
+
+    def get_value(self, code: int) -> Hashable:
+        """Returns the value of a code.
+
+        Args:
+            code (int): Code of the value.
+
+        Returns:
+            Hashable: The value of the code.
+        """
+        return self.list_of_values[code]
@@ -0,0 +1,116 @@
+"""The process state switches, the mass balance of storages and the load
+profile accumulation compare and subtract a large number of points in time.
+Python datetime objects and the datetimerange package are comparatively slow
+for this purpose, so that these calculations use integer microseconds since
+the EPOCH. Microseconds are the resolution of datetime.datetime, so that the
+conversion does not change any result. The process state switch times of the
+TimeData are stored as integer times and are converted back to datetime
+objects when the entries of the process states are created. The stream
+states and all entries of the production plan keep their datetime objects.
+"""
+
+import datetime
+
+import datetimerange
+import pandas
+
+EPOCH = datetime.datetime(1970, 1, 1)
+"""Point in time that corresponds to the integer time 0."""
+ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+"""Duration of one unit of the integer time."""
+MICROSECONDS_PER_SECOND = 1000000
+NANOSECONDS_PER_MICROSECOND = 1000
+
+
+def convert_datetime_to_integer_time(date_time: datetime.datetime) -> int:
+    """Converts a point in time to the microseconds since the EPOCH.
+    The nanoseconds of pandas Timestamps are read directly, because their
+    subtraction is considerably slower than the one of datetime objects.
+
+    Args:
+        date_time (datetime.datetime): Point in time that is converted.
+
+    Returns:
+        int: Microseconds since the EPOCH.
+    """
+    if type(date_time) is pandas.Timestamp:
+        return date_time.value // NANOSECONDS_PER_MICROSECOND
+    return (date_time - EPOCH) // ONE_MICROSECOND
+
+
+def convert_integer_time_to_datetime(integer_time: int) -> datetime.datetime:
+    """Converts microseconds since the EPOCH to a point in time.
+
+    Args:
+        integer_time (int): Microseconds since the EPOCH.
+
+    Returns:
+        datetime.datetime: Point in time of the integer time.
+    """
+    return EPOCH + datetime.timedelta(microseconds=integer_time)
+
+
+def convert_timedelta_to_integer_time(duration: datetime.timedelta) -> int:
+    """Converts a duration to microseconds.
+
+    Args:
+        duration (datetime.timedelta): Duration that is converted.
+
+    Returns:
+        int: Duration in microseconds.
+    """
+    return duration // ONE_MICROSECOND
+
+
+def convert_date_time_range_to_integer_times(
+    date_time_range: datetimerange.DateTimeRange,
+) -> tuple[int, int]:
+    """Converts the start and end of a DateTimeRange to integer times.
+
+    Args:
+        date_time_range (datetimerange.DateTimeRange): Date range that is
+            converted.
+
+    Returns:
+        tuple[int, int]: Integer start time and integer end time of the
+            date range.
+    """
+    return (
+        convert_datetime_to_integer_time(date_time=date_time_range.start_datetime),
+        convert_datetime_to_integer_time(date_time=date_time_range.end_datetime),
+    )
+
+
+def get_integer_time_overlap_share(
+    numerator_start_time: int,
+    numerator_end_time: int,
+    denominator_start_time: int,
+    denominator_end_time: int,
+) -> float:
+    """Determines the share of the denominator period that is covered by
+    the numerator period. The periods overlap if the start of one period
+    lies within the other period, which corresponds to
+    DateTimeRange.is_intersection. The durations are converted to seconds
+    before the division, like DateTimeRange.get_timedelta_second, so that
+    the share is exactly the same as the share of the DateTimeRanges.
+
+    Args:
+        numerator_start_time (int): Integer start time of the numerator period.
+        numerator_end_time (int): Integer end time of the numerator period.
+        denominator_start_time (int): Integer start time of the denominator period.
+        denominator_end_time (int): Integer end time of the denominator period.
+
+    Returns:
+        float: Share between 0 and 1 of the denominator period.
+    """
+    if (
+        denominator_start_time <= numerator_start_time <= denominator_end_time
+        or numerator_start_time <= denominator_start_time <= numerator_end_time
+    ):
+        intersection_duration = min(denominator_end_time, numerator_end_time) - max(
+            denominator_start_time, numerator_start_time
+        )
+        return (intersection_duration / MICROSECONDS_PER_SECOND) / (
+            (denominator_end_time - denominator_start_time) / MICROSECONDS_PER_SECOND
+        )
+    return 0
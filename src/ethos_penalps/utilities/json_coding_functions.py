@@ -1,11 +1,17 @@
+import dataclasses
 import datetime
 import json
+import types
+import typing
+from typing import Any, TypeVar
 
 import datetimerange
 import pint
 
 from ethos_penalps.utilities.units import Units
 
+RecordType = TypeVar("RecordType")
+
 
 def json_datetime_serialization_function(date_time_object):
     if isinstance(date_time_object, datetime.datetime):
@@ -51,6 +57,198 @@ def json_datetime_range_deserialization_function(
     )
 
 
+def _get_field_coder(record_field: dataclasses.Field, coder_name: str) -> Any:
+    """Returns the encoder or decoder that has been assigned to a field by
+    dataclasses_json.config.
+
+    Args:
+        record_field (dataclasses.Field): Field of a record dataclass.
+        coder_name (str): Either "encoder" or "decoder".
+
+    Returns:
+        Any: The function or None if no function has been assigned.
+    """
+    return record_field.metadata.get("dataclasses_json", {}).get(coder_name)
+
+
+def _encode_value(value: Any) -> Any:
+    """Converts a value of a field without an encoder to a json compatible value.
+
+    Args:
+        value (Any): Value of the field.
+
+    Returns:
+        Any: Json compatible value.
+    """
+    if isinstance(value, datetime.datetime):
+        return json_datetime_serialization_function(date_time_object=value)
+    if isinstance(value, datetime.timedelta):
+        return json_timedelta_serialization_function(date_time_object=value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return convert_record_to_dict(record=value)
+    return value
+
+
+def _decode_value(value: Any, field_type: Any) -> Any:
+    """Converts a json value of a field without a decoder to the type of the field.
+
+    Args:
+        value (Any): Json value of the field.
+        field_type (Any): Type hint of the field.
+
+    Returns:
+        Any: Value of the field.
+    """
+    if value is None:
+        return None
+    if typing.get_origin(field_type) in (typing.Union, types.UnionType):
+        list_of_types = [
+            argument
+            for argument in typing.get_args(field_type)
+            if argument is not type(None)
+        ]
+        if len(list_of_types) == 1:
+            field_type = list_of_types[0]
+    if field_type is datetime.datetime:
+        return json_datetime_deserialization_function(date_time_string=value)
+    if field_type is datetime.timedelta:
+        return json_timedelta_deserialization_function(date_time_string=value)
+    if dataclasses.is_dataclass(field_type) and isinstance(value, dict):
+        return create_record_from_dict(record_type=field_type, dictionary=value)
+    return value
+
+
+def convert_record_to_dict(record: Any) -> dict[str, Any]:
+    """Converts a record dataclass, like a stream state or a production plan entry,
+    to a dictionary of json compatible values. The encoders in the metadata of
+    the fields are considered.
+
+    Args:
+        record (Any): Instance of a record dataclass.
+
+    Returns:
+        dict[str, Any]: The field names and the encoded values of the record.
+    """
+    dictionary = {}
+    for record_field in dataclasses.fields(record):
+        value = getattr(record, record_field.name)
+        encoder = _get_field_coder(record_field=record_field, coder_name="encoder")
+        if encoder is None:
+            dictionary[record_field.name] = _encode_value(value=value)
+        else:
+            dictionary[record_field.name] = encoder(value)
+    return dictionary
+
+
+def create_record_from_dict(
+    record_type: type[RecordType], dictionary: dict[str, Any]
+) -> RecordType:
+    """Creates a record dataclass from a dictionary that has been created by
+    convert_record_to_dict. Keys which are not fields of the record are ignored.
+
+    Args:
+        record_type (type[RecordType]): Class of the record.
+        dictionary (dict[str, Any]): The field names and the encoded values.
+
+    Returns:
+        RecordType: The decoded record.
+    """
+    dict_of_field_types = typing.get_type_hints(record_type)
+    dict_of_arguments = {}
+    for record_field in dataclasses.fields(record_type):
+        if not record_field.init or record_field.name not in dictionary:
+            continue
+        value = dictionary[record_field.name]
+        decoder = _get_field_coder(record_field=record_field, coder_name="decoder")
+        if decoder is None:
+            dict_of_arguments[record_field.name] = _decode_value(
+                value=value, field_type=dict_of_field_types.get(record_field.name)
+            )
+        else:
+            dict_of_arguments[record_field.name] = decoder(value)
+    return record_type(**dict_of_arguments)
+
+
+def convert_record_to_json(record: Any) -> str:
+    """Converts a record dataclass, like a stream state or a production plan entry,
+    to a json string.
+
+    Args:
+        record (Any): Instance of a record dataclass.
+
+    Returns:
+        str: Json string of the record.
+    """
+    return json.dumps(convert_record_to_dict(record=record))
+
+
+def create_record_from_json(
+    record_type: type[RecordType], json_string: str
+) -> RecordType:
+    """Creates a record dataclass from a json string that has been created by
+    convert_record_to_json. Keys which are not fields of the record are ignored.
+
+    Args:
+        record_type (type[RecordType]): Class of the record.
+        json_string (str): Json string of the record.
+
+    Returns:
+        RecordType: The decoded record.
+    """
+    return create_record_from_dict(
+        record_type=record_type, dictionary=json.loads(json_string)
+    )
+
+
+class RecordJsonMixin:
+    """Provides to_json, to_dict, from_json and from_dict for slotted record
+    dataclasses. In contrast to DataClassJsonMixin it does not add a __dict__
+    to each instance.
+    """
+
+    __slots__ = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the record to a dictionary of json compatible values.
+
+        Returns:
+            dict[str, Any]: The field names and the encoded values of the record.
+        """
+        return convert_record_to_dict(record=self)
+
+    def to_json(self) -> str:
+        """Converts the record to a json string.
+
+        Returns:
+            str: Json string of the record.
+        """
+        return convert_record_to_json(record=self)
+
+    @classmethod
+    def from_dict(cls: type[RecordType], dictionary: dict[str, Any]) -> RecordType:
+        """Creates a record from a dictionary that has been created by to_dict.
+
+        Args:
+            dictionary (dict[str, Any]): The field names and the encoded values.
+
+        Returns:
+            RecordType: The decoded record.
+        """
+        return create_record_from_dict(record_type=cls, dictionary=dictionary)
+
+    @classmethod
+    def from_json(cls: type[RecordType], json_string: str) -> RecordType:
+        """Creates a record from a json string that has been created by to_json.
+
+        Args:
+            json_string (str): Json string of the record.
+
+        Returns:
+            RecordType: The decoded record.
+        """
+        return create_record_from_json(record_type=cls, json_string=json_string)
+
+
 def json_pint_unit_serialization_function(pint_unit):
     if isinstance(pint_unit, pint.Unit):
         astropy_dictionary = {
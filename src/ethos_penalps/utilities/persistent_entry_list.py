@@ -0,0 +1,99 @@
+from collections.abc import Collection, Iterable, Iterator
+from typing import Any
+
+
+class PersistentEntryList(Collection):
+    """Append only list of production plan entries. The entries are stored
+    as a chain of nodes that point to the previously appended node.
+    A copy of the list only references the last node of the chain so that
+    a copy is created in constant time. Entries that are appended to a copy
+    or to the original are not visible in the other one because each of
+    them creates its own node that points to the shared part of the chain.
+
+    Only appending, the length and the access to the last entry take
+    constant time. Other indices and slices raise a TypeError, because they
+    would have to traverse the chain. Iterating from the first entry creates
+    a temporary list of all entries, reversed iteration walks the chain.
+    """
+
+    __slots__ = ("_last_node", "_length")
+
+    def __init__(self, entries: Iterable[Any] = ()) -> None:
+        """
+
+        Args:
+            entries (Iterable[Any], optional): Entries that are appended to the
+                new list. Defaults to ().
+        """
+        self._last_node: tuple[Any, tuple | None] | None = None
+        self._length: int = 0
+        self.extend(entries)
+
+    def append(self, entry: Any):
+        """Appends an entry to the end of the list.
+
+        Args:
+            entry (Any): Entry that is appended.
+        """
+        self._last_node = (entry, self._last_node)
+        self._length = self._length + 1
+
+    def extend(self, entries: Iterable[Any]):
+        """Appends all entries to the end of the list.
+
+        Args:
+            entries (Iterable[Any]): Entries that are appended.
+        """
+        for entry in entries:
+            self.append(entry)
+
+    def create_copy(self) -> "PersistentEntryList":
+        """Creates a copy that shares all current entries with this list.
+
+        Returns:
+            PersistentEntryList: Copy of the list.
+        """
+        copy_of_list = PersistentEntryList()
+        copy_of_list._last_node = self._last_node
+        copy_of_list._length = self._length
+        return copy_of_list
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __reversed__(self) -> Iterator[Any]:
+        current_node = self._last_node
+        while current_node is not None:
+            entry, current_node = current_node
+            yield entry
+
+    def __iter__(self) -> Iterator[Any]:
+        list_of_entries = list(self.__reversed__())
+        list_of_entries.reverse()
+        return iter(list_of_entries)
+
+    def __contains__(self, value: object) -> bool:
+        return any(entry == value for entry in reversed(self))
+
+    def __getitem__(self, index: int) -> Any:
+        if isinstance(index, slice) or index not in (-1, self._length - 1):
+            raise TypeError(
+                "A PersistentEntryList only provides access to its last entry. "
+                "It must be converted to a list to access the index: " + str(index)
+            )
+        if self._last_node is None:
+            raise IndexError("list index out of range")
+        return self._last_node[0]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (PersistentEntryList, list)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return "PersistentEntryList(" + repr(list(self)) + ")"
+
+    def __reduce__(self):
+        # The chain of nodes is converted to a list because nested tuples
+        # would exceed the recursion limit of pickle for long lists.
+        return (PersistentEntryList, (list(self),))
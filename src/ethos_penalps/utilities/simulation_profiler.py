@@ -0,0 +1,376 @@
+import math
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy
+import pandas
+
+from ethos_penalps.node_operations import (
+    DownstreamAdaptionOrder,
+    DownstreamValidationOrder,
+    NodeOperation,
+    UpstreamAdaptionOrder,
+)
+from ethos_penalps.process_nodes.process_chain_storage import ProcessChainStorage
+from ethos_penalps.process_nodes.process_node import ProcessNode
+from ethos_penalps.utilities.logger_ethos_penalps import PeNALPSLogger
+
+if TYPE_CHECKING:
+    from ethos_penalps.organizational_agents.process_chain import ProcessChain
+
+logger = PeNALPSLogger.get_logger_without_handler()
+
+MINIMUM_HISTOGRAM_DURATION: float = 1e-7
+"""Upper edge of the first bin of the call duration histogram in seconds."""
+NUMBER_OF_HISTOGRAM_BINS_PER_DECADE: int = 50
+NUMBER_OF_HISTOGRAM_DECADES: int = 10
+
+
+@dataclass
+class CallDurationStatistics:
+    """Summarizes the wall times of the calls of a node with a node operation
+    type in constant memory. The number of calls, the cumulative and the maximum
+    time are exact. The percentiles are determined from a histogram with
+    logarithmic bins, so that their relative error is below 5 %.
+    """
+
+    number_of_calls: int = 0
+    cumulative_time: float = 0.0
+    maximum_time: float = 0.0
+    histogram_counts: numpy.ndarray = field(
+        default_factory=lambda: numpy.zeros(
+            NUMBER_OF_HISTOGRAM_BINS_PER_DECADE * NUMBER_OF_HISTOGRAM_DECADES + 2,
+            dtype=numpy.int64,
+        )
+    )
+    """The first bin contains the calls that are shorter than the
+    MINIMUM_HISTOGRAM_DURATION and the last bin the calls that exceed the
+    largest bin."""
+
+    def add_call_duration(self, call_duration: float):
+        """Adds the wall time of a call to the statistics.
+
+        Args:
+            call_duration (float): Wall time of the call in seconds.
+        """
+        self.number_of_calls = self.number_of_calls + 1
+        self.cumulative_time = self.cumulative_time + call_duration
+        if call_duration > self.maximum_time:
+            self.maximum_time = call_duration
+        if call_duration <= MINIMUM_HISTOGRAM_DURATION:
+            bin_index = 0
+        else:
+            bin_index = min(
+                math.ceil(
+                    math.log10(call_duration / MINIMUM_HISTOGRAM_DURATION)
+                    * NUMBER_OF_HISTOGRAM_BINS_PER_DECADE
+                ),
+                len(self.histogram_counts) - 1,
+            )
+        self.histogram_counts[bin_index] = self.histogram_counts[bin_index] + 1
+
+    def get_mean_time(self) -> float:
+        """Returns the mean wall time of the calls.
+
+        Returns:
+            float: Mean wall time in seconds.
+        """
+        return self.cumulative_time / self.number_of_calls
+
+    def get_percentile(self, percentile: float) -> float:
+        """Returns the upper edge of the histogram bin that contains the
+        percentile. It is limited to the maximum time of the calls.
+
+        Args:
+            percentile (float): Percentile between 0 and 100.
+
+        Returns:
+            float: Wall time of the percentile in seconds.
+        """
+        rank = max(math.ceil(percentile / 100 * self.number_of_calls), 1)
+        bin_index = int(
+            numpy.searchsorted(numpy.cumsum(self.histogram_counts), rank, side="left")
+        )
+        upper_bin_edge = MINIMUM_HISTOGRAM_DURATION * 10 ** (
+            bin_index / NUMBER_OF_HISTOGRAM_BINS_PER_DECADE
+        )
+        return min(upper_bin_edge, self.maximum_time)
+
+
+class SimulationProfiler:
+    """Measures the wall time of each call of process_input_order of the nodes
+    of the ProcessChains it is assigned to. The calls are grouped by chain, node
+    and the type of the received node operation and each group is summarized by
+    CallDurationStatistics of constant size. The profiler is only called by
+    the chains if it has been assigned to them, so that a simulation without
+    profiler is not slowed down.
+    """
+
+    adaption_operation_types: tuple[str, ...] = (
+        UpstreamAdaptionOrder.__name__,
+        DownstreamAdaptionOrder.__name__,
+    )
+    validation_operation_types: tuple[str, ...] = (DownstreamValidationOrder.__name__,)
+
+    def __init__(self) -> None:
+        self.dict_of_call_duration_statistics: dict[
+            tuple[str, str, str], CallDurationStatistics
+        ] = {}
+        self.dict_of_node_types: dict[str, str] = {}
+        self.dict_of_number_of_iterations: dict[str, int] = {}
+        self.dict_of_number_of_fulfilled_orders: dict[str, int] = {}
+
+    def profile_process_input_order(
+        self,
+        process_chain_name: str,
+        process_node: ProcessNode,
+        input_node_operation: NodeOperation,
+    ) -> NodeOperation:
+        """Passes the node operation to the node and records the duration
+        of the call.
+
+        Args:
+            process_chain_name (str): Name of the chain that is simulated.
+            process_node (ProcessNode): The node that receives the node operation.
+            input_node_operation (NodeOperation): The node operation that
+                is processed by the node.
+
+        Returns:
+            NodeOperation: The output node operation of the node.
+        """
+        start_time = time.perf_counter()
+        output_node_operation = process_node.process_input_order(
+            input_node_operation=input_node_operation
+        )
+        call_duration = time.perf_counter() - start_time
+        key = (
+            process_chain_name,
+            process_node.name,
+            type(input_node_operation).__name__,
+        )
+        call_duration_statistics = self.dict_of_call_duration_statistics.get(key)
+        if call_duration_statistics is None:
+            call_duration_statistics = CallDurationStatistics()
+            self.dict_of_call_duration_statistics[key] = call_duration_statistics
+            self.dict_of_node_types[process_node.name] = type(process_node).__name__
+        call_duration_statistics.add_call_duration(call_duration=call_duration)
+        return output_node_operation
+
+    def add_process_chain_summary(self, process_chain: "ProcessChain"):
+        """Stores the number of iterations and fulfilled orders of a chain
+        after its simulation is terminated.
+
+        Args:
+            process_chain (ProcessChain): The chain that has been simulated.
+        """
+        process_chain_name = process_chain.process_chain_identifier.chain_name
+        self.dict_of_number_of_iterations[process_chain_name] = (
+            process_chain.number_of_iterations
+        )
+        sink = process_chain.get_sink()
+        if isinstance(sink, ProcessChainStorage):
+            sink = sink.sink
+        splitted_order = sink.order_distributor.dict_of_splitted_order[
+            process_chain.process_chain_identifier
+        ]
+        self.dict_of_number_of_fulfilled_orders[process_chain_name] = (
+            splitted_order.current_order_number
+        )
+
+    def check_if_calls_are_recorded(self) -> bool:
+        """Checks if any call of a node has been recorded.
+
+        Returns:
+            bool: Returns True if at least one call has been recorded.
+        """
+        return bool(self.dict_of_call_duration_statistics)
+
+    def get_iterations_per_fulfilled_order(
+        self, process_chain_name: str
+    ) -> float | None:
+        """Returns the average number of iterations that were required
+        to fulfill an order of the chain.
+
+        Args:
+            process_chain_name (str): Name of the chain.
+
+        Returns:
+            float | None: Iterations per fulfilled order or None if the chain
+                has not fulfilled any order.
+        """
+        number_of_fulfilled_orders = self.dict_of_number_of_fulfilled_orders.get(
+            process_chain_name, 0
+        )
+        if number_of_fulfilled_orders == 0:
+            return None
+        return (
+            self.dict_of_number_of_iterations[process_chain_name]
+            / number_of_fulfilled_orders
+        )
+
+    def get_node_operation_profile_data_frame(self) -> pandas.DataFrame:
+        """Returns the call statistics of each node and node operation type.
+
+        Returns:
+            pandas.DataFrame: Contains a row for each chain, node and node
+                operation type with the number of calls, the cumulative and
+                the percentile wall times of the calls.
+        """
+        list_of_rows = []
+        for (
+            process_chain_name,
+            node_name,
+            node_operation_type,
+        ), call_duration_statistics in self.dict_of_call_duration_statistics.items():
+            list_of_rows.append(
+                {
+                    "Process chain": process_chain_name,
+                    "Node": node_name,
+                    "Node type": self.dict_of_node_types[node_name],
+                    "Node operation": node_operation_type,
+                    "Number of calls": call_duration_statistics.number_of_calls,
+                    "Cumulative time [s]": call_duration_statistics.cumulative_time,
+                    "Mean time [s]": call_duration_statistics.get_mean_time(),
+                    "50th percentile [s]": call_duration_statistics.get_percentile(
+                        percentile=50
+                    ),
+                    "90th percentile [s]": call_duration_statistics.get_percentile(
+                        percentile=90
+                    ),
+                    "99th percentile [s]": call_duration_statistics.get_percentile(
+                        percentile=99
+                    ),
+                    "Maximum time [s]": call_duration_statistics.maximum_time,
+                }
+            )
+        node_operation_profile_data_frame = pandas.DataFrame(
+            list_of_rows,
+            columns=[
+                "Process chain",
+                "Node",
+                "Node type",
+                "Node operation",
+                "Number of calls",
+                "Cumulative time [s]",
+                "Mean time [s]",
+                "50th percentile [s]",
+                "90th percentile [s]",
+                "99th percentile [s]",
+                "Maximum time [s]",
+            ],
+        )
+        return node_operation_profile_data_frame.sort_values(
+            "Cumulative time [s]", ascending=False, ignore_index=True
+        )
+
+    def get_node_profile_data_frame(self) -> pandas.DataFrame:
+        """Returns the aggregated call statistics of each node in each chain.
+
+        Returns:
+            pandas.DataFrame: Contains a row for each chain and node with the
+                number of calls, the cumulative wall time, the ratio of received
+                adaption to validation orders and the calls per fulfilled order.
+        """
+        node_operation_profile_data_frame = self.get_node_operation_profile_data_frame()
+        list_of_rows = []
+        for (
+            process_chain_name,
+            node_name,
+        ), node_data_frame in node_operation_profile_data_frame.groupby(
+            ["Process chain", "Node"], sort=False
+        ):
+            number_of_adaptions = node_data_frame.loc[
+                node_data_frame["Node operation"].isin(self.adaption_operation_types),
+                "Number of calls",
+            ].sum()
+            number_of_validations = node_data_frame.loc[
+                node_data_frame["Node operation"].isin(self.validation_operation_types),
+                "Number of calls",
+            ].sum()
+            if number_of_validations > 0:
+                adaption_to_validation_ratio = (
+                    number_of_adaptions / number_of_validations
+                )
+            else:
+                adaption_to_validation_ratio = numpy.nan
+            number_of_calls = node_data_frame["Number of calls"].sum()
+            number_of_fulfilled_orders = self.dict_of_number_of_fulfilled_orders.get(
+                process_chain_name, 0
+            )
+            if number_of_fulfilled_orders > 0:
+                calls_per_fulfilled_order = number_of_calls / number_of_fulfilled_orders
+            else:
+                calls_per_fulfilled_order = numpy.nan
+            list_of_rows.append(
+                {
+                    "Process chain": process_chain_name,
+                    "Node": node_name,
+                    "Node type": self.dict_of_node_types[node_name],
+                    "Number of calls": number_of_calls,
+                    "Cumulative time [s]": node_data_frame["Cumulative time [s]"].sum(),
+                    "Adaption to validation ratio": adaption_to_validation_ratio,
+                    "Calls per fulfilled order": calls_per_fulfilled_order,
+                }
+            )
+        node_profile_data_frame = pandas.DataFrame(
+            list_of_rows,
+            columns=[
+                "Process chain",
+                "Node",
+                "Node type",
+                "Number of calls",
+                "Cumulative time [s]",
+                "Adaption to validation ratio",
+                "Calls per fulfilled order",
+            ],
+        )
+        return node_profile_data_frame.sort_values(
+            "Cumulative time [s]", ascending=False, ignore_index=True
+        )
+
+    def get_process_chain_profile_data_frame(self) -> pandas.DataFrame:
+        """Returns the number of iterations and fulfilled orders of each chain.
+
+        Returns:
+            pandas.DataFrame: Contains a row for each simulated chain.
+        """
+        list_of_rows = []
+        for (
+            process_chain_name,
+            number_of_iterations,
+        ) in self.dict_of_number_of_iterations.items():
+            iterations_per_fulfilled_order = self.get_iterations_per_fulfilled_order(
+                process_chain_name=process_chain_name
+            )
+            if iterations_per_fulfilled_order is None:
+                iterations_per_fulfilled_order = numpy.nan
+            list_of_rows.append(
+                {
+                    "Process chain": process_chain_name,
+                    "Number of iterations": number_of_iterations,
+                    "Number of fulfilled orders": self.dict_of_number_of_fulfilled_orders[
+                        process_chain_name
+                    ],
+                    "Iterations per fulfilled order": iterations_per_fulfilled_order,
+                    "Cumulative time [s]": sum(
+                        call_duration_statistics.cumulative_time
+                        for (
+                            chain_name,
+                            _,
+                            _,
+                        ), call_duration_statistics in self.dict_of_call_duration_statistics.items()
+                        if chain_name == process_chain_name
+                    ),
+                }
+            )
+        return pandas.DataFrame(
+            list_of_rows,
+            columns=[
+                "Process chain",
+                "Number of iterations",
+                "Number of fulfilled orders",
+                "Iterations per fulfilled order",
+                "Cumulative time [s]",
+            ],
+        )
@@ -0,0 +1,77 @@
+from typing import Any
+
+
+class _MissingValue:
+    """Marks an attribute or a dictionary item that did not exist
+    before it was changed.
+    """
+
+
+MISSING_VALUE = _MissingValue()
+
+
+class UndoLog:
+    """Records the previous values of attributes and dictionary items
+    before they are changed. A rollback restores the recorded values in
+    reverse order, so that all changes since the last call of clear are undone.
+    The previous values are only referenced, so recording a change does not
+    depend on the size of the changed objects.
+    """
+
+    def __init__(self) -> None:
+        self.list_of_undo_entries: list[tuple[bool, Any, Any, Any]] = []
+        """Each entry contains a flag which is True for dictionary items, the
+        owner of the attribute or the dictionary, the attribute name or key and
+        the previous value."""
+
+    def record_attribute(self, owner: Any, attribute_name: str):
+        """Records the value of an attribute before it is changed.
+
+        Args:
+            owner (Any): Object that owns the attribute.
+            attribute_name (str): Name of the attribute that is changed.
+        """
+        self.list_of_undo_entries.append(
+            (
+                False,
+                owner,
+                attribute_name,
+                getattr(owner, attribute_name, MISSING_VALUE),
+            )
+        )
+
+    def record_dictionary_item(self, dictionary: dict, key: Any):
+        """Records the value of a dictionary item before it is changed.
+
+        Args:
+            dictionary (dict): Dictionary that is changed.
+            key (Any): Key of the item that is changed.
+        """
+        self.list_of_undo_entries.append(
+            (True, dictionary, key, dictionary.get(key, MISSING_VALUE))
+        )
+
+    def clear(self):
+        """Discards all recorded changes, so that the current state becomes
+        the state that is restored by the next rollback.
+        """
+        self.list_of_undo_entries.clear()
+
+    def rollback(self):
+        """Restores all recorded values in reverse order and discards
+        the recorded changes.
+        """
+        for is_dictionary_item, owner, key, previous_value in reversed(
+            self.list_of_undo_entries
+        ):
+            if is_dictionary_item is True:
+                if previous_value is MISSING_VALUE:
+                    owner.pop(key, None)
+                else:
+                    owner[key] = previous_value
+            elif previous_value is MISSING_VALUE:
+                if hasattr(owner, key):
+                    delattr(owner, key)
+            else:
+                setattr(owner, key, previous_value)
+        self.list_of_undo_entries.clear()
@@ -0,0 +1,161 @@
+import warnings
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from ethos_penalps.data_classes import (
+    ProcessStepProductionPlanEntry,
+    StorageProductionPlanEntry,
+)
+from ethos_penalps.utilities.columnar_entry_list import ColumnarEntryList
+from ethos_penalps.utilities.exceptions_and_warnings import (
+    MisconfigurationError,
+    UnexpectedBehaviorWarning,
+)
+
+MINIMUM_VALID_STORAGE_LEVEL = -1
+"""Storage levels below this level are reported as invalid. The small
+tolerance below zero prevents warnings due to rounding errors.
+"""
+
+
+class ValidationLevels:
+    """Contains the levels of the consistency checks of the simulation
+    results that are conducted during the simulation.
+    """
+
+    off: str = "off"
+    """No consistency checks are conducted."""
+    boundary: str = "boundary"
+    """Only the new entries and the junction between the last existing entry
+    and the first new entry are checked when entries are added to the
+    ProductionPlan. The effort does not depend on the number of existing entries."""
+    full: str = "full"
+    """All entries of the ProductionPlan are checked each time entries are
+    added. Should only be used for debugging because the effort grows with
+    the number of entries."""
+
+
+def check_validation_level(validation_level: str):
+    """Checks if the validation level is one of the ValidationLevels.
+
+    Args:
+        validation_level (str): The validation level that is checked.
+
+    Raises:
+        MisconfigurationError: Is raised if the validation level is unknown.
+    """
+    if validation_level not in (
+        ValidationLevels.off,
+        ValidationLevels.boundary,
+        ValidationLevels.full,
+    ):
+        raise MisconfigurationError(
+            "Unknown validation level: " + str(validation_level)
+        )
+
+
+def check_process_step_entry_alignment(
+    list_of_process_step_entries: Iterable[ProcessStepProductionPlanEntry],
+    previous_entry: ProcessStepProductionPlanEntry | None = None,
+):
+    """Checks if the process step entries align without gaps. The entries
+    are ordered from the latest to the earliest entry, so that each entry
+    must end at the start time of its predecessor in the list.
+
+    Args:
+        list_of_process_step_entries (Iterable[ProcessStepProductionPlanEntry]): The
+            entries that are checked.
+        previous_entry (ProcessStepProductionPlanEntry | None, optional): The
+            entry that precedes the checked entries in the list. Defaults to None.
+
+    Raises:
+        Exception: Is raised if two entries do not align.
+    """
+    for process_step_entry in list_of_process_step_entries:
+        if previous_entry is not None:
+            if process_step_entry.end_time != previous_entry.start_time:
+                raise Exception("Process step states do no align")
+        previous_entry = process_step_entry
+
+
+def check_storage_entry_consistency(
+    list_of_storage_entries: Iterable[StorageProductionPlanEntry],
+    previous_entry: StorageProductionPlanEntry | None = None,
+):
+    """Checks the mass balance of consecutive storage entries and warns if
+    the storage level is negative. Consecutive entries must share a boundary
+    in time and storage level. Storages of process steps are ordered from
+    the latest to the earliest entry while the storages of sinks and sources
+    are ordered from the earliest to the latest entry.
+
+    Args:
+        list_of_storage_entries (Iterable[StorageProductionPlanEntry]): The
+            entries that are checked.
+        previous_entry (StorageProductionPlanEntry | None, optional): The
+            entry that precedes the checked entries in the list. Defaults to None.
+    """
+    for storage_entry in list_of_storage_entries:
+        if (
+            min(
+                storage_entry.storage_level_at_start, storage_entry.storage_level_at_end
+            )
+            < MINIMUM_VALID_STORAGE_LEVEL
+        ):
+            warnings.warn(
+                "Storage level went below zero in entry: "
+                + str(storage_entry)
+                + " Results are faulty",
+                category=UnexpectedBehaviorWarning,
+            )
+        if previous_entry is not None and not (
+            _check_if_storage_entry_follows(
+                earlier_entry=previous_entry, later_entry=storage_entry
+            )
+            or _check_if_storage_entry_follows(
+                earlier_entry=storage_entry, later_entry=previous_entry
+            )
+        ):
+            warnings.warn(
+                "The mass balance of the storage entries is not consistent. Last entry: "
+                + str(previous_entry)
+                + " current entry: "
+                + str(storage_entry),
+                category=UnexpectedBehaviorWarning,
+            )
+        previous_entry = storage_entry
+
+
+def _check_if_storage_entry_follows(
+    earlier_entry: StorageProductionPlanEntry, later_entry: StorageProductionPlanEntry
+) -> bool:
+    """Checks if the later entry continues the earlier entry
+    in time and storage level.
+
+    Args:
+        earlier_entry (StorageProductionPlanEntry): The earlier entry.
+        later_entry (StorageProductionPlanEntry): The later entry.
+
+    Returns:
+        bool: True if the later entry starts at the end of the earlier entry.
+    """
+    return (
+        earlier_entry.end_time == later_entry.start_time
+        and earlier_entry.storage_level_at_end == later_entry.storage_level_at_start
+    )
+
+
+def get_last_entry(list_of_entries: Sequence) -> Any | None:
+    """Returns the last entry of a list of entries. The collected entries
+    of a ColumnarEntryList are not written to its columns for this purpose.
+
+    Args:
+        list_of_entries (Sequence): List of entries or ColumnarEntryList.
+
+    Returns:
+        Any | None: The last entry or None if the list is empty.
+    """
+    if isinstance(list_of_entries, ColumnarEntryList):
+        return list_of_entries.get_last_entry()
+    if len(list_of_entries) == 0:
+        return None
+    return list_of_entries[-1]
@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+from ethos_penalps.benchmark.benchmark_model_generator import (
+    BenchmarkModelGenerator,
+    BenchmarkModelParameters,
+    BenchmarkStreamTypes,
+)
+from ethos_penalps.benchmark.benchmark_runner import BenchmarkRunner
+from ethos_penalps.benchmark.execution_plan_benchmark import (
+    run_execution_plan_benchmark,
+)
+from ethos_penalps.benchmark.order_aggregation_benchmark import (
+    run_order_aggregation_benchmark,
+)
+from ethos_penalps.benchmark.output_branch_benchmark import (
+    run_output_branch_benchmark,
+)
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+
+
+@pytest.mark.parametrize(
+    "stream_type",
+    [
+        BenchmarkStreamTypes.batch,
+        BenchmarkStreamTypes.continuous,
+        BenchmarkStreamTypes.mixed,
+    ],
+)
+def test_benchmark_model_generator(stream_type: str):
+    benchmark_model_parameters = BenchmarkModelParameters(
+        number_of_orders=3,
+        number_of_process_steps_in_chain=3,
+        number_of_parallel_chains=2,
+        stream_type=stream_type,
+    )
+    enterprise = BenchmarkModelGenerator(
+        benchmark_model_parameters=benchmark_model_parameters
+    ).create_enterprise()
+    network_level = enterprise.list_of_network_level[0]
+    assert len(network_level.list_of_process_chains) == 2
+    for process_chain in network_level.list_of_process_chains:
+        assert len(process_chain.get_process_node_dict_without_sink_and_source()) == 3
+    enterprise.start_simulation(number_of_iterations_in_chain=5000)
+    for (
+        splitted_order
+    ) in (
+        network_level.get_main_sink().order_distributor.dict_of_splitted_order.values()
+    ):
+        assert splitted_order.current_order_number == (
+            splitted_order.get_order_data_frame().shape[0]
+        )
+        assert splitted_order.get_order_data_frame()["produced_mass"].sum() == (
+            pytest.approx(splitted_order.target_mass)
+        )
+
+
+def test_benchmark_runner(tmp_path):
+    benchmark_runner = BenchmarkRunner(
+        list_of_benchmark_model_parameters=[
+            BenchmarkModelParameters(number_of_orders=2),
+            BenchmarkModelParameters(
+                number_of_orders=2, stream_type=BenchmarkStreamTypes.mixed
+            ),
+        ],
+        run_in_separate_processes=False,
+    )
+    benchmark_runner.run()
+    output_path = tmp_path / "benchmark_results.json"
+    benchmark_runner.write_json(output_path=str(output_path))
+    with open(output_path) as file:
+        result_dict = json.load(file)
+    assert len(result_dict["list_of_benchmark_results"]) == 2
+    for benchmark_result in result_dict["list_of_benchmark_results"]:
+        assert benchmark_result["simulation_time"] > 0
+        assert benchmark_result["post_processing_time"] > 0
+        assert benchmark_result["report_generation_time"] is None
+        assert benchmark_result["number_of_iterations"] > 0
+        assert benchmark_result["number_of_fulfilled_orders"] > 0
+        assert benchmark_result["parameters"]["number_of_orders"] == 2
+
+
+def test_benchmark_model_parameters_misconfiguration():
+    with pytest.raises(MisconfigurationError):
+        BenchmarkModelParameters(stream_type="pneumatic")
+    with pytest.raises(MisconfigurationError):
+        BenchmarkModelParameters(number_of_parallel_chains=0)
+
+
+def test_order_aggregation_benchmark():
+    benchmark_result = run_order_aggregation_benchmark(number_of_orders=1000)
+    assert benchmark_result.number_of_orders == 1000
+    assert benchmark_result.continuous_aggregation_time > 0
+    assert benchmark_result.batch_aggregation_time > 0
+    assert 0 < benchmark_result.number_of_continuous_aggregated_orders <= 1000
+    assert benchmark_result.number_of_batch_aggregated_orders > 0
+
+
+def test_execution_plan_benchmark():
+    benchmark_result = run_execution_plan_benchmark(
+        benchmark_model_parameters=BenchmarkModelParameters(
+            number_of_orders=2, stream_type=BenchmarkStreamTypes.mixed
+        ),
+        number_of_repetitions=1,
+    )
+    assert benchmark_result.number_of_iterations > 0
+    assert benchmark_result.interpreted_iterations_per_second > 0
+    assert benchmark_result.compiled_iterations_per_second > 0
+    assert benchmark_result.parameters["number_of_orders"] == 2
+
+
+def test_output_branch_benchmark():
+    list_of_benchmark_results = run_output_branch_benchmark(
+        list_of_number_of_batches=[10, 20], number_of_orders=2
+    )
+    assert [
+        benchmark_result.number_of_batches
+        for benchmark_result in list_of_benchmark_results
+    ] == [10, 20]
+    for benchmark_result in list_of_benchmark_results:
+        assert benchmark_result.shared_entries_time > 0
+        assert benchmark_result.copied_lists_time > 0
@@ -0,0 +1,175 @@
+import os
+from test.parallel_simulation.packaging_line_enterprise import (
+    create_packaging_line_enterprise,
+)
+from test.simulation_checkpoint.copying_simulation_checkpoint_writer import (
+    CopyingSimulationCheckpointWriter,
+)
+from test.test_tutorial.tutorial_enterprise import create_tutorial_enterprise
+
+import cloudpickle
+import pytest
+
+from ethos_penalps.node_operations import TerminateProduction
+from ethos_penalps.organizational_agents.enterprise import resume_simulation
+from ethos_penalps.utilities.debugging_information import (
+    DebuggingInformationLogger,
+    NodeOperationTraceModes,
+)
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+
+
+def get_list_of_loop_numbers(
+    debugging_information_logger: DebuggingInformationLogger,
+) -> list[int]:
+    return [
+        node_operation_record.loop_number
+        for node_operation_record in debugging_information_logger.get_node_operation_records()
+    ]
+
+
+def test_node_operation_trace_modes(tmp_path):
+    file_trace_enterprise = create_tutorial_enterprise()
+    file_trace_enterprise.set_node_operation_trace(
+        trace_mode=NodeOperationTraceModes.file, trace_directory=str(tmp_path)
+    )
+    file_trace_enterprise.start_simulation()
+    ring_buffer_enterprise = create_tutorial_enterprise()
+    ring_buffer_enterprise.set_node_operation_trace(
+        trace_mode=NodeOperationTraceModes.ring_buffer, ring_buffer_size=3
+    )
+    ring_buffer_enterprise.start_simulation()
+    disabled_trace_enterprise = create_tutorial_enterprise()
+    disabled_trace_enterprise.set_node_operation_trace(
+        trace_mode=NodeOperationTraceModes.off
+    )
+    disabled_trace_enterprise.start_simulation()
+
+    for network_level_index, network_level in enumerate(
+        file_trace_enterprise.list_of_network_level
+    ):
+        for process_chain_index, process_chain in enumerate(
+            network_level.list_of_process_chains
+        ):
+            # The file contains the records of all operations of the chain
+            list_of_file_trace_records = list(
+                process_chain.debugging_information_logger.get_node_operation_records()
+            )
+            assert len(list_of_file_trace_records) == process_chain.number_of_iterations
+            assert [
+                node_operation_record.loop_number
+                for node_operation_record in list_of_file_trace_records
+            ] == list(range(process_chain.number_of_iterations))
+            # The branch data of the node operations is not recorded
+            assert os.path.getsize(
+                process_chain.debugging_information_logger.trace_file_path
+            ) < 2000 * len(list_of_file_trace_records)
+            with pytest.raises(MisconfigurationError):
+                list(process_chain.debugging_information_logger.get_node_operations())
+
+            # The ring buffer contains the latest operations
+            ring_buffer_process_chain = ring_buffer_enterprise.list_of_network_level[
+                network_level_index
+            ].list_of_process_chains[process_chain_index]
+            ring_buffer_entries = list(
+                ring_buffer_process_chain.debugging_information_logger.get_node_operations()
+            )
+            assert len(ring_buffer_entries) == 3
+            for (loop_number, node_operation), file_node_operation_record in zip(
+                ring_buffer_entries, list_of_file_trace_records[-3:]
+            ):
+                assert loop_number == file_node_operation_record.loop_number
+                assert (
+                    node_operation.operation_type
+                    == file_node_operation_record.operation_type
+                )
+                assert (
+                    node_operation.starting_node_name
+                    == file_node_operation_record.starting_node_name
+                )
+            assert get_list_of_loop_numbers(
+                ring_buffer_process_chain.debugging_information_logger
+            ) == [
+                node_operation_record.loop_number
+                for node_operation_record in list_of_file_trace_records[-3:]
+            ]
+
+            disabled_trace_process_chain = (
+                disabled_trace_enterprise.list_of_network_level[
+                    network_level_index
+                ].list_of_process_chains[process_chain_index]
+            )
+            assert (
+                get_list_of_loop_numbers(
+                    disabled_trace_process_chain.debugging_information_logger
+                )
+                == []
+            )
+
+
+def test_file_trace_is_continued_after_pickling(tmp_path):
+    enterprise = create_tutorial_enterprise()
+    enterprise.set_node_operation_trace(
+        trace_mode=NodeOperationTraceModes.file, trace_directory=str(tmp_path)
+    )
+    process_chain = enterprise.list_of_network_level[0].list_of_process_chains[0]
+    debugging_information_logger = process_chain.debugging_information_logger
+    enterprise.start_simulation()
+    list_of_loop_numbers = get_list_of_loop_numbers(debugging_information_logger)
+
+    # A copy of the logger, e.g. from a checkpoint, appends to the same file
+    copied_debugging_information_logger: DebuggingInformationLogger = cloudpickle.loads(
+        cloudpickle.dumps(debugging_information_logger)
+    )
+    copied_debugging_information_logger.add_node_operation(
+        node_operation=TerminateProduction(
+            next_node_name=None, starting_node_name="Sink"
+        )
+    )
+    list_of_node_operation_records = list(
+        copied_debugging_information_logger.get_node_operation_records()
+    )
+    assert len(list_of_node_operation_records) == len(list_of_loop_numbers) + 1
+    assert list_of_node_operation_records[-1].operation_type == "Terminate production"
+
+
+def test_file_trace_is_truncated_when_the_simulation_is_resumed(tmp_path):
+    enterprise = create_packaging_line_enterprise(number_of_lines=2, number_of_orders=4)
+    enterprise.set_node_operation_trace(
+        trace_mode=NodeOperationTraceModes.file,
+        trace_directory=str(tmp_path / "trace"),
+    )
+    checkpoint_path = str(tmp_path / "checkpoint.pckl")
+    enterprise.set_simulation_checkpoint_writer(
+        simulation_checkpoint_writer=CopyingSimulationCheckpointWriter(
+            checkpoint_path=checkpoint_path, number_of_orders_between_checkpoints=1
+        )
+    )
+    enterprise.start_simulation()
+    list_of_process_chains = enterprise.list_of_network_level[0].list_of_process_chains
+    list_of_complete_traces = [
+        get_list_of_loop_numbers(process_chain.debugging_information_logger)
+        for process_chain in list_of_process_chains
+    ]
+
+    # The completed simulation takes the place of a crash after the first checkpoint
+    resumed_enterprise = resume_simulation(checkpoint_path=checkpoint_path + ".1")
+    list_of_resumed_process_chains = resumed_enterprise.list_of_network_level[
+        0
+    ].list_of_process_chains
+    for process_chain, list_of_loop_numbers in zip(
+        list_of_resumed_process_chains, list_of_complete_traces
+    ):
+        assert (
+            get_list_of_loop_numbers(process_chain.debugging_information_logger)
+            == list_of_loop_numbers
+        )
+
+
+def test_node_operation_trace_misconfiguration():
+    with pytest.raises(MisconfigurationError):
+        DebuggingInformationLogger(trace_mode="all")
+    with pytest.raises(MisconfigurationError):
+        DebuggingInformationLogger(trace_mode=NodeOperationTraceModes.file)
+    with pytest.raises(MisconfigurationError):
+        DebuggingInformationLogger(ring_buffer_size=0)
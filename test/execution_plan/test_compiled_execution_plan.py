@@ -0,0 +1,60 @@
+from test.parallel_simulation.simulation_result_comparison import (
+    assert_equal_simulation_results,
+)
+from test.parallel_simulation.toffee_enterprise import create_toffee_enterprise
+from test.test_tutorial.tutorial_enterprise import create_tutorial_enterprise
+
+from ethos_penalps.node_operations import TerminateProduction
+from ethos_penalps.organizational_agents.compiled_execution_plan import (
+    CompiledChainExecutionPlan,
+)
+
+
+def test_compiled_execution_plan_of_tutorial_model():
+    interpreted_enterprise = create_tutorial_enterprise()
+    interpreted_enterprise.start_simulation(number_of_iterations_in_chain=2000)
+    compiled_enterprise = create_tutorial_enterprise()
+    compiled_enterprise.enable_compiled_execution_plan()
+    compiled_enterprise.start_simulation(number_of_iterations_in_chain=2000)
+    assert_equal_simulation_results(
+        enterprise_1=interpreted_enterprise, enterprise_2=compiled_enterprise
+    )
+    for interpreted_network_level, compiled_network_level in zip(
+        interpreted_enterprise.list_of_network_level,
+        compiled_enterprise.list_of_network_level,
+    ):
+        for interpreted_process_chain, compiled_process_chain in zip(
+            interpreted_network_level.list_of_process_chains,
+            compiled_network_level.list_of_process_chains,
+        ):
+            assert compiled_process_chain.number_of_iterations == (
+                interpreted_process_chain.number_of_iterations
+            )
+
+
+def test_compiled_execution_plan_of_toffee_model():
+    interpreted_enterprise = create_toffee_enterprise()
+    interpreted_enterprise.start_simulation()
+    compiled_enterprise = create_toffee_enterprise()
+    compiled_enterprise.enable_compiled_execution_plan()
+    compiled_enterprise.start_simulation()
+    assert_equal_simulation_results(
+        enterprise_1=interpreted_enterprise, enterprise_2=compiled_enterprise
+    )
+
+
+def test_compiled_execution_plan_ids():
+    enterprise = create_tutorial_enterprise()
+    process_chain = enterprise.list_of_network_level[0].list_of_process_chains[0]
+    compiled_chain_execution_plan = CompiledChainExecutionPlan(
+        process_chain=process_chain
+    )
+    for node_name, process_node in process_chain.process_node_dict.items():
+        node_id = compiled_chain_execution_plan.dict_of_node_ids[node_name]
+        assert compiled_chain_execution_plan.list_of_nodes[node_id] is process_node
+    assert (
+        compiled_chain_execution_plan.get_next_node_id(
+            TerminateProduction(next_node_name=None, starting_node_name="Sink")
+        )
+        is None
+    )
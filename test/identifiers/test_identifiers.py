@@ -0,0 +1,58 @@
+import pickle
+from test.test_tutorial.tutorial_enterprise import create_tutorial_enterprise
+
+from ethos_penalps.data_classes import OutputBranchIdentifier, TemporalBranchIdentifier
+from ethos_penalps.utilities.columnar_entry_list import convert_entries_to_data_frame
+from ethos_penalps.utilities.identifiers import (
+    IdentifierCounter,
+    InterningTable,
+    get_new_identifier,
+)
+
+
+def test_identifiers_are_consecutive_and_continue_after_restored_identifiers():
+    first_identifier = get_new_identifier()
+    output_branch_identifier = OutputBranchIdentifier(branch_number=0)
+    temporal_branch_identifier = TemporalBranchIdentifier(branch_number=0)
+    assert output_branch_identifier.global_unique_identifier == first_identifier + 1
+    assert temporal_branch_identifier.global_unique_identifier == first_identifier + 2
+
+    IdentifierCounter.continue_after(next_identifier=first_identifier + 100)
+    assert get_new_identifier() == first_identifier + 100
+    # The counter is never reset to smaller identifiers
+    IdentifierCounter.continue_after(next_identifier=0)
+    assert get_new_identifier() == first_identifier + 101
+
+
+def test_interning_table_stores_each_value_once():
+    interning_table = InterningTable()
+    first_name = "".join(["Process", " step"])
+    second_name = "".join(["Process", " step"])
+    assert first_name is not second_name
+    assert interning_table.get_code(first_name) == 0
+    assert interning_table.get_code(second_name) == 0
+    assert interning_table.get_code(1) == 1
+    assert interning_table.get_code(1.0) == 2
+    assert len(interning_table) == 3
+    assert interning_table.get_value(0) is interning_table.get_value(
+        interning_table.get_code("Process step")
+    )
+
+
+def test_production_plan_lists_share_the_interning_table():
+    enterprise = create_tutorial_enterprise(number_of_orders=2)
+    enterprise.start_simulation()
+    production_plan = enterprise.production_plan
+    interning_table = production_plan.interning_table
+    for list_of_entries in production_plan.process_step_states_dict.values():
+        assert list_of_entries.interning_table is interning_table
+        data_frame = convert_entries_to_data_frame(entries=list_of_entries)
+        # The categories of a column only contain the values of the column
+        assert set(data_frame["process_step_name"].cat.categories) == {
+            entry.process_step_name for entry in list_of_entries
+        }
+    restored_production_plan = pickle.loads(pickle.dumps(production_plan))
+    for list_of_entries in restored_production_plan.stream_state_dict.values():
+        assert (
+            list_of_entries.interning_table is restored_production_plan.interning_table
+        )
@@ -0,0 +1,115 @@
+import datetime
+import random
+
+import datetimerange
+import pandas
+
+from ethos_penalps.time_data import TimeData
+from ethos_penalps.utilities.integer_time import (
+    EPOCH,
+    convert_datetime_to_integer_time,
+    convert_integer_time_to_datetime,
+    convert_timedelta_to_integer_time,
+    get_integer_time_overlap_share,
+)
+
+
+def get_date_time_range_overlap_share(
+    numerator_date_range: datetimerange.DateTimeRange,
+    denominator_date_range: datetimerange.DateTimeRange,
+) -> float:
+    if denominator_date_range.is_intersection(numerator_date_range):
+        intersection = denominator_date_range.intersection(x=numerator_date_range)
+        return (
+            intersection.get_timedelta_second()
+            / denominator_date_range.get_timedelta_second()
+        )
+    return 0
+
+
+def test_integer_time_conversion_keeps_microseconds():
+    list_of_date_times = [
+        datetime.datetime(2022, 1, 2, 23, 34, 0, 123456),
+        datetime.datetime(1960, 5, 1, 0, 0, 0, 1),
+        datetime.datetime(1970, 1, 1),
+    ]
+    for date_time in list_of_date_times:
+        integer_time = convert_datetime_to_integer_time(date_time=date_time)
+        assert type(integer_time) is int
+        assert EPOCH + datetime.timedelta(microseconds=integer_time) == date_time
+        assert convert_integer_time_to_datetime(integer_time=integer_time) == date_time
+        assert (
+            convert_datetime_to_integer_time(date_time=pandas.Timestamp(date_time))
+            == integer_time
+        )
+    duration = datetime.timedelta(days=3, microseconds=7)
+    integer_duration = convert_timedelta_to_integer_time(duration=duration)
+    assert integer_duration == 3 * 24 * 3600 * 10**6 + 7
+
+
+def test_integer_time_overlap_share_matches_date_time_ranges():
+    random_generator = random.Random(3)
+    start_date = datetime.datetime(2023, 1, 1)
+    for _ in range(2000):
+        list_of_date_times = sorted(
+            start_date
+            + datetime.timedelta(
+                minutes=random_generator.randint(0, 20),
+                microseconds=random_generator.choice([0, 1, 333333]),
+            )
+            for _ in range(4)
+        )
+        random_generator.shuffle(list_of_date_times)
+        numerator_date_range = datetimerange.DateTimeRange(
+            *sorted(list_of_date_times[:2])
+        )
+        denominator_date_range = datetimerange.DateTimeRange(
+            *sorted(list_of_date_times[2:])
+        )
+        if denominator_date_range.timedelta == datetime.timedelta(0):
+            continue
+        integer_overlap_share = get_integer_time_overlap_share(
+            numerator_start_time=convert_datetime_to_integer_time(
+                date_time=numerator_date_range.start_datetime
+            ),
+            numerator_end_time=convert_datetime_to_integer_time(
+                date_time=numerator_date_range.end_datetime
+            ),
+            denominator_start_time=convert_datetime_to_integer_time(
+                date_time=denominator_date_range.start_datetime
+            ),
+            denominator_end_time=convert_datetime_to_integer_time(
+                date_time=denominator_date_range.end_datetime
+            ),
+        )
+        assert integer_overlap_share == get_date_time_range_overlap_share(
+            numerator_date_range=numerator_date_range,
+            denominator_date_range=denominator_date_range,
+        )
+
+
+def test_time_data_stores_the_process_state_switch_times_as_integer_times():
+    global_end_date = datetime.datetime(2022, 1, 2, 23, 34, 0, 123456)
+    time_data = TimeData(
+        global_start_date=datetime.datetime(2022, 1, 1), global_end_date=global_end_date
+    )
+    assert time_data.get_last_process_state_switch_time() == global_end_date
+    next_process_state_switch_time = global_end_date - datetime.timedelta(
+        minutes=3, microseconds=1
+    )
+    time_data.set_next_process_state_switch_time(
+        next_discrete_event_time=pandas.Timestamp(next_process_state_switch_time)
+    )
+    time_data.set_last_process_state_switch_time()
+    time_data.set_next_event_time_as_last_idle_time()
+    assert time_data.last_process_state_switch_integer_time == (
+        convert_datetime_to_integer_time(date_time=next_process_state_switch_time)
+    )
+    time_data_copy = time_data.create_self_copy()
+    assert (
+        time_data_copy.get_last_process_state_switch_time()
+        == time_data_copy.get_last_idle_date()
+        == time_data_copy.get_next_process_state_switch_time()
+        == next_process_state_switch_time
+    )
+    assert type(time_data_copy.get_last_idle_date()) is datetime.datetime
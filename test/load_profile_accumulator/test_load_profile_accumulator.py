@@ -0,0 +1,184 @@
+import datetime
+import math
+from test.test_tutorial.tutorial_enterprise import create_tutorial_enterprise
+
+import numpy
+import pytest
+
+from ethos_penalps.data_classes import LoadProfileEntry, LoadType
+from ethos_penalps.load_profile_accumulator import (
+    LoadProfileGridAccumulator,
+    LoadProfileObjectTypes,
+)
+from ethos_penalps.post_processing.load_profile_entry_post_processor import (
+    LoadProfileEntryPostProcessor,
+)
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+
+START_DATE = datetime.datetime(2022, 1, 2, hour=22)
+END_DATE = datetime.datetime(2022, 1, 3)
+
+
+def create_load_profile_entry(
+    load_type: LoadType,
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    energy_quantity: float,
+) -> LoadProfileEntry:
+    return LoadProfileEntry(
+        load_type=load_type,
+        start_time=start_time,
+        end_time=end_time,
+        energy_quantity=energy_quantity,
+        energy_unit="MJ",
+        average_power_consumption=energy_quantity
+        / (end_time - start_time).total_seconds(),
+        power_unit="MW",
+    )
+
+
+def test_energy_is_distributed_by_the_overlap_with_the_periods():
+    load_type = LoadType(name="Electricity")
+    load_profile_grid_accumulator = LoadProfileGridAccumulator(
+        start_date=START_DATE, end_date=END_DATE, resample_frequency="1h"
+    )
+    for start_time, end_time in (
+        # Spans the end of the first and the start of the second period
+        (
+            START_DATE + datetime.timedelta(minutes=30),
+            START_DATE + datetime.timedelta(minutes=90),
+        ),
+        # Starts before and ends after the grid
+        (
+            START_DATE - datetime.timedelta(hours=1),
+            END_DATE + datetime.timedelta(hours=1),
+        ),
+    ):
+        load_profile_grid_accumulator.add_load_profile_entry(
+            object_type=LoadProfileObjectTypes.stream,
+            object_name="Stream",
+            load_profile_entry=create_load_profile_entry(
+                load_type=load_type,
+                start_time=start_time,
+                end_time=end_time,
+                energy_quantity=60,
+            ),
+        )
+
+    energy_array = load_profile_grid_accumulator.get_energy_array(
+        object_type=LoadProfileObjectTypes.stream,
+        object_name="Stream",
+        load_type_uuid=load_type.uuid,
+    )
+    numpy.testing.assert_allclose(energy_array, [30 + 15, 30 + 15])
+    resampled_load_profile = (
+        load_profile_grid_accumulator.create_load_profile_meta_data_resampled(
+            object_type=LoadProfileObjectTypes.stream,
+            object_name="Stream",
+            load_type_uuid=load_type.uuid,
+        )
+    )
+    assert list(resampled_load_profile.data_frame["start_time"]) == [
+        START_DATE,
+        START_DATE + datetime.timedelta(hours=1),
+    ]
+    assert resampled_load_profile.total_energy == pytest.approx(90)
+    with pytest.raises(MisconfigurationError):
+        LoadProfileGridAccumulator(
+            start_date=START_DATE, end_date=START_DATE, resample_frequency="1h"
+        )
+
+
+def test_accumulated_profiles_match_the_resampled_entries():
+    enterprise = create_tutorial_enterprise(number_of_orders=3)
+    load_profile_grid_accumulator = enterprise.enable_load_profile_accumulation(
+        start_date=START_DATE, end_date=END_DATE, resample_frequency="5min"
+    )
+    enterprise.start_simulation()
+
+    load_profile_entry_post_processor = LoadProfileEntryPostProcessor()
+    load_profile_collection = enterprise.load_profile_handler.load_profile_collection
+    number_of_compared_profiles = 0
+    for (
+        process_step_name,
+        process_step_load_profile_collection,
+    ) in load_profile_collection.dict_process_step_load_profile_collections.items():
+        for (
+            load_type_uuid,
+            list_of_load_profile_entries,
+        ) in process_step_load_profile_collection.dict_of_load_entry_lists.items():
+            load_profile_meta_data = (
+                load_profile_entry_post_processor.create_load_profile_meta_data(
+                    list_of_load_profile_entries=list_of_load_profile_entries,
+                    start_date_time_series=START_DATE,
+                    end_date_time_series=END_DATE,
+                    object_name=process_step_name,
+                    object_type="Process Step",
+                )
+            )
+            resampled_load_profile = (
+                load_profile_entry_post_processor.resample_load_profile_meta_data(
+                    load_profile_meta_data=load_profile_meta_data,
+                    start_date=START_DATE,
+                    end_date=END_DATE,
+                    resample_frequency="5min",
+                )
+            )
+            numpy.testing.assert_allclose(
+                load_profile_grid_accumulator.get_energy_array(
+                    object_type=LoadProfileObjectTypes.process_step,
+                    object_name=process_step_name,
+                    load_type_uuid=load_type_uuid,
+                ),
+                resampled_load_profile.data_frame["energy_quantity"].to_numpy(),
+                atol=1e-9,
+            )
+            number_of_compared_profiles = number_of_compared_profiles + 1
+    assert number_of_compared_profiles > 0
+
+
+def test_load_profile_entries_are_optional():
+    enterprise = create_tutorial_enterprise(number_of_orders=3)
+    load_profile_grid_accumulator = enterprise.enable_load_profile_accumulation(
+        start_date=START_DATE, end_date=END_DATE, resample_frequency="5min"
+    )
+    enterprise.start_simulation()
+    enterprise_without_entries = create_tutorial_enterprise(number_of_orders=3)
+    accumulator_without_entries = (
+        enterprise_without_entries.enable_load_profile_accumulation(
+            start_date=START_DATE,
+            end_date=END_DATE,
+            resample_frequency="5min",
+            retain_load_profile_entries=False,
+        )
+    )
+    enterprise_without_entries.start_simulation()
+
+    load_profile_collection = (
+        enterprise_without_entries.load_profile_handler.load_profile_collection
+    )
+    assert load_profile_collection.dict_stream_load_profile_collections == {}
+    assert load_profile_collection.dict_process_step_load_profile_collections == {}
+    # The load types of both enterprises have different uuids
+    dict_of_total_energies = {}
+    for (
+        object_type,
+        object_name,
+        load_type_uuid,
+    ), energy_array in load_profile_grid_accumulator.dict_of_energy_arrays.items():
+        load_type = load_profile_grid_accumulator.dict_of_load_types[load_type_uuid]
+        dict_of_total_energies[(object_type, object_name, load_type.name)] = (
+            energy_array.sum()
+        )
+    assert len(dict_of_total_energies) > 0
+    for (
+        object_type,
+        object_name,
+        load_type_uuid,
+    ), energy_array in accumulator_without_entries.dict_of_energy_arrays.items():
+        load_type = accumulator_without_entries.dict_of_load_types[load_type_uuid]
+        assert math.isclose(
+            energy_array.sum(),
+            dict_of_total_energies.pop((object_type, object_name, load_type.name)),
+        )
+    assert dict_of_total_energies == {}
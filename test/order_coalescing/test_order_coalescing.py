@@ -0,0 +1,179 @@
+import datetime
+import warnings
+from test.test_tutorial.tutorial_enterprise import create_tutorial_enterprise
+
+import pandas
+import pytest
+
+from ethos_penalps.benchmark.benchmark_model_generator import (
+    BenchmarkModelGenerator,
+    BenchmarkModelParameters,
+    BenchmarkStreamTypes,
+)
+from ethos_penalps.data_classes import Commodity, ProductionOrder
+from ethos_penalps.order_coalescing import OrderCoalescingOptions, coalesce_orders
+from ethos_penalps.utilities.exceptions_and_warnings import (
+    MisconfigurationError,
+    UnexpectedBehaviorWarning,
+)
+from ethos_penalps.utilities.validation import MINIMUM_VALID_STORAGE_LEVEL
+
+test_commodity = Commodity(name="Test Commodity")
+start_date = datetime.datetime(2023, 1, 1)
+
+
+def create_order_data_frame(
+    list_of_minutes: list[int], list_of_production_targets: list[float]
+) -> pandas.DataFrame:
+    list_of_orders = []
+    for order_number, (minutes, production_target) in enumerate(
+        zip(list_of_minutes, list_of_production_targets)
+    ):
+        list_of_orders.append(
+            ProductionOrder(
+                production_target=production_target,
+                production_deadline=start_date + datetime.timedelta(minutes=minutes),
+                order_number=order_number,
+                commodity=test_commodity,
+            )
+        )
+    return pandas.DataFrame(data=list_of_orders)
+
+
+def test_coalescing_with_deadline_tolerance():
+    order_data_frame = create_order_data_frame(
+        list_of_minutes=[50, 0, 5, 10, 30, 41],
+        list_of_production_targets=[6.0, 1.0, 2.0, 3.0, 4.0, 5.0],
+    )
+    coalesced_data_frame, order_coalescing_report = coalesce_orders(
+        order_data_frame=order_data_frame,
+        order_coalescing_options=OrderCoalescingOptions(
+            deadline_tolerance=datetime.timedelta(minutes=10)
+        ),
+    )
+    assert coalesced_data_frame["production_target"].tolist() == [6.0, 4.0, 11.0]
+    assert coalesced_data_frame["production_deadline"].tolist() == [
+        pandas.Timestamp(start_date),
+        pandas.Timestamp(start_date + datetime.timedelta(minutes=30)),
+        pandas.Timestamp(start_date + datetime.timedelta(minutes=41)),
+    ]
+    assert coalesced_data_frame["global_unique_identifier"].is_unique
+    assert not set(coalesced_data_frame["global_unique_identifier"]) & set(
+        order_data_frame["global_unique_identifier"]
+    )
+    assert order_coalescing_report.number_of_orders == 6
+    assert order_coalescing_report.number_of_coalesced_orders == 3
+    assert order_coalescing_report.maximum_deadline_deviation == datetime.timedelta(
+        minutes=10
+    )
+    assert order_coalescing_report.shifted_mass == 11.0
+    # (2 * 5 + 3 * 10 + 6 * 9) / 21 minutes
+    mass_weighted_mean_deadline_deviation = (
+        order_coalescing_report.mass_weighted_mean_deadline_deviation
+    )
+    assert mass_weighted_mean_deadline_deviation.total_seconds() == pytest.approx(
+        94 / 21 * 60
+    )
+
+
+def test_coalescing_with_maximum_merged_mass():
+    order_data_frame = create_order_data_frame(
+        list_of_minutes=[0, 1, 2, 3, 4, 5],
+        list_of_production_targets=[1.0, 2.0, 8.0, 1.0, 1.0, 1.0],
+    )
+    coalesced_data_frame, order_coalescing_report = coalesce_orders(
+        order_data_frame=order_data_frame,
+        order_coalescing_options=OrderCoalescingOptions(maximum_merged_mass=4),
+    )
+    # The order which exceeds the maximum mass is not merged
+    assert coalesced_data_frame["production_target"].tolist() == [3.0, 8.0, 3.0]
+    assert order_coalescing_report.number_of_coalesced_orders == 3
+    assert order_coalescing_report.maximum_deadline_deviation == datetime.timedelta(
+        minutes=2
+    )
+
+
+def test_order_coalescing_options_misconfiguration():
+    with pytest.raises(MisconfigurationError):
+        OrderCoalescingOptions()
+    with pytest.raises(MisconfigurationError):
+        OrderCoalescingOptions(deadline_tolerance=datetime.timedelta(minutes=-1))
+    with pytest.raises(MisconfigurationError):
+        OrderCoalescingOptions(maximum_merged_mass=0)
+
+
+@pytest.mark.parametrize(
+    "stream_type", [BenchmarkStreamTypes.continuous, BenchmarkStreamTypes.batch]
+)
+def test_simulation_with_order_coalescing(stream_type: str):
+    benchmark_model_parameters = BenchmarkModelParameters(
+        number_of_orders=12,
+        stream_type=stream_type,
+        mass_per_order=1,
+        time_span_between_orders=datetime.timedelta(hours=1),
+    )
+    enterprise = BenchmarkModelGenerator(
+        benchmark_model_parameters=benchmark_model_parameters
+    ).create_enterprise()
+    enterprise.enable_order_coalescing(deadline_tolerance=datetime.timedelta(hours=3))
+    enterprise.start_simulation(number_of_iterations_in_chain=5000)
+
+    main_sink = enterprise.list_of_network_level[0].get_main_sink()
+    dict_of_order_coalescing_reports = enterprise.get_order_coalescing_reports()
+    order_coalescing_report = dict_of_order_coalescing_reports[main_sink.name]
+    assert order_coalescing_report.number_of_orders == 12
+    assert order_coalescing_report.number_of_coalesced_orders == 3
+    assert order_coalescing_report.maximum_deadline_deviation == datetime.timedelta(
+        hours=3
+    )
+    for splitted_order in main_sink.order_distributor.dict_of_splitted_order.values():
+        assert splitted_order.get_order_data_frame()["produced_mass"].sum() == (
+            pytest.approx(12)
+        )
+
+
+def test_coalescing_with_time_bucket_and_maximum_storage_level_increase():
+    order_data_frame = create_order_data_frame(
+        list_of_minutes=[0, 20, 50, 70, 80, 100],
+        list_of_production_targets=[1.0, 2.0, 3.0, 1.0, 1.0, 1.0],
+    )
+    coalesced_data_frame, order_coalescing_report = coalesce_orders(
+        order_data_frame=order_data_frame,
+        order_coalescing_options=OrderCoalescingOptions(
+            time_bucket=datetime.timedelta(hours=1)
+        ),
+    )
+    assert coalesced_data_frame["production_target"].tolist() == [6.0, 3.0]
+    # Only the mass of the orders after the first order of a merged
+    # order is delivered in advance
+    coalesced_data_frame, order_coalescing_report = coalesce_orders(
+        order_data_frame=order_data_frame,
+        order_coalescing_options=OrderCoalescingOptions(
+            maximum_storage_level_increase=3
+        ),
+    )
+    assert coalesced_data_frame["production_target"].tolist() == [3.0, 6.0]
+
+
+def test_simulation_with_storage_order_aggregation():
+    enterprise = create_tutorial_enterprise(number_of_orders=8)
+    enterprise.enable_storage_order_aggregation(time_bucket=datetime.timedelta(hours=1))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", category=UnexpectedBehaviorWarning)
+        enterprise.start_simulation(number_of_iterations_in_chain=20000)
+
+    process_chain_storage = enterprise.list_of_network_level[1].get_main_sink()
+    order_collection = process_chain_storage.sink.order_distributor.order_collection
+    order_coalescing_report = enterprise.get_storage_order_aggregation_reports()[
+        process_chain_storage.name
+    ]
+    assert order_coalescing_report.number_of_orders == 8
+    assert order_coalescing_report.number_of_coalesced_orders == 2
+    assert len(order_collection.order_data_frame) == 2
+    assert order_collection.target_mass == pytest.approx(8 * 0.00065, rel=0.1)
+    for list_of_storage_entries in enterprise.production_plan.storage_state_dict[
+        process_chain_storage.name
+    ].values():
+        for storage_entry in list_of_storage_entries:
+            assert storage_entry.storage_level_at_start >= MINIMUM_VALID_STORAGE_LEVEL
+            assert storage_entry.storage_level_at_end >= MINIMUM_VALID_STORAGE_LEVEL
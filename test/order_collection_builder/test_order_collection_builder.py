@@ -0,0 +1,176 @@
+import datetime
+
+import numpy
+import pandas
+import pytest
+
+from ethos_penalps.data_classes import Commodity, OrderCollection, ProductionOrder
+from ethos_penalps.order_collection_builder import OrderCollectionBuilder
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+
+test_commodity = Commodity(name="Test Commodity")
+
+
+def test_order_data_frame_matches_data_frame_of_production_orders():
+    production_targets = [1.5, 2.0, 0.25]
+    production_deadlines = [
+        datetime.datetime(2023, 1, 3),
+        datetime.datetime(2023, 1, 2, 12, 30),
+        datetime.datetime(2023, 1, 1),
+    ]
+    order_data_frame = OrderCollectionBuilder(
+        commodity=test_commodity
+    ).create_order_data_frame(
+        production_targets=production_targets,
+        production_deadlines=production_deadlines,
+    )
+    expected_data_frame = pandas.DataFrame(
+        data=[
+            ProductionOrder(
+                production_target=production_target,
+                production_deadline=production_deadline,
+                order_number=order_number,
+                commodity=test_commodity,
+            )
+            for order_number, (production_target, production_deadline) in enumerate(
+                zip(production_targets, production_deadlines)
+            )
+        ]
+    )
+    assert order_data_frame["global_unique_identifier"].is_unique
+    pandas.testing.assert_frame_equal(
+        order_data_frame.drop(columns="global_unique_identifier"),
+        expected_data_frame.drop(columns="global_unique_identifier"),
+    )
+
+
+def test_order_collection_from_shift_calendar():
+    order_collection = OrderCollectionBuilder(
+        commodity=test_commodity
+    ).create_order_collection_from_shift_calendar(
+        start_date=datetime.date(2023, 1, 2),
+        end_date=datetime.date(2023, 1, 8),
+        mass_per_shift=3,
+        shift_length=datetime.timedelta(hours=8),
+        number_of_shifts_per_day=2,
+        first_shift_start_time=datetime.time(hour=6),
+        weekend_work=False,
+        list_of_holidays=[datetime.date(2023, 1, 4)],
+    )
+    order_data_frame = order_collection.order_data_frame
+    # Monday to Friday without the holiday on Wednesday
+    assert len(order_data_frame) == 8
+    assert order_collection.target_mass == 24
+    assert order_data_frame["production_deadline"].iloc[:4].tolist() == [
+        pandas.Timestamp(2023, 1, 2, 14),
+        pandas.Timestamp(2023, 1, 2, 22),
+        pandas.Timestamp(2023, 1, 3, 14),
+        pandas.Timestamp(2023, 1, 3, 22),
+    ]
+    assert pandas.Timestamp(2023, 1, 4, 14) not in set(
+        order_data_frame["production_deadline"]
+    )
+    with pytest.raises(MisconfigurationError):
+        OrderCollectionBuilder(
+            commodity=test_commodity
+        ).create_order_collection_from_shift_calendar(
+            start_date=datetime.date(2023, 1, 7),
+            end_date=datetime.date(2023, 1, 8),
+            mass_per_shift=3,
+            shift_length=datetime.timedelta(hours=8),
+            number_of_shifts_per_day=1,
+            first_shift_start_time=datetime.time(hour=6),
+            weekend_work=False,
+        )
+
+
+def test_order_collection_from_deadline_series():
+    deadline_series = pandas.Series(
+        data=[1.0, 0.0, 2.5],
+        index=pandas.date_range(start="2023-01-01", periods=3, freq="1h"),
+    )
+    order_collection = OrderCollectionBuilder(
+        commodity=test_commodity
+    ).create_order_collection_from_deadline_series(deadline_series=deadline_series)
+    assert order_collection.order_data_frame["production_target"].tolist() == [
+        1.0,
+        2.5,
+    ]
+    assert order_collection.target_mass == 3.5
+
+
+def create_file_data_frame(number_of_orders: int) -> pandas.DataFrame:
+    return pandas.DataFrame(
+        data={
+            "production_deadline": pandas.date_range(
+                start="2023-01-01", periods=number_of_orders, freq="15min"
+            ),
+            "production_target": numpy.linspace(1, 2, number_of_orders),
+            "customer": ["Customer"] * number_of_orders,
+        }
+    )
+
+
+def test_read_order_collection_from_csv_in_chunks(tmp_path):
+    file_data_frame = create_file_data_frame(number_of_orders=250)
+    file_path = tmp_path / "orders.csv"
+    file_data_frame.to_csv(file_path, index=False)
+    order_collection = OrderCollectionBuilder(
+        commodity=test_commodity
+    ).read_order_collection_from_csv(file_path=str(file_path), chunk_size=100)
+    order_data_frame = order_collection.order_data_frame
+    assert len(order_data_frame) == 250
+    assert order_data_frame["order_number"].tolist() == list(range(250))
+    numpy.testing.assert_allclose(
+        order_data_frame["production_target"], file_data_frame["production_target"]
+    )
+    assert (
+        order_data_frame["production_deadline"]
+        == file_data_frame["production_deadline"]
+    ).all()
+    assert order_collection.target_mass == pytest.approx(375)
+
+
+def test_read_order_collection_from_parquet_in_chunks(tmp_path):
+    pytest.importorskip("pyarrow")
+    file_data_frame = create_file_data_frame(number_of_orders=250)
+    file_path = tmp_path / "orders.parquet"
+    file_data_frame.to_parquet(file_path, index=False)
+    order_collection = OrderCollectionBuilder(
+        commodity=test_commodity
+    ).read_order_collection_from_parquet(file_path=str(file_path), chunk_size=100)
+    order_data_frame = order_collection.order_data_frame
+    assert len(order_data_frame) == 250
+    assert (
+        order_data_frame["production_target"] == file_data_frame["production_target"]
+    ).all()
+    assert (
+        order_data_frame["production_deadline"]
+        == file_data_frame["production_deadline"]
+    ).all()
+
+
+def test_append_list_of_order_collections():
+    order_collection_builder = OrderCollectionBuilder(commodity=test_commodity)
+    order_collection = OrderCollection(target_mass=0, commodity=test_commodity)
+    order_collection.append_list_of_order_collections(
+        list_of_order_collections=[
+            order_collection_builder.create_order_collection(
+                production_targets=[1.0, 2.0],
+                production_deadlines=[
+                    datetime.datetime(2023, 1, 1),
+                    datetime.datetime(2023, 1, 2),
+                ],
+            ),
+            order_collection_builder.create_order_collection(
+                production_targets=[3.0],
+                production_deadlines=[datetime.datetime(2023, 1, 3)],
+            ),
+        ]
+    )
+    assert order_collection.target_mass == 6.0
+    assert order_collection.order_data_frame["production_target"].tolist() == [
+        1.0,
+        2.0,
+        3.0,
+    ]
@@ -0,0 +1,287 @@
+import datetime
+import math
+import numbers
+
+import numpy
+import pandas
+import pytest
+
+from ethos_penalps.data_classes import Commodity, ProductionOrder
+from ethos_penalps.order_aggregation import (
+    _convert_hours_to_integer_nanoseconds,
+    aggregate_orders_for_batch_streams,
+    aggregate_orders_for_continuous_streams,
+)
+
+test_commodity = Commodity(name="Test Commodity")
+
+
+def aggregate_orders_for_continuous_streams_row_by_row(
+    order_data_frame: pandas.DataFrame,
+    total_operation_rate_of_streams: numbers.Number,
+) -> pandas.DataFrame:
+    """Previous implementation of OrderDistributor.aggregate_order_continuos_streams
+    which is used as reference.
+    """
+    intermediate_data_frame = order_data_frame.copy()
+    intermediate_data_frame.sort_values(
+        by="production_deadline", ascending=False, inplace=True
+    )
+    intermediate_data_frame.reset_index(inplace=True, drop=True)
+    series_of_operation_rate_multiplier = (
+        intermediate_data_frame.loc[:, "production_target"]
+        / total_operation_rate_of_streams
+    )
+    duration_list = []
+    for multiplier in series_of_operation_rate_multiplier:
+        duration_list.append(multiplier * datetime.timedelta(hours=1))
+    intermediate_data_frame.loc[:, "duration_list"] = duration_list
+    intermediate_data_frame.loc[:, "start_time"] = (
+        intermediate_data_frame.loc[:, "production_deadline"]
+        - intermediate_data_frame.loc[:, "duration_list"]
+    )
+    previous_deadline = None
+    previous_start_time = None
+    aggregated_production_target = 0
+    output_order_list = []
+    current_order_number = 1
+    first_deadline_has_been_set = False
+    second_deadline_has_been_set = False
+    deadline_accumulated_order = None
+    start_time_agglomerated_order = None
+    for index, current_row in intermediate_data_frame.iterrows():
+        current_deadline = current_row["production_deadline"]
+        current_start_time = current_row["start_time"]
+        current_duration = current_row["duration_list"]
+        if (
+            first_deadline_has_been_set is False
+            and second_deadline_has_been_set is False
+        ):
+            deadline_accumulated_order = current_deadline
+            first_deadline_has_been_set = True
+        if (
+            first_deadline_has_been_set is True
+            and second_deadline_has_been_set is False
+        ):
+            deadline_accumulated_order = current_deadline
+            second_deadline_has_been_set = True
+        if start_time_agglomerated_order is None:
+            start_time_agglomerated_order = current_start_time
+        else:
+            start_time_agglomerated_order = (
+                start_time_agglomerated_order - current_duration
+            )
+        aggregated_production_target = (
+            aggregated_production_target + current_row["production_target"]
+        )
+        if previous_deadline is not None and previous_start_time is not None:
+            if current_deadline <= start_time_agglomerated_order:
+                production_order = ProductionOrder(
+                    production_target=aggregated_production_target,
+                    production_deadline=deadline_accumulated_order,
+                    order_number=current_order_number,
+                    commodity=current_row["commodity"],
+                )
+                output_order_list.append(production_order)
+                current_order_number = current_order_number + 1
+                aggregated_production_target = 0
+                deadline_accumulated_order = None
+                start_time_agglomerated_order = None
+                first_deadline_has_been_set = False
+                second_deadline_has_been_set = False
+        previous_deadline = current_row["production_deadline"]
+        previous_start_time = current_row["start_time"]
+    if aggregated_production_target < 0 or isinstance(
+        deadline_accumulated_order, datetime.datetime
+    ):
+        production_order = ProductionOrder(
+            production_target=aggregated_production_target,
+            production_deadline=deadline_accumulated_order,
+            order_number=current_order_number,
+            commodity=current_row["commodity"],
+        )
+        output_order_list.append(production_order)
+    return pandas.DataFrame(data=output_order_list)
+
+
+def aggregate_orders_for_batch_streams_row_by_row(
+    input_order_data_frame: pandas.DataFrame,
+    order_target_mass: numbers.Number,
+    commodity: Commodity,
+) -> pandas.DataFrame:
+    """Previous implementation of OrderDistributor.aggregate_order_batch_streams
+    which is used as reference.
+    """
+    input_order_data_frame = input_order_data_frame.copy()
+    input_order_data_frame.sort_values(
+        by="production_deadline", ascending=False, inplace=True
+    )
+    input_order_data_frame.reset_index(inplace=True, drop=True)
+    total_sum = input_order_data_frame.loc[:, "production_target"].sum()
+    number_of_output_order = math.ceil(total_sum / order_target_mass)
+    input_order_data_frame.loc[:, "Cumulative Target Upper Bound"] = (
+        input_order_data_frame.loc[:, "production_target"].cumsum()
+    )
+    list_of_aggregated_production_order = []
+    for current_output_order_number in range(1, number_of_output_order + 1):
+        lower_bound_required_cumulative_mass = numpy.float64(order_target_mass) * (
+            numpy.float64(current_output_order_number) - numpy.float64(1)
+        )
+        upper_bound_required_cumulative_mass = numpy.float64(
+            order_target_mass
+        ) * numpy.float64(current_output_order_number)
+        selection_upper_index = input_order_data_frame.loc[
+            input_order_data_frame.loc[:, "Cumulative Target Upper Bound"]
+            <= upper_bound_required_cumulative_mass
+        ]
+        if selection_upper_index.empty is True:
+            upper_index = input_order_data_frame.index[-1]
+        else:
+            upper_index = selection_upper_index.index[-1]
+        cumulative_mass_at_upper_index = input_order_data_frame.at[
+            upper_index, "Cumulative Target Upper Bound"
+        ]
+        if (
+            cumulative_mass_at_upper_index < upper_bound_required_cumulative_mass
+            and not math.isclose(
+                cumulative_mass_at_upper_index, upper_bound_required_cumulative_mass
+            )
+        ):
+            if upper_index < input_order_data_frame.shape[0] - 1:
+                upper_index = upper_index + 1
+        updated_cumulative_mass_at_upper_index = input_order_data_frame.at[
+            upper_index, "Cumulative Target Upper Bound"
+        ]
+        available_mass_in_order_range = (
+            updated_cumulative_mass_at_upper_index
+            - lower_bound_required_cumulative_mass
+        )
+        if available_mass_in_order_range < order_target_mass and not math.isclose(
+            available_mass_in_order_range, order_target_mass
+        ):
+            production_target = available_mass_in_order_range
+        else:
+            production_target = order_target_mass
+        deadline = input_order_data_frame.loc[upper_index, "production_deadline"]
+        if production_target == 0 or not isinstance(deadline, datetime.datetime):
+            raise Exception("asd")
+        production_order = ProductionOrder(
+            production_target=production_target,
+            production_deadline=deadline,
+            commodity=commodity,
+            order_number=current_output_order_number,
+        )
+        list_of_aggregated_production_order.append(production_order)
+    return pandas.DataFrame(data=list_of_aggregated_production_order)
+
+
+def create_random_order_data_frame(
+    random_generator: numpy.random.Generator,
+    number_of_orders: int,
+    use_integer_targets: bool = False,
+) -> pandas.DataFrame:
+    """Creates orders with random targets and deadlines. The deadlines are
+    drawn from a small range, so that some orders share their deadline.
+    """
+    start_date = datetime.datetime(2023, 1, 1)
+    list_of_orders = []
+    for _ in range(number_of_orders):
+        if use_integer_targets:
+            production_target = int(random_generator.integers(1, 20))
+        else:
+            production_target = float(random_generator.uniform(0.01, 20))
+        list_of_orders.append(
+            ProductionOrder(
+                production_target=production_target,
+                production_deadline=start_date
+                + datetime.timedelta(
+                    minutes=int(random_generator.integers(0, 10 * number_of_orders)),
+                    microseconds=int(random_generator.integers(0, 3)) * 500_000,
+                ),
+                order_number=0,
+                commodity=test_commodity,
+            )
+        )
+    return pandas.DataFrame(data=list_of_orders)
+
+
+def check_if_aggregated_orders_are_equal(
+    aggregated_data_frame: pandas.DataFrame, reference_data_frame: pandas.DataFrame
+):
+    """The global unique identifiers differ because they are new for each order."""
+    assert list(aggregated_data_frame.columns) == list(reference_data_frame.columns)
+    if reference_data_frame.empty:
+        return
+    pandas.testing.assert_frame_equal(
+        aggregated_data_frame.drop(columns="global_unique_identifier"),
+        reference_data_frame.drop(columns="global_unique_identifier"),
+        check_exact=True,
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_continuous_aggregation_matches_row_by_row_aggregation(seed: int):
+    random_generator = numpy.random.default_rng(seed=seed)
+    order_data_frame = create_random_order_data_frame(
+        random_generator=random_generator,
+        number_of_orders=int(random_generator.integers(1, 150)),
+        use_integer_targets=seed % 4 == 0,
+    )
+    total_operation_rate_of_streams = float(random_generator.uniform(1, 200))
+    check_if_aggregated_orders_are_equal(
+        aggregated_data_frame=aggregate_orders_for_continuous_streams(
+            order_data_frame=order_data_frame,
+            total_operation_rate_of_streams=total_operation_rate_of_streams,
+        ),
+        reference_data_frame=aggregate_orders_for_continuous_streams_row_by_row(
+            order_data_frame=order_data_frame,
+            total_operation_rate_of_streams=total_operation_rate_of_streams,
+        ),
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_batch_aggregation_matches_row_by_row_aggregation(seed: int):
+    random_generator = numpy.random.default_rng(seed=seed)
+    order_data_frame = create_random_order_data_frame(
+        random_generator=random_generator,
+        number_of_orders=int(random_generator.integers(1, 150)),
+        use_integer_targets=seed % 4 == 0,
+    )
+    if seed % 4 == 0:
+        order_target_mass = int(random_generator.integers(1, 30))
+    else:
+        order_target_mass = float(random_generator.uniform(0.1, 30))
+    check_if_aggregated_orders_are_equal(
+        aggregated_data_frame=aggregate_orders_for_batch_streams(
+            order_data_frame=order_data_frame,
+            order_target_mass=order_target_mass,
+            commodity=test_commodity,
+        ),
+        reference_data_frame=aggregate_orders_for_batch_streams_row_by_row(
+            input_order_data_frame=order_data_frame,
+            order_target_mass=order_target_mass,
+            commodity=test_commodity,
+        ),
+    )
+
+
+def test_duration_conversion_matches_timedelta_multiplication():
+    random_generator = numpy.random.default_rng(seed=0)
+    # Contains exact half microseconds and values close to them
+    hours = numpy.concatenate(
+        [
+            random_generator.uniform(0, 1000, size=10000),
+            (numpy.arange(1000) + 0.5) / 3_600_000_000,
+            numpy.nextafter((numpy.arange(1000) + 0.5) / 3_600_000_000, 1),
+        ]
+    )
+    expected_durations = [
+        (float(value) * datetime.timedelta(hours=1))
+        // datetime.timedelta(microseconds=1)
+        * 1000
+        for value in hours
+    ]
+    assert _convert_hours_to_integer_nanoseconds(hours=hours).tolist() == (
+        expected_durations
+    )
@@ -0,0 +1,60 @@
+import datetime
+
+import pandas
+
+from ethos_penalps.data_classes import Commodity, ProductionOrder
+from ethos_penalps.order_book import OrderBook
+
+
+def create_order_data_frame(number_of_orders: int) -> pandas.DataFrame:
+    commodity = Commodity(name="Product")
+    return pandas.DataFrame(
+        [
+            ProductionOrder(
+                production_target=10 + order_number,
+                production_deadline=datetime.datetime(2023, 1, 1)
+                + datetime.timedelta(hours=order_number),
+                order_number=order_number,
+                commodity=commodity,
+            )
+            for order_number in range(number_of_orders)
+        ]
+    )
+
+
+def test_orders_match_the_rows_of_the_data_frame():
+    order_data_frame = create_order_data_frame(number_of_orders=5)
+    order_book = OrderBook(order_data_frame=order_data_frame)
+
+    assert len(order_book) == 5
+    for order_number in range(5):
+        order_data_frame_row = order_data_frame.iloc[order_number]
+        production_order = order_book.get_order(order_number=order_number)
+        assert production_order == ProductionOrder(
+            production_target=order_data_frame_row.loc["production_target"],
+            production_deadline=order_data_frame_row.loc["production_deadline"],
+            order_number=order_data_frame_row.loc["order_number"],
+            commodity=order_data_frame_row.loc["commodity"],
+            global_unique_identifier=order_data_frame_row.loc[
+                "global_unique_identifier"
+            ],
+            produced_mass=order_data_frame_row.loc["produced_mass"],
+        )
+        assert type(production_order.production_deadline) is pandas.Timestamp
+
+
+def test_produced_mass_is_updated_in_place():
+    order_book = OrderBook(order_data_frame=create_order_data_frame(number_of_orders=3))
+    order_book.add_produced_mass(order_number=1, produced_mass=2.5)
+    order_book.add_produced_mass(order_number=1, produced_mass=4)
+    copied_order_book = order_book.copy()
+    copied_order_book.add_produced_mass(order_number=0, produced_mass=1)
+
+    assert order_book.get_order(order_number=1).produced_mass == 6.5
+    assert order_book.get_total_produced_mass() == 6.5
+    assert copied_order_book.get_total_produced_mass() == 7.5
+    order_data_frame = order_book.to_data_frame()
+    assert order_data_frame["produced_mass"].tolist() == [0, 6.5, 0]
+    # The data frame is a copy that does not change the book
+    order_data_frame.loc[0, "produced_mass"] = 100
+    assert order_book.get_order(order_number=0).produced_mass == 0
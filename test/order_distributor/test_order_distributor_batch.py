@@ -86,9 +86,9 @@ def test_batch_order_distribution():
     list_of_meta_data.append(total_order_collection_meta_data)
     for splitted_order in order_distributor.dict_of_splitted_order.values():
         print(splitted_order)
-        splitted_total_mass = splitted_order.order_data_frame.loc[
-            :, "production_target"
-        ].sum()
+        splitted_total_mass = (
+            splitted_order.get_order_data_frame().loc[:, "production_target"].sum()
+        )
         print("splitted total mass", splitted_total_mass)
         order_meta_data = post_process_order_collection(order_collection=splitted_order)
         list_of_meta_data.append(order_meta_data)
@@ -251,9 +251,9 @@ def test_batch_order_distribution_from_sample_data():
     list_of_meta_data.append(total_order_collection_meta_data)
     for splitted_order in order_distributor.dict_of_splitted_order.values():
         print(splitted_order)
-        splitted_total_mass = splitted_order.order_data_frame.loc[
-            :, "production_target"
-        ].sum()
+        splitted_total_mass = (
+            splitted_order.get_order_data_frame().loc[:, "production_target"].sum()
+        )
         print("splitted total mass", splitted_total_mass)
         order_meta_data = post_process_order_collection(order_collection=splitted_order)
         list_of_meta_data.append(order_meta_data)
@@ -0,0 +1,153 @@
+import datetime
+import os
+from test.parallel_simulation.packaging_line_enterprise import (
+    create_packaging_line_enterprise,
+)
+from test.parallel_simulation.simulation_result_comparison import (
+    assert_equal_simulation_results,
+)
+
+import pytest
+
+from ethos_penalps.data_classes import Commodity, OrderCollection
+from ethos_penalps.order_generator import NOrderGenerator
+from ethos_penalps.organizational_agents.enterprise import Enterprise
+from ethos_penalps.organizational_agents.order_update_simulation import (
+    OrderUpdateSimulator,
+    set_orders_of_main_sink,
+)
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+
+LATEST_DEADLINE = datetime.datetime(year=2023, month=1, day=1)
+
+
+def create_order_collection(
+    number_of_orders: int, production_deadline: datetime.datetime
+) -> OrderCollection:
+    order_generator = NOrderGenerator(
+        commodity=Commodity(name="Packaged Toffee"),
+        mass_per_order=0.39 * 2 * 24 * 1,
+        production_deadline=production_deadline,
+        number_of_orders=number_of_orders,
+        time_span_between_order=datetime.timedelta(days=3),
+    )
+    return order_generator.create_n_order_collection()
+
+
+def create_updated_order_collection() -> OrderCollection:
+    """Adds an order with an earlier deadline. The orders with the latest
+    deadlines are unchanged.
+    """
+    order_collection = create_order_collection(
+        number_of_orders=3, production_deadline=LATEST_DEADLINE
+    )
+    order_collection.append_order_collection(
+        create_order_collection(
+            number_of_orders=1,
+            production_deadline=LATEST_DEADLINE - datetime.timedelta(days=12),
+        )
+    )
+    return order_collection
+
+
+def create_enterprise(order_collection: OrderCollection) -> Enterprise:
+    enterprise = create_packaging_line_enterprise(number_of_lines=1)
+    set_orders_of_main_sink(enterprise=enterprise, order_collection=order_collection)
+    return enterprise
+
+
+def test_simulation_of_updated_orders(tmp_path):
+    order_update_simulator = OrderUpdateSimulator(snapshot_directory=str(tmp_path))
+    order_update_simulation_result = order_update_simulator.simulate(
+        enterprise=create_enterprise(
+            order_collection=create_order_collection(
+                number_of_orders=3, production_deadline=LATEST_DEADLINE
+            )
+        )
+    )
+    assert order_update_simulation_result.simulation_difference is None
+    previous_enterprise = order_update_simulation_result.enterprise
+
+    # The state is loaded from the snapshot directory
+    order_update_simulator = OrderUpdateSimulator(snapshot_directory=str(tmp_path))
+    order_update_simulation_result = order_update_simulator.simulate_order_update(
+        order_collection=create_updated_order_collection()
+    )
+    reference_enterprise = create_enterprise(
+        order_collection=create_updated_order_collection()
+    )
+    reference_enterprise.start_simulation()
+    assert_equal_simulation_results(
+        enterprise_1=reference_enterprise,
+        enterprise_2=order_update_simulation_result.enterprise,
+    )
+    simulation_difference = order_update_simulation_result.simulation_difference
+    assert simulation_difference.number_of_reused_orders == 1
+    assert simulation_difference.number_of_simulated_orders == 1
+    assert simulation_difference.list_of_changed_object_names
+    # The production for the order with the latest deadline is unchanged
+    previous_stream_entries = previous_enterprise.production_plan.stream_state_dict[
+        "Packaging Machine 1_Packaged Toffee Sink_Packaged Toffee"
+    ]
+    assert simulation_difference.end_time <= previous_stream_entries[0].start_time
+    assert simulation_difference.start_time < simulation_difference.end_time
+
+    # Repeating the update reproduces the result without differences
+    order_update_simulation_result = order_update_simulator.simulate_order_update(
+        order_collection=create_updated_order_collection()
+    )
+    simulation_difference = order_update_simulation_result.simulation_difference
+    assert simulation_difference.list_of_changed_object_names == []
+    assert simulation_difference.start_time is None
+    assert_equal_simulation_results(
+        enterprise_1=reference_enterprise,
+        enterprise_2=order_update_simulation_result.enterprise,
+    )
+
+
+def test_order_update_requires_previous_simulation(tmp_path):
+    order_update_simulator = OrderUpdateSimulator(snapshot_directory=str(tmp_path))
+    with pytest.raises(MisconfigurationError):
+        order_update_simulator.simulate_order_update(
+            order_collection=create_updated_order_collection()
+        )
+
+
+def test_appended_latest_orders_are_simulated_completely(tmp_path):
+    order_update_simulator = OrderUpdateSimulator(snapshot_directory=str(tmp_path))
+    order_update_simulator.simulate(
+        enterprise=create_enterprise(
+            order_collection=create_order_collection(
+                number_of_orders=2,
+                production_deadline=LATEST_DEADLINE - datetime.timedelta(days=3),
+            )
+        )
+    )
+
+    # The new order has the latest deadline and is simulated first
+    order_update_simulation_result = order_update_simulator.simulate_order_update(
+        order_collection=create_order_collection(
+            number_of_orders=3, production_deadline=LATEST_DEADLINE
+        )
+    )
+    reference_enterprise = create_enterprise(
+        order_collection=create_order_collection(
+            number_of_orders=3, production_deadline=LATEST_DEADLINE
+        )
+    )
+    reference_enterprise.start_simulation()
+    assert_equal_simulation_results(
+        enterprise_1=reference_enterprise,
+        enterprise_2=order_update_simulation_result.enterprise,
+    )
+    simulation_difference = order_update_simulation_result.simulation_difference
+    assert simulation_difference.number_of_reused_orders == 0
+    assert simulation_difference.list_of_changed_object_names
+    # All snapshots are appended to a single file
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        [
+            OrderUpdateSimulator.base_enterprise_file_name,
+            OrderUpdateSimulator.snapshot_file_name,
+            OrderUpdateSimulator.state_file_name,
+        ]
+    )
@@ -0,0 +1,212 @@
+import datetime
+
+from ethos_penalps.data_classes import Commodity, LoadType
+from ethos_penalps.order_generator import NOrderGenerator
+from ethos_penalps.organizational_agents.enterprise import Enterprise
+from ethos_penalps.organizational_agents.process_chain import ProcessChain
+from ethos_penalps.process_nodes.sink import Sink
+from ethos_penalps.process_nodes.source import Source
+from ethos_penalps.stream import BatchStreamStaticData, ContinuousStreamStaticData
+from ethos_penalps.time_data import TimeData
+
+
+def fill_packaging_line(
+    process_chain: ProcessChain,
+    sink: Sink,
+    source: Source,
+    line_number: int,
+    cut_toffee_commodity: Commodity,
+    electricity_load: LoadType,
+) -> ProcessChain:
+    """Fills a process chain with a cutting and packaging line. All lines
+    that are created by this function are structurally identical and only
+    differ in the names of their nodes and streams.
+
+    Args:
+        process_chain (ProcessChain): The empty process chain of the line.
+        sink (Sink): Sink that receives the packaged toffee.
+        source (Source): Source that provides the cooled toffee.
+        line_number (int): Number that is appended to all names of the line.
+        cut_toffee_commodity (Commodity): Intermediate commodity of the line.
+        electricity_load (LoadType): Load type of the conveyor belt.
+
+    Returns:
+        ProcessChain: The filled process chain.
+    """
+    process_chain.add_sink(sink=sink)
+    process_chain.add_source(source=source)
+
+    cutting_machine = process_chain.create_process_step(
+        name="Cutting Machine " + str(line_number)
+    )
+    packaging_machine = process_chain.create_process_step(
+        name="Packaging Machine " + str(line_number)
+    )
+
+    # Cutting machine
+    cutting_state = cutting_machine.process_state_handler.create_state_for_parallel_input_and_output_stream_with_storage(
+        process_state_name="Continuous Cutting"
+    )
+    idle_state = cutting_machine.process_state_handler.create_idle_process_state(
+        process_state_name="Idle State"
+    )
+    activate_cutting = cutting_machine.process_state_handler.process_state_switch_selector_handler.process_state_switch_handler.create_process_state_switch_at_next_discrete_event(
+        start_process_state=cutting_state,
+        end_process_state=idle_state,
+    )
+    cutting_machine.process_state_handler.process_state_switch_selector_handler.create_single_choice_selector(
+        process_state_switch=activate_cutting
+    )
+    deactivate_cutting = cutting_machine.process_state_handler.process_state_switch_selector_handler.process_state_switch_handler.create_process_state_switch_at_input_stream(
+        start_process_state=idle_state,
+        end_process_state=cutting_state,
+    )
+    cutting_machine.process_state_handler.process_state_switch_selector_handler.create_single_choice_selector(
+        process_state_switch=deactivate_cutting
+    )
+
+    # Packaging machine
+    packing_state = packaging_machine.process_state_handler.create_state_for_parallel_input_and_output_stream_with_storage(
+        process_state_name="Packaging"
+    )
+    idle_state_packing = (
+        packaging_machine.process_state_handler.create_idle_process_state(
+            process_state_name="Idle"
+        )
+    )
+    activate_packaging = packaging_machine.process_state_handler.process_state_switch_selector_handler.process_state_switch_handler.create_process_state_switch_at_next_discrete_event(
+        start_process_state=packing_state,
+        end_process_state=idle_state_packing,
+    )
+    packaging_machine.process_state_handler.process_state_switch_selector_handler.create_single_choice_selector(
+        process_state_switch=activate_packaging
+    )
+    deactivate_packaging = packaging_machine.process_state_handler.process_state_switch_selector_handler.process_state_switch_handler.create_process_state_switch_at_input_stream(
+        start_process_state=idle_state_packing,
+        end_process_state=packing_state,
+    )
+    packaging_machine.process_state_handler.process_state_switch_selector_handler.create_single_choice_selector(
+        process_state_switch=deactivate_packaging
+    )
+
+    # Streams
+    source_to_cutter = process_chain.stream_handler.create_batch_stream(
+        batch_stream_static_data=BatchStreamStaticData(
+            start_process_step_name=source.name,
+            end_process_step_name=cutting_machine.name,
+            delay=datetime.timedelta(minutes=0.5),
+            commodity=source.commodity,
+            maximum_batch_mass_value=0.13,
+            name_to_display="Input Stream Cutter " + str(line_number),
+        )
+    )
+    cutter_to_packaging = process_chain.stream_handler.create_continuous_stream(
+        continuous_stream_static_data=ContinuousStreamStaticData(
+            start_process_step_name=cutting_machine.name,
+            end_process_step_name=packaging_machine.name,
+            commodity=cut_toffee_commodity,
+            maximum_operation_rate=0.78,
+            name_to_display="Output Stream Cutter " + str(line_number),
+        )
+    )
+    packaging_to_sink = process_chain.stream_handler.create_continuous_stream(
+        continuous_stream_static_data=ContinuousStreamStaticData(
+            start_process_step_name=packaging_machine.name,
+            end_process_step_name=sink.name,
+            commodity=sink.commodity,
+            maximum_operation_rate=0.78,
+            name_to_display="Output Stream Packaging " + str(line_number),
+        )
+    )
+    cutter_to_packaging.create_stream_energy_data(
+        specific_energy_demand=13.846,
+        load_type=electricity_load,
+        energy_unit="MJ",
+        mass_unit="metric_ton",
+    )
+
+    # Mass balances and storages
+    cutting_machine.create_main_mass_balance(
+        commodity=cut_toffee_commodity,
+        input_to_output_conversion_factor=1,
+        main_input_stream=source_to_cutter,
+        main_output_stream=cutter_to_packaging,
+    )
+    cutting_machine.process_state_handler.process_step_data.main_mass_balance.create_storage(
+        current_storage_level=0
+    )
+    packaging_machine.create_main_mass_balance(
+        commodity=sink.commodity,
+        input_to_output_conversion_factor=1,
+        main_input_stream=cutter_to_packaging,
+        main_output_stream=packaging_to_sink,
+    )
+    packaging_machine.process_state_handler.process_step_data.main_mass_balance.create_storage(
+        current_storage_level=0
+    )
+
+    source.add_output_stream(
+        output_stream=source_to_cutter,
+        process_chain_identifier=process_chain.process_chain_identifier,
+    )
+    sink.add_input_stream(
+        input_stream=packaging_to_sink,
+        process_chain_identifier=process_chain.process_chain_identifier,
+    )
+    return process_chain
+
+
+def create_packaging_line_enterprise(
+    number_of_lines: int = 3, number_of_orders: int = 1
+) -> Enterprise:
+    """Creates a model with a single NetworkLevel that consists of
+    identical packaging lines. All lines feed the sink by a continuous
+    stream so that each line receives the same orders.
+
+    Args:
+        number_of_lines (int, optional): Number of identical lines. Defaults to 3.
+        number_of_orders (int, optional): Number of orders in the sink. Defaults to 1.
+
+    Returns:
+        Enterprise: The packaging line model.
+    """
+    time_data = TimeData(
+        global_end_date=datetime.datetime(year=2023, month=1, day=1),
+        global_start_date=datetime.datetime(year=2022, month=1, day=1),
+    )
+    enterprise = Enterprise(location="Example Location", time_data=time_data)
+    packaging_level = enterprise.create_network_level()
+
+    cooled_toffee = Commodity(name="Cooled Toffee")
+    cut_toffee_commodity = Commodity(name="Cut Toffee")
+    packaged_toffee_commodity = Commodity(name="Packaged Toffee")
+    electricity_load = LoadType("Electricity")
+
+    order_generator = NOrderGenerator(
+        commodity=packaged_toffee_commodity,
+        mass_per_order=0.39 * 2 * 24 * 1,
+        production_deadline=time_data.global_end_date,
+        number_of_orders=number_of_orders,
+        time_span_between_order=datetime.timedelta(days=1),
+    )
+    packaged_toffee_sink = packaging_level.create_main_sink(
+        order_collection=order_generator.create_n_order_collection(),
+        name="Packaged Toffee Sink",
+        commodity=packaged_toffee_commodity,
+    )
+    cooled_toffee_source = packaging_level.create_main_source(
+        name="Cooled Toffee Source", commodity=cooled_toffee
+    )
+    for line_number in range(1, number_of_lines + 1):
+        packaging_line = packaging_level.create_process_chain(
+            process_chain_name="Packaging Line " + str(line_number)
+        )
+        fill_packaging_line(
+            process_chain=packaging_line,
+            sink=packaged_toffee_sink,
+            source=cooled_toffee_source,
+            line_number=line_number,
+            cut_toffee_commodity=cut_toffee_commodity,
+            electricity_load=electricity_load,
+        )
+    return enterprise
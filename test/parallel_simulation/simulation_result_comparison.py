@@ -0,0 +1,54 @@
+from ethos_penalps.load_profile_calculator import LoadProfileCollection
+from ethos_penalps.organizational_agents.enterprise import Enterprise
+
+
+def convert_load_profile_collection_to_dict(
+    load_profile_collection: LoadProfileCollection,
+) -> dict[str, dict[str, list[tuple]]]:
+    """The uuid of the LoadTypes differs between two separately created
+    models. Thus the entries are compared by the name of the LoadType.
+    """
+    output_dict = {}
+    for object_name, entry_collection in list(
+        load_profile_collection.dict_stream_load_profile_collections.items()
+    ) + list(
+        load_profile_collection.dict_process_step_load_profile_collections.items()
+    ):
+        output_dict[object_name] = {}
+        for (
+            load_type_uuid,
+            list_of_entries,
+        ) in entry_collection.dict_of_load_entry_lists.items():
+            load_type_name = entry_collection.load_type_dict[load_type_uuid].name
+            output_dict[object_name][load_type_name] = [
+                (
+                    entry.start_time,
+                    entry.end_time,
+                    entry.energy_quantity,
+                    entry.average_power_consumption,
+                )
+                for entry in list_of_entries
+            ]
+    return output_dict
+
+
+def assert_equal_simulation_results(enterprise_1: Enterprise, enterprise_2: Enterprise):
+    production_plan_1 = enterprise_1.production_plan
+    production_plan_2 = enterprise_2.production_plan
+    assert list(production_plan_1.process_step_states_dict) == list(
+        production_plan_2.process_step_states_dict
+    )
+    assert (
+        production_plan_1.process_step_states_dict
+        == production_plan_2.process_step_states_dict
+    )
+    assert list(production_plan_1.stream_state_dict) == list(
+        production_plan_2.stream_state_dict
+    )
+    assert production_plan_1.stream_state_dict == production_plan_2.stream_state_dict
+    assert production_plan_1.storage_state_dict == production_plan_2.storage_state_dict
+    assert convert_load_profile_collection_to_dict(
+        enterprise_1.load_profile_handler.load_profile_collection
+    ) == convert_load_profile_collection_to_dict(
+        enterprise_2.load_profile_handler.load_profile_collection
+    )
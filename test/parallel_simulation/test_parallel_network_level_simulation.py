@@ -0,0 +1,129 @@
+import dataclasses
+from test.parallel_simulation.packaging_line_enterprise import (
+    create_packaging_line_enterprise,
+)
+from test.parallel_simulation.simulation_result_comparison import (
+    assert_equal_simulation_results,
+)
+from test.parallel_simulation.toffee_enterprise import create_toffee_enterprise
+
+from ethos_penalps.data_classes import (
+    OutputBranchIdentifier,
+    ProductionOrder,
+    StreamBranchIdentifier,
+    TemporalBranchIdentifier,
+)
+from ethos_penalps.organizational_agents.parallel_network_level_simulation import (
+    ParallelNetworkLevelSimulator,
+)
+from ethos_penalps.utilities.debugging_information import (
+    DebuggingInformationLogger,
+)
+from ethos_penalps.utilities.identifiers import IdentifierCounter
+
+
+def test_parallel_simulation_equals_sequential_simulation():
+    sequential_enterprise = create_toffee_enterprise()
+    sequential_enterprise.start_simulation()
+
+    parallel_enterprise = create_toffee_enterprise()
+    parallel_enterprise.start_simulation(number_of_parallel_processes=2)
+
+    assert_equal_simulation_results(
+        enterprise_1=sequential_enterprise, enterprise_2=parallel_enterprise
+    )
+    for production_plan in (
+        sequential_enterprise.production_plan,
+        parallel_enterprise.production_plan,
+    ):
+        assert production_plan.process_step_states_dict["Toffee Machine 1"]
+        assert production_plan.process_step_states_dict["Toffee Machine 2"]
+
+
+def get_set_of_identifiers(
+    debugging_information_logger: DebuggingInformationLogger,
+) -> set[int]:
+    """Collects the identifiers of the branches and orders that are referenced
+    by the recorded node operations of a chain.
+    """
+    set_of_identifiers = set()
+    set_of_visited_object_ids = set()
+    list_of_objects = [
+        node_operation
+        for _, node_operation in debugging_information_logger.get_node_operations()
+    ]
+    while list_of_objects:
+        current_object = list_of_objects.pop()
+        if id(current_object) in set_of_visited_object_ids:
+            continue
+        set_of_visited_object_ids.add(id(current_object))
+        if isinstance(
+            current_object,
+            (
+                OutputBranchIdentifier,
+                TemporalBranchIdentifier,
+                StreamBranchIdentifier,
+                ProductionOrder,
+            ),
+        ):
+            set_of_identifiers.add(current_object.global_unique_identifier)
+        if dataclasses.is_dataclass(current_object):
+            list_of_objects.extend(
+                getattr(current_object, field.name)
+                for field in dataclasses.fields(current_object)
+            )
+        elif isinstance(current_object, (list, tuple)):
+            list_of_objects.extend(current_object)
+        elif isinstance(current_object, dict):
+            list_of_objects.extend(current_object.values())
+    return set_of_identifiers
+
+
+def test_parallel_simulation_creates_unique_identifiers(monkeypatch):
+    list_of_first_worker_identifiers = []
+    simulate_network_level = ParallelNetworkLevelSimulator.simulate_network_level
+
+    def record_first_worker_identifier(self, *args, **kwargs):
+        list_of_first_worker_identifiers.append(IdentifierCounter.next_identifier)
+        return simulate_network_level(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        ParallelNetworkLevelSimulator,
+        "simulate_network_level",
+        record_first_worker_identifier,
+    )
+    enterprise = create_packaging_line_enterprise(number_of_lines=3, number_of_orders=3)
+    enterprise.start_simulation(number_of_parallel_processes=2)
+
+    # The identifiers which have been created before the parallel simulation
+    # are shared by all chains
+    list_of_sets_of_identifiers = [
+        {
+            identifier
+            for identifier in get_set_of_identifiers(
+                debugging_information_logger=process_chain.debugging_information_logger
+            )
+            if identifier >= list_of_first_worker_identifiers[0]
+        }
+        for process_chain in enterprise.list_of_network_level[0].list_of_process_chains
+    ]
+    for set_of_identifiers in list_of_sets_of_identifiers:
+        assert set_of_identifiers
+    for chain_index, set_of_identifiers in enumerate(list_of_sets_of_identifiers):
+        for other_set_of_identifiers in list_of_sets_of_identifiers[chain_index + 1 :]:
+            assert set_of_identifiers.isdisjoint(other_set_of_identifiers)
+    # The identifiers of the parent process continue after those of the workers
+    assert IdentifierCounter.next_identifier > max(
+        max(set_of_identifiers) for set_of_identifiers in list_of_sets_of_identifiers
+    )
+
+
+def test_failed_chains_of_the_parallel_simulation_are_recorded():
+    enterprise = create_packaging_line_enterprise(number_of_lines=2)
+    enterprise.start_simulation(
+        number_of_iterations_in_chain=2, number_of_parallel_processes=2
+    )
+
+    for process_chain in enterprise.list_of_network_level[0].list_of_process_chains:
+        assert process_chain.simulation_failed
+        assert "maximum number of iterations" in process_chain.simulation_error_message
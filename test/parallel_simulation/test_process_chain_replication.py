@@ -0,0 +1,98 @@
+from test.parallel_simulation.packaging_line_enterprise import (
+    create_packaging_line_enterprise,
+)
+from test.parallel_simulation.simulation_result_comparison import (
+    assert_equal_simulation_results,
+)
+
+from ethos_penalps.organizational_agents.process_chain_replication import (
+    ProcessChainReplicator,
+)
+
+
+def test_detect_identical_process_chains():
+    enterprise = create_packaging_line_enterprise(number_of_lines=3)
+    network_level = enterprise.list_of_network_level[0]
+    # The last line has a slower conveyor belt and is not identical
+    last_line = network_level.list_of_process_chains[2]
+    last_line.stream_handler.get_stream(
+        stream_name="Cutting Machine 3_Packaging Machine 3_Cut Toffee"
+    ).static_data.maximum_operation_rate = 0.5
+    network_level.combine_stream_handler_from_chains()
+    network_level.combine_node_dict()
+    network_level.get_main_sink().initialize_sink()
+
+    process_chain_replicator = ProcessChainReplicator(network_level=network_level)
+    process_chain_replicator.detect_identical_process_chains()
+    first_line, second_line, last_line = network_level.list_of_process_chains
+    assert not process_chain_replicator.check_if_process_chain_is_replica(
+        process_chain=first_line
+    )
+    assert process_chain_replicator.check_if_process_chain_is_replica(
+        process_chain=second_line
+    )
+    assert not process_chain_replicator.check_if_process_chain_is_replica(
+        process_chain=last_line
+    )
+    process_chain_replica = process_chain_replicator.dict_of_process_chain_replicas[
+        second_line.process_chain_identifier
+    ]
+    assert process_chain_replica.representative_process_chain is first_line
+    assert process_chain_replica.name_mapping["Cutting Machine 1"] == (
+        "Cutting Machine 2"
+    )
+    assert process_chain_replica.name_mapping["Output Stream Cutter 1"] == (
+        "Output Stream Cutter 2"
+    )
+
+
+def test_replicated_simulation_equals_sequential_simulation():
+    sequential_enterprise = create_packaging_line_enterprise(number_of_lines=3)
+    sequential_enterprise.start_simulation()
+
+    replicated_enterprise = create_packaging_line_enterprise(number_of_lines=3)
+    replicated_enterprise.start_simulation(replicate_identical_process_chains=True)
+
+    assert_equal_simulation_results(
+        enterprise_1=sequential_enterprise, enterprise_2=replicated_enterprise
+    )
+    assert list(replicated_enterprise.production_plan.storage_state_dict) == list(
+        sequential_enterprise.production_plan.storage_state_dict
+    )
+    sequential_sink = sequential_enterprise.list_of_network_level[0].main_sink
+    replicated_sink = replicated_enterprise.list_of_network_level[0].main_sink
+    assert (
+        sequential_sink.input_stream_state_list
+        == replicated_sink.input_stream_state_list
+    )
+    for splitted_order_collection, replicated_splitted_order_collection in zip(
+        sequential_sink.order_distributor.dict_of_splitted_order.values(),
+        replicated_sink.order_distributor.dict_of_splitted_order.values(),
+    ):
+        # The unique identifiers of the orders differ between both models
+        assert (
+            splitted_order_collection.get_order_data_frame()
+            .drop(columns="global_unique_identifier")
+            .equals(
+                replicated_splitted_order_collection.get_order_data_frame().drop(
+                    columns="global_unique_identifier"
+                )
+            )
+        )
+    assert replicated_enterprise.production_plan.process_step_states_dict[
+        "Packaging Machine 3"
+    ]
+
+
+def test_replicated_parallel_simulation_equals_sequential_simulation():
+    sequential_enterprise = create_packaging_line_enterprise(number_of_lines=2)
+    sequential_enterprise.start_simulation()
+
+    replicated_enterprise = create_packaging_line_enterprise(number_of_lines=2)
+    replicated_enterprise.start_simulation(
+        number_of_parallel_processes=2, replicate_identical_process_chains=True
+    )
+
+    assert_equal_simulation_results(
+        enterprise_1=sequential_enterprise, enterprise_2=replicated_enterprise
+    )
@@ -0,0 +1,104 @@
+import datetime
+from test.test_toffee_production.cutting_and_packaging_chain import (
+    fill_cutting_and_packaging_chain,
+)
+from test.test_toffee_production.toffee_preparation_chain_1 import (
+    fill_toffee_preparation_chain_1,
+)
+from test.test_toffee_production.toffee_preparation_chain_2 import (
+    fill_toffee_preparation_chain_2,
+)
+
+from ethos_penalps.data_classes import Commodity, LoadType
+from ethos_penalps.order_generator import NOrderGenerator
+from ethos_penalps.organizational_agents.enterprise import Enterprise
+from ethos_penalps.time_data import TimeData
+
+
+def create_toffee_enterprise(number_of_orders: int = 1) -> Enterprise:
+    """Creates the toffee production model which has two identical
+    process chains in the toffee production level.
+
+    Args:
+        number_of_orders (int, optional): Number of orders in the
+            packaged toffee sink. Defaults to 1.
+
+    Returns:
+        Enterprise: The toffee production model.
+    """
+    time_data = TimeData(
+        global_end_date=datetime.datetime(year=2023, month=1, day=1),
+        global_start_date=datetime.datetime(year=2022, month=1, day=1),
+    )
+    enterprise = Enterprise(location="Example Location", time_data=time_data)
+    toffee_packaging_level = enterprise.create_network_level()
+    toffee_production_level = enterprise.create_network_level()
+
+    toffee_input_commodity = Commodity(name="Raw Toffee Ingredients")
+    cooled_toffee = Commodity(name="Cooled Toffee")
+    cut_toffee_commodity = Commodity(name="Cut Toffee")
+    packaged_toffee_commodity = Commodity(name="Packaged Toffee")
+
+    electricity_load = LoadType("Electricity")
+    natural_gas_load = LoadType("Natural Gas")
+
+    order_generator = NOrderGenerator(
+        commodity=packaged_toffee_commodity,
+        mass_per_order=0.39 * 2 * 24 * 1,
+        production_deadline=time_data.global_end_date,
+        number_of_orders=number_of_orders,
+        time_span_between_order=datetime.timedelta(days=1),
+    )
+    product_order_collection = order_generator.create_n_order_collection()
+
+    packaged_toffee_sink = toffee_packaging_level.create_main_sink(
+        order_collection=product_order_collection,
+        name="Packaged Toffee Sink",
+        commodity=packaged_toffee_commodity,
+    )
+    cooled_toffee_storage = (
+        toffee_packaging_level.create_process_chain_storage_as_source(
+            commodity=cooled_toffee,
+            name="Cooled Toffee Storage",
+        )
+    )
+    toffee_production_level.add_process_chain_storage_as_sink(
+        process_chain_storage=cooled_toffee_storage
+    )
+    toffee_raw_material_source = toffee_production_level.create_main_source(
+        name="Toffee Raw Materials", commodity=toffee_input_commodity
+    )
+
+    toffee_packaging_chain = toffee_packaging_level.create_process_chain(
+        process_chain_name="Cutting and Packaging"
+    )
+    fill_cutting_and_packaging_chain(
+        process_chain=toffee_packaging_chain,
+        sink=packaged_toffee_sink,
+        source=cooled_toffee_storage,
+        cooled_toffee=cooled_toffee,
+        cut_toffee_commodity=cut_toffee_commodity,
+        packaged_toffee_commodity=packaged_toffee_commodity,
+        electricity_load=electricity_load,
+    )
+    toffee_production_chain_1 = toffee_production_level.create_process_chain(
+        process_chain_name="Toffee Production Chain 1",
+    )
+    fill_toffee_preparation_chain_1(
+        process_chain=toffee_production_chain_1,
+        cooled_toffee_sink=cooled_toffee_storage,
+        raw_toffee_source=toffee_raw_material_source,
+        electricity_load=electricity_load,
+        natural_gas_load=natural_gas_load,
+    )
+    toffee_production_chain_2 = toffee_production_level.create_process_chain(
+        process_chain_name="Toffee Production Chain 2",
+    )
+    fill_toffee_preparation_chain_2(
+        process_chain=toffee_production_chain_2,
+        cooled_toffee_sink=cooled_toffee_storage,
+        raw_toffee_source=toffee_raw_material_source,
+        electricity_load=electricity_load,
+        natural_gas_load=natural_gas_load,
+    )
+    return enterprise
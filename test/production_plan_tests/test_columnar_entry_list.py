@@ -0,0 +1,240 @@
+import dataclasses
+import datetime
+import pickle
+from test.test_tutorial.tutorial_enterprise import create_tutorial_enterprise
+
+import numpy
+import pandas
+
+from ethos_penalps.data_classes import (
+    Commodity,
+    ProcessStepProductionPlanEntry,
+    StorageProductionPlanEntry,
+)
+from ethos_penalps.stream import (
+    BatchStreamProductionPlanEntry,
+    ProcessStepProductionPlanEntryWithInputStreamState,
+)
+from ethos_penalps.utilities.columnar_entry_list import (
+    ColumnarEntryList,
+    convert_entries_to_data_frame,
+)
+
+
+def create_batch_stream_entry(index: int) -> BatchStreamProductionPlanEntry:
+    start_time = datetime.datetime(2023, 1, 1) + datetime.timedelta(minutes=index)
+    return BatchStreamProductionPlanEntry(
+        name="Batch stream",
+        commodity="Product",
+        start_time=start_time,
+        end_time=pandas.Timestamp(start_time + datetime.timedelta(minutes=1)),
+        duration=datetime.timedelta(minutes=1),
+        delay=pandas.Timedelta(minutes=index),
+        batch_mass_value=index,
+        batch_mass_unit="t",
+        minimum_batch_mass_value=0,
+        maximum_batch_mass_value=float("inf"),
+        stream_type="BatchStream",
+        name_to_display=None,
+    )
+
+
+def test_entries_are_recreated_from_the_columns():
+    list_of_entries = [create_batch_stream_entry(index=index) for index in range(3000)]
+    columnar_entry_list = ColumnarEntryList(list_of_entries[:1000])
+    columnar_entry_list.extend(list_of_entries[1000:])
+
+    assert len(columnar_entry_list) == 3000
+    assert columnar_entry_list == list_of_entries
+    assert columnar_entry_list[-1] == list_of_entries[-1]
+    assert columnar_entry_list[10:12] == list_of_entries[10:12]
+    assert type(columnar_entry_list[5].end_time) is pandas.Timestamp
+    assert type(columnar_entry_list[5].start_time) is datetime.datetime
+    assert list_of_entries[:2] + columnar_entry_list[2:] == list_of_entries
+    restored_entry_list = pickle.loads(pickle.dumps(columnar_entry_list))
+    assert restored_entry_list == list_of_entries
+
+
+def test_entries_of_different_types_are_stored_in_one_list():
+    start_time = datetime.datetime(2023, 1, 1)
+    process_step_entry = ProcessStepProductionPlanEntry(
+        process_step_name="Process step",
+        process_state_name="Idle",
+        start_time=start_time,
+        end_time=start_time + datetime.timedelta(hours=1),
+        duration="1:00:00",
+        process_state_type="Idle",
+    )
+    entry_with_input_stream_state = ProcessStepProductionPlanEntryWithInputStreamState(
+        process_step_name="Process step",
+        process_state_name="Filling",
+        start_time=start_time + datetime.timedelta(hours=1),
+        end_time=start_time + datetime.timedelta(hours=2),
+        duration="1:00:00",
+        process_state_type="Filling",
+        stream_start_time=start_time,
+        stream_end_time=start_time + datetime.timedelta(hours=2),
+        total_stream_mass=[1, 2],
+    )
+    list_of_entries = [
+        process_step_entry,
+        entry_with_input_stream_state,
+        process_step_entry,
+    ]
+    columnar_entry_list = ColumnarEntryList(list_of_entries)
+
+    assert list(columnar_entry_list) == list_of_entries
+    data_frame = columnar_entry_list.to_data_frame()
+    assert list(data_frame["process_state_name"]) == ["Idle", "Filling", "Idle"]
+    assert data_frame["stream_start_time"].isna().tolist() == [True, False, True]
+    assert data_frame["total_stream_mass"].tolist() == [None, [1, 2], None]
+
+
+def test_data_frame_references_the_columns():
+    commodity = Commodity(name="Product")
+    start_time = datetime.datetime(2023, 1, 1)
+    list_of_storage_entries = [
+        StorageProductionPlanEntry(
+            process_step_name="Storage",
+            start_time=start_time + datetime.timedelta(hours=index),
+            end_time=start_time + datetime.timedelta(hours=index + 1),
+            duration="1:00:00",
+            storage_level_at_start=index,
+            storage_level_at_end=index + 1.5,
+            commodity=commodity,
+        )
+        for index in range(100)
+    ]
+    columnar_entry_list = ColumnarEntryList(list_of_storage_entries)
+    data_frame = convert_entries_to_data_frame(entries=columnar_entry_list)
+    reference_data_frame = pandas.DataFrame(list_of_storage_entries)
+
+    pandas.testing.assert_frame_equal(
+        data_frame.astype({"process_step_name": object, "duration": object}),
+        reference_data_frame.astype({"storage_level_at_start": float}),
+    )
+    assert numpy.shares_memory(
+        data_frame["storage_level_at_end"].to_numpy(),
+        columnar_entry_list.get_column_values("storage_level_at_end"),
+    )
+    # Data frames that have been handed out are not changed by new entries
+    columnar_entry_list.extend(list_of_storage_entries)
+    assert len(data_frame) == 100
+
+
+def test_production_plan_data_frames_match_the_entries():
+    enterprise = create_tutorial_enterprise(number_of_orders=2)
+    enterprise.start_simulation()
+    for list_of_entries in enterprise.production_plan.process_step_states_dict.values():
+        data_frame = convert_entries_to_data_frame(entries=list_of_entries)
+        assert len(data_frame) == len(list_of_entries)
+        assert list(data_frame["end_time"]) == [
+            entry.end_time for entry in list_of_entries
+        ]
+
+
+def test_spilled_columns_are_read_from_memory_maps(tmp_path):
+    list_of_entries = [create_batch_stream_entry(index=index) for index in range(2000)]
+    columnar_entry_list = ColumnarEntryList(list_of_entries[:1500])
+    columnar_entry_list.spill_to_directory(directory_path=str(tmp_path))
+
+    assert isinstance(columnar_entry_list.get_column_values("delay"), numpy.memmap)
+    assert columnar_entry_list == list_of_entries[:1500]
+    assert type(columnar_entry_list[5].end_time) is pandas.Timestamp
+    data_frame = columnar_entry_list.to_data_frame()
+    # Entries that are appended after the spill are stored in memory again
+    columnar_entry_list.extend(list_of_entries[1500:])
+    assert columnar_entry_list == list_of_entries
+    assert len(data_frame) == 1500
+    columnar_entry_list.spill_to_directory(directory_path=str(tmp_path))
+    assert pickle.loads(pickle.dumps(columnar_entry_list)) == list_of_entries
+    assert list(data_frame["batch_mass_value"]) == list(range(1500))
+
+
+def test_spills_only_write_the_appended_rows_to_new_chunks(tmp_path):
+    list_of_entries = [create_batch_stream_entry(index=index) for index in range(3000)]
+    columnar_entry_list = ColumnarEntryList(list_of_entries[:1000])
+    columnar_entry_list.spill_to_directory(directory_path=str(tmp_path))
+    columnar_entry_list.extend(list_of_entries[1000:2500])
+    first_chunk = columnar_entry_list.get_column_values("delay")[:1000]
+
+    columnar_entry_list.spill_to_directory(directory_path=str(tmp_path))
+    columnar_entry_list.extend(list_of_entries[2500:])
+
+    assert len(numpy.load(tmp_path / "delay_0.npy", mmap_mode="r")) == 1000
+    assert len(numpy.load(tmp_path / "delay_1000.npy", mmap_mode="r")) == 1500
+    assert numpy.array_equal(
+        numpy.load(tmp_path / "entry_type_codes_1000.npy"), numpy.zeros(1500)
+    )
+    assert list(first_chunk) == [entry.delay for entry in list_of_entries[:1000]]
+    assert columnar_entry_list == list_of_entries
+    assert columnar_entry_list[999:1001] == list_of_entries[999:1001]
+    assert list(columnar_entry_list.to_data_frame()["end_time"]) == [
+        entry.end_time for entry in list_of_entries
+    ]
+
+
+def test_production_plan_entries_are_spilled_after_each_chain(tmp_path):
+    enterprise = create_tutorial_enterprise(number_of_orders=2)
+    enterprise.start_simulation()
+    spilled_enterprise = create_tutorial_enterprise(number_of_orders=2)
+    spilled_enterprise.set_spill_directory(spill_directory=str(tmp_path))
+    spilled_enterprise.start_simulation()
+
+    production_plan = enterprise.production_plan
+    spilled_production_plan = spilled_enterprise.production_plan
+    assert (
+        spilled_production_plan.process_step_states_dict
+        == production_plan.process_step_states_dict
+    )
+    assert (
+        spilled_production_plan.stream_state_dict == production_plan.stream_state_dict
+    )
+    assert (
+        spilled_production_plan.storage_state_dict == production_plan.storage_state_dict
+    )
+    for list_of_entries in spilled_production_plan.process_step_states_dict.values():
+        assert list_of_entries.spill_directory_path.startswith(str(tmp_path))
+        assert isinstance(list_of_entries.get_column_values("start_time"), numpy.memmap)
+
+
+def test_load_profile_entries_are_spilled_after_each_chain(tmp_path):
+    enterprise = create_tutorial_enterprise(number_of_orders=2)
+    enterprise.start_simulation()
+    spilled_enterprise = create_tutorial_enterprise(number_of_orders=2)
+    spilled_enterprise.set_spill_directory(spill_directory=str(tmp_path))
+    spilled_enterprise.start_simulation()
+
+    load_profile_collection = enterprise.load_profile_handler.load_profile_collection
+    spilled_load_profile_collection = (
+        spilled_enterprise.load_profile_handler.load_profile_collection
+    )
+    list_of_load_entry_lists = (
+        load_profile_collection.get_list_of_columnar_load_entry_lists(
+            interning_table=enterprise.production_plan.interning_table
+        )
+    )
+    list_of_spilled_load_entry_lists = (
+        spilled_load_profile_collection.get_list_of_columnar_load_entry_lists(
+            interning_table=spilled_enterprise.production_plan.interning_table
+        )
+    )
+    assert len(list_of_spilled_load_entry_lists) == len(list_of_load_entry_lists) > 0
+    for (category_name, list_name, list_of_entries), (
+        spilled_category_name,
+        spilled_list_name,
+        list_of_spilled_entries,
+    ) in zip(list_of_load_entry_lists, list_of_spilled_load_entry_lists):
+        assert (spilled_category_name, spilled_list_name) == (category_name, list_name)
+        # The uuids of the load types differ between the enterprises
+        assert [
+            dataclasses.replace(load_profile_entry, load_type=None)
+            for load_profile_entry in list_of_spilled_entries
+        ] == [
+            dataclasses.replace(load_profile_entry, load_type=None)
+            for load_profile_entry in list_of_entries
+        ]
+        assert list_of_spilled_entries.spill_directory_path.startswith(str(tmp_path))
+        assert isinstance(
+            list_of_spilled_entries.get_column_values("start_time"), numpy.memmap
+        )
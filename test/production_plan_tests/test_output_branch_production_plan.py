@@ -0,0 +1,122 @@
+import datetime
+import pickle
+from test.test_tutorial.tutorial_enterprise import create_tutorial_enterprise
+
+import pytest
+
+from ethos_penalps.data_classes import Commodity, StorageProductionPlanEntry
+from ethos_penalps.production_plan import OutputBranchProductionPlan, ProductionPlan
+from ethos_penalps.utilities.columnar_entry_list import ColumnarEntryList
+from ethos_penalps.utilities.persistent_entry_list import PersistentEntryList
+
+
+def create_storage_entry(
+    commodity: Commodity, index: int
+) -> StorageProductionPlanEntry:
+    start_time = datetime.datetime(2023, 1, 1) + datetime.timedelta(hours=index)
+    return StorageProductionPlanEntry(
+        process_step_name="Storage step",
+        start_time=start_time,
+        end_time=start_time + datetime.timedelta(hours=1),
+        duration=datetime.timedelta(hours=1),
+        storage_level_at_start=index,
+        storage_level_at_end=index + 1,
+        commodity=commodity,
+    )
+
+
+def test_persistent_entry_list_copies_are_independent():
+    original_list = PersistentEntryList([0, 1, 2])
+    copied_list = original_list.create_copy()
+    original_list.append(3)
+    copied_list.extend([4, 5])
+    assert list(original_list) == [0, 1, 2, 3]
+    assert list(copied_list) == [0, 1, 2, 4, 5]
+    assert copied_list[-1] == 5
+    assert copied_list[len(copied_list) - 1] == 5
+    with pytest.raises(TypeError):
+        copied_list[1:3]
+    with pytest.raises(TypeError):
+        copied_list[0]
+    with pytest.raises(IndexError):
+        PersistentEntryList()[-1]
+    assert 4 in copied_list and 3 not in copied_list
+    assert list(reversed(original_list)) == [3, 2, 1, 0]
+    assert original_list == [0, 1, 2, 3]
+    restored_list = pickle.loads(pickle.dumps(PersistentEntryList(range(50000))))
+    assert len(restored_list) == 50000
+    assert restored_list[-1] == 49999
+
+
+def test_output_branch_production_plan_copy_is_independent():
+    first_commodity = Commodity(name="First commodity")
+    second_commodity = Commodity(name="Second commodity")
+    output_branch_production_plan = OutputBranchProductionPlan()
+    output_branch_production_plan.add_process_step_state_entries(
+        process_step_name="Process step", list_of_process_step_entries=["a", "b"]
+    )
+    for commodity in (first_commodity, second_commodity):
+        output_branch_production_plan.add_storage_entry(
+            process_step_name="Storage step",
+            storage_entry=create_storage_entry(commodity=commodity, index=0),
+        )
+    copied_production_plan = output_branch_production_plan.create_self_copy()
+    copied_production_plan.add_process_step_state_entries(
+        process_step_name="Process step", list_of_process_step_entries=["c"]
+    )
+    copied_production_plan.add_storage_entry(
+        process_step_name="Storage step",
+        storage_entry=create_storage_entry(commodity=first_commodity, index=1),
+    )
+
+    assert list(
+        output_branch_production_plan.process_step_states_dict["Process step"]
+    ) == ["a", "b"]
+    assert list(copied_production_plan.process_step_states_dict["Process step"]) == [
+        "a",
+        "b",
+        "c",
+    ]
+    # The storage entries of all commodities must be copied
+    assert set(copied_production_plan.storage_state_dict["Storage step"]) == {
+        first_commodity,
+        second_commodity,
+    }
+    assert (
+        len(
+            output_branch_production_plan.storage_state_dict["Storage step"][
+                first_commodity
+            ]
+        )
+        == 1
+    )
+    assert (
+        len(copied_production_plan.storage_state_dict["Storage step"][first_commodity])
+        == 2
+    )
+
+
+def test_temporary_production_plan_is_added_as_columnar_entry_lists():
+    output_branch_production_plan = OutputBranchProductionPlan()
+    output_branch_production_plan.add_process_step_state_entries(
+        process_step_name="Process step", list_of_process_step_entries=[]
+    )
+    production_plan = ProductionPlan(load_profile_handler=None)
+    production_plan.add_temporary_production_plan(
+        temporary_production_plan=output_branch_production_plan
+    )
+    assert (
+        type(production_plan.process_step_states_dict["Process step"])
+        is ColumnarEntryList
+    )
+
+
+def test_production_plan_contains_columnar_entry_lists_after_simulation():
+    enterprise = create_tutorial_enterprise(number_of_orders=2)
+    enterprise.start_simulation()
+    for (
+        list_of_process_step_entries
+    ) in enterprise.production_plan.process_step_states_dict.values():
+        assert type(list_of_process_step_entries) is ColumnarEntryList
+    for list_of_stream_entries in enterprise.production_plan.stream_state_dict.values():
+        assert type(list_of_stream_entries) is ColumnarEntryList
@@ -0,0 +1,146 @@
+import datetime
+import functools
+import os
+from test.parallel_simulation.packaging_line_enterprise import (
+    create_packaging_line_enterprise,
+)
+
+import cloudpickle
+import pandas
+
+from ethos_penalps.data_classes import Commodity
+from ethos_penalps.order_generator import NOrderGenerator
+from ethos_penalps.organizational_agents.enterprise import Enterprise
+from ethos_penalps.scenario_runner import (
+    ScenarioRunner,
+    create_batch_mass_setter,
+    create_order_generator_setter,
+    create_scenario_summary,
+    create_stream_maximum_operation_rate_setter,
+)
+
+MAXIMUM_OPERATION_RATE_COLUMN = "Cutter conveyor rate"
+ORDER_COLUMN = "Orders"
+BATCH_MASS_COLUMN = "Cutter batch mass"
+
+
+def create_scenario_runner(number_of_processes: int) -> ScenarioRunner:
+    return ScenarioRunner(
+        enterprise_factory=functools.partial(
+            create_packaging_line_enterprise, number_of_lines=1
+        ),
+        dict_of_parameter_setters={
+            MAXIMUM_OPERATION_RATE_COLUMN: create_stream_maximum_operation_rate_setter(
+                stream_name="Cutting Machine 1_Packaging Machine 1_Cut Toffee"
+            ),
+            ORDER_COLUMN: create_order_generator_setter(
+                sink_name="Packaged Toffee Sink"
+            ),
+            BATCH_MASS_COLUMN: create_batch_mass_setter(
+                process_step_name="Cutting Machine 1", set_input_stream=True
+            ),
+        },
+        number_of_processes=number_of_processes,
+    )
+
+
+def create_two_order_generator() -> NOrderGenerator:
+    return NOrderGenerator(
+        commodity=Commodity(name="Packaged Toffee"),
+        mass_per_order=0.39 * 2 * 24 * 1,
+        production_deadline=datetime.datetime(year=2023, month=1, day=1),
+        number_of_orders=2,
+        time_span_between_order=datetime.timedelta(days=1),
+    )
+
+
+def test_scenario_runner_summaries(tmp_path):
+    scenario_table = pandas.DataFrame(
+        {
+            MAXIMUM_OPERATION_RATE_COLUMN: [None, 0.39, None],
+            ORDER_COLUMN: [None, None, create_two_order_generator()],
+            BATCH_MASS_COLUMN: [None, None, 0.26],
+        },
+        index=["Base", "Slow conveyor", "Two orders"],
+    )
+    scenario_runner = create_scenario_runner(number_of_processes=1)
+    summary_data_frame = scenario_runner.run_scenarios(
+        scenario_table=scenario_table,
+        list_of_scenarios_to_persist=["Two orders"],
+        result_directory=str(tmp_path),
+    )
+    assert list(summary_data_frame.index) == ["Base", "Slow conveyor", "Two orders"]
+    assert not summary_data_frame["simulation_failed"].any()
+    energy_column = "Total energy Electricity [MJ]"
+    peak_power_column = "Peak power Electricity [MW]"
+
+    # The summary of the unchanged scenario equals the summary of the base model
+    base_enterprise = create_packaging_line_enterprise(number_of_lines=1)
+    base_enterprise.start_simulation()
+    base_summary = create_scenario_summary(
+        enterprise=base_enterprise, scenario_name="Base"
+    )
+    assert summary_data_frame.loc["Base", energy_column] == (
+        base_summary.total_energy_per_load_type["Electricity"]
+    )
+    assert summary_data_frame.loc["Base", "makespan"] == base_summary.makespan
+    assert summary_data_frame.loc["Base", "number_of_iterations"] > 0
+
+    # The energy only depends on the mass, the power on the rate
+    assert summary_data_frame.loc["Slow conveyor", energy_column] == (
+        summary_data_frame.loc["Base", energy_column]
+    )
+    assert summary_data_frame.loc["Slow conveyor", peak_power_column] < (
+        summary_data_frame.loc["Base", peak_power_column]
+    )
+    assert summary_data_frame.loc["Slow conveyor", "makespan"] > (
+        summary_data_frame.loc["Base", "makespan"]
+    )
+    assert summary_data_frame.loc["Two orders", energy_column] == (
+        2 * summary_data_frame.loc["Base", energy_column]
+    )
+
+    # Only the selected scenario is persisted
+    assert os.listdir(tmp_path) == ["Two orders.pckl"]
+    assert summary_data_frame.loc["Two orders", "result_path"] == str(
+        tmp_path / "Two orders.pckl"
+    )
+    assert summary_data_frame.loc["Base", "result_path"] is None
+    with open(tmp_path / "Two orders.pckl", "rb") as file:
+        persisted_enterprise: Enterprise = cloudpickle.load(file)
+    assert persisted_enterprise.production_plan.process_step_states_dict[
+        "Cutting Machine 1"
+    ]
+
+
+def test_scenario_runner_in_process_pool():
+    scenario_table = pandas.DataFrame(
+        {MAXIMUM_OPERATION_RATE_COLUMN: [0.78, 0.39]},
+        index=["Fast conveyor", "Slow conveyor"],
+    )
+    sequential_summary_data_frame = create_scenario_runner(
+        number_of_processes=1
+    ).run_scenarios(scenario_table=scenario_table)
+    parallel_summary_data_frame = create_scenario_runner(
+        number_of_processes=2
+    ).run_scenarios(scenario_table=scenario_table)
+    pandas.testing.assert_frame_equal(
+        sequential_summary_data_frame, parallel_summary_data_frame
+    )
+
+
+def test_failed_chain_is_reported_in_the_summary():
+    scenario_runner = ScenarioRunner(
+        enterprise_factory=functools.partial(
+            create_packaging_line_enterprise, number_of_lines=1
+        ),
+        dict_of_parameter_setters={},
+        number_of_iterations_in_chain=2,
+    )
+    summary_data_frame = scenario_runner.run_scenarios(
+        scenario_table=pandas.DataFrame(index=["Too few iterations"])
+    )
+    assert summary_data_frame.loc["Too few iterations", "simulation_failed"]
+    assert "maximum number of iterations" in (
+        summary_data_frame.loc["Too few iterations", "error_message"]
+    )
@@ -0,0 +1,32 @@
+import shutil
+
+from ethos_penalps.node_operations import NodeOperation
+from ethos_penalps.organizational_agents.simulation_checkpoint import (
+    SimulationCheckpointWriter,
+)
+
+
+class CopyingSimulationCheckpointWriter(SimulationCheckpointWriter):
+    """Keeps a copy of each checkpoint to resume from intermediate
+    states of a completed simulation.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.list_of_record_sizes: list[tuple[int, int]] = []
+
+    def write_checkpoint(self, current_node_operation: NodeOperation):
+        journal_length = 0
+        if self.simulation_checkpoint_journal is not None:
+            journal_length = self.simulation_checkpoint_journal.journal_length
+        super().write_checkpoint(current_node_operation=current_node_operation)
+        self.list_of_record_sizes.append(
+            (
+                self.process_chain_index,
+                self.simulation_checkpoint_journal.journal_length - journal_length,
+            )
+        )
+        shutil.copyfile(
+            self.checkpoint_path,
+            self.checkpoint_path + "." + str(self.number_of_written_checkpoints),
+        )
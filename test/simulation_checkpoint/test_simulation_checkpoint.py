@@ -0,0 +1,146 @@
+import datetime
+from test.parallel_simulation.packaging_line_enterprise import (
+    create_packaging_line_enterprise,
+)
+from test.parallel_simulation.simulation_result_comparison import (
+    assert_equal_simulation_results,
+)
+from test.simulation_checkpoint.copying_simulation_checkpoint_writer import (
+    CopyingSimulationCheckpointWriter,
+)
+
+import numpy
+import pytest
+
+from ethos_penalps.organizational_agents.enterprise import resume_simulation
+from ethos_penalps.organizational_agents.simulation_checkpoint import (
+    SimulationCheckpointWriter,
+    load_simulation_checkpoint,
+)
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+
+
+def test_resume_simulation_from_checkpoint(tmp_path):
+    reference_enterprise = create_packaging_line_enterprise(
+        number_of_lines=2, number_of_orders=3
+    )
+    reference_enterprise.start_simulation()
+
+    checkpoint_path = str(tmp_path / "checkpoint.pckl")
+    simulation_checkpoint_writer = CopyingSimulationCheckpointWriter(
+        checkpoint_path=checkpoint_path, number_of_orders_between_checkpoints=1
+    )
+    checkpointed_enterprise = create_packaging_line_enterprise(
+        number_of_lines=2, number_of_orders=3
+    )
+    checkpointed_enterprise.set_simulation_checkpoint_writer(
+        simulation_checkpoint_writer=simulation_checkpoint_writer
+    )
+    checkpointed_enterprise.start_simulation()
+    assert_equal_simulation_results(
+        enterprise_1=reference_enterprise, enterprise_2=checkpointed_enterprise
+    )
+    # The orders are aggregated to two orders per chain. No checkpoint
+    # is written when the last order of a chain is fulfilled.
+    assert simulation_checkpoint_writer.number_of_written_checkpoints == 2
+
+    # Resume in the middle of the first and the second chain
+    for checkpoint_number, process_chain_index in ((1, 0), (2, 1)):
+        copy_of_checkpoint_path = checkpoint_path + "." + str(checkpoint_number)
+        simulation_checkpoint = load_simulation_checkpoint(
+            checkpoint_path=copy_of_checkpoint_path
+        )
+        assert simulation_checkpoint.process_chain_index == process_chain_index
+        resumed_enterprise = resume_simulation(checkpoint_path=copy_of_checkpoint_path)
+        assert_equal_simulation_results(
+            enterprise_1=reference_enterprise, enterprise_2=resumed_enterprise
+        )
+
+
+def test_checkpoints_require_sequential_simulation(tmp_path):
+    enterprise = create_packaging_line_enterprise(number_of_lines=2)
+    enterprise.enable_simulation_checkpoints(
+        checkpoint_path=str(tmp_path / "checkpoint.pckl")
+    )
+    with pytest.raises(MisconfigurationError):
+        enterprise.start_simulation(number_of_parallel_processes=2)
+    with pytest.raises(MisconfigurationError):
+        SimulationCheckpointWriter(
+            checkpoint_path=str(tmp_path / "checkpoint.pckl"),
+            number_of_orders_between_checkpoints=None,
+        )
+
+
+def test_resume_simulation_with_accumulated_load_profiles(tmp_path):
+    start_date = datetime.datetime(2022, 12, 1)
+    end_date = datetime.datetime(2023, 1, 1)
+    reference_enterprise = create_packaging_line_enterprise(
+        number_of_lines=2, number_of_orders=4
+    )
+    reference_accumulator = reference_enterprise.enable_load_profile_accumulation(
+        start_date=start_date, end_date=end_date, resample_frequency="15min"
+    )
+    reference_enterprise.start_simulation()
+
+    checkpoint_path = str(tmp_path / "checkpoint.pckl")
+    checkpointed_enterprise = create_packaging_line_enterprise(
+        number_of_lines=2, number_of_orders=4
+    )
+    checkpointed_enterprise.enable_load_profile_accumulation(
+        start_date=start_date, end_date=end_date, resample_frequency="15min"
+    )
+    simulation_checkpoint_writer = CopyingSimulationCheckpointWriter(
+        checkpoint_path=checkpoint_path, number_of_orders_between_checkpoints=1
+    )
+    checkpointed_enterprise.set_simulation_checkpoint_writer(
+        simulation_checkpoint_writer=simulation_checkpoint_writer
+    )
+    checkpointed_enterprise.start_simulation()
+
+    for checkpoint_number in range(
+        1, simulation_checkpoint_writer.number_of_written_checkpoints + 1
+    ):
+        resumed_enterprise = resume_simulation(
+            checkpoint_path=checkpoint_path + "." + str(checkpoint_number)
+        )
+        assert_equal_simulation_results(
+            enterprise_1=reference_enterprise, enterprise_2=resumed_enterprise
+        )
+        resumed_accumulator = (
+            resumed_enterprise.load_profile_handler.load_profile_collection.load_profile_grid_accumulator
+        )
+        # The uuids of the load types differ between the models
+        dict_of_resumed_arrays = {
+            key[:2]: energy_array
+            for key, energy_array in resumed_accumulator.dict_of_energy_arrays.items()
+        }
+        assert len(dict_of_resumed_arrays) == len(
+            reference_accumulator.dict_of_energy_arrays
+        )
+        for key, energy_array in reference_accumulator.dict_of_energy_arrays.items():
+            numpy.testing.assert_allclose(dict_of_resumed_arrays[key[:2]], energy_array)
+
+
+def test_checkpoint_size_does_not_grow_with_the_simulated_orders(tmp_path):
+    enterprise = create_packaging_line_enterprise(
+        number_of_lines=2, number_of_orders=24
+    )
+    simulation_checkpoint_writer = CopyingSimulationCheckpointWriter(
+        checkpoint_path=str(tmp_path / "checkpoint.pckl"),
+        number_of_orders_between_checkpoints=1,
+    )
+    enterprise.set_simulation_checkpoint_writer(
+        simulation_checkpoint_writer=simulation_checkpoint_writer
+    )
+    enterprise.start_simulation()
+
+    list_of_record_sizes = [
+        record_size
+        for process_chain_index, record_size in (
+            simulation_checkpoint_writer.list_of_record_sizes
+        )
+        if process_chain_index == 0
+    ]
+    assert len(list_of_record_sizes) >= 10
+    # Only the entries of the last order are added to each record
+    assert list_of_record_sizes[-1] < 1.05 * list_of_record_sizes[2]
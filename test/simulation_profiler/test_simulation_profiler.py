@@ -0,0 +1,121 @@
+from test.parallel_simulation.simulation_result_comparison import (
+    assert_equal_simulation_results,
+)
+from test.test_tutorial.tutorial_enterprise import create_tutorial_enterprise
+
+import datapane
+import numpy
+import pandas
+import pytest
+
+from ethos_penalps.post_processing.report_generator.simulation_profile_page import (
+    SimulationProfilePageGenerator,
+)
+from ethos_penalps.utilities.simulation_profiler import CallDurationStatistics
+
+
+def test_simulation_profiler():
+    profiled_enterprise = create_tutorial_enterprise()
+    simulation_profiler = profiled_enterprise.enable_simulation_profiler()
+    profiled_enterprise.start_simulation()
+    enterprise = create_tutorial_enterprise()
+    enterprise.start_simulation()
+    assert_equal_simulation_results(
+        enterprise_1=profiled_enterprise, enterprise_2=enterprise
+    )
+
+    node_operation_profile_data_frame = (
+        simulation_profiler.get_node_operation_profile_data_frame()
+    )
+    process_chain_profile_data_frame = (
+        simulation_profiler.get_process_chain_profile_data_frame().set_index(
+            "Process chain"
+        )
+    )
+    for network_level in profiled_enterprise.list_of_network_level:
+        for process_chain in network_level.list_of_process_chains:
+            process_chain_name = process_chain.process_chain_identifier.chain_name
+            # Each iteration is a single call of a node
+            number_of_calls = node_operation_profile_data_frame.loc[
+                node_operation_profile_data_frame["Process chain"]
+                == process_chain_name,
+                "Number of calls",
+            ].sum()
+            assert number_of_calls == process_chain.number_of_iterations
+            process_chain_profile = process_chain_profile_data_frame.loc[
+                process_chain_name
+            ]
+            assert process_chain_profile["Number of fulfilled orders"] > 0
+            assert process_chain_profile["Iterations per fulfilled order"] == (
+                process_chain.number_of_iterations
+                / process_chain_profile["Number of fulfilled orders"]
+            )
+    assert (node_operation_profile_data_frame["Cumulative time [s]"] >= 0).all()
+    assert (
+        node_operation_profile_data_frame["99th percentile [s]"]
+        <= node_operation_profile_data_frame["Maximum time [s]"]
+    ).all()
+    node_profile_data_frame = simulation_profiler.get_node_profile_data_frame()
+    sink_profile = node_profile_data_frame.loc[
+        node_profile_data_frame["Node type"] == "Sink"
+    ]
+    assert not sink_profile.empty
+    assert (sink_profile["Adaption to validation ratio"] >= 0).all()
+
+    simulation_profile_page_generator = SimulationProfilePageGenerator(
+        simulation_profiler=simulation_profiler
+    )
+    assert isinstance(
+        simulation_profile_page_generator.create_simulation_profile_page(),
+        datapane.Group,
+    )
+
+
+def test_simulation_profiler_with_compiled_execution_plan():
+    interpreted_enterprise = create_tutorial_enterprise()
+    interpreted_simulation_profiler = (
+        interpreted_enterprise.enable_simulation_profiler()
+    )
+    interpreted_enterprise.start_simulation()
+    compiled_enterprise = create_tutorial_enterprise()
+    compiled_simulation_profiler = compiled_enterprise.enable_simulation_profiler()
+    compiled_enterprise.enable_compiled_execution_plan()
+    compiled_enterprise.start_simulation()
+
+    list_of_index_columns = ["Process chain", "Node", "Node operation"]
+    interpreted_number_of_calls = (
+        interpreted_simulation_profiler.get_node_operation_profile_data_frame()
+        .set_index(list_of_index_columns)["Number of calls"]
+        .sort_index()
+    )
+    compiled_number_of_calls = (
+        compiled_simulation_profiler.get_node_operation_profile_data_frame()
+        .set_index(list_of_index_columns)["Number of calls"]
+        .sort_index()
+    )
+    pandas.testing.assert_series_equal(
+        interpreted_number_of_calls, compiled_number_of_calls
+    )
+
+
+def test_call_duration_statistics_approximate_the_percentiles():
+    random_generator = numpy.random.default_rng(seed=0)
+    call_durations = random_generator.lognormal(mean=-9, sigma=1.5, size=20000)
+    call_duration_statistics = CallDurationStatistics()
+    number_of_histogram_bins = len(call_duration_statistics.histogram_counts)
+    for call_duration in call_durations.tolist():
+        call_duration_statistics.add_call_duration(call_duration=call_duration)
+
+    assert len(call_duration_statistics.histogram_counts) == number_of_histogram_bins
+    assert call_duration_statistics.number_of_calls == 20000
+    assert call_duration_statistics.cumulative_time == pytest.approx(
+        call_durations.sum()
+    )
+    assert call_duration_statistics.maximum_time == call_durations.max()
+    for percentile in (50, 90, 99):
+        assert call_duration_statistics.get_percentile(
+            percentile=percentile
+        ) == pytest.approx(numpy.percentile(call_durations, percentile), rel=0.05)
+    assert call_duration_statistics.get_percentile(percentile=100) == (
+        call_durations.max()
+    )
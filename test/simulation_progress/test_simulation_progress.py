@@ -0,0 +1,151 @@
+import datetime
+from test.test_tutorial.tutorial_enterprise import create_tutorial_enterprise
+
+import pytest
+
+from ethos_penalps.organizational_agents.simulation_progress import (
+    SimulationProgress,
+    SimulationProgressReporter,
+)
+from ethos_penalps.utilities.exceptions_and_warnings import (
+    MisconfigurationError,
+    SimulationAbortedError,
+)
+
+
+@pytest.mark.parametrize("use_compiled_execution_plan", [False, True])
+def test_simulation_progress_reporter(use_compiled_execution_plan: bool):
+    list_of_simulation_progress: list[SimulationProgress] = []
+    enterprise = create_tutorial_enterprise()
+    enterprise.enable_simulation_progress(
+        callback=list_of_simulation_progress.append,
+        reporting_interval=datetime.timedelta(0),
+        log_progress=False,
+    )
+    if use_compiled_execution_plan is True:
+        enterprise.enable_compiled_execution_plan()
+    enterprise.start_simulation()
+    list_of_process_chains = [
+        process_chain
+        for network_level in enterprise.list_of_network_level
+        for process_chain in network_level.list_of_process_chains
+    ]
+    list_of_final_progress = [
+        simulation_progress
+        for simulation_progress in list_of_simulation_progress
+        if simulation_progress.process_chain_is_terminated
+    ]
+    # A report after each iteration and a final report for each chain
+    assert len(list_of_final_progress) == len(list_of_process_chains)
+    assert len(list_of_simulation_progress) == len(list_of_process_chains) + sum(
+        process_chain.number_of_iterations for process_chain in list_of_process_chains
+    )
+    for process_chain, final_progress in zip(
+        list_of_process_chains, list_of_final_progress
+    ):
+        assert final_progress.process_chain_name == (
+            process_chain.process_chain_identifier.chain_name
+        )
+        assert final_progress.number_of_iterations == process_chain.number_of_iterations
+        assert final_progress.number_of_fulfilled_orders == (
+            final_progress.number_of_orders
+        )
+        assert final_progress.estimated_remaining_time == datetime.timedelta(0)
+    assert list_of_final_progress[-1].network_level_index == 1
+    assert list_of_final_progress[-1].total_number_of_iterations == sum(
+        process_chain.number_of_iterations for process_chain in list_of_process_chains
+    )
+
+
+def test_iterate_simulation_progress():
+    reference_enterprise = create_tutorial_enterprise()
+    list_of_reference_progress: list[SimulationProgress] = []
+    reference_enterprise.enable_simulation_progress(
+        callback=list_of_reference_progress.append,
+        reporting_interval=datetime.timedelta(0),
+        log_progress=False,
+    )
+    reference_enterprise.start_simulation()
+
+    enterprise = create_tutorial_enterprise()
+    enterprise.enable_simulation_progress(
+        reporting_interval=datetime.timedelta(0), log_progress=False
+    )
+    list_of_simulation_progress = list(enterprise.iterate_simulation_progress())
+    assert len(list_of_simulation_progress) == len(list_of_reference_progress)
+    for simulation_progress, reference_progress in zip(
+        list_of_simulation_progress, list_of_reference_progress
+    ):
+        assert simulation_progress.process_chain_name == (
+            reference_progress.process_chain_name
+        )
+        assert simulation_progress.number_of_iterations == (
+            reference_progress.number_of_iterations
+        )
+        assert simulation_progress.number_of_fulfilled_orders == (
+            reference_progress.number_of_fulfilled_orders
+        )
+    assert list_of_simulation_progress[-1].process_chain_is_terminated is True
+
+
+def test_stopped_iteration_aborts_simulation():
+    reference_enterprise = create_tutorial_enterprise()
+    reference_enterprise.start_simulation()
+    enterprise = create_tutorial_enterprise()
+    simulation_progress_reporter = enterprise.enable_simulation_progress(
+        reporting_interval=datetime.timedelta(0), log_progress=False
+    )
+    for simulation_progress in enterprise.iterate_simulation_progress():
+        if simulation_progress.number_of_iterations >= 5:
+            break
+    assert simulation_progress_reporter.queue_of_simulation_progress is None
+    # The simulation runs ahead of the iteration and is stopped
+    # at the next iteration of the current chain.
+    list_of_number_of_iterations = [
+        process_chain.number_of_iterations
+        for network_level in enterprise.list_of_network_level
+        for process_chain in network_level.list_of_process_chains
+    ]
+    list_of_reference_number_of_iterations = [
+        process_chain.number_of_iterations
+        for network_level in reference_enterprise.list_of_network_level
+        for process_chain in network_level.list_of_process_chains
+    ]
+    assert list_of_number_of_iterations != list_of_reference_number_of_iterations
+    assert sum(list_of_number_of_iterations) < sum(
+        list_of_reference_number_of_iterations
+    )
+
+
+def test_simulation_is_aborted_by_callback():
+    def abort_simulation(simulation_progress: SimulationProgress):
+        if simulation_progress.number_of_iterations >= 5:
+            raise SimulationAbortedError("The simulation is too slow")
+
+    enterprise = create_tutorial_enterprise()
+    enterprise.enable_simulation_progress(
+        callback=abort_simulation,
+        reporting_interval=datetime.timedelta(0),
+        log_progress=False,
+    )
+    with pytest.raises(SimulationAbortedError):
+        enterprise.start_simulation()
+    enterprise = create_tutorial_enterprise()
+    enterprise.enable_simulation_progress(
+        callback=abort_simulation,
+        reporting_interval=datetime.timedelta(0),
+        log_progress=False,
+    )
+    with pytest.raises(SimulationAbortedError):
+        list(enterprise.iterate_simulation_progress())
+
+
+def test_simulation_progress_reporter_misconfiguration():
+    with pytest.raises(MisconfigurationError):
+        SimulationProgressReporter(reporting_interval=datetime.timedelta(seconds=-1))
+    enterprise = create_tutorial_enterprise()
+    with pytest.raises(MisconfigurationError):
+        enterprise.iterate_simulation_progress()
+    enterprise.enable_simulation_progress()
+    with pytest.raises(MisconfigurationError):
+        enterprise.start_simulation(number_of_parallel_processes=2)
@@ -0,0 +1,97 @@
+from collections.abc import Callable
+from test.parallel_simulation.simulation_result_comparison import (
+    assert_equal_simulation_results,
+)
+from test.parallel_simulation.toffee_enterprise import create_toffee_enterprise
+from test.test_tutorial.tutorial_enterprise import create_tutorial_enterprise
+
+import pytest
+
+from ethos_penalps.benchmark.benchmark_model_generator import (
+    BenchmarkModelGenerator,
+    BenchmarkModelParameters,
+    BenchmarkStreamTypes,
+)
+from ethos_penalps.organizational_agents.enterprise import Enterprise
+from ethos_penalps.process_step_data import StateRestorationModes
+from ethos_penalps.time_data import TimeData
+from ethos_penalps.utilities.exceptions_and_warnings import MisconfigurationError
+from ethos_penalps.utilities.undo_log import UndoLog
+
+
+def create_batch_benchmark_enterprise() -> Enterprise:
+    return BenchmarkModelGenerator(
+        benchmark_model_parameters=BenchmarkModelParameters(
+            number_of_orders=5,
+            number_of_process_steps_in_chain=3,
+            stream_type=BenchmarkStreamTypes.batch,
+        )
+    ).create_enterprise()
+
+
+def create_mixed_benchmark_enterprise() -> Enterprise:
+    return BenchmarkModelGenerator(
+        benchmark_model_parameters=BenchmarkModelParameters(
+            number_of_orders=5,
+            number_of_process_steps_in_chain=3,
+            stream_type=BenchmarkStreamTypes.mixed,
+        )
+    ).create_enterprise()
+
+
+@pytest.mark.parametrize(
+    "enterprise_factory",
+    [
+        create_tutorial_enterprise,
+        create_toffee_enterprise,
+        create_batch_benchmark_enterprise,
+        create_mixed_benchmark_enterprise,
+    ],
+)
+def test_undo_log_equals_snapshot_restoration(
+    enterprise_factory: Callable[[], Enterprise],
+):
+    snapshot_enterprise = enterprise_factory()
+    snapshot_enterprise.start_simulation(number_of_iterations_in_chain=5000)
+    undo_log_enterprise = enterprise_factory()
+    undo_log_enterprise.set_state_restoration_mode(
+        state_restoration_mode=StateRestorationModes.undo_log
+    )
+    undo_log_enterprise.start_simulation(number_of_iterations_in_chain=5000)
+    assert_equal_simulation_results(
+        enterprise_1=snapshot_enterprise, enterprise_2=undo_log_enterprise
+    )
+    for snapshot_network_level, undo_log_network_level in zip(
+        snapshot_enterprise.list_of_network_level,
+        undo_log_enterprise.list_of_network_level,
+    ):
+        for snapshot_process_chain, undo_log_process_chain in zip(
+            snapshot_network_level.list_of_process_chains,
+            undo_log_network_level.list_of_process_chains,
+        ):
+            assert undo_log_process_chain.number_of_iterations == (
+                snapshot_process_chain.number_of_iterations
+            )
+
+
+def test_undo_log_rollback_of_time_data():
+    time_data = TimeData()
+    time_data.undo_log = UndoLog()
+    time_data.set_next_process_state_switch_time(
+        next_discrete_event_time=TimeData().global_start_date
+    )
+    time_data.set_next_stream_end_time(
+        next_stream_end_time=TimeData().global_start_date
+    )
+    time_data.set_next_event_time_as_last_idle_time()
+    time_data.undo_log.rollback()
+    assert time_data.last_idle_time == time_data.global_end_date
+    assert time_data.next_process_state_switch_time == time_data.global_end_date
+    assert not hasattr(time_data, "next_stream_end_time")
+    assert not time_data.undo_log.list_of_undo_entries
+
+
+def test_unknown_state_restoration_mode():
+    enterprise = create_tutorial_enterprise()
+    with pytest.raises(MisconfigurationError):
+        enterprise.set_state_restoration_mode(state_restoration_mode="unknown")
@@ -0,0 +1,170 @@
+import datetime
+
+import numpy
+import pytest
+
+from ethos_penalps.data_classes import Commodity, StorageProductionPlanEntry
+from ethos_penalps.storage import BaseStorage
+from ethos_penalps.stream import (
+    BatchStreamState,
+    BatchStreamStaticData,
+    ContinuousStreamState,
+    ContinuousStreamStaticData,
+)
+from ethos_penalps.stream_handler import StreamHandler
+
+storage_commodity = Commodity(name="Stored Commodity")
+start_date = datetime.datetime(2023, 1, 1)
+
+
+def create_storage_with_random_stream_states(
+    seed: int, number_of_stream_states: int
+) -> tuple[BaseStorage, list, list]:
+    random_generator = numpy.random.default_rng(seed=seed)
+    stream_handler = StreamHandler()
+    list_of_streams = []
+    for stream_index in range(4):
+        list_of_streams.append(
+            stream_handler.create_continuous_stream(
+                continuous_stream_static_data=ContinuousStreamStaticData(
+                    start_process_step_name="Start " + str(stream_index),
+                    end_process_step_name="Continuous End",
+                    commodity=storage_commodity,
+                )
+            )
+        )
+        list_of_streams.append(
+            stream_handler.create_batch_stream(
+                batch_stream_static_data=BatchStreamStaticData(
+                    start_process_step_name="Start " + str(stream_index),
+                    end_process_step_name="Batch End",
+                    commodity=storage_commodity,
+                    delay=datetime.timedelta(minutes=3),
+                )
+            )
+        )
+    list_of_input_stream_states = []
+    list_of_output_stream_states = []
+    for _ in range(number_of_stream_states):
+        stream = list_of_streams[random_generator.integers(len(list_of_streams))]
+        # Coarse start times create many shared start and end times
+        state_start_time = start_date + datetime.timedelta(
+            minutes=int(random_generator.integers(0, 120)),
+            microseconds=int(random_generator.choice([0, 1, 333333])),
+        )
+        duration = datetime.timedelta(minutes=int(random_generator.integers(1, 40)))
+        mass = float(random_generator.uniform(0.1, 10))
+        if stream.static_data.stream_type == "ContinuousStream":
+            stream_state = ContinuousStreamState(
+                name=stream.name,
+                start_time=state_start_time,
+                end_time=state_start_time + duration,
+                total_mass=mass,
+                current_operation_rate=mass / duration.total_seconds() * 3600,
+            )
+        else:
+            stream_state = BatchStreamState(
+                name=stream.name,
+                start_time=state_start_time,
+                end_time=state_start_time + stream.static_data.delay,
+                batch_mass_value=mass,
+            )
+        if random_generator.random() < 0.5:
+            list_of_input_stream_states.append(stream_state)
+        else:
+            list_of_output_stream_states.append(stream_state)
+    storage = BaseStorage(
+        stream_handler=stream_handler,
+        input_to_output_conversion_factor=0.7,
+        commodity=storage_commodity,
+        process_step_name="Test Storage",
+        storage_level_at_start=3.0,
+    )
+    return storage, list_of_input_stream_states, list_of_output_stream_states
+
+
+def create_storage_entries_by_scanning_all_stream_states(
+    storage: BaseStorage,
+    list_of_input_stream_states: list,
+    list_of_output_stream_states: list,
+    last_storage_update_time: datetime.datetime,
+) -> list[StorageProductionPlanEntry]:
+    list_of_date_time_ranges = (
+        storage.create_a_list_of_datetime_ranges_from_list_of_stream_states(
+            list_of_input_stream_states=list_of_input_stream_states,
+            list_of_output_stream_states=list_of_output_stream_states,
+            exclude_output_times_before_input_end_time=False,
+            exclude_output_times_before_input_start_time=False,
+            last_update_time_storage=last_storage_update_time,
+            order_from_end_to_start=False,
+        )
+    )
+    return [
+        storage.create_storage_entry_from_start_to_end(
+            list_of_input_stream_states=list_of_input_stream_states,
+            list_of_output_stream_states=list_of_output_stream_states,
+            storage_date_range=storage_date_time_range,
+        )
+        for storage_date_time_range in list_of_date_time_ranges
+    ]
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("number_of_stream_states", [0, 1, 5, 60])
+def test_storage_entries_match_scan_of_all_stream_states(
+    seed: int, number_of_stream_states: int
+):
+    storage, list_of_input_stream_states, list_of_output_stream_states = (
+        create_storage_with_random_stream_states(
+            seed=seed, number_of_stream_states=number_of_stream_states
+        )
+    )
+    reference_storage = BaseStorage(
+        stream_handler=storage.stream_handler,
+        input_to_output_conversion_factor=storage.input_to_output_conversion_factor,
+        commodity=storage.commodity,
+        process_step_name=storage.process_step_name,
+        storage_level_at_start=storage.current_storage_level,
+    )
+    last_storage_update_time = start_date + datetime.timedelta(minutes=10)
+
+    list_of_storage_entries = storage.create_storage_entries_from_start_to_end(
+        list_of_input_stream_states=list_of_input_stream_states,
+        list_of_output_stream_states=list_of_output_stream_states,
+        last_storage_update_time=last_storage_update_time,
+    )
+    list_of_reference_entries = create_storage_entries_by_scanning_all_stream_states(
+        storage=reference_storage,
+        list_of_input_stream_states=list_of_input_stream_states,
+        list_of_output_stream_states=list_of_output_stream_states,
+        last_storage_update_time=last_storage_update_time,
+    )
+
+    assert list_of_storage_entries == list_of_reference_entries
+    assert storage.current_storage_level == reference_storage.current_storage_level
+    assert storage.total_input == reference_storage.total_input
+    assert storage.total_output == reference_storage.total_output
+
+
+def test_infinitesimal_continuous_input_stream_state_is_rejected():
+    storage, _, _ = create_storage_with_random_stream_states(
+        seed=0, number_of_stream_states=0
+    )
+    continuous_stream_name = next(
+        stream_name
+        for stream_name, stream in storage.stream_handler.stream_dict.items()
+        if stream.static_data.stream_type == "ContinuousStream"
+    )
+    infinitesimal_stream_state = ContinuousStreamState(
+        name=continuous_stream_name,
+        start_time=start_date + datetime.timedelta(hours=1),
+        end_time=start_date + datetime.timedelta(hours=1),
+        total_mass=1.0,
+        current_operation_rate=0,
+    )
+    with pytest.raises(Exception, match="infinitesimal"):
+        storage.create_storage_entries_from_start_to_end(
+            list_of_input_stream_states=[infinitesimal_stream_state],
+            list_of_output_stream_states=[],
+            last_storage_update_time=start_date,
+        )
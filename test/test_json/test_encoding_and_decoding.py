@@ -1,16 +1,30 @@
 import datetime
 import json
+import pickle
 from dataclasses import dataclass, field
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
-from ethos_penalps.data_classes import Commodity, LoadType, StreamLoadEnergyData
+from ethos_penalps.data_classes import (
+    Commodity,
+    LoadType,
+    ProcessStepProductionPlanEntry,
+    StorageProductionPlanEntry,
+    StreamLoadEnergyData,
+)
 from ethos_penalps.stream import (
     BatchStream,
+    BatchStreamProductionPlanEntry,
+    BatchStreamState,
     BatchStreamStaticData,
     ContinuousStream,
+    ContinuousStreamState,
     ContinuousStreamStaticData,
 )
 from ethos_penalps.stream_handler import StreamHandler
+from ethos_penalps.utilities.json_coding_functions import (
+    convert_record_to_json,
+    create_record_from_json,
+)
 from ethos_penalps.utilities.own_object_json_encoding_decoding import (
     MyDecoder,
     MyEncoder,
@@ -173,3 +187,77 @@ def test_encode_and_decode_stream_handler():
         batch_stream.name
     ) == stream_handler.get_stream(batch_stream.name)
     assert reread_stream_handler.stream_dict == stream_handler.stream_dict
+
+
+def test_encode_and_decode_stream_states():
+    start_time = datetime.datetime(2023, 1, 1, 8)
+    end_time = datetime.datetime(2023, 1, 1, 9, 30)
+    batch_stream_state = BatchStreamState(
+        name="Batch stream",
+        start_time=start_time,
+        end_time=end_time,
+        batch_mass_value=12.5,
+    )
+    continuous_stream_state = ContinuousStreamState(
+        name="Continuous stream",
+        start_time=start_time,
+        end_time=end_time,
+        total_mass=30,
+        current_operation_rate=20,
+    )
+    for stream_state in (batch_stream_state, continuous_stream_state):
+        assert not hasattr(stream_state, "__dict__")
+        reread_stream_state = create_record_from_json(
+            record_type=type(stream_state),
+            json_string=convert_record_to_json(record=stream_state),
+        )
+        assert reread_stream_state == stream_state
+        assert pickle.loads(pickle.dumps(stream_state)) == stream_state
+        assert stream_state.date_time_range.get_timedelta_second() == 5400
+        assert type(stream_state).from_json(stream_state.to_json()) == stream_state
+
+    old_json_dict = json.loads(batch_stream_state.to_json())
+    old_json_dict["date_time_range"] = "{}"
+    assert BatchStreamState.from_dict(old_json_dict) == batch_stream_state
+
+
+def test_encode_and_decode_production_plan_entries():
+    start_time = datetime.datetime(2023, 1, 1, 8)
+    end_time = datetime.datetime(2023, 1, 1, 9, 30)
+    list_of_entries = [
+        BatchStreamProductionPlanEntry(
+            name="Batch stream",
+            commodity="Product",
+            start_time=start_time,
+            end_time=end_time,
+            duration=end_time - start_time,
+            delay=datetime.timedelta(minutes=3),
+            batch_mass_value=12.5,
+            batch_mass_unit="t",
+            minimum_batch_mass_value=0,
+            maximum_batch_mass_value=20,
+            stream_type="BatchStream",
+            name_to_display=None,
+        ),
+        ProcessStepProductionPlanEntry(
+            process_step_name="Process step",
+            process_state_name="Idle",
+            start_time=start_time,
+            end_time=end_time,
+            duration="1:30:00",
+            process_state_type="Idle",
+        ),
+        StorageProductionPlanEntry(
+            process_step_name="Storage",
+            start_time=start_time,
+            end_time=end_time,
+            duration="1:30:00",
+            storage_level_at_start=1.0,
+            storage_level_at_end=2.5,
+            commodity=Commodity(name="Product"),
+        ),
+    ]
+    for entry in list_of_entries:
+        assert not hasattr(entry, "__dict__")
+        assert type(entry).from_json(entry.to_json()) == entry
+        assert type(entry).from_dict(entry.to_dict()) == entry
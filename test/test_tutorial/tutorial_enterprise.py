@@ -0,0 +1,85 @@
+import datetime
+from test.test_tutorial.blending_process_chain import fill_blending_process_chain
+from test.test_tutorial.cooking_process_chain import fill_cooking_process_chain
+
+from ethos_penalps.data_classes import Commodity
+from ethos_penalps.order_generator import NOrderGenerator
+from ethos_penalps.organizational_agents.enterprise import Enterprise
+from ethos_penalps.time_data import TimeData
+
+
+def create_tutorial_enterprise(number_of_orders: int = 4) -> Enterprise:
+    """Creates the model of the fifth tutorial which consists of a cooking
+    and a blending NetworkLevel with two chains each.
+
+    Args:
+        number_of_orders (int, optional): Number of orders in the
+            cooked goods sink. Defaults to 4.
+
+    Returns:
+        Enterprise: The tutorial model.
+    """
+    raw_commodity = Commodity(name="Raw Goods")
+    uncooked_commodity = Commodity(name="Uncooked Goods")
+    cooked_commodity = Commodity(name="Cooked Goods")
+    end_date = datetime.datetime(2022, 1, 3)
+    time_data = TimeData(
+        global_start_date=datetime.datetime(2022, 1, 2, hour=22),
+        global_end_date=end_date,
+    )
+    order_generator = NOrderGenerator(
+        commodity=cooked_commodity,
+        mass_per_order=0.00065,
+        production_deadline=end_date,
+        number_of_orders=number_of_orders,
+        time_span_between_order=datetime.timedelta(minutes=5),
+    )
+    enterprise = Enterprise(time_data=time_data, name="Cooking Example")
+    cooking_network_level = enterprise.create_network_level()
+    blending_network_level = enterprise.create_network_level()
+
+    cooked_goods_sink = cooking_network_level.create_main_sink(
+        name="Cooked Goods Sink",
+        commodity=cooked_commodity,
+        order_collection=order_generator.create_n_order_collection(),
+    )
+    uncooked_goods_storage = (
+        cooking_network_level.create_process_chain_storage_as_source(
+            name="Uncooked Goods", commodity=uncooked_commodity
+        )
+    )
+    raw_goods_source = blending_network_level.create_main_source(
+        "Raw Goods", commodity=raw_commodity
+    )
+    blending_network_level.add_process_chain_storage_as_sink(
+        process_chain_storage=uncooked_goods_storage
+    )
+    for chain_number in (1, 2):
+        cooking_chain = cooking_network_level.create_process_chain(
+            "Cooking Chain " + str(chain_number)
+        )
+        cooking_chain.add_sink(sink=cooked_goods_sink)
+        cooking_chain.add_source(source=uncooked_goods_storage)
+        fill_cooking_process_chain(
+            process_chain=cooking_chain,
+            uncooked_commodity=uncooked_commodity,
+            cooked_commodity=cooked_commodity,
+            cooked_goods_sink=cooked_goods_sink,
+            uncooked_goods_storage=uncooked_goods_storage,
+            process_step_name="Cooker " + str(chain_number),
+        )
+    for chain_number in (1, 2):
+        blending_chain = blending_network_level.create_process_chain(
+            "Blending Chain " + str(chain_number)
+        )
+        blending_chain.add_sink(sink=uncooked_goods_storage)
+        blending_chain.add_source(source=raw_goods_source)
+        fill_blending_process_chain(
+            process_chain=blending_chain,
+            raw_commodity=raw_commodity,
+            cooked_commodity=cooked_commodity,
+            raw_goods_source=raw_goods_source,
+            uncooked_storage=uncooked_goods_storage,
+            process_step_name="Blender " + str(chain_number),
+        )
+    return enterprise
@@ -0,0 +1,122 @@
+import datetime
+from test.test_tutorial.tutorial_enterprise import create_tutorial_enterprise
+
+import pytest
+
+from ethos_penalps.data_classes import (
+    Commodity,
+    ProcessStepProductionPlanEntry,
+    StorageProductionPlanEntry,
+)
+from ethos_penalps.production_plan import OutputBranchProductionPlan, ProductionPlan
+from ethos_penalps.utilities.exceptions_and_warnings import (
+    MisconfigurationError,
+    UnexpectedBehaviorWarning,
+)
+from ethos_penalps.utilities.validation import ValidationLevels
+
+START_TIME = datetime.datetime(2023, 1, 1)
+
+
+def create_process_step_entry(start_hour: int) -> ProcessStepProductionPlanEntry:
+    return ProcessStepProductionPlanEntry(
+        process_step_name="Process step",
+        process_state_name="Idle",
+        start_time=START_TIME + datetime.timedelta(hours=start_hour),
+        end_time=START_TIME + datetime.timedelta(hours=start_hour + 1),
+        duration=datetime.timedelta(hours=1),
+        process_state_type="Idle",
+    )
+
+
+def create_temporary_production_plan(
+    list_of_start_hours: list[int],
+) -> OutputBranchProductionPlan:
+    temporary_production_plan = OutputBranchProductionPlan()
+    temporary_production_plan.add_process_step_state_entries(
+        process_step_name="Process step",
+        list_of_process_step_entries=[
+            create_process_step_entry(start_hour=start_hour)
+            for start_hour in list_of_start_hours
+        ],
+    )
+    return temporary_production_plan
+
+
+@pytest.mark.parametrize(
+    "validation_level", [ValidationLevels.boundary, ValidationLevels.full]
+)
+def test_misaligned_entries_are_detected_at_the_junction(validation_level: str):
+    production_plan = ProductionPlan(
+        load_profile_handler=None, validation_level=validation_level
+    )
+    # The entries are ordered from the latest to the earliest entry
+    production_plan.add_temporary_production_plan(
+        temporary_production_plan=create_temporary_production_plan(
+            list_of_start_hours=[10, 9]
+        )
+    )
+    production_plan.add_temporary_production_plan(
+        temporary_production_plan=create_temporary_production_plan(
+            list_of_start_hours=[8, 7]
+        )
+    )
+    with pytest.raises(Exception, match="Process step states do no align"):
+        production_plan.add_temporary_production_plan(
+            temporary_production_plan=create_temporary_production_plan(
+                list_of_start_hours=[5]
+            )
+        )
+
+
+def test_no_entries_are_checked_if_the_validation_is_turned_off():
+    production_plan = ProductionPlan(
+        load_profile_handler=None, validation_level=ValidationLevels.off
+    )
+    for list_of_start_hours in ([10, 9], [5], [3, 8]):
+        production_plan.add_temporary_production_plan(
+            temporary_production_plan=create_temporary_production_plan(
+                list_of_start_hours=list_of_start_hours
+            )
+        )
+    assert len(production_plan.process_step_states_dict["Process step"]) == 5
+
+
+def test_negative_storage_levels_are_reported():
+    commodity = Commodity(name="Product")
+    storage_entry = StorageProductionPlanEntry(
+        process_step_name="Storage",
+        start_time=START_TIME,
+        end_time=START_TIME + datetime.timedelta(hours=1),
+        duration=datetime.timedelta(hours=1),
+        storage_level_at_start=0,
+        storage_level_at_end=-5,
+        commodity=commodity,
+    )
+    production_plan = ProductionPlan(load_profile_handler=None)
+    with pytest.warns(UnexpectedBehaviorWarning, match="below zero"):
+        production_plan.add_list_of_storage_entries(
+            storage_name="Storage",
+            commodity=commodity,
+            list_of_storage_entries=[storage_entry],
+        )
+
+
+def test_simulation_results_do_not_depend_on_the_validation_level():
+    dict_of_process_step_entries = {}
+    for validation_level in (ValidationLevels.off, ValidationLevels.full):
+        enterprise = create_tutorial_enterprise(number_of_orders=2)
+        enterprise.set_validation_level(validation_level=validation_level)
+        enterprise.start_simulation()
+        dict_of_process_step_entries[validation_level] = {
+            process_step_name: list(list_of_entries)
+            for process_step_name, list_of_entries in (
+                enterprise.production_plan.process_step_states_dict.items()
+            )
+        }
+    assert (
+        dict_of_process_step_entries[ValidationLevels.off]
+        == dict_of_process_step_entries[ValidationLevels.full]
+    )
+    with pytest.raises(MisconfigurationError):
+        enterprise.set_validation_level(validation_level="partial")